@@ -2,13 +2,21 @@
 
 import json
 import csv
+import bisect
 import datetime
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import omni.usd
 from pxr import Usd, UsdGeom, Gf
 import carb
 
+from . import trajectory_analysis
+
+
+# Time base for precomputed schedules (integer milliseconds since this epoch)
+_SCHEDULE_EPOCH = datetime.datetime(1970, 1, 1)
+
 
 class TimeTravelCore:
     """Core logic for Time Travel Extension."""
@@ -17,7 +25,12 @@ class TimeTravelCore:
         self._config = {}
         self._data = {}  # {timestamp_str: {objid: (x, y, z)}}
         self._timestamps = []  # Sorted list of timestamps
+        self._timestamp_ms = []  # Parallel to _timestamps, integer ms for bisect
+        self._keyframes = []  # Full position snapshot every _keyframe_interval timestamps
+        self._keyframe_interval = 50
         self._prim_map = {}  # {objid: prim_path}
+        self._current_positions = {}  # {objid: (x, y, z)} last written to the stage (local translate)
+        self._frame_changed_fns = []  # Callbacks fired after each stage write: fn(moved_objids)
         self._event_summary = []  # List of important event timestamps
         
         self._start_time = None
@@ -29,10 +42,23 @@ class TimeTravelCore:
         self._playback_speed = 1.0
         self._accumulated_time = 0.0
         self._use_event_summary = False
+        self._stage_dirty = False  # Latched seek/playback step, applied once in update()
+        
+        # Activity-adaptive speed (capture): [(start_ms, end_ms, speed_factor)]
+        self._use_adaptive_speed = False
+        self._adaptive_schedule = []
+        self._adaptive_settings = {
+            "proximity_threshold": 200.0,  # XZ distance counted as near contact
+            "quiet_speed": 3.0,            # Speed factor while no pair is near
+            "active_speed": 1.0,           # Speed factor around near contacts
+            "margin_seconds": 1.0          # Padding around near-contact periods
+        }
         
         # Event playback state
-        self._event_playback_start_time = None  # When current event started playing
         self._event_playback_duration = 1.0  # Play 1 second at each event
+        self._event_schedule = []  # [(segment_start_ms, segment_end_ms, camera_xyz)], merged and sorted
+        self._event_segment_active = False  # True once playback has entered the current segment
+        self._event_playback_ms = 0.0  # Playback position inside the schedule (absolute ms)
         
         # Event camera control
         self._event_positions = {}  # {timestamp_str: (x, y, z)}
@@ -143,6 +169,9 @@ class TimeTravelCore:
             # Extract event summary
             self._event_summary = self._config.get('event_summary', [])
             
+            # Adaptive capture speed settings (optional)
+            self._adaptive_settings.update(self._config.get('adaptive_speed', {}))
+            
             carb.log_info(f"[TimeTravel] Config loaded")
             return True
             
@@ -195,6 +224,10 @@ class TimeTravelCore:
                 print(self._end_time)
                 self._current_time = self._start_time
             
+            # Seek index: numeric timestamps + periodic keyframe snapshots
+            self._keyframe_interval = max(1, int(self._config.get('keyframe_interval', self._keyframe_interval)))
+            self._build_keyframes()
+            
             carb.log_info(f"[TimeTravel] Data loaded: {len(self._timestamps)} timestamps, {self._start_time} to {self._end_time}")
             return True
             
@@ -215,6 +248,16 @@ class TimeTravelCore:
         """Format datetime to timestamp string matching data format."""
         return dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
     
+    def _to_ms(self, dt: datetime.datetime) -> int:
+        """Convert datetime to integer milliseconds (schedule time base)."""
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return (dt - _SCHEDULE_EPOCH) // datetime.timedelta(milliseconds=1)
+    
+    def _from_ms(self, ms: float) -> datetime.datetime:
+        """Convert schedule milliseconds back to datetime."""
+        return _SCHEDULE_EPOCH + datetime.timedelta(milliseconds=ms)
+    
     def set_time_range(self, start_time: datetime.datetime, end_time: datetime.datetime) -> bool:
         """Set user-defined time range with validation."""
         # Validate that end time is after start time
@@ -237,14 +280,16 @@ class TimeTravelCore:
             self._start_time = adjusted_start
             self._end_time = adjusted_end
             
+            # Event schedule only covers the selected range
+            if self._event_summary:
+                self._build_event_schedule()
+            
             # Ensure current time is within new range
             if self._current_time:
                 if self._current_time < self._start_time:
-                    self._current_time = self._start_time
-                    self.update_stage_objects()
+                    self.request_seek(self._start_time)
                 elif self._current_time > self._end_time:
-                    self._current_time = self._end_time
-                    self.update_stage_objects()
+                    self.request_seek(self._end_time)
             
             carb.log_info(f"[TimeTravel] Time range set: {self._start_time} to {self._end_time}")
             return True
@@ -259,46 +304,75 @@ class TimeTravelCore:
         """Get original data end time."""
         return self._end_time or datetime.datetime.now()
     
-    def get_data_at_time(self, timestamp: datetime.datetime) -> Dict:
+    def get_data_at_time(self, timestamp: datetime.datetime, seek_index: Optional[tuple] = None) -> Dict:
         """
         Get object positions at specific timestamp (API for future AI integration).
         Removed microseconds for matching.
         Adjust matching second unit as needed.
+        seek_index: snapshot from snapshot_seek_index() to read from instead of the live data (worker threads).
         """
         # Normalize to milliseconds (remove microseconds beyond milliseconds)
         # .123456 → .123000 (마이크로초 부분 제거)
         normalized_time = timestamp.replace(microsecond=(timestamp.microsecond // 1000) * 1000)
-        # print(f"Normalized time: {normalized_time}")
-        timestamp_str = self._format_timestamp(normalized_time)
-        # print(f"Timestamp string: {timestamp_str}")
-        # Check if exact timestamp exists
-        if timestamp_str in self._data:
-            return self._data[timestamp_str]
-        
-        # Apply LKV (Last Known Value) logic
-        return self._get_lkv_data(timestamp_str)
+        # Always resolve the full LKV (Last Known Value) snapshot, also on exact sample hits:
+        # a sample row only holds the objects reported at that timestamp
+        return self._get_keyframe_data(self._to_ms(normalized_time), seek_index)
+    
+    def snapshot_seek_index(self) -> tuple:
+        """
+        Copy the containers get_data_at_time reads, for use off the main thread.
+        A reload or clear on the main thread mutates or replaces them; the per-timestamp
+        position dicts themselves are never modified after loading, so shallow copies suffice.
+        """
+        return (list(self._timestamps), list(self._timestamp_ms), list(self._keyframes),
+                dict(self._data), self._keyframe_interval)
     
     def _get_lkv_data(self, timestamp_str: str) -> Dict:
         """Get last known value for given timestamp."""
         if not self._timestamps:
             return {}
         
-        # Find the closest previous timestamp
-        prev_timestamp = None
-        for ts in self._timestamps:
-            if ts <= timestamp_str:
-                prev_timestamp = ts
-            else:
-                break
+        return self._get_keyframe_data(self._to_ms(self._parse_timestamp(timestamp_str)))
+    
+    def _build_keyframes(self):
+        """
+        Build the seek index used for scrubbing.
+        Every _keyframe_interval timestamps, store a full snapshot of all object
+        positions (last known value per object) so any seek costs one snapshot
+        copy plus at most _keyframe_interval - 1 forward applies.
+        """
+        self._timestamp_ms = [self._to_ms(self._parse_timestamp(ts)) for ts in self._timestamps]
+        self._keyframes = []
+        
+        positions = {}
+        for index, ts in enumerate(self._timestamps):
+            positions.update(self._data[ts])
+            if index % self._keyframe_interval == 0:
+                self._keyframes.append(dict(positions))
+        
+        carb.log_info(f"[TimeTravel] Built {len(self._keyframes)} keyframes "
+                      f"(interval {self._keyframe_interval} timestamps)")
+    
+    def _get_keyframe_data(self, time_ms: int, seek_index: Optional[tuple] = None) -> Dict:
+        """Resolve all object positions at time_ms from the nearest preceding keyframe."""
+        timestamps, timestamp_ms, keyframes, data, interval = seek_index or (
+            self._timestamps, self._timestamp_ms, self._keyframes, self._data, self._keyframe_interval
+        )
+        if not keyframes:
+            return {}
         
-        if prev_timestamp:
-            return self._data[prev_timestamp]
+        # Last timestamp at or before time_ms (before data start -> first frame)
+        index = max(0, bisect.bisect_right(timestamp_ms, time_ms) - 1)
+        keyframe_index = index // interval
         
-        # If no previous data, return first available data
-        return self._data[self._timestamps[0]] if self._timestamps else {}
+        positions = dict(keyframes[keyframe_index])
+        for ts in timestamps[keyframe_index * interval + 1:index + 1]:
+            positions.update(data[ts])
+        return positions
     
     def update_stage_objects(self):
         """Update USD stage objects based on current time."""
+        self._stage_dirty = False
         self._stage = self._usd_context.get_stage()
         if not self._stage:
             return
@@ -307,8 +381,16 @@ class TimeTravelCore:
         data = self.get_data_at_time(self._current_time)
         
         if not data:
+            self._notify_frame_changed([])
             return
         
+        # Objects whose position differs from the last stage write
+        moved_objids = [objid for objid, position in data.items()
+                        if self._current_positions.get(objid) != position]
+        
+        # Keep the frame so consumers (overlay) can read positions without touching USD
+        self._current_positions.update(data)
+        
         # Update each mapped object
         for objid, prim_path in self._prim_map.items():
             if objid not in data:
@@ -338,19 +420,49 @@ class TimeTravelCore:
                     
             except Exception as e:
                 carb.log_error(f"[TimeTravel] Failed to update {objid}: {e}")
+        
+        self._notify_frame_changed(moved_objids)
+    
+    def add_frame_changed_fn(self, fn):
+        """
+        Register fn(moved_objids) called after every stage write (playback step or seek).
+        Nothing is fired while paused, so listeners cost nothing on idle frames.
+        """
+        if fn not in self._frame_changed_fns:
+            self._frame_changed_fns.append(fn)
+    
+    def remove_frame_changed_fn(self, fn):
+        """Unregister a callback added with add_frame_changed_fn."""
+        if fn in self._frame_changed_fns:
+            self._frame_changed_fns.remove(fn)
+    
+    def _notify_frame_changed(self, moved_objids: List[str]):
+        """Fire frame changed callbacks."""
+        for fn in list(self._frame_changed_fns):
+            try:
+                fn(moved_objids)
+            except Exception as e:
+                carb.log_error(f"[TimeTravel] Frame changed callback failed: {e}")
+    
+    def request_seek(self, dt: datetime.datetime):
+        """
+        Seek to dt. Current time changes immediately; the resolve and stage write
+        are latched and applied once in the next update(), using the latest value only.
+        All seeks (slider, Go button, Next Event) go through here.
+        """
+        if self._start_time and self._end_time:
+            # Clamp to valid range
+            self._current_time = max(self._start_time, min(dt, self._end_time))
+            self._stage_dirty = True
     
     def set_to_earliest_time(self):
         """Set stage to earliest timestamp."""
         if self._start_time:
-            self._current_time = self._start_time
-            self.update_stage_objects()
+            self.request_seek(self._start_time)
     
     def set_current_time(self, dt: datetime.datetime):
-        """Set current time and update stage."""
-        if self._start_time and self._end_time:
-            # Clamp to valid range
-            self._current_time = max(self._start_time, min(dt, self._end_time))
-            self.update_stage_objects()
+        """Set current time (stage is updated on the next update())."""
+        self.request_seek(dt)
     
     def get_progress(self) -> float:
         """Get current progress as 0-1 value."""
@@ -365,7 +477,7 @@ class TimeTravelCore:
         return min(1.0, max(0.0, current_duration / total_duration))
     
     def set_progress(self, progress: float):
-        """Set progress (0-1) and update current time."""
+        """Set progress (0-1) and seek there (stage is updated on the next update())."""
         if not self._start_time or not self._end_time:
             return
         
@@ -373,8 +485,7 @@ class TimeTravelCore:
         total_duration = (self._end_time - self._start_time).total_seconds()
         seconds_offset = total_duration * progress
         
-        self._current_time = self._start_time + datetime.timedelta(seconds=seconds_offset)
-        self.update_stage_objects()
+        self.request_seek(self._start_time + datetime.timedelta(seconds=seconds_offset))
     
     def toggle_playback(self):
         """Toggle play/pause state."""
@@ -383,21 +494,33 @@ class TimeTravelCore:
         
         # Reset event playback state when starting
         if self._is_playing and self._use_event_summary:
-            self._event_playback_start_time = None
+            self._event_segment_active = False
     
     def update(self, dt: float):
+        """
+        Called once per app frame. Advances playback, then applies the latched
+        seek/playback step: at most one resolve and stage write per frame.
+        """
+        if self._is_playing and self._current_time:
+            self._advance_playback(dt)
+        
+        if self._stage_dirty:
+            self.update_stage_objects()
+    
+    def _advance_playback(self, dt: float):
         """ 
         재생시 0.1초 단위로 화면을 업데이트. 추후에 변화가 감지 기반 업데이트 로직으로 변경 가능
         - 0.1초 단위로 업데이트하는 이유는 너무 자주 업데이트하면 성능에 부담이 될 수 있기 때문.
         - 변화 감지 기반 업데이트의 장점은 더 자연스러운 움직임.
         """
-        if not self._is_playing or not self._current_time:
-            return
-        
-        self._accumulated_time += dt * self._playback_speed
+        # Negative speed accumulates negative time (reverse playback)
+        speed = self._playback_speed
+        if self._use_adaptive_speed and not self._use_event_summary:
+            speed *= trajectory_analysis.speed_at(self._adaptive_schedule, self._to_ms(self._current_time))
+        self._accumulated_time += dt * speed
         
         # Update every 0.1 second (or when accumulated time >= 0.1 second)
-        if self._accumulated_time >= 0.1:
+        if abs(self._accumulated_time) >= 0.1:
             seconds_to_add = self._accumulated_time
             self._accumulated_time = 0.0  # Reset accumulated time
             
@@ -405,82 +528,185 @@ class TimeTravelCore:
                 # Event Summary Mode: Play 1 second at each event
                 self._update_event_playback(seconds_to_add)
             else:
-                # Normal playback
+                # Normal playback (forward or reverse)
                 new_time = self._current_time + datetime.timedelta(seconds=seconds_to_add)
                 
                 if new_time >= self._end_time:
                     new_time = self._end_time
                     self._is_playing = False
+                elif new_time <= self._start_time:
+                    new_time = self._start_time
+                    self._is_playing = False
                 
                 self._current_time = new_time
-                self.update_stage_objects()
+                self._stage_dirty = True
     
     def _update_event_playback(self, dt: float):
         """
         Update playback in Event Summary Mode.
-        Plays 1 second at each event timestamp, then jumps to next event.
+        Walks the precomputed event schedule like normal playback: time advances
+        inside a segment and overflows into the next one. Stops after the last segment.
+        Negative dt walks the schedule backwards and stops at the first segment start.
         """
-        # Initialize event playback if not started
-        if self._event_playback_start_time is None:
-            # Go to current event timestamp
-            self._go_to_current_event()
-            self._event_playback_start_time = self._current_time
+        if not self._event_schedule:
+            self._is_playing = False
+            return
+        
+        # Enter the segment at the current time on the first tick after (re)starting playback
+        if not self._event_segment_active:
+            self._current_event_index = self._event_index_at(self._to_ms(self._current_time), reverse=dt < 0)
+            self._go_to_current_event(at_end=dt < 0)
             return
         
-        # Calculate elapsed time since event started
-        elapsed = (self._current_time - self._event_playback_start_time).total_seconds()
+        position_ms = self._event_playback_ms + dt * 1000.0
+        segment_start_ms, segment_end_ms, _ = self._event_schedule[self._current_event_index]
         
-        # If we've played for the duration, move to next event
-        if elapsed >= self._event_playback_duration:
-            # Move to next event
-            self._current_event_index = (self._current_event_index + 1) % len(self._event_summary)
-            
-            # If we've looped back to start, stop playback
+        while position_ms < segment_start_ms:
+            # First segment reached - stop at its start
             if self._current_event_index == 0:
+                self._current_time = self._from_ms(segment_start_ms)
+                self._stage_dirty = True
+                self._event_segment_active = False
+                self._is_playing = False
+                carb.log_info("[TimeTravel] Reverse event playback completed")
+                return
+            
+            # Carry the underflow into the end of the previous segment
+            underflow_ms = segment_start_ms - position_ms
+            self._current_event_index -= 1
+            segment_start_ms, segment_end_ms, camera_xyz = self._event_schedule[self._current_event_index]
+            position_ms = segment_end_ms - underflow_ms
+            if camera_xyz is not None:
+                self._move_summarization_camera(camera_xyz)
+        
+        while position_ms >= segment_end_ms:
+            # Last segment played - stop at its end
+            if self._current_event_index + 1 >= len(self._event_schedule):
+                self._current_time = self._from_ms(segment_end_ms)
+                self._stage_dirty = True
+                self._event_segment_active = False
                 self._is_playing = False
                 carb.log_info("[TimeTravel] Event playback completed")
                 return
             
-            # Go to next event and reset timer
-            self._go_to_current_event()
-            self._event_playback_start_time = self._current_time
-        else:
-            # Continue playing at normal speed
-            new_time = self._current_time + datetime.timedelta(seconds=dt)
-            self._current_time = new_time
-            self.update_stage_objects()
+            # Carry the overflow into the next segment
+            overflow_ms = position_ms - segment_end_ms
+            self._current_event_index += 1
+            segment_start_ms, segment_end_ms, camera_xyz = self._event_schedule[self._current_event_index]
+            position_ms = segment_start_ms + overflow_ms
+            if camera_xyz is not None:
+                self._move_summarization_camera(camera_xyz)
+        
+        self._event_playback_ms = position_ms
+        self._current_time = self._from_ms(position_ms)
+        self._stage_dirty = True
+    
+    def _build_event_schedule(self):
+        """
+        Compile event timestamps into a flat playback schedule.
+        Each event becomes [t, t + _event_playback_duration); overlapping or adjacent
+        segments are merged and keep the first camera position.
+        Segments are clipped to the selected time range; events outside it are dropped.
+        """
+        duration_ms = int(round(self._event_playback_duration * 1000))
+        range_start_ms = self._to_ms(self._start_time) if self._start_time else None
+        range_end_ms = self._to_ms(self._end_time) if self._end_time else None
+        segments = []
+        
+        for event_timestamp in self._event_summary:
+            try:
+                start_ms = self._to_ms(self._parse_timestamp(event_timestamp))
+            except Exception:
+                carb.log_error(f"[TimeTravel] Failed to parse event timestamp: {event_timestamp}")
+                continue
+            end_ms = start_ms + duration_ms
+            # 선택한 시간 범위 밖의 구간은 잘라냄
+            if range_start_ms is not None:
+                start_ms, end_ms = max(start_ms, range_start_ms), min(end_ms, range_end_ms)
+                if start_ms >= end_ms:
+                    continue
+            segments.append((start_ms, end_ms, self._event_positions.get(event_timestamp)))
+        
+        segments.sort(key=lambda segment: segment[0])
+        
+        schedule = []
+        for start_ms, end_ms, camera_xyz in segments:
+            if schedule and start_ms <= schedule[-1][1]:
+                prev_start_ms, prev_end_ms, prev_camera = schedule[-1]
+                schedule[-1] = (
+                    prev_start_ms,
+                    max(prev_end_ms, end_ms),
+                    prev_camera if prev_camera is not None else camera_xyz
+                )
+            else:
+                schedule.append((start_ms, end_ms, camera_xyz))
+        
+        self._event_schedule = schedule
+        self._current_event_index = 0
+        self._event_segment_active = False
+        
+        carb.log_info(f"[TimeTravel] Event schedule: {len(self._event_summary)} events -> "
+                      f"{len(schedule)} segments, {self.get_event_summary_duration():.3f}s total")
+    
+    def _event_index_at(self, time_ms: int, reverse: bool = False) -> int:
+        """
+        Schedule segment where playback from time_ms starts.
+        Forward: first segment not yet finished (wraps to the first one after the last).
+        Reverse: last segment starting before time_ms (wraps to the last one before the first).
+        """
+        if reverse:
+            index = bisect.bisect_left([start_ms for start_ms, _, _ in self._event_schedule], time_ms) - 1
+            return index if index >= 0 else len(self._event_schedule) - 1
+        index = bisect.bisect_right([end_ms for _, end_ms, _ in self._event_schedule], time_ms)
+        return index if index < len(self._event_schedule) else 0
     
-    def _go_to_current_event(self):
-        """Jump to current event in summary based on _current_event_index."""
-        if not self._event_summary:
+    def _go_to_current_event(self, at_end: bool = False):
+        """Jump to the start (or end, for reverse playback) of the current schedule segment."""
+        if not self._event_schedule:
             return
         
-        event_timestamp = self._event_summary[self._current_event_index]
+        segment_start_ms, segment_end_ms, camera_xyz = self._event_schedule[self._current_event_index]
         
-        try:
-            event_time = self._parse_timestamp(event_timestamp)
-            self.set_current_time(event_time)
-            
-            # Move Summarization camera to event position if available
-            if self._use_event_summary and event_timestamp in self._event_positions:
-                self._move_summarization_camera_to_event(event_timestamp)
-        except Exception as e:
-            carb.log_error(f"[TimeTravel] Failed to parse event timestamp: {event_timestamp}")
+        # Reverse playback enters just inside the segment end
+        target_ms = segment_end_ms - 1 if at_end else segment_start_ms
+        self._event_playback_ms = float(target_ms)
+        self._event_segment_active = True
+        self.request_seek(self._from_ms(target_ms))
+        
+        # Move Summarization camera to event position if available
+        if self._use_event_summary and camera_xyz is not None:
+            self._move_summarization_camera(camera_xyz)
     
     def _go_to_next_event(self):
-        """Jump to next event in summary."""
-        if not self._event_summary:
+        """Jump to next segment in the event schedule."""
+        if not self._event_schedule:
             return
         
-        self._current_event_index = (self._current_event_index + 1) % len(self._event_summary)
+        self._current_event_index = (self._current_event_index + 1) % len(self._event_schedule)
         self._go_to_current_event()
     
     def go_to_next_event(self):
         """Manually jump to next event (for Next Event button)."""
-        if self._event_summary:
+        if not self._event_schedule:
+            self._build_event_schedule()
+        if self._event_schedule:
             self._go_to_next_event()
-            # Reset event playback timer when manually jumping
-            self._event_playback_start_time = None
+            # Restart segment timing from the jumped-to segment start
+            self._event_segment_active = False
+    
+    def get_event_schedule(self) -> List[Tuple[int, int, Optional[Tuple[float, float, float]]]]:
+        """Get compiled event schedule [(segment_start_ms, segment_end_ms, camera_xyz)]."""
+        return list(self._event_schedule)
+    
+    def get_event_summary_duration(self) -> float:
+        """Get exact playback length of the event summary in dataset seconds (speed 1.0)."""
+        return sum(end_ms - start_ms for start_ms, end_ms, _ in self._event_schedule) / 1000.0
+    
+    def set_event_playback_duration(self, seconds: float):
+        """Set per-event playback length and recompile the schedule."""
+        self._event_playback_duration = max(0.001, seconds)
+        if self._event_summary:
+            self._build_event_schedule()
     
     # Getter methods for UI
     def get_start_time(self) -> datetime.datetime:
@@ -505,7 +731,56 @@ class TimeTravelCore:
         return self._playback_speed
     
     def set_playback_speed(self, speed: float):
-        self._playback_speed = max(0.1, speed)
+        """Set playback speed. Negative values play in reverse (minimum magnitude 0.1)."""
+        magnitude = max(0.1, abs(speed))
+        self._playback_speed = -magnitude if speed < 0 else magnitude
+    
+    def build_adaptive_speed_schedule(self) -> bool:
+        """
+        Compute the activity-adaptive speed schedule from the trajectory data.
+        Quiet periods (no object pair within proximity_threshold on XZ) play at
+        quiet_speed, near-contact periods (padded by margin_seconds) at active_speed.
+        Factors multiply the Speed field; stage time itself is never remapped,
+        so the timestamp overlay stays correct.
+        """
+        if not self._data:
+            carb.log_warn("[TimeTravel] No trajectory data for adaptive speed schedule")
+            return False
+        
+        settings = self._adaptive_settings
+        self._adaptive_schedule = trajectory_analysis.build_speed_schedule(
+            self._data,
+            threshold=float(settings["proximity_threshold"]),
+            quiet_speed=float(settings["quiet_speed"]),
+            active_speed=float(settings["active_speed"]),
+            margin_ms=int(float(settings["margin_seconds"]) * 1000)
+        )
+        
+        active_seconds = sum(end_ms - start_ms for start_ms, end_ms, speed in self._adaptive_schedule
+                             if speed == settings["active_speed"]) / 1000.0
+        carb.log_info(f"[TimeTravel] Adaptive speed schedule: {len(self._adaptive_schedule)} segments, "
+                      f"{active_seconds:.1f}s near contact, "
+                      f"video length {self.get_adaptive_video_duration():.1f}s")
+        return True
+    
+    def set_use_adaptive_speed(self, use: bool) -> bool:
+        """Enable/disable adaptive speed. Builds the schedule on first use."""
+        if use and not self._adaptive_schedule and not self.build_adaptive_speed_schedule():
+            self._use_adaptive_speed = False
+            return False
+        self._use_adaptive_speed = use
+        return True
+    
+    def is_adaptive_speed(self) -> bool:
+        return self._use_adaptive_speed
+    
+    def get_adaptive_schedule(self) -> List[Tuple[int, int, float]]:
+        """Get adaptive speed schedule [(start_ms, end_ms, speed_factor)]."""
+        return list(self._adaptive_schedule)
+    
+    def get_adaptive_video_duration(self) -> float:
+        """Video length in seconds for the full range with adaptive factors (Speed field = 1.0)."""
+        return trajectory_analysis.schedule_video_duration(self._adaptive_schedule)
     
     def has_data(self) -> bool:
         return len(self._timestamps) > 0
@@ -516,22 +791,30 @@ class TimeTravelCore:
     def set_use_event_summary(self, use: bool):
         self._use_event_summary = use
         self._current_event_index = 0
+        self._event_segment_active = False
+        if use:
+            self._build_event_schedule()
+    
+    def get_prim_map(self) -> Dict[str, str]:
+        """Get objid -> prim path mapping of Time Travel objects."""
+        return dict(self._prim_map)
+    
+    def get_current_positions(self) -> Dict[str, Tuple[float, float, float]]:
+        """Get {objid: (x, y, z)} as last written to the stage (prim local translate). Read-only."""
+        return self._current_positions
     
     def get_summary_events(self) -> List[str]:
         """Get list of event timestamps (API for future AI integration)."""
         return self._event_summary.copy()
     
-    def _move_summarization_camera_to_event(self, timestamp: str):
+    def _move_summarization_camera(self, position: Tuple[float, float, float]):
         """
         Move Summarization camera to event position.
         Uses object's x and z coordinates, maintains fixed height and rotation.
         
         Args:
-            timestamp: Event timestamp string
+            position: Event object position (x, y, z)
         """
-        if timestamp not in self._event_positions:
-            return
-        
         try:
             if not self._stage:
                 self._stage = self._usd_context.get_stage()
@@ -549,7 +832,7 @@ class TimeTravelCore:
                 return
             
             # Get object position from event
-            obj_x, obj_y, obj_z = self._event_positions[timestamp]
+            obj_x, obj_y, obj_z = position
             
             # Set camera position: use object's x and z, fixed camera height
             camera_position = Gf.Vec3d(obj_x, self._summarization_camera_height, obj_z)
@@ -634,7 +917,7 @@ class TimeTravelCore:
             # Update event summary and positions
             self._event_summary = event_timestamps
             self._event_positions = event_positions
-            self._current_event_index = 0
+            self._build_event_schedule()
             
             carb.log_info(f"[TimeTravel] Loaded {len(event_timestamps)} event timestamps with positions")
             return True
@@ -676,8 +959,15 @@ class TimeTravelCore:
         # Clear memory data
         self._data.clear()
         self._timestamps.clear()
+        self._timestamp_ms = []
+        self._keyframes = []
+        self._adaptive_schedule = []
+        self._use_adaptive_speed = False
         self._prim_map.clear()
+        self._current_positions = {}
         self._event_summary.clear()
+        self._event_schedule = []
+        self._event_segment_active = False
         
         # Reset time tracking
         self._start_time = None
@@ -796,21 +1086,43 @@ class TimeTravelCore:
     # ------------------------------------------------------------------
     # Event Processing Methods
     # ------------------------------------------------------------------
-    def process_event_json(self, json_path: str) -> bool:
+    def process_event_json(
+        self,
+        json_path: str,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        seek_index: Optional[tuple] = None,
+    ) -> bool:
         """
         Process VLM event detection JSON file.
         
         Steps:
-        1. Import and use Event_Post_Processing functions to convert to JSONL
-        2. Load JSONL and extract first object positions
-        3. Save position data to JSONL
+        1. Import and use Event_Post_Processing functions to consolidate events
+        2. Extract first object positions
+        3. Save the consolidated events (intermediate JSONL) and position data (event list JSONL)
+        
+        Safe to call from a worker thread (EventProcessingWindow runs it on the shared executor)
+        when seek_index is taken on the main thread beforehand.
         
         Args:
             json_path: Path to VLM output JSON file
+            progress_callback: Optional fn(fraction, message) called between steps and per event
+            cancel_event: Optional event; when set, processing stops before writing any output
+            seek_index: Trajectory snapshot from snapshot_seek_index() (default: taken now)
             
         Returns:
-            True if successful, False otherwise
+            True if successful, False otherwise (also when cancelled)
         """
+        def report(fraction: float, message: str):
+            if progress_callback:
+                progress_callback(fraction, message)
+
+        def cancelled() -> bool:
+            if cancel_event is not None and cancel_event.is_set():
+                carb.log_warn("[TimeTravel] Event processing cancelled")
+                return True
+            return False
+
         try:
             from pathlib import Path
             
@@ -828,27 +1140,45 @@ class TimeTravelCore:
             
             # Step 1: Load and process JSON data
             carb.log_info("[TimeTravel] Step 1: Converting JSON to JSONL...")
+            report(0.0, "Converting JSON to JSONL...")
             
+            if seek_index is None:
+                seek_index = self.snapshot_seek_index()
             vlm_data = load_json(str(json_path))
             events = consolidate_events(vlm_data, base_date="2025-01-01")
-            # Save processed JSONL to intermediate_results directory (same level as outputs)
-            output_processed_dir = json_path.parent.parent / "intermediate_results"
-            output_processed_dir.mkdir(exist_ok=True)
-            output_jsonl = output_processed_dir / f"{json_path.stem}_intermediate.jsonl"
-            save_jsonl(events, str(output_jsonl))
-            
-            carb.log_info(f"[TimeTravel] JSONL saved: {output_jsonl}")
             carb.log_info(f"[TimeTravel] Processed {len(events)} unique timestamps")
             
+            if cancelled():
+                return False
+
             # Step 2: Extract first object positions
             carb.log_info("[TimeTravel] Step 2: Extracting first object positions...")
+            report(0.1, f"Extracting positions for {len(events)} timestamps...")
 
-            event_list = self._generate_event_list(events)
+            # 진행률은 0.1 ~ 0.9 구간을 이벤트 수에 비례해 사용
+            event_list = self._generate_event_list(
+                events,
+                progress_callback=lambda done, total: report(0.1 + 0.8 * done / max(total, 1),
+                                                             f"Extracting positions ({done}/{total})"),
+                cancel_event=cancel_event,
+                seek_index=seek_index,
+            )
+            if cancelled():
+                return False
 
             if not event_list:
                 carb.log_error("[TimeTravel] No event list data extracted")
                 return False
-            # Step 3: Create event_lists directory and save event list data (same level as outputs)
+            # Step 3: 모든 단계가 끝난 뒤에만 저장 (취소 시 결과 파일이 남지 않음)
+            report(0.9, "Saving event list...")
+            # Save processed JSONL to intermediate_results directory (same level as outputs)
+            output_processed_dir = json_path.parent.parent / "intermediate_results"
+            output_processed_dir.mkdir(exist_ok=True)
+            output_jsonl = output_processed_dir / f"{json_path.stem}_intermediate.jsonl"
+            save_jsonl(events, str(output_jsonl))
+            carb.log_info(f"[TimeTravel] JSONL saved: {output_jsonl}")
+            
+            # Create event_lists directory and save event list data (same level as outputs)
             event_lists_dir = json_path.parent.parent / "event_list"
             event_lists_dir.mkdir(exist_ok=True)
 
@@ -860,6 +1190,7 @@ class TimeTravelCore:
 
             carb.log_info(f"[TimeTravel] event list data saved: {event_lists_dir_jsonl}")
             carb.log_info(f"[TimeTravel] Processed {len(event_list)} events")
+            report(1.0, f"Processed {len(event_list)} events")
 
             return True
             
@@ -869,7 +1200,13 @@ class TimeTravelCore:
             carb.log_error(traceback.format_exc())
             return False
 
-    def _generate_event_list(self, events: Dict[str, List[List[str]]]) -> list:
+    def _generate_event_list(
+        self,
+        events: Dict[str, List[List[str]]],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        seek_index: Optional[tuple] = None,
+    ) -> list:
         """
         각 이벤트의 첫 번째 객체의 위치를 추출.
         그리고 extension의 내부 메모리 데이터를 사용하여 첫 객체의 위치 정보 확보.
@@ -878,6 +1215,9 @@ class TimeTravelCore:
         Args:
             events: Dictionary mapping timestamp to list of object ID groups
                     Example: {"2025-01-01 00:00:28.000": [["obj001", "obj004"]]}
+            progress_callback: Optional fn(done, total) called per timestamp
+            cancel_event: Optional event; when set, stops and returns what was extracted so far
+            seek_index: Trajectory snapshot from snapshot_seek_index() (default: live data)
             
         Returns:
             List of dictionaries with timestamp, objid, and position
@@ -885,7 +1225,12 @@ class TimeTravelCore:
         position_data = []
         
         try:
-            for timestamp, obj_pairs in events.items():
+            total = len(events)
+            for index, (timestamp, obj_pairs) in enumerate(events.items()):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                if progress_callback:
+                    progress_callback(index, total)
                 if not obj_pairs or not obj_pairs[0]:
                     continue
                 
@@ -895,7 +1240,7 @@ class TimeTravelCore:
                 # Parse timestamp and get position from in-memory data
                 try:
                     time_obj = self._parse_timestamp(timestamp)
-                    time_data = self.get_data_at_time(time_obj)
+                    time_data = self.get_data_at_time(time_obj, seek_index)
                     
                     if first_objid in time_data:
                         x, y, z = time_data[first_objid]
@@ -6,8 +6,9 @@ Converts timestamps and object IDs to match core.py in-memory format.
 
 import json
 import argparse
+import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from collections import defaultdict
 
 
@@ -86,7 +87,57 @@ def format_objid_for_core(obj_num: int) -> str:
     return f"obj{obj_num:03d}"
 
 
-def consolidate_events(data: Dict[str, Any], base_date: str = "2025-01-01") -> Dict[str, List[List[str]]]:
+def load_time_map(file_path: str) -> Dict[str, Any]:
+    """
+    Load a stitched-video time map sidecar (written by utils/event_window_video.py).
+    Format: {"segments": [{"video_start": 0.0, "video_end": 4.0,
+                           "data_start": "2025-01-01 00:00:27.000", "data_end": "2025-01-01 00:00:31.000"}, ...],
+             "overlay_clock": "dataset" | "video", "speed": 1.0, ...}
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def restore_timestamp(time_str: str, time_map: Dict[str, Any]) -> str:
+    """
+    Restore a VLM timestamp (HH:MM:SS) reported on a stitched video to dataset time.
+    
+    The VLM reads the time from the rendered overlay, so the map's "overlay_clock" decides
+    the mapping (maps written before the field existed always rendered dataset time):
+    - "dataset": the overlay already shows dataset time -> returned unchanged
+    - "video": elapsed seconds in the stitched video -> mapped through the segment that contains it
+    
+    Returns:
+        Time in "HH:MM:SS" format (dataset time); unchanged if no segment matches
+    """
+    overlay_clock = time_map.get("overlay_clock", "dataset")
+    if overlay_clock == "dataset":
+        return time_str
+    if overlay_clock != "video":
+        raise ValueError(f"Unknown time map overlay_clock: {overlay_clock}")
+    
+    segments = time_map.get("segments", [])
+    speed = float(time_map.get("speed", 1.0))
+    try:
+        hours, minutes, seconds = (int(part) for part in time_str.split(":"))
+    except ValueError:
+        return time_str
+    
+    video_seconds = hours * 3600 + minutes * 60 + seconds
+    for segment in segments:
+        if segment["video_start"] <= video_seconds < segment["video_end"]:
+            data_start = datetime.datetime.strptime(segment["data_start"], "%Y-%m-%d %H:%M:%S.%f")
+            restored = data_start + datetime.timedelta(seconds=(video_seconds - segment["video_start"]) * speed)
+            return restored.strftime("%H:%M:%S")
+    
+    return time_str
+
+
+def consolidate_events(
+    data: Dict[str, Any],
+    base_date: str = "2025-01-01",
+    time_map: Optional[Dict[str, Any]] = None
+) -> Dict[str, List[List[str]]]:
     """
     VLM 의 chunk_responses 에서 모든 이벤트를 통합하여 정돈된 json 포맷으로 변환합니다.
     Consolidate all events from chunk_responses and convert to organized JSON format.
@@ -94,6 +145,8 @@ def consolidate_events(data: Dict[str, Any], base_date: str = "2025-01-01") -> D
     Args:
         data: The loaded JSON data
         base_date: Base date for timestamp conversion
+        time_map: Optional stitched-video time map (see load_time_map).
+                  Defaults to data["time_map"] when the VLM output carries one.
     
     Returns:
         Dictionary mapping timestamp to list of object ID groups
@@ -101,6 +154,9 @@ def consolidate_events(data: Dict[str, Any], base_date: str = "2025-01-01") -> D
     """
     consolidated = defaultdict(list)
     
+    if time_map is None:
+        time_map = data.get("time_map")
+    
     chunk_responses = data.get("chunk_responses", [])
     
     for chunk in chunk_responses:
@@ -111,6 +167,9 @@ def consolidate_events(data: Dict[str, Any], base_date: str = "2025-01-01") -> D
             # Each event is like {"00:00:28": [1, 4]}
             for timestamp, obj_list in event.items():
                 if obj_list:  # Only add non-empty lists
+                    # Stitched video: restore true dataset time
+                    if time_map:
+                        timestamp = restore_timestamp(timestamp, time_map)
                     # Convert timestamp to core.py format
                     formatted_timestamp = format_timestamp_for_core(timestamp, base_date)
                     # Convert object IDs to core.py format
@@ -209,6 +268,12 @@ def main():
         action="store_true",
         help="Also save a summary JSON file"
     )
+    parser.add_argument(
+        "--time-map",
+        type=str,
+        default=None,
+        help="Time map sidecar of a stitched video (*.timemap.json) to restore dataset timestamps"
+    )
     parser.add_argument(
         "--date",
         type=str,
@@ -229,7 +294,8 @@ def main():
     
     # Process events
     print(f"Processing events with base date: {args.date}")
-    events = consolidate_events(data, base_date=args.date)
+    time_map = load_time_map(args.time_map) if args.time_map else None
+    events = consolidate_events(data, base_date=args.date, time_map=time_map)
     
     # Print statistics
     print_statistics(events)
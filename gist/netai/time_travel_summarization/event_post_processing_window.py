@@ -4,6 +4,8 @@ import omni.ui as ui
 import carb
 from pathlib import Path
 
+from .task_executor import get_executor
+
 
 class EventProcessingWindow:
     """Window for processing VLM event detection results."""
@@ -17,12 +19,15 @@ class EventProcessingWindow:
         self._json_filename_model = ui.SimpleStringModel("video_18_20251113_232343.json")
         self._status_label = None
         self._process_button = None
+        self._cancel_button = None
+        self._progress_bar = None
+        self._task = None  # TaskHandle of the running post-processing
         
         self._build_ui()
     
     def _build_ui(self):
         """Build the event processing window UI."""
-        self._window = ui.Window("Event Post Processing", width=400, height=300)
+        self._window = ui.Window("Event Post Processing", width=400, height=320)
         
         with self._window.frame:
             with ui.VStack(spacing=10, style={"margin": 3}):
@@ -41,8 +46,14 @@ class EventProcessingWindow:
                 
                 ui.Spacer(height=5)
 
-                # Process Button
-                self._process_button = ui.Button("Process Events", height=40, clicked_fn=self._on_process_clicked)
+                # Process / Cancel Buttons
+                with ui.HStack(height=40, spacing=5):
+                    self._process_button = ui.Button("Process Events", clicked_fn=self._on_process_clicked)
+                    self._cancel_button = ui.Button("Cancel", width=70, clicked_fn=self._on_cancel_clicked)
+                    self._cancel_button.enabled = False
+                
+                # Progress
+                self._progress_bar = ui.ProgressBar(height=8)
                 
                 ui.Spacer(height=5)
                 
@@ -76,28 +87,74 @@ class EventProcessingWindow:
         
         self._update_status("Processing events...", processing=True)
         self._process_button.enabled = False
+        self._cancel_button.enabled = True
+        self._progress_bar.model.set_value(0.0)
         
-        try:
-            # Call core to process events
-            success = self._core.process_event_json(str(json_path))
-            
-            if success:
-                self._update_status("Events processed successfully!\n" + 
-                                  f"- JSONL saved\n" +
-                                  f"- Position data extracted\n" +
-                                  f"Check vlm_outputs/ folder for results.", 
-                                  success=True)
-            else:
-                self._update_status("✗ Event processing failed. Check console for details.", error=True)
+        # Run on the shared worker pool so the UI keeps its frame rate; callbacks arrive on the main loop.
+        # The trajectory index is copied here so a data reload during processing cannot race the worker.
+        self._task = get_executor().submit(
+            self._process,
+            str(json_path),
+            self._core.snapshot_seek_index(),
+            name="EventProcessing",
+            pass_context=True,
+            on_done=self._on_process_done,
+            on_progress=self._on_process_progress,
+        )
+    
+    def _process(self, json_path: str, seek_index: tuple, context) -> bool:
+        """Worker thread: run the core post-processing with progress and cancellation."""
+        return self._core.process_event_json(
+            json_path,
+            progress_callback=context.report,
+            cancel_event=context.cancel_event,
+            seek_index=seek_index,
+        )
+    
+    def _on_cancel_clicked(self):
+        """Handle cancel button click."""
+        if self._task and self._task.cancel():
+            self._update_status("Cancelling...", processing=True)
+            self._cancel_button.enabled = False
+    
+    def _on_process_progress(self, task):
+        """Show worker progress (main loop)."""
+        if self._task is not task or not self._window:
+            return
+        if task.progress is not None:
+            self._progress_bar.model.set_value(task.progress)
+        if task.message:
+            self._update_status(task.message, processing=True)
+    
+    def _on_process_done(self, task):
+        """Show the result of the worker (main loop)."""
+        if self._task is task:
+            self._task = None
+        if not self._window:
+            return
+        self._process_button.enabled = True
+        self._cancel_button.enabled = False
         
-        except Exception as e:
-            self._update_status(f"✗ Error: {str(e)}", error=True)
-            carb.log_error(f"[EventWindow] Processing error: {e}")
-            import traceback
-            carb.log_error(traceback.format_exc())
+        if task.cancelled():
+            self._progress_bar.model.set_value(0.0)
+            self._update_status("Event processing cancelled.", error=True)
+            return
         
-        finally:
-            self._process_button.enabled = True
+        error = task.exception()
+        if error is not None:
+            self._update_status(f"✗ Error: {str(error)}", error=True)
+            carb.log_error(f"[EventWindow] Processing error: {error}")
+            import traceback
+            carb.log_error("".join(traceback.format_exception(type(error), error, error.__traceback__)))
+        elif task.result():
+            self._progress_bar.model.set_value(1.0)
+            self._update_status("Events processed successfully!\n" + 
+                              f"- JSONL saved\n" +
+                              f"- Position data extracted\n" +
+                              f"Check vlm_outputs/ folder for results.", 
+                              success=True)
+        else:
+            self._update_status("✗ Event processing failed. Check console for details.", error=True)
     
     def _update_status(self, message: str, error=False, success=False, processing=False):
         """Update status label with color coding."""
@@ -115,6 +172,9 @@ class EventProcessingWindow:
     
     def destroy(self):
         """Clean up the window."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
         if self._window:
             self._window.destroy()
             self._window = None
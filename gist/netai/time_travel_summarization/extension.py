@@ -13,6 +13,7 @@ from .core import TimeTravelCore
 from .event_post_processing_window import EventProcessingWindow
 from .vlm_client_core import VLMClientCore
 from .vlm_client_window import VLMClientWindow
+from .task_executor import shutdown_executor
 
 # Optional imports for overlay (with error handling)
 try:
@@ -116,7 +117,7 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
         if self._window:
             self._window.update_ui()
         
-        # Note: ViewOverlay updates itself via frame subscription
+        # Note: ViewOverlay updates itself via the core's frame changed signal
         # No need to call update() manually
     
     def on_shutdown(self):
@@ -153,8 +154,13 @@ class NetAITimetravelDreamAI(omni.ext.IExt):
         
         # Clean up VLM Client core
         if hasattr(self, '_vlm_client_core'):
+            if self._vlm_client_core:
+                self._vlm_client_core.shutdown()
             self._vlm_client_core = None
         
+        # Stop the shared background executor (cancels tasks left by the windows)
+        shutdown_executor()
+        
         # Clean up overlay window (OPTIONAL)
         if hasattr(self, '_overlay_control') and self._overlay_control:
             try:
@@ -0,0 +1,141 @@
+"""
+Label Layout
+Screen-space culling and decluttering for overlay labels (pure NumPy).
+Used by view_overlay_core.py; kept free of omni / carb / pxr so it can be reused by
+offline renderers and checked outside Omniverse.
+
+Matrices follow the Gf / USD row-vector convention: clip = [x y z 1] @ view @ projection.
+Screen coordinates are pixels with the origin at the top-left corner.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+OFFSET = "offset"  # move overlapping labels to a free slot around their anchor
+
+# Candidate slots for OFFSET, in units of the cell size (nearest first)
+_OFFSET_SLOTS = [
+    (0.0, -1.0), (1.0, 0.0), (0.0, 1.0), (-1.0, 0.0),
+    (0.75, -0.75), (0.75, 0.75), (-0.75, 0.75), (-0.75, -0.75),
+    (0.0, -2.0), (2.0, 0.0), (0.0, 2.0), (-2.0, 0.0),
+]
+
+
+def project(
+    points: np.ndarray,
+    view_projection: np.ndarray,
+    width: float,
+    height: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Project world points (N, 3) to screen pixels.
+
+    Returns:
+        screen (N, 2) pixels, ndc_z (N,), in_front (N,) bool (w > 0)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    clip = np.hstack([points, np.ones((len(points), 1))]) @ view_projection
+    w = clip[:, 3]
+    in_front = w > 1e-9
+    safe_w = np.where(in_front, w, 1.0)
+    ndc = clip[:, :3] / safe_w[:, None]
+    screen = np.empty((len(points), 2))
+    screen[:, 0] = (ndc[:, 0] + 1.0) * 0.5 * width
+    screen[:, 1] = (1.0 - ndc[:, 1]) * 0.5 * height
+    return screen, ndc[:, 2], in_front
+
+
+def unproject(
+    screen: np.ndarray,
+    ndc_z: np.ndarray,
+    inverse_view_projection: np.ndarray,
+    width: float,
+    height: float,
+) -> np.ndarray:
+    """Inverse of project for points in front of the camera: pixels + ndc depth -> world (N, 3)."""
+    screen = np.asarray(screen, dtype=np.float64).reshape(-1, 2)
+    ndc = np.empty((len(screen), 4))
+    ndc[:, 0] = screen[:, 0] / width * 2.0 - 1.0
+    ndc[:, 1] = 1.0 - screen[:, 1] / height * 2.0
+    ndc[:, 2] = ndc_z
+    ndc[:, 3] = 1.0
+    world = ndc @ inverse_view_projection
+    return world[:, :3] / world[:, 3:4]
+
+
+def cull(
+    screen: np.ndarray,
+    in_front: np.ndarray,
+    width: float,
+    height: float,
+    padding=0.0,
+) -> np.ndarray:
+    """Visible mask: in front of the camera and inside the viewport grown by padding pixels (scalar or (N,))."""
+    return (in_front
+            & (screen[:, 0] >= -padding) & (screen[:, 0] <= width + padding)
+            & (screen[:, 1] >= -padding) & (screen[:, 1] <= height + padding))
+
+
+def declutter(
+    screen: np.ndarray,
+    visible: np.ndarray,
+    min_distance: float,
+    mode: str = OFFSET,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resolve label overlaps with a uniform grid spatial hash (cell size = min_distance).
+
+    Labels are placed in index order; each one is checked only against already placed
+    labels in its own and the 8 neighbouring cells, so the pass is O(n) for bounded density.
+
+    Args:
+        screen: (N, 2) label centers in pixels
+        visible: (N,) labels to lay out (others are ignored)
+        min_distance: Minimum center distance in pixels (label diameter)
+        mode: OFFSET (move to the nearest free slot, hide if none)
+
+    Returns:
+        offsets (N, 2) pixels to add to screen, hidden (N,) bool
+    """
+    if mode != OFFSET:
+        raise ValueError(f"Unknown declutter mode: {mode}")
+
+    count = len(screen)
+    offsets = np.zeros((count, 2))
+    hidden = np.zeros(count, dtype=bool)
+    if min_distance <= 0 or count < 2:
+        return offsets, hidden
+
+    grid = {}
+    min_distance_sq = min_distance * min_distance
+
+    def is_free(x, y):
+        cx, cy = int(x // min_distance), int(y // min_distance)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for px, py in grid.get((cx + dx, cy + dy), ()):
+                    if (px - x) ** 2 + (py - y) ** 2 < min_distance_sq:
+                        return False
+        return True
+
+    def place(x, y):
+        grid.setdefault((int(x // min_distance), int(y // min_distance)), []).append((x, y))
+
+    points = screen.tolist()  # plain floats: much faster than NumPy scalars in this loop
+    for index in np.flatnonzero(visible).tolist():
+        x, y = points[index]
+        if is_free(x, y):
+            place(x, y)
+            continue
+
+        for sx, sy in _OFFSET_SLOTS:
+            nx, ny = x + sx * min_distance, y + sy * min_distance
+            if is_free(nx, ny):
+                offsets[index] = (nx - x, ny - y)
+                place(nx, ny)
+                break
+        else:
+            hidden[index] = True
+
+    return offsets, hidden
@@ -0,0 +1,301 @@
+"""
+Shared background task executor for the extension windows.
+
+Blocking work (event post-processing, hashing, file IO) runs on one bounded thread pool, and
+request coroutines run on Kit's main event loop, both behind the same TaskHandle API:
+progress, cancellation and completion callbacks. Callbacks are always delivered on the main
+loop, so windows can update omni.ui widgets from them directly.
+
+Worker size: TIME_TRAVEL_WORKERS environment variable (default 4).
+This module must not import omni.ui so the core modules can use it.
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import carb
+
+
+class TaskCancelled(RuntimeError):
+    """Raised inside a blocking task when its handle was cancelled (see TaskContext.check_cancelled)."""
+
+
+class TaskContext:
+    """
+    Passed to blocking tasks submitted with pass_context=True.
+    Lets the worker report progress and notice cancellation.
+    """
+
+    def __init__(self, handle: "TaskHandle"):
+        self._handle = handle
+
+    @property
+    def cancel_event(self) -> threading.Event:
+        """Set when the task is cancelled (hand it to APIs that take a cancel_event)."""
+        return self._handle._cancel_event
+
+    @property
+    def cancelled(self) -> bool:
+        return self._handle._cancel_event.is_set()
+
+    def check_cancelled(self) -> None:
+        """Raise TaskCancelled if the task was cancelled."""
+        if self.cancelled:
+            raise TaskCancelled(f"Task cancelled: {self._handle.name}")
+
+    def report(self, fraction: Optional[float] = None, message: str = "") -> None:
+        """Report progress (0.0 - 1.0) and an optional message; thread-safe."""
+        self._handle._set_progress(fraction, message)
+
+
+class TaskHandle:
+    """
+    Future-like handle of a submitted task.
+    add_done_callback / on_progress callbacks run on the main loop.
+    """
+
+    PROGRESS_INTERVAL = 0.1  # 진행률 callback 최소 간격 (초)
+
+    def __init__(self, executor: "BackgroundExecutor", task_id: int, name: str):
+        self.id = task_id
+        self.name = name
+        self.progress: Optional[float] = None
+        self.message = ""
+        self.started_at = time.time()
+        self._executor = executor
+        self._cancel_event = threading.Event()
+        self._future = None  # concurrent.futures.Future 또는 asyncio.Task
+        self._done_callbacks: List[Callable[["TaskHandle"], None]] = []
+        self._progress_callbacks: List[Callable[["TaskHandle"], None]] = []
+        self._last_progress_report = 0.0
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def cancelled(self) -> bool:
+        """True if the task was cancelled (before or while running)."""
+        if self._future is not None and self._future.done() and self._future.cancelled():
+            return True
+        return self._cancel_event.is_set() and self.done()
+
+    def result(self) -> Any:
+        """Result of a finished task; raises its exception (or CancelledError)."""
+        if not self.done():
+            raise concurrent.futures.InvalidStateError(f"Task not finished: {self.name}")
+        return self._future.result()
+
+    def exception(self) -> Optional[BaseException]:
+        if not self.done() or self._future.cancelled():
+            return None
+        return self._future.exception()
+
+    def cancel(self) -> bool:
+        """
+        Request cancellation. Queued thread tasks never start; running thread tasks see
+        TaskContext.cancelled; coroutines receive CancelledError.
+        """
+        self._cancel_event.set()
+        if self._future is None or self._future.done():
+            return False
+        self._future.cancel()
+        return True
+
+    # ------------------------------------------------------------------
+    # callbacks (main loop)
+    # ------------------------------------------------------------------
+    def add_done_callback(self, fn: Callable[["TaskHandle"], None]) -> None:
+        """Call fn(handle) on the main loop when the task finishes (immediately if already done)."""
+        if self.done():
+            self._executor._call_on_main(fn, self)
+        else:
+            self._done_callbacks.append(fn)
+
+    def add_progress_callback(self, fn: Callable[["TaskHandle"], None]) -> None:
+        """Call fn(handle) on the main loop when progress / message change (throttled)."""
+        self._progress_callbacks.append(fn)
+
+    def _set_progress(self, fraction: Optional[float], message: str) -> None:
+        self.progress = fraction
+        self.message = message
+        now = time.perf_counter()
+        finished = fraction is not None and fraction >= 1.0
+        if not finished and now - self._last_progress_report < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress_report = now
+        for fn in list(self._progress_callbacks):
+            self._executor._call_on_main(fn, self)
+
+    def _finish(self) -> None:
+        """Run done callbacks; called on the main loop."""
+        self._executor._forget(self)
+        callbacks, self._done_callbacks = self._done_callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception as e:
+                carb.log_error(f"[TaskExecutor] Callback of '{self.name}' failed: {e}")
+
+
+class BackgroundExecutor:
+    """
+    Bounded executor shared by the windows.
+
+    Args:
+        max_workers: Thread pool size for blocking tasks, also the limit of concurrently
+                     running coroutines (extra ones wait for a slot)
+        loop: Main event loop for callbacks (default: the loop of the creating thread)
+    """
+
+    def __init__(self, max_workers: int = 4, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.max_workers = max(1, max_workers)
+        self._loop = loop or asyncio.get_event_loop()
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="TimeTravelWorker"
+        )
+        self._slots = None  # asyncio.Semaphore, main loop 에서 처음 사용할 때 생성
+        self._ids = itertools.count(1)
+        self._tasks: Dict[int, TaskHandle] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # 제출
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        name: Optional[str] = None,
+        pass_context: bool = False,
+        on_done: Optional[Callable[[TaskHandle], None]] = None,
+        on_progress: Optional[Callable[[TaskHandle], None]] = None,
+        **kwargs,
+    ) -> TaskHandle:
+        """
+        Run blocking fn(*args, **kwargs) on the thread pool.
+        With pass_context=True, fn also receives context=TaskContext for progress / cancellation.
+        """
+        handle = self._new_handle(name or getattr(fn, "__name__", "task"), on_done, on_progress)
+        if pass_context:
+            kwargs["context"] = TaskContext(handle)
+
+        def run():
+            # 실행 직전에 취소됐으면 시작하지 않음
+            if handle._cancel_event.is_set():
+                raise TaskCancelled(f"Task cancelled: {handle.name}")
+            return fn(*args, **kwargs)
+
+        future = self._pool.submit(run)
+        handle._future = future
+        future.add_done_callback(lambda _: self._call_on_main(lambda: handle._finish()))
+        return handle
+
+    def run_coroutine(
+        self,
+        coroutine,
+        name: Optional[str] = None,
+        on_done: Optional[Callable[[TaskHandle], None]] = None,
+        on_progress: Optional[Callable[[TaskHandle], None]] = None,
+    ) -> TaskHandle:
+        """Schedule a coroutine on the main loop (call from the main thread). At most max_workers run at once."""
+        handle = self._new_handle(name or getattr(coroutine, "__name__", "coroutine"), on_done, on_progress)
+
+        async def run():
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.max_workers)
+            async with self._slots:
+                return await coroutine
+
+        def finished(_):
+            # 시작 전(슬롯 대기 중)에 취소되면 coroutine 이 실행되지 않으므로 닫아서 경고 방지
+            coroutine.close()
+            handle._finish()
+
+        task = asyncio.ensure_future(run(), loop=self._loop)
+        handle._future = task
+        task.add_done_callback(finished)
+        return handle
+
+    async def run_blocking(self, fn: Callable[..., Any], *args) -> Any:
+        """Await blocking fn(*args) on the shared pool from a coroutine."""
+        return await self._loop.run_in_executor(self._pool, fn, *args)
+
+    # ------------------------------------------------------------------
+    # 조회 / 종료
+    # ------------------------------------------------------------------
+    def running(self) -> List[TaskHandle]:
+        """Handles of unfinished tasks."""
+        with self._lock:
+            return list(self._tasks.values())
+
+    def cancel_all(self) -> int:
+        handles = self.running()
+        for handle in handles:
+            handle.cancel()
+        return len(handles)
+
+    def shutdown(self) -> None:
+        """Cancel all tasks and stop the pool without waiting for running threads."""
+        self._closed = True
+        self.cancel_all()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _new_handle(self, name, on_done, on_progress) -> TaskHandle:
+        if self._closed:
+            raise RuntimeError("BackgroundExecutor is shut down")
+        handle = TaskHandle(self, next(self._ids), name)
+        if on_done:
+            handle.add_done_callback(on_done)
+        if on_progress:
+            handle.add_progress_callback(on_progress)
+        with self._lock:
+            self._tasks[handle.id] = handle
+        return handle
+
+    def _forget(self, handle: TaskHandle) -> None:
+        with self._lock:
+            self._tasks.pop(handle.id, None)
+
+    def _call_on_main(self, fn: Callable, *args) -> None:
+        """Run fn(*args) on the main loop (directly if already on it)."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._loop.call_soon(fn, *args)
+            return
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(fn, *args)
+
+
+_executor: Optional[BackgroundExecutor] = None
+
+
+def get_executor() -> BackgroundExecutor:
+    """Shared executor, created on first use (call first from the main thread)."""
+    global _executor
+    if _executor is None:
+        _executor = BackgroundExecutor(max_workers=int(os.environ.get("TIME_TRAVEL_WORKERS", 4)))
+        carb.log_info(f"[TaskExecutor] Started with {_executor.max_workers} workers")
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Cancel shared tasks and release the pool (extension shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -9,3 +9,9 @@
 # its affiliates is strictly prohibited.
 
 from .test_hello_world import *
+from .test_time_map import *
+from .test_trajectory_analysis import *
+from .test_label_layout import *
+from .test_label_atlas import *
+from .test_upload_cache import *
+from .test_vss_segmenter import *
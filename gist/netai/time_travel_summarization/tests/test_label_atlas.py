@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+
+import numpy as np
+import omni.kit.test
+
+from .. import view_overlay_core
+
+
+def _cells(atlas: np.ndarray, count: int, cell_size: int):
+    columns = max(1, int(np.ceil(np.sqrt(count))))
+    return [atlas[row * cell_size:(row + 1) * cell_size, col * cell_size:(col + 1) * cell_size]
+            for row, col in (divmod(index, columns) for index in range(count))]
+
+
+class TestLabelAtlas(omni.kit.test.AsyncTestCase):
+    CELL = 64
+
+    def _check_readable(self, texts, font_path):
+        atlas = view_overlay_core.build_label_atlas(texts, self.CELL, font_path)
+        cells = _cells(atlas, len(texts), self.CELL)
+        glyphs = []
+        for text, cell in zip(texts, cells):
+            # Opaque disc, transparent corners
+            self.assertEqual(cell[self.CELL // 2, 2, 3], 255)
+            self.assertEqual(cell[0, 0, 3], 0, text)
+            # Dark number pixels only inside the disc
+            dark = cell[..., 0] < 128
+            self.assertGreater(int(dark.sum()), 20, text)
+            self.assertTrue(np.all(cell[dark, 3] == 255), text)
+            glyphs.append(dark.tobytes())
+        # Every label renders to a different bitmap
+        self.assertEqual(len(set(glyphs)), len(texts))
+
+    async def test_fallback_glyphs_are_distinct(self):
+        self._check_readable([str(digit) for digit in range(10)] + ["12", "21", "108", "180"], None)
+
+    async def test_font_glyphs_are_distinct(self):
+        font_path = view_overlay_core.kit_font_path()
+        if font_path is None or view_overlay_core.ImageFont is None:
+            self.skipTest("Kit UI font or Pillow not available")
+        self._check_readable([str(digit) for digit in range(10)] + ["12", "21", "108", "180"], font_path)
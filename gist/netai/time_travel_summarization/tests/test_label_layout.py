@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+import numpy as np
+import omni.kit.test
+
+from .. import label_layout
+
+
+def _perspective(near: float = 1.0, far: float = 1000.0) -> np.ndarray:
+    """Row-vector perspective (90 deg fov, aspect 1) looking down -Z from the origin."""
+    return np.array([
+        [1.0, 0.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0, 0.0],
+        [0.0, 0.0, -(far + near) / (far - near), -1.0],
+        [0.0, 0.0, -2.0 * far * near / (far - near), 0.0],
+    ])
+
+
+class TestLabelLayout(omni.kit.test.AsyncTestCase):
+    async def test_project_unproject_round_trip(self):
+        view_projection = _perspective()
+        points = np.array([[0.0, 0.0, -10.0], [5.0, -2.0, -20.0], [0.0, 0.0, 10.0]])
+        screen, ndc_z, in_front = label_layout.project(points, view_projection, 200, 100)
+        self.assertEqual(in_front.tolist(), [True, True, False])
+        np.testing.assert_allclose(screen[0], (100.0, 50.0))
+        restored = label_layout.unproject(screen[:2], ndc_z[:2], np.linalg.inv(view_projection), 200, 100)
+        np.testing.assert_allclose(restored, points[:2], atol=1e-6)
+
+    async def test_cull_uses_padding(self):
+        screen = np.array([[-5.0, 10.0], [50.0, 50.0], [150.0, 50.0]])
+        in_front = np.array([True, True, False])
+        self.assertEqual(label_layout.cull(screen, in_front, 100, 100).tolist(), [False, True, False])
+        self.assertEqual(label_layout.cull(screen, in_front, 100, 100, padding=10.0).tolist(), [True, True, False])
+
+    async def test_declutter_keeps_every_colliding_label(self):
+        # Two labels on the same spot (collision) and one far away
+        screen = np.array([[50.0, 50.0], [51.0, 50.0], [300.0, 300.0]])
+        offsets, hidden = label_layout.declutter(screen, np.ones(3, dtype=bool), 20.0)
+        self.assertFalse(hidden.any())
+        self.assertEqual(offsets[0].tolist(), [0.0, 0.0])
+        self.assertEqual(offsets[2].tolist(), [0.0, 0.0])
+        placed = screen + offsets
+        self.assertGreaterEqual(np.linalg.norm(placed[1] - placed[0]), 20.0)
+
+    async def test_declutter_ignores_invisible_labels(self):
+        screen = np.array([[50.0, 50.0], [50.0, 50.0]])
+        offsets, hidden = label_layout.declutter(screen, np.array([True, False]), 20.0)
+        self.assertFalse(hidden.any())
+        self.assertFalse(offsets.any())
+
+    async def test_declutter_hides_only_without_free_slot(self):
+        # Dense cluster: more labels than the 12 candidate slots around the first one
+        screen = np.zeros((20, 2)) + 100.0
+        offsets, hidden = label_layout.declutter(screen, np.ones(20, dtype=bool), 10.0)
+        self.assertTrue(hidden.any())
+        self.assertFalse(hidden[:5].any())
+        placed = (screen + offsets)[~hidden]
+        distances = np.linalg.norm(placed[:, None, :] - placed[None, :, :], axis=2)
+        self.assertGreaterEqual(distances[~np.eye(len(placed), dtype=bool)].min(), 10.0 - 1e-9)
+
+    async def test_declutter_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            label_layout.declutter(np.zeros((2, 2)), np.ones(2, dtype=bool), 10.0, mode="merge")
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+import omni.kit.test
+
+from ..event_post_processing_core import consolidate_events, restore_timestamp
+
+SEGMENTS = [
+    {"video_start": 0.0, "video_end": 4.0,
+     "data_start": "2025-01-01 00:00:28.000", "data_end": "2025-01-01 00:00:32.000"},
+    {"video_start": 4.0, "video_end": 10.0,
+     "data_start": "2025-01-01 00:00:50.000", "data_end": "2025-01-01 00:00:56.000"},
+]
+
+
+class TestRestoreTimestamp(omni.kit.test.AsyncTestCase):
+    async def test_dataset_clock_keeps_timestamps(self):
+        time_map = {"overlay_clock": "dataset", "speed": 1.0, "segments": SEGMENTS}
+        self.assertEqual(restore_timestamp("00:00:30", time_map), "00:00:30")
+        # Also values that would fall inside a segment's video range
+        self.assertEqual(restore_timestamp("00:00:02", time_map), "00:00:02")
+
+    async def test_legacy_map_without_clock_is_dataset(self):
+        self.assertEqual(restore_timestamp("00:00:02", {"segments": SEGMENTS}), "00:00:02")
+
+    async def test_video_clock_maps_through_segments(self):
+        time_map = {"overlay_clock": "video", "speed": 1.0, "segments": SEGMENTS}
+        self.assertEqual(restore_timestamp("00:00:00", time_map), "00:00:28")
+        self.assertEqual(restore_timestamp("00:00:02", time_map), "00:00:30")
+        self.assertEqual(restore_timestamp("00:00:05", time_map), "00:00:51")
+        # Outside the stitched video -> unchanged
+        self.assertEqual(restore_timestamp("00:00:30", time_map), "00:00:30")
+
+    async def test_video_clock_applies_speed(self):
+        time_map = {"overlay_clock": "video", "speed": 2.0, "segments": [
+            {"video_start": 0.0, "video_end": 2.0,
+             "data_start": "2025-01-01 00:00:28.000", "data_end": "2025-01-01 00:00:32.000"},
+        ]}
+        self.assertEqual(restore_timestamp("00:00:01", time_map), "00:00:30")
+
+    async def test_unknown_clock_raises(self):
+        with self.assertRaises(ValueError):
+            restore_timestamp("00:00:01", {"overlay_clock": "wall", "segments": SEGMENTS})
+
+    async def test_consolidate_events_uses_time_map(self):
+        data = {
+            "chunk_responses": [{"content": '[{"00:00:02": [1, 4]}]'}],
+            "time_map": {"overlay_clock": "video", "speed": 1.0, "segments": SEGMENTS},
+        }
+        self.assertEqual(consolidate_events(data), {"2025-01-01 00:00:30.000": [["obj001", "obj004"]]})
+        data["time_map"]["overlay_clock"] = "dataset"
+        self.assertEqual(consolidate_events(data), {"2025-01-01 00:00:02.000": [["obj001", "obj004"]]})
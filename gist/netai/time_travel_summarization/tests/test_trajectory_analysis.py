@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+import omni.kit.test
+
+from .. import trajectory_analysis
+
+
+def _data(rows):
+    """{second: {objid: (x, z)}} -> TimeTravelCore._data layout."""
+    return {
+        f"2025-01-01 00:00:{second:02d}.000": {objid: (x, 0.0, z) for objid, (x, z) in frame.items()}
+        for second, frame in sorted(rows.items())
+    }
+
+
+class TestTrajectoryAnalysis(omni.kit.test.AsyncTestCase):
+    async def test_timestamp_round_trip(self):
+        ms = trajectory_analysis.to_ms(trajectory_analysis.parse_timestamp("2025-01-01 00:00:28.250"))
+        self.assertEqual(trajectory_analysis.format_timestamp_ms(ms), "2025-01-01 00:00:28.250")
+
+    async def test_iter_full_frames_fills_forward(self):
+        data = _data({0: {"a": (0, 0), "b": (5, 0)}, 1: {"a": (1, 0)}})
+        frames = [(time_ms, dict(positions)) for time_ms, positions in trajectory_analysis.iter_full_frames(data)]
+        self.assertEqual(frames[1][1], {"a": (1, 0.0, 0), "b": (5, 0.0, 0)})
+        self.assertEqual(frames[1][0] - frames[0][0], 1000)
+
+    async def test_objid_label_map_matches_overlay_numbers(self):
+        self.assertEqual(trajectory_analysis.objid_label_map(["obj_b", "obj_a"]), {"obj_a": "1", "obj_b": "2"})
+
+    async def test_find_close_pairs_uses_xz_distance(self):
+        positions = {"a": (0.0, 999.0, 0.0), "b": (3.0, -999.0, 4.0), "c": (10.0, 0.0, 0.0), "d": (150.0, 0.0, 0.0)}
+        self.assertEqual(sorted(trajectory_analysis.find_close_pairs(positions, 6.0)), [("a", "b")])
+        # Pairs across grid cells are found once
+        self.assertEqual(sorted(trajectory_analysis.find_close_pairs(positions, 11.0)), [("a", "b"), ("a", "c"), ("b", "c")])
+        self.assertEqual(trajectory_analysis.find_close_pairs(positions, 0.0), [])
+
+    async def test_merge_intervals(self):
+        self.assertEqual(trajectory_analysis.merge_intervals([(5, 8), (0, 3), (3, 4)]), [(0, 4), (5, 8)])
+        self.assertEqual(trajectory_analysis.merge_intervals([(0, 3), (5, 8)], gap_ms=2), [(0, 8)])
+
+    async def test_proximity_intervals_and_speed_schedule(self):
+        data = _data({
+            0: {"a": (0, 0), "b": (100, 0)},
+            2: {"b": (1, 0)},
+            3: {"b": (100, 0)},
+            6: {"b": (100, 0)},
+        })
+        start_ms = trajectory_analysis.to_ms(trajectory_analysis.parse_timestamp("2025-01-01 00:00:00.000"))
+        self.assertEqual(trajectory_analysis.proximity_intervals(data, 10.0),
+                         [(start_ms + 2000, start_ms + 3000)])
+        self.assertEqual(trajectory_analysis.proximity_intervals(data, 10.0, margin_ms=500),
+                         [(start_ms + 1500, start_ms + 3500)])
+
+        schedule = trajectory_analysis.build_speed_schedule(data, 10.0, quiet_speed=3.0)
+        self.assertEqual(schedule, [
+            (start_ms, start_ms + 2000, 3.0),
+            (start_ms + 2000, start_ms + 3000, 1.0),
+            (start_ms + 3000, start_ms + 6000, 3.0),
+        ])
+        self.assertEqual(trajectory_analysis.speed_at(schedule, start_ms + 2500), 1.0)
+        self.assertEqual(trajectory_analysis.speed_at(schedule, start_ms + 7000, default=2.0), 2.0)
+        self.assertAlmostEqual(trajectory_analysis.schedule_video_duration(schedule), 2 / 3 + 1 + 1)
+
+    async def test_schedule_frame_times_follow_speed(self):
+        schedule = [(0, 1000, 1.0), (1000, 3000, 2.0)]
+        frame_times = trajectory_analysis.schedule_frame_times(schedule, fps=2.0)
+        self.assertEqual(frame_times, [0.0, 500.0, 1000.0, 2000.0, 3000.0])
@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import omni.kit.test
+
+from ..utils.VSS_upload_cache import UploadCache, file_sha256, upload_with_cache
+
+
+class _NotFound(Exception):
+    status_code = 404
+
+
+class _FakeClient:
+    """Minimal VSSClient: uploads get sequential ids, files live in a dict."""
+
+    def __init__(self):
+        self.files = {}
+        self.uploads = 0
+        self.deleted = []
+
+    def upload_video(self, file_path, **kwargs):
+        self.uploads += 1
+        file_id = f"file-{self.uploads}"
+        self.files[file_id] = file_path
+        return {"id": file_id}
+
+    def get_file(self, file_id):
+        if file_id not in self.files:
+            raise _NotFound(file_id)
+        return {"id": file_id}
+
+    def delete_video(self, file_id):
+        if self.files.pop(file_id, None) is None:
+            raise _NotFound(file_id)
+        self.deleted.append(file_id)
+
+
+class TestUploadCache(omni.kit.test.AsyncTestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.manifest = self.root / "manifest.json"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _video(self, name: str, content: bytes) -> str:
+        path = self.root / name
+        path.write_bytes(content)
+        return str(path)
+
+    async def test_hash_is_reused_until_file_changes(self):
+        cache = UploadCache(self.manifest)
+        path = self._video("a.mp4", b"first")
+        sha256 = cache.hash_file(path)
+        self.assertEqual(sha256, file_sha256(path))
+        # Persisted: a new instance reads the recorded hash
+        self.assertEqual(UploadCache(self.manifest).hash_file(path), sha256)
+
+        Path(path).write_bytes(b"second, longer")
+        self.assertNotEqual(cache.hash_file(path), sha256)
+
+    async def test_record_lookup_and_remove(self):
+        cache = UploadCache(self.manifest)
+        path = self._video("a.mp4", b"video")
+        cache.record("abc", "file-1", path)
+        self.assertEqual(UploadCache(self.manifest).lookup("abc"), "file-1")
+        self.assertEqual(cache.sha256_for("file-1"), "abc")
+        cache.remove_file_id("file-1")
+        self.assertIsNone(cache.lookup("abc"))
+        self.assertIsNone(UploadCache(self.manifest).lookup("abc"))
+
+    async def test_corrupt_manifest_is_ignored(self):
+        self.manifest.write_text("{not json", encoding="utf-8")
+        cache = UploadCache(self.manifest)
+        self.assertIsNone(cache.lookup("abc"))
+        cache.record("abc", "file-1", self._video("a.mp4", b"video"))
+        self.assertEqual(UploadCache(self.manifest).lookup("abc"), "file-1")
+
+    async def test_evicts_least_recently_used_except_protected(self):
+        cache = UploadCache(self.manifest, max_files=2)
+        path = self._video("a.mp4", b"video")
+        for index, sha256 in enumerate(["old", "mid", "new"]):
+            cache.record(sha256, f"file-{sha256}", path)
+            cache._entries[sha256]["last_used"] = 1000.0 + index
+
+        self.assertEqual([sha256 for sha256, _ in cache.select_evictions()], ["old"])
+        self.assertEqual([sha256 for sha256, _ in cache.select_evictions(protect={"old"})], ["mid"])
+
+        deleted = []
+        self.assertEqual(cache.evict(deleted.append), ["file-old"])
+        self.assertEqual(deleted, ["file-old"])
+        self.assertIsNone(cache.lookup("old"))
+        self.assertEqual(cache.lookup("new"), "file-new")
+
+    async def test_evict_limits_bytes_and_age(self):
+        path = self._video("a.mp4", b"x" * 10)
+        cache = UploadCache(self.manifest, max_files=None, max_bytes=15)
+        cache.record("a", "file-a", path)
+        cache.record("b", "file-b", path)
+        cache._entries["a"]["last_used"] -= 1.0
+        self.assertEqual([sha256 for sha256, _ in cache.select_evictions()], ["a"])
+
+        cache = UploadCache(self.root / "age.json", max_files=None, max_age=60.0)
+        cache.record("a", "file-a", path)
+        cache.record("b", "file-b", path)
+        cache._entries["a"]["last_used"] = time.time() - 120.0
+        self.assertEqual([sha256 for sha256, _ in cache.select_evictions()], ["a"])
+
+    async def test_evict_keeps_record_on_failure_and_drops_missing(self):
+        cache = UploadCache(self.manifest, max_files=0)
+        path = self._video("a.mp4", b"video")
+        cache.record("gone", "file-gone", path)
+        cache.record("busy", "file-busy", path)
+
+        def delete(file_id):
+            if file_id == "file-gone":
+                raise _NotFound(file_id)
+            raise RuntimeError("server busy")
+
+        self.assertEqual(cache.evict(delete), ["file-gone"])
+        self.assertIsNone(cache.lookup("gone"))
+        # Retried on the next eviction
+        self.assertEqual(cache.lookup("busy"), "file-busy")
+
+    async def test_upload_with_cache_reuses_and_reuploads(self):
+        client = _FakeClient()
+        cache = UploadCache(self.manifest)
+        path = self._video("a.mp4", b"video")
+
+        response, reused = upload_with_cache(client, cache, path)
+        self.assertFalse(reused)
+        self.assertEqual(response["id"], "file-1")
+
+        # Same content under another name -> reused, no upload
+        copy = self._video("b.mp4", b"video")
+        response, reused = upload_with_cache(client, cache, copy)
+        self.assertTrue(reused)
+        self.assertEqual(response["id"], "file-1")
+        self.assertEqual(client.uploads, 1)
+
+        # Deleted on the server -> uploaded again and re-recorded
+        client.files.clear()
+        response, reused = upload_with_cache(client, cache, path)
+        self.assertFalse(reused)
+        self.assertEqual(response["id"], "file-2")
+        self.assertEqual(cache.lookup(file_sha256(path)), "file-2")
+
+    async def test_upload_with_cache_evicts_over_limit(self):
+        client = _FakeClient()
+        cache = UploadCache(self.manifest, max_files=1)
+        first = self._video("a.mp4", b"first")
+        upload_with_cache(client, cache, first)
+        upload_with_cache(client, cache, self._video("b.mp4", b"second"))
+        self.assertEqual(client.deleted, ["file-1"])
+        self.assertIsNone(cache.lookup(file_sha256(first)))
+        self.assertTrue(os.path.exists(first))
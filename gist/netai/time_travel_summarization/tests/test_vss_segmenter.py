@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: LicenseRef-NvidiaProprietary
+#
+# NVIDIA CORPORATION, its affiliates and licensors retain all intellectual
+# property and proprietary rights in and to this material, related
+# documentation and any modifications thereto. Any use, reproduction,
+# disclosure or distribution of this material and related documentation
+# without an express license agreement from NVIDIA CORPORATION or
+# its affiliates is strictly prohibited.
+
+
+import omni.kit.test
+
+from ..utils.VSS_segmenter import merge_segment_responses, plan_segments, shift_time
+
+
+def _chunk_starts(duration: float, chunk_duration: float, overlap: float):
+    """Chunk start times the server uses for a whole video (see vss_mock_server.chunk_windows)."""
+    stride = chunk_duration - overlap
+    starts, start = [], 0.0
+    while start < duration - 1e-6:
+        starts.append(round(start, 6))
+        start += stride
+    return starts
+
+
+class TestPlanSegments(omni.kit.test.AsyncTestCase):
+    async def test_without_overlap(self):
+        segments = plan_segments(100.0, 25.0, 10.0)
+        self.assertEqual([(s.start, s.end, s.nominal_end) for s in segments],
+                         [(0.0, 30.0, 30.0), (30.0, 60.0, 60.0), (60.0, 90.0, 90.0), (90.0, 100.0, 100.0)])
+
+    async def test_short_tail_joins_previous_segment(self):
+        segments = plan_segments(95.0, 30.0, 10.0)
+        self.assertEqual([(s.start, s.end) for s in segments], [(0.0, 30.0), (30.0, 60.0), (60.0, 95.0)])
+
+    async def test_segments_follow_server_chunk_grid_with_overlap(self):
+        for duration, segment_duration, chunk, overlap in [(100.0, 25.0, 10.0, 2.0), (61.0, 20.0, 10.0, 5.0),
+                                                           (300.0, 60.0, 20.0, 3.0)]:
+            segments = plan_segments(duration, segment_duration, chunk, overlap)
+            stride = chunk - overlap
+            merged = []
+            for segment in segments:
+                # Every segment starts on a chunk boundary of the whole video
+                self.assertAlmostEqual(segment.start / stride, round(segment.start / stride))
+                self.assertAlmostEqual(segment.end, min(duration, segment.nominal_end + overlap))
+                last = segment.index == len(segments) - 1
+                for local in _chunk_starts(segment.duration, chunk, overlap):
+                    if last or segment.start + local < segment.nominal_end:
+                        merged.append(round(segment.start + local, 6))
+            # Segmented chunks are exactly the chunks of the whole video
+            self.assertEqual(merged, _chunk_starts(duration, chunk, overlap))
+
+    async def test_rejects_invalid_chunking(self):
+        with self.assertRaises(ValueError):
+            plan_segments(100.0, 25.0, 0.0)
+        with self.assertRaises(ValueError):
+            plan_segments(100.0, 25.0, 10.0, 10.0)
+
+
+class TestMergeSegmentResponses(omni.kit.test.AsyncTestCase):
+    async def test_shift_times_and_drop_overlap_chunks(self):
+        segments = plan_segments(40.0, 16.0, 10.0, 2.0)  # stride 8 -> [0, 18), [16, 40)
+        self.assertEqual([(s.start, s.end) for s in segments], [(0.0, 18.0), (16.0, 40.0)])
+        responses = [
+            {"id": "a", "model": "m", "usage": {"total_tokens": 3},
+             "chunk_responses": [{"start_time": "00:00:00", "end_time": "00:00:10", "content": "x"},
+                                 {"start_time": "00:00:08", "end_time": "00:00:18", "content": "y"},
+                                 {"start_time": "00:00:16", "end_time": "00:00:18", "content": "dup"}]},
+            {"id": "b", "model": "m", "usage": {"total_tokens": 4},
+             "chunk_responses": [{"start_time": 0, "end_time": 10, "content": "z"}]},
+        ]
+        merged = merge_segment_responses(responses, segments)
+        self.assertEqual([chunk["content"] for chunk in merged["chunk_responses"]], ["x", "y", "z"])
+        self.assertEqual(merged["chunk_responses"][1]["start_time"], "00:00:08")
+        self.assertEqual(merged["chunk_responses"][2]["start_time"], 16)
+        self.assertEqual(merged["chunk_responses"][2]["end_time"], 26)
+        self.assertEqual(merged["usage"], {"total_tokens": 7})
+        self.assertEqual(merged["model"], "m")
+        self.assertEqual([info["id"] for info in merged["segments"]], ["a", "b"])
+
+    async def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            merge_segment_responses([{}], [])
+
+
+class TestShiftTime(omni.kit.test.AsyncTestCase):
+    async def test_keeps_format(self):
+        self.assertEqual(shift_time("00:00:05", 10), "00:00:15")
+        self.assertEqual(shift_time("01:05", 10), "01:15")
+        self.assertEqual(shift_time("00:59.5", 1), "01:00.5")
+        self.assertEqual(shift_time("5.50", 1), "6.50")
+        self.assertEqual(shift_time(5, 1), 6)
+        self.assertEqual(shift_time(5.5, 0.5), 6.0)
+
+    async def test_unknown_values_unchanged(self):
+        self.assertEqual(shift_time("abc", 3), "abc")
+        self.assertIs(shift_time(True, 3), True)
+        self.assertIsNone(shift_time(None, 3))
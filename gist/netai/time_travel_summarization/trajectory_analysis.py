@@ -0,0 +1,227 @@
+"""
+Trajectory Analysis
+Pure-Python helpers over the trajectory store ({timestamp_str: {objid: (x, y, z)}}).
+Used by core.py for capture scheduling and by utils/ scripts that run outside Omniverse,
+so this module must not import omni / carb / pxr.
+
+Distances are measured on the XZ ground plane (what the BEV summarization camera sees).
+Times are integer milliseconds since 1970-01-01 (naive), the same time base as core.py schedules.
+"""
+
+import bisect
+import csv
+import datetime
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+Position = Tuple[float, float, float]
+Frame = Dict[str, Position]
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+# ----------------------------------------------------------------------
+# Timestamps
+# ----------------------------------------------------------------------
+def parse_timestamp(timestamp_str: str) -> datetime.datetime:
+    """Parse data timestamp ("2025-01-01 00:00:00.000" or ISO with Z) to naive datetime."""
+    try:
+        dt = datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    except ValueError:
+        dt = datetime.datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def to_ms(dt: datetime.datetime) -> int:
+    """Convert naive datetime to integer milliseconds."""
+    return (dt - _EPOCH) // datetime.timedelta(milliseconds=1)
+
+
+def from_ms(ms: float) -> datetime.datetime:
+    """Convert milliseconds back to naive datetime."""
+    return _EPOCH + datetime.timedelta(milliseconds=ms)
+
+
+def format_timestamp_ms(ms: float) -> str:
+    """Format milliseconds in the data timestamp format ("YYYY-MM-DD HH:MM:SS.fff")."""
+    return from_ms(ms).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+# ----------------------------------------------------------------------
+# Loading / iteration
+# ----------------------------------------------------------------------
+def load_trajectory_csv(csv_path: str) -> Dict[str, Frame]:
+    """
+    Load trajectory CSV (timestamp,objid,x,y,z) into the same in-memory layout as
+    TimeTravelCore._data. Rows are assumed to be sorted by timestamp.
+    """
+    data: Dict[str, Frame] = {}
+    with open(csv_path, 'r') as f:
+        for row in csv.DictReader(f):
+            data.setdefault(row['timestamp'], {})[row['objid']] = (
+                float(row['x']), float(row['y']), float(row['z'])
+            )
+    return data
+
+
+def iter_full_frames(data: Dict[str, Frame]) -> Iterator[Tuple[int, Frame]]:
+    """
+    Yield (time_ms, positions) for every timestamp, where positions holds the last
+    known value of every object seen so far (sparse rows are filled forward).
+    The yielded dict is reused between iterations; copy it if you keep it.
+    """
+    positions: Frame = {}
+    for timestamp_str, frame in data.items():
+        positions.update(frame)
+        yield to_ms(parse_timestamp(timestamp_str)), positions
+
+
+def objid_label_map(objids) -> Dict[str, str]:
+    """
+    Map objid -> on-screen label number, matching the overlay.
+    auto_generate_astronauts names prims Astronaut{i:03d} over sorted objids (i from 1),
+    and ViewOverlay._get_id_from_name shows int(last three digits).
+    """
+    return {objid: str(int(f"{index:03d}"[-3:])) for index, objid in enumerate(sorted(objids), start=1)}
+
+
+# ----------------------------------------------------------------------
+# Proximity
+# ----------------------------------------------------------------------
+def find_close_pairs(positions: Frame, threshold: float) -> List[Tuple[str, str]]:
+    """
+    Find all object pairs closer than threshold on the XZ plane.
+    Uniform grid spatial hash with cell size = threshold, so each object is only
+    compared with objects in its own and the 8 neighbouring cells (O(n) for sparse scenes).
+    """
+    if threshold <= 0 or len(positions) < 2:
+        return []
+
+    grid = defaultdict(list)
+    for objid, (x, _, z) in positions.items():
+        grid[(int(x // threshold), int(z // threshold))].append((objid, x, z))
+
+    threshold_sq = threshold * threshold
+    pairs = []
+    for (cx, cz), members in grid.items():
+        for dx in (-1, 0, 1):
+            for dz in (-1, 0, 1):
+                neighbours = grid.get((cx + dx, cz + dz))
+                if not neighbours:
+                    continue
+                for objid_a, ax, az in members:
+                    for objid_b, bx, bz in neighbours:
+                        # Each unordered pair once
+                        if objid_a >= objid_b:
+                            continue
+                        if (ax - bx) ** 2 + (az - bz) ** 2 < threshold_sq:
+                            pairs.append((objid_a, objid_b))
+    return pairs
+
+
+def merge_intervals(intervals: List[Tuple[int, int]], gap_ms: int = 0) -> List[Tuple[int, int]]:
+    """Merge overlapping intervals (and ones separated by at most gap_ms)."""
+    merged: List[Tuple[int, int]] = []
+    for start_ms, end_ms in sorted(intervals):
+        if merged and start_ms <= merged[-1][1] + gap_ms:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end_ms))
+        else:
+            merged.append((start_ms, end_ms))
+    return merged
+
+
+def proximity_intervals(
+    data: Dict[str, Frame],
+    threshold: float,
+    margin_ms: int = 0,
+) -> List[Tuple[int, int]]:
+    """
+    Intervals [start_ms, end_ms) during which at least one object pair is within
+    threshold, each padded by margin_ms on both sides, merged and clamped to the data range.
+    A sample counts until the next sample's timestamp.
+    """
+    samples = [(time_ms, bool(find_close_pairs(positions, threshold)))
+               for time_ms, positions in iter_full_frames(data)]
+    if not samples:
+        return []
+
+    data_start_ms, data_end_ms = samples[0][0], samples[-1][0]
+    intervals = []
+    for index, (time_ms, is_close) in enumerate(samples):
+        if not is_close:
+            continue
+        next_ms = samples[index + 1][0] if index + 1 < len(samples) else time_ms + 1
+        intervals.append((max(data_start_ms, time_ms - margin_ms),
+                          min(data_end_ms, next_ms + margin_ms)))
+    return merge_intervals(intervals)
+
+
+# ----------------------------------------------------------------------
+# Capture speed schedule
+# ----------------------------------------------------------------------
+def build_speed_schedule(
+    data: Dict[str, Frame],
+    threshold: float,
+    quiet_speed: float,
+    active_speed: float = 1.0,
+    margin_ms: int = 0,
+) -> List[Tuple[int, int, float]]:
+    """
+    Activity-adaptive playback schedule covering the whole data range:
+    [(start_ms, end_ms, speed)], with active_speed near contacts (see proximity_intervals)
+    and quiet_speed everywhere else.
+    """
+    timestamps = list(data.keys())
+    if not timestamps:
+        return []
+
+    data_start_ms = to_ms(parse_timestamp(timestamps[0]))
+    data_end_ms = to_ms(parse_timestamp(timestamps[-1]))
+
+    schedule = []
+    cursor_ms = data_start_ms
+    for start_ms, end_ms in proximity_intervals(data, threshold, margin_ms):
+        if start_ms > cursor_ms:
+            schedule.append((cursor_ms, start_ms, quiet_speed))
+        schedule.append((start_ms, end_ms, active_speed))
+        cursor_ms = end_ms
+    if cursor_ms < data_end_ms:
+        schedule.append((cursor_ms, data_end_ms, quiet_speed))
+    return schedule
+
+
+def speed_at(schedule: List[Tuple[int, int, float]], time_ms: float, default: float = 1.0) -> float:
+    """Speed factor of the schedule segment containing time_ms."""
+    index = bisect.bisect_right(schedule, (time_ms, float('inf'), float('inf'))) - 1
+    if 0 <= index < len(schedule) and time_ms < schedule[index][1]:
+        return schedule[index][2]
+    return default
+
+
+def schedule_video_duration(schedule: List[Tuple[int, int, float]]) -> float:
+    """Length in seconds of a video that plays the schedule (1x = real time)."""
+    return sum((end_ms - start_ms) / speed for start_ms, end_ms, speed in schedule) / 1000.0
+
+
+def schedule_frame_times(
+    schedule: List[Tuple[int, int, float]],
+    fps: float,
+    base_speed: float = 1.0,
+    start_ms: Optional[float] = None,
+) -> List[float]:
+    """
+    Dataset time (ms) shown by each output video frame when playing the schedule at
+    fps, with every segment's speed multiplied by base_speed.
+    """
+    frame_times = []
+    if not schedule:
+        return frame_times
+
+    time_ms = float(schedule[0][0] if start_ms is None else start_ms)
+    end_ms = schedule[-1][1]
+    while time_ms <= end_ms:
+        frame_times.append(time_ms)
+        time_ms += 1000.0 / fps * base_speed * speed_at(schedule, time_ms, default=1.0)
+    return frame_times
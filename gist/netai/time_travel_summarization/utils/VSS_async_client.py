@@ -0,0 +1,479 @@
+"""
+VSSClient 의 asyncio 버전 (aiohttp 기반)
+
+VSSClient 와 같은 메서드(upload_video / delete_video / generate_vlm_captions / 프롬프트 프리셋)를
+coroutine 으로 제공하여, 하나의 event loop 에서 여러 업로드 / 캡션 요청을 동시에 진행할 수 있음.
+동시에 전송 중인 요청 수는 max_concurrency 로 제한되며, 재시도 / 속도 제한 / circuit breaker 는
+VSSClient 와 같은 RetryPolicy / TokenBucket / CircuitBreaker 를 사용함.
+
+Omniverse Kit 에서는 Kit 의 main event loop 에서 await 하면 결과가 UI 스레드로 돌아오므로
+별도 스레드에서 UI 를 건드릴 필요가 없음.
+
+사용법:
+    async with AsyncVSSClient("http://localhost:8100", prompt_presets=presets, max_concurrency=4) as client:
+        uploaded = await client.upload_video("video/video_19.mp4")
+        results = await asyncio.gather(*[
+            client.generate_vlm_captions(uploaded["id"], model, preset_name="simple_view")
+            for model in ("gpt-4o", "Qwen3-VL-8B-Instruct")
+        ])
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import aiohttp
+
+try:
+    from .VSS_client import PromptPreset, PromptPresetMixin, RequestTiming
+    from .VSS_response_cache import ResponseCache
+    from .VSS_resilience import CircuitBreaker, RetryPolicy, TokenBucket, VSSRequestError
+    from .VSS_upload import DEFAULT_CHUNK_SIZE, StreamingMultipartEncoder, UploadCancelled, UploadProgress
+    from .VSS_metrics import MetricsRegistry, RequestMetrics
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from VSS_client import PromptPreset, PromptPresetMixin, RequestTiming
+    from VSS_response_cache import ResponseCache
+    from VSS_resilience import CircuitBreaker, RetryPolicy, TokenBucket, VSSRequestError
+    from VSS_upload import DEFAULT_CHUNK_SIZE, StreamingMultipartEncoder, UploadCancelled, UploadProgress
+    from VSS_metrics import MetricsRegistry, RequestMetrics
+
+logger = logging.getLogger(__name__)
+
+# aiohttp 3.10+ 에서만 연결 timeout 을 별도 예외로 구분함
+_CONNECT_ERRORS = tuple(
+    error for error in (aiohttp.ClientConnectorError, getattr(aiohttp, "ConnectionTimeoutError", None)) if error
+)
+
+
+@dataclass
+class AsyncResponse:
+    """body 까지 모두 읽은 응답 (세션 연결은 이미 반환됨)."""
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    elapsed: float  # 요청 전송 ~ 응답 헤더 수신 (초)
+    metrics: Optional[RequestMetrics] = None  # 호출 전체 측정값 (_request 가 채움)
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+def _timing_trace_config() -> aiohttp.TraceConfig:
+    """
+    DNS 조회 / 새 연결 시간을 trace_request_ctx (dict) 에 기록하는 TraceConfig.
+    connect 는 DNS 를 포함하며, 재사용한 연결이면 기록되지 않음.
+    """
+    trace = aiohttp.TraceConfig()
+
+    def on_start(key):
+        async def callback(session, context, params):
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx[key] = time.perf_counter()
+        return callback
+
+    def on_end(key):
+        async def callback(session, context, params):
+            probe = context.trace_request_ctx
+            if probe is not None and f"{key}_start" in probe:
+                probe[key] = probe.get(key, 0.0) + time.perf_counter() - probe.pop(f"{key}_start")
+        return callback
+
+    trace.on_dns_resolvehost_start.append(on_start("dns_start"))
+    trace.on_dns_resolvehost_end.append(on_end("dns"))
+    trace.on_connection_create_start.append(on_start("connect_start"))
+    trace.on_connection_create_end.append(on_end("connect"))
+    return trace
+
+
+class AsyncVSSClient(PromptPresetMixin):
+    """
+    NVIDIA VSS 서버와 통신하는 asyncio 클라이언트. 메서드와 인자는 VSSClient 와 동일하며 모두 coroutine.
+
+    aiohttp.ClientSession 과 동시성 semaphore 는 처음 요청할 때 현재 실행 중인 event loop 에서 생성됨.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        default_chunk_duration: int = 2,
+        default_chunk_overlap_duration: int = 0,
+        prompt_presets: Optional[Dict[str, PromptPreset]] = None,
+        max_concurrency: int = 4,
+        pool_size: int = 10,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 900.0,
+        keep_alive: bool = True,
+        timing_history: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        model_rate_limits: Optional[Dict[str, float]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 전송 중일 수 있는 최대 요청 수 (초과 요청은 대기)
+            그 외: VSSClient 와 동일
+        """
+        self.base_url = base_url.rstrip("/")
+        self.default_chunk_duration = default_chunk_duration
+        self.default_chunk_overlap_duration = default_chunk_overlap_duration
+        self.prompt_presets: Dict[str, PromptPreset] = prompt_presets or {}
+
+        self.max_concurrency = max_concurrency
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
+        self.timeout = aiohttp.ClientTimeout(total=None, connect=connect_timeout, sock_read=read_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 요청별 시간 측정
+        self.last_timing: Optional[RequestTiming] = None
+        self._timings = deque(maxlen=timing_history)
+        self.metrics = metrics or MetricsRegistry()
+
+        # 재시도 / 속도 제한 / circuit breaker
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        self._model_rate_limiters = {
+            model: TokenBucket(rate) for model, rate in (model_rate_limits or {}).items() if rate
+        }
+        self.response_cache = response_cache
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """현재 event loop 에서 session 을 생성 (닫혔으면 다시 생성)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._pool_size, force_close=not self._keep_alive)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self.timeout, trace_configs=[_timing_trace_config()]
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        """Session 의 모든 연결을 닫음."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def get_request_timings(self) -> List[RequestTiming]:
+        """최근 요청들의 시간 측정 결과 (오래된 순)."""
+        return list(self._timings)
+
+    async def health_check(self, timeout: float = 3.0) -> bool:
+        """GET /health/ready 가 200 이면 True. 재시도 / circuit breaker / 동시성 제한을 거치지 않음."""
+        try:
+            async with self._get_session().get(
+                f"{self.base_url}/health/ready", timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as resp:
+                return resp.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    # ------------------------------------------------------------------
+    # 1. 비디오 업로드 / 삭제
+    # ------------------------------------------------------------------
+    async def upload_video(
+        self,
+        file_path: str,
+        purpose: str = "vision",
+        media_type: str = "video",
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        cancel_event=None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        VSS 서버에 비디오(또는 이미지)를 업로드. 인자와 반환값은 VSSClient.upload_video 참고.
+        progress_callback 은 event loop 스레드에서 호출되므로 UI 를 바로 갱신해도 됨.
+        실행 중인 task 를 cancel() 해도 업로드가 중단됨.
+        """
+        url = f"{self.base_url}/files"
+
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        encoder = StreamingMultipartEncoder(
+            "file", file_path,
+            fields={"purpose": purpose, "media_type": media_type},
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+        )
+
+        # async generator 는 한 번만 소비되므로 시도마다 처음부터 새로 만듦
+        def build_body():
+            encoder.rewind()
+            return encoder.async_iter()
+
+        try:
+            # 업로드는 서버에 파일을 만들기 때문에 idempotent 하지 않음
+            resp = await self._request(
+                "POST", url, "upload_video", idempotent=False,
+                data_factory=build_body, body_info=encoder, headers=encoder.headers,
+            )
+        finally:
+            encoder.close()
+
+        self._raise_for_error(resp, "upload_video")
+        return resp.json()
+
+    async def delete_video(self, file_id: str) -> Dict[str, Any]:
+        """업로드된 비디오(파일)를 삭제."""
+        url = f"{self.base_url}/files/{file_id}"
+        resp = await self._request("DELETE", url, "delete_video")
+        self._raise_for_error(resp, "delete_video")
+        return resp.json()
+
+    async def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """업로드된 파일 정보 조회. 서버에 없으면 (404) None."""
+        url = f"{self.base_url}/files/{file_id}"
+        resp = await self._request("GET", url, "get_file")
+        if resp.status == 404:
+            return None
+        self._raise_for_error(resp, "get_file")
+        return resp.json()
+
+    # ------------------------------------------------------------------
+    # 2. generate_vlm_captions 기능
+    # ------------------------------------------------------------------
+    async def generate_vlm_captions(
+        self,
+        video_id: str,
+        model: str,
+        preset_name: Optional[str] = None,
+        prompt: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        chunk_duration: Optional[int] = None,
+        chunk_overlap_duration: Optional[int] = None,
+        response_format: str = "json_object",
+        extra_params: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+        video_hash: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """VLM 기반 캡션 생성 요청. 인자와 재시도 규칙은 VSSClient.generate_vlm_captions 참고."""
+        url, payload, headers = self._build_caption_request(
+            video_id, model, preset_name, prompt, system_prompt,
+            chunk_duration, chunk_overlap_duration, response_format, extra_params, request_id,
+        )
+        if use_cache and self.response_cache is not None and video_hash:
+            cached = self._cached_response(video_hash, payload)
+            if cached is not None:
+                return cached
+
+        resp = await self._request(
+            "POST", url, "generate_vlm_captions",
+            idempotent=bool(request_id),
+            rate_limiter=self._model_rate_limiters.get(model),
+            model=model, record_metrics=False,
+            data=json.dumps(payload), headers=headers,
+        )
+        result = {}
+        try:
+            self._raise_for_error(resp, "generate_vlm_captions")
+            result = resp.json()
+        finally:
+            self._finish_caption_metrics(resp.metrics, result)
+        # 서버 응답에 execution_time이 있으면 사용, 없으면 클라이언트 측 측정값 사용
+        if "execution_time" not in result:
+            result["execution_time"] = resp.elapsed
+        self._store_response(video_hash, payload, result)
+        return result
+
+    # ------------------------------------------------------------------
+    # 내부 유틸
+    # ------------------------------------------------------------------
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        idempotent: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        data_factory: Optional[Callable[[], Any]] = None,
+        body_info: Optional[StreamingMultipartEncoder] = None,
+        model: Optional[str] = None,
+        record_metrics: bool = True,
+        **kwargs,
+    ) -> AsyncResponse:
+        """
+        요청을 보내고 소요 시간을 기록. 재시도 / 측정값 기록 규칙은 VSSClient._request 와 동일.
+        data_factory 가 있으면 시도마다 호출하여 body 를 새로 만듦 (multipart 업로드),
+        body_info 는 그 body 의 크기 / 전송 시간을 제공하는 encoder.
+        backoff 대기 중에는 동시성 슬롯을 점유하지 않음.
+        """
+        metrics = self._new_metrics(method, url, context, model)
+        started = time.perf_counter()
+        try:
+            resp = await self._request_with_retries(
+                method, url, context, idempotent, rate_limiter, data_factory, body_info, metrics, **kwargs
+            )
+        except (Exception, asyncio.CancelledError) as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            metrics.total = time.perf_counter() - started
+            self.metrics.record(metrics)
+            raise
+        metrics.total = time.perf_counter() - started
+        resp.metrics = metrics
+        if record_metrics:
+            self.metrics.record(metrics)
+        return resp
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        idempotent: bool,
+        rate_limiter: Optional[TokenBucket],
+        data_factory: Optional[Callable[[], Any]],
+        body_info: Optional[StreamingMultipartEncoder],
+        metrics: RequestMetrics,
+        **kwargs,
+    ) -> AsyncResponse:
+        policy = self.retry_policy
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.circuit_breaker.before_request(context)
+            for bucket in (self._rate_limiter, rate_limiter):
+                if bucket:
+                    await self._acquire(bucket)
+            if data_factory is not None:
+                kwargs["data"] = data_factory()
+
+            metrics.retries = attempt - 1
+            try:
+                resp = await self._send(method, url, context, attempt, metrics, body_info, **kwargs)
+            except (UploadCancelled, asyncio.CancelledError):
+                # 사용자 취소는 백엔드 상태와 무관
+                self.circuit_breaker.release_trial()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # aiohttp 는 body 생성 중 발생한 UploadCancelled 를 연결 오류로 감싸서 올림
+                cancelled = self._find_cause(e, UploadCancelled)
+                if cancelled is not None:
+                    self.circuit_breaker.release_trial()
+                    raise cancelled from e
+                self.circuit_breaker.record_failure()
+                retryable = idempotent or isinstance(e, _CONNECT_ERRORS)
+                if not retryable or attempt > policy.max_retries:
+                    raise
+                delay = policy.compute_delay(attempt)
+                logger.warning(f"[AsyncVSSClient:{context}] {type(e).__name__}, retry {attempt}/{policy.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            # 5xx 만 백엔드 장애로 간주 (4xx / 429 는 서버가 살아 있음)
+            if resp.status >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+            retryable = idempotent or resp.status in policy.REJECTED_STATUSES
+            if resp.status in policy.retry_statuses and retryable and attempt <= policy.max_retries:
+                delay = policy.compute_delay(attempt, resp.headers.get("Retry-After"))
+                logger.warning(f"[AsyncVSSClient:{context}] HTTP {resp.status}, retry {attempt}/{policy.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            return resp
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        attempt: int,
+        metrics: RequestMetrics,
+        body_info: Optional[StreamingMultipartEncoder] = None,
+        **kwargs,
+    ) -> AsyncResponse:
+        """요청 1회 전송 (동시성 제한 적용) + 시간 기록 (metrics 에는 이 시도의 값을 덮어씀)."""
+        session = self._get_session()
+        body = body_info if body_info is not None else kwargs.get("data")
+        metrics.upload_bytes = self._body_size(body)
+        metrics.dns = metrics.upload = metrics.ttfb = None
+        metrics.download_bytes = 0
+        probe: Dict[str, float] = {}
+        async with self._semaphore:
+            started = time.perf_counter()
+            resp = None
+            error = None
+            try:
+                async with session.request(method, url, trace_request_ctx=probe, **kwargs) as raw:
+                    headers_at = time.perf_counter()
+                    metrics.status_code = raw.status
+                    metrics.ttfb = headers_at - started
+                    content = await raw.read()
+                    resp = AsyncResponse(raw.status, raw.headers, content, headers_at - started)
+                metrics.download_bytes = len(content)
+                return resp
+            except (Exception, asyncio.CancelledError) as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                metrics.dns = probe.get("dns")
+                metrics.connect = probe.get("connect", 0.0)
+                metrics.upload = getattr(body, "send_duration", None)
+                timing = RequestTiming(
+                    context=context,
+                    method=method,
+                    url=url,
+                    status_code=resp.status if resp is not None else None,
+                    elapsed=time.perf_counter() - started,
+                    response_elapsed=resp.elapsed if resp is not None else None,
+                    error=error,
+                    attempt=attempt,
+                )
+                self.last_timing = timing
+                self._timings.append(timing)
+
+    @staticmethod
+    def _find_cause(error: BaseException, error_type):
+        """예외 체인(__cause__ / __context__)에서 error_type 인스턴스를 찾음."""
+        seen = set()
+        while error is not None and id(error) not in seen:
+            if isinstance(error, error_type):
+                return error
+            seen.add(id(error))
+            error = error.__cause__ or error.__context__
+        return None
+
+    @staticmethod
+    async def _acquire(bucket: TokenBucket) -> None:
+        """event loop 를 막지 않고 토큰을 기다림."""
+        while True:
+            wait = bucket.try_acquire()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    @staticmethod
+    def _raise_for_error(resp: AsyncResponse, context: str) -> None:
+        """HTTP 에러 공통 처리 (VSSClient._raise_for_error 와 같은 메시지 / 예외)."""
+        if resp.status < 400:
+            return
+        try:
+            err_json = resp.json()
+            msg = err_json.get("message") or err_json
+        except Exception:
+            msg = resp.text
+        raise VSSRequestError(f"[AsyncVSSClient:{context}] HTTP {resp.status} - {msg}", resp.status)
@@ -0,0 +1,570 @@
+"""
+여러 VSS 서버(GPU 별 VSS stack)에 요청을 나누는 backend pool
+
+연구실에서는 GPU 마다 VSS stack 을 따로 띄우므로 (VLM_server/run_qwen3-vl-8b.sh 의 --gpus "device=N"),
+VIA_BACKEND 에 여러 주소를 쉼표로 주면 하나의 클라이언트처럼 사용할 수 있게 함.
+- 라우팅: 업로드는 healthy backend 중 진행 중 요청(outstanding)이 가장 적은 곳으로 (같으면 누적 요청이 적은 곳)
+- sticky: 업로드한 file id 는 그 파일을 가진 backend 에서만 사용 (delete / get_file / generate_vlm_captions).
+  모르는 file id (이전 실행의 업로드 캐시, 재개한 작업) 는 각 backend 에 get_file 로 찾아서 기록
+- health check: 처음 사용할 때와 unhealthy backend 는 health_interval 마다 GET /health/ready 로 확인.
+  연결 실패 / timeout / 503 / circuit open 이 나면 그 backend 를 unhealthy 로 표시 (다른 5xx 는 요청 문제로 보고 그대로 raise)
+- failover: 업로드는 다른 backend 로 다시 시도하고, generate 중 backend 가 죽으면 원본 파일을 다른
+  backend 에 다시 올려 같은 요청을 보냄 (이후 원래 file id 는 새 backend 의 file id 로 연결되고, 죽은 backend 의 기록은 제거)
+- backend 마다 CircuitBreaker 를 따로 두며, BackendPool 을 동기 / 비동기 클라이언트가 공유할 수 있음
+- 라우팅 / failover 로직은 BackendPool 의 *_plan generator 에 한 번만 작성. plan 은 필요한 backend 호출
+  (BackendCall) 을 yield 하고, PooledVSSClient / AsyncPooledVSSClient 는 그 호출을 각자의 방식
+  (동기 / await) 으로 실행해 결과나 예외를 돌려주기만 함
+
+사용법:
+    client = create_vss_client("http://10.38.38.40:8100,http://10.38.38.40:8101", prompt_presets=presets)
+    uploaded = client.upload_video("video/video_19.mp4")        # outstanding 이 적은 backend 로
+    client.generate_vlm_captions(uploaded["id"], model, preset_name="simple_view")  # 같은 backend 로
+    print(client.get_backend_status())
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+import requests
+
+try:
+    from .VSS_client import PromptPresetMixin, VSSClient
+    from .VSS_metrics import MetricsRegistry
+    from .VSS_resilience import CircuitBreaker, CircuitOpenError, VSSRequestError
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from VSS_client import PromptPresetMixin, VSSClient
+    from VSS_metrics import MetricsRegistry
+    from VSS_resilience import CircuitBreaker, CircuitOpenError, VSSRequestError
+
+logger = logging.getLogger(__name__)
+
+# backend 장애로 보는 전송 오류 (aiohttp 는 설치된 경우에만)
+_TRANSPORT_ERRORS: Tuple[type, ...] = (requests.RequestException, ConnectionError, asyncio.TimeoutError, TimeoutError)
+try:
+    import aiohttp
+    _TRANSPORT_ERRORS += (aiohttp.ClientError,)
+except ImportError:
+    pass
+
+
+def parse_backend_urls(value: str) -> List[str]:
+    """"http://a:8100, http://b:8100" 처럼 쉼표 / 공백으로 구분한 주소 목록 (중복 제거, 순서 유지)."""
+    urls = [url.rstrip("/") for url in re.split(r"[,\s]+", value or "") if url]
+    return list(dict.fromkeys(urls))
+
+
+def is_backend_failure(error: BaseException) -> bool:
+    """
+    다른 backend 로 넘길 오류인지 (연결 실패 / timeout / circuit open / 503).
+    다른 HTTP 오류 (4xx, 500 등) 는 요청 자체의 문제일 수 있어 다른 backend 에서도 같으므로 False.
+    """
+    if isinstance(error, CircuitOpenError):
+        return True
+    if isinstance(error, VSSRequestError):
+        return error.status_code == 503
+    return isinstance(error, _TRANSPORT_ERRORS)
+
+
+@dataclass
+class Backend:
+    """backend 1개의 상태"""
+    url: str
+    circuit_breaker: CircuitBreaker
+    outstanding: int = 0             # 진행 중 요청 수
+    healthy: Optional[bool] = None   # None = 아직 확인 안 함
+    checked_at: float = 0.0          # 마지막 health 판정 시각 (time.monotonic)
+    requests: int = 0
+    failures: int = 0
+    last_error: Optional[str] = None
+
+
+class BackendPool:
+    """
+    backend 목록, health 상태, 진행 중 요청 수, file id 소유 정보 (thread-safe) 와 라우팅 / failover 로직.
+    PooledVSSClient / AsyncPooledVSSClient 가 사용하며 둘이 같은 pool 을 공유하면 업로드한 파일 정보도 공유됨.
+
+    Args:
+        urls: VSS 서버 주소 목록
+        health_interval: unhealthy backend 를 다시 확인하는 간격 (초)
+        failure_threshold / recovery_timeout: backend 별 CircuitBreaker 설정
+        health_timeout: health check timeout (초)
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        health_interval: float = 30.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        health_timeout: float = 3.0,
+    ):
+        urls = list(dict.fromkeys(url.rstrip("/") for url in urls if url))
+        if not urls:
+            raise ValueError("At least one VSS backend URL is required")
+        self.backends = [Backend(url, CircuitBreaker(failure_threshold, recovery_timeout)) for url in urls]
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self._lock = threading.Lock()
+        self._turn = itertools.count()
+        self._owners: Dict[str, Backend] = {}   # file id -> backend
+        self._sources: Dict[str, str] = {}      # file id -> 로컬 파일 경로 (failover 재업로드용)
+        self._aliases: Dict[str, str] = {}      # 원래 file id -> failover 후 file id
+
+    # ------------------------------------------------------------------
+    # health / 라우팅
+    # ------------------------------------------------------------------
+    def due_for_check(self) -> List[Backend]:
+        """health check 가 필요한 backend (아직 확인 안 함, 또는 unhealthy 이고 health_interval 경과)."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                backend for backend in self.backends
+                if backend.healthy is None
+                or (not backend.healthy and now - backend.checked_at >= self.health_interval)
+            ]
+
+    def set_health(self, backend: Backend, healthy: bool) -> None:
+        with self._lock:
+            if healthy and backend.healthy is False:
+                logger.info(f"[BackendPool] {backend.url} is healthy again")
+            elif not healthy and backend.healthy is not False:
+                logger.warning(f"[BackendPool] {backend.url} failed health check")
+            backend.healthy = healthy
+            backend.checked_at = time.monotonic()
+
+    def candidates(self, exclude: Iterable[str] = ()) -> List[Backend]:
+        """사용 가능한 backend 를 진행 중 요청이 적은 순으로 (같으면 누적 요청이 적은 순, 그다음 돌아가며)."""
+        exclude = set(exclude)
+        turn = next(self._turn)
+        count = len(self.backends)
+        with self._lock:
+            usable = [
+                (index, backend) for index, backend in enumerate(self.backends)
+                if backend.url not in exclude
+                and backend.healthy is not False
+                and backend.circuit_breaker.state != CircuitBreaker.OPEN
+            ]
+            usable.sort(key=lambda item: (item[1].outstanding, item[1].requests, (item[0] - turn) % count))
+        return [backend for _, backend in usable]
+
+    @contextmanager
+    def track(self, backend: Backend):
+        """요청 1건 동안 outstanding 을 올려 둠 (async 함수 안에서도 사용 가능)."""
+        with self._lock:
+            backend.outstanding += 1
+            backend.requests += 1
+        try:
+            yield backend
+        finally:
+            with self._lock:
+                backend.outstanding -= 1
+
+    def record_failure(self, backend: Backend, error: BaseException) -> None:
+        """backend 장애 기록: health_interval 뒤 다시 확인할 때까지 라우팅에서 제외."""
+        with self._lock:
+            backend.failures += 1
+            backend.last_error = f"{type(error).__name__}: {error}"
+            backend.healthy = False
+            backend.checked_at = time.monotonic()
+        logger.warning(f"[BackendPool] {backend.url} marked unhealthy: {backend.last_error}")
+
+    def _handle_error(self, backend: Backend, error: BaseException) -> None:
+        """backend 장애이면 기록하고 반환, 아니면 (요청 문제) 그대로 raise. except 블록 안에서 호출."""
+        if not is_backend_failure(error):
+            raise error
+        self.record_failure(backend, error)
+
+    # ------------------------------------------------------------------
+    # file id 소유 정보
+    # ------------------------------------------------------------------
+    def register_file(self, file_id: str, backend: Backend, source_path: Optional[str] = None) -> None:
+        with self._lock:
+            self._owners[file_id] = backend
+            if source_path:
+                self._sources[file_id] = source_path
+
+    def register_source(self, file_id: str, source_path: str) -> None:
+        """file id 의 원본 파일 경로 기록 (업로드 캐시로 재사용한 파일도 failover 가능하게)."""
+        with self._lock:
+            self._sources[file_id] = source_path
+
+    def resolve(self, file_id: str) -> Tuple[str, Optional[Backend]]:
+        """failover 로 바뀐 file id 와 그 소유 backend (모르면 None)."""
+        with self._lock:
+            actual = self._aliases.get(file_id, file_id)
+            return actual, self._owners.get(actual)
+
+    def set_alias(self, file_id: str, replacement_id: str) -> None:
+        """failover: file_id 를 replacement_id 로 연결하고, 죽은 backend 에 있던 이전 file id 의 기록은 제거."""
+        with self._lock:
+            previous = self._aliases.get(file_id, file_id)
+            if previous != replacement_id:
+                self._owners.pop(previous, None)
+                self._sources.pop(previous, None)
+            self._aliases[file_id] = replacement_id
+
+    def source_of(self, file_id: str) -> Optional[str]:
+        with self._lock:
+            return self._sources.get(file_id) or self._sources.get(self._aliases.get(file_id, ""))
+
+    def forget_file(self, file_id: str) -> None:
+        with self._lock:
+            actual = self._aliases.pop(file_id, file_id)
+            for key in {file_id, actual}:
+                self._owners.pop(key, None)
+                self._sources.pop(key, None)
+
+    def owner_url(self, file_id: str) -> Optional[str]:
+        _, backend = self.resolve(file_id)
+        return backend.url if backend else None
+
+    def status(self) -> List[Dict[str, Any]]:
+        """backend 별 상태 (health, circuit, 진행 중 / 누적 요청 수, 소유 파일 수, 마지막 오류)."""
+        with self._lock:
+            owned = {}
+            for backend in self._owners.values():
+                owned[backend.url] = owned.get(backend.url, 0) + 1
+            return [
+                {
+                    "url": backend.url,
+                    "healthy": backend.healthy,
+                    "circuit": backend.circuit_breaker.state,
+                    "outstanding": backend.outstanding,
+                    "requests": backend.requests,
+                    "failures": backend.failures,
+                    "files": owned.get(backend.url, 0),
+                    "last_error": backend.last_error,
+                }
+                for backend in self.backends
+            ]
+
+    def no_backend_error(self, last_error: Optional[BaseException] = None) -> VSSRequestError:
+        detail = f" (last error: {type(last_error).__name__}: {last_error})" if last_error else ""
+        urls = ", ".join(backend.url for backend in self.backends)
+        return VSSRequestError(f"[BackendPool] No healthy VSS backend among {urls}{detail}", 503)
+
+    # ------------------------------------------------------------------
+    # 요청 plan (클라이언트가 BackendCall 을 실행하고 결과 / 예외를 send / throw)
+    # ------------------------------------------------------------------
+    def health_plan(self, timeout: Optional[float] = None) -> "Plan":
+        """모든 backend 를 확인하고 하나라도 healthy 이면 True."""
+        results = yield [self._probe_call(backend, timeout) for backend in self.backends]
+        for backend, healthy in zip(self.backends, results):
+            self.set_health(backend, healthy)
+        return any(results)
+
+    def upload_plan(
+        self, file_path: str, exclude: Iterable[str] = (), last_error: Optional[BaseException] = None, **kwargs
+    ) -> "Plan":
+        """진행 중 요청이 가장 적은 healthy backend 에 업로드 (backend 장애면 다른 backend 로)."""
+        exclude = set(exclude)
+        while True:
+            backend = yield from self._select_plan(exclude, last_error)
+            try:
+                result = yield BackendCall(backend, "upload_video", (file_path,), kwargs)
+            except Exception as e:
+                self._handle_error(backend, e)
+                exclude.add(backend.url)
+                last_error = e
+                continue
+            self.register_file(result["id"], backend, file_path)
+            return result
+
+    def delete_plan(self, file_id: str) -> "Plan":
+        actual, backend = yield from self._owner_plan(file_id)
+        result = yield BackendCall(backend, "delete_video", (actual,))
+        self.forget_file(file_id)
+        return result
+
+    def get_file_plan(self, file_id: str) -> "Plan":
+        """소유 backend 에서 조회. 소유 backend 를 모르면 모든 backend 에서 찾고, 장애 중이면 None (다시 업로드하도록)."""
+        actual, backend = self.resolve(file_id)
+        if backend is None:
+            return (yield from self._discover_plan(actual))
+        try:
+            info = yield BackendCall(backend, "get_file", (actual,))
+        except Exception as e:
+            self._handle_error(backend, e)
+            return None
+        if info is None:
+            self.forget_file(file_id)
+        return info
+
+    def generate_plan(self, video_id: str, model: str, **kwargs) -> "Plan":
+        """video_id 를 가진 backend 로 요청. 그 backend 가 죽으면 원본 파일을 다른 backend 에 다시 올려 재시도."""
+        actual, backend = yield from self._owner_plan(video_id)
+        tried = set()
+        while True:
+            try:
+                return (yield BackendCall(backend, "generate_vlm_captions", (actual, model), kwargs))
+            except Exception as e:
+                self._handle_error(backend, e)
+                tried.add(backend.url)
+                source = self.source_of(video_id)
+                if not source or not os.path.exists(source):
+                    raise
+                logger.warning(f"[BackendPool] Failing over {video_id} from {backend.url}: re-uploading {source}")
+                uploaded = yield from self.upload_plan(source, exclude=tried, last_error=e)
+                actual = uploaded["id"]
+                backend = self.resolve(actual)[1]
+                self.set_alias(video_id, actual)
+
+    def _probe_call(self, backend: Backend, timeout: Optional[float] = None) -> "BackendCall":
+        return BackendCall(backend, "health_check", (timeout or self.health_timeout,), tracked=False)
+
+    def _select_plan(self, exclude: Iterable[str], last_error: Optional[BaseException] = None) -> "Plan":
+        due = [backend for backend in self.due_for_check() if backend.url not in exclude]
+        if due:
+            results = yield [self._probe_call(backend) for backend in due]
+            for backend, healthy in zip(due, results):
+                self.set_health(backend, healthy)
+        candidates = self.candidates(exclude)
+        if not candidates:
+            raise self.no_backend_error(last_error) from last_error
+        return candidates[0]
+
+    def _owner_plan(self, file_id: str) -> "Plan":
+        """(실제 file id, 소유 backend). 모르면 모든 backend 에서 찾음."""
+        actual, backend = self.resolve(file_id)
+        if backend is None:
+            if (yield from self._discover_plan(actual)) is None:
+                raise VSSRequestError(f"[BackendPool] File {file_id} not found on any VSS backend", 404)
+            actual, backend = self.resolve(file_id)
+        return actual, backend
+
+    def _discover_plan(self, file_id: str) -> "Plan":
+        for backend in self.candidates():
+            try:
+                info = yield BackendCall(backend, "get_file", (file_id,))
+            except Exception as e:
+                self._handle_error(backend, e)
+                continue
+            if info is not None:
+                self.register_file(file_id, backend)
+                return info
+        return None
+
+
+@dataclass
+class BackendCall:
+    """plan 이 클라이언트에게 맡기는 backend 호출 1건 (tracked 이면 outstanding 에 포함)"""
+    backend: Backend
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    tracked: bool = True
+
+
+# plan: BackendCall 또는 BackendCall 목록 (동시에 실행해도 되는 health check) 을 yield 하고 결과를 돌려받는 generator
+Plan = Generator[Union[BackendCall, List[BackendCall]], Any, Any]
+
+
+def _split_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """backend 별 클라이언트에 넘길 옵션 (circuit breaker 는 backend 마다 따로 사용)."""
+    options = dict(options)
+    options.pop("circuit_breaker", None)
+    options.pop("base_url", None)
+    return options
+
+
+class _PooledClientBase(PromptPresetMixin):
+    """PooledVSSClient / AsyncPooledVSSClient 공용: backend 별 클라이언트 생성과 상태 조회."""
+
+    def __init__(
+        self,
+        base_urls: Iterable[str],
+        client_class: type,
+        pool: Optional[BackendPool] = None,
+        health_interval: float = 30.0,
+        health_timeout: float = 3.0,
+        **client_options,
+    ):
+        self.pool = pool or BackendPool(base_urls, health_interval, health_timeout=health_timeout)
+        self.base_url = self.pool.backends[0].url
+        self.default_chunk_duration = client_options.get("default_chunk_duration", 2)
+        self.default_chunk_overlap_duration = client_options.get("default_chunk_overlap_duration", 0)
+        self.prompt_presets = client_options.get("prompt_presets") or {}
+        self.response_cache = client_options.get("response_cache")
+        self.metrics = client_options.get("metrics") or MetricsRegistry()
+
+        options = _split_options(client_options)
+        options.update(prompt_presets=self.prompt_presets, metrics=self.metrics)
+        self._clients = {}
+        for backend in self.pool.backends:
+            client = client_class(backend.url, circuit_breaker=backend.circuit_breaker, **options)
+            client.prompt_presets = self.prompt_presets  # 프리셋 추가 / 삭제를 모든 backend 가 공유
+            self._clients[backend.url] = client
+        self._last_url = self.base_url
+
+    @property
+    def last_timing(self):
+        """마지막으로 사용한 backend 의 마지막 요청 시간 측정."""
+        return self._clients[self._last_url].last_timing
+
+    def get_request_timings(self):
+        """모든 backend 의 최근 요청 시간 측정 결과."""
+        return [timing for client in self._clients.values() for timing in client.get_request_timings()]
+
+    def get_backend_status(self) -> List[Dict[str, Any]]:
+        return self.pool.status()
+
+    def register_source(self, file_id: str, source_path: str) -> None:
+        self.pool.register_source(file_id, source_path)
+
+    def _method(self, call: BackendCall):
+        if call.tracked:
+            self._last_url = call.backend.url
+        return getattr(self._clients[call.backend.url], call.method)
+
+
+class PooledVSSClient(_PooledClientBase):
+    """
+    여러 backend 에 나눠 보내는 VSSClient. 메서드와 인자는 VSSClient 와 같음.
+
+    Args:
+        base_urls: VSS 서버 주소 목록
+        pool: 공유할 BackendPool (None 이면 새로 생성)
+        health_interval / health_timeout: unhealthy backend 재확인 간격, health check timeout (초, pool 을 새로 만들 때만 사용)
+        client_options: 각 backend 의 VSSClient 인자 (metrics / response_cache / prompt_presets 는 모든 backend 가 공유)
+    """
+
+    def __init__(self, base_urls: Iterable[str], pool: Optional[BackendPool] = None, **options):
+        super().__init__(base_urls, VSSClient, pool, **options)
+
+    def close(self) -> None:
+        for client in self._clients.values():
+            client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def health_check(self, timeout: Optional[float] = None) -> bool:
+        """모든 backend 를 확인하고 하나라도 healthy 이면 True."""
+        return self._run(self.pool.health_plan(timeout))
+
+    def upload_video(self, file_path: str, **kwargs) -> Dict[str, Any]:
+        """진행 중 요청이 가장 적은 healthy backend 에 업로드 (실패하면 다른 backend 로). 인자는 VSSClient.upload_video 참고."""
+        return self._run(self.pool.upload_plan(file_path, **kwargs))
+
+    def delete_video(self, file_id: str) -> Dict[str, Any]:
+        return self._run(self.pool.delete_plan(file_id))
+
+    def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        return self._run(self.pool.get_file_plan(file_id))
+
+    def generate_vlm_captions(self, video_id: str, model: str, **kwargs) -> Dict[str, Any]:
+        """video_id 를 가진 backend 로 요청 (failover 포함). 인자는 VSSClient.generate_vlm_captions 참고."""
+        return self._run(self.pool.generate_plan(video_id, model, **kwargs))
+
+    def _run(self, plan: Plan) -> Any:
+        """plan 이 요청한 backend 호출을 순서대로 실행."""
+        result, error = None, None
+        while True:
+            try:
+                request = plan.throw(error) if error is not None else plan.send(result)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result, error = self._call(request), None
+            except Exception as e:
+                result, error = None, e
+
+    def _call(self, request: Union[BackendCall, List[BackendCall]]) -> Any:
+        if isinstance(request, list):
+            return [self._call(call) for call in request]
+        if not request.tracked:
+            return self._method(request)(*request.args, **request.kwargs)
+        with self.pool.track(request.backend):
+            return self._method(request)(*request.args, **request.kwargs)
+
+
+class AsyncPooledVSSClient(_PooledClientBase):
+    """
+    PooledVSSClient 의 asyncio 버전 (backend 마다 AsyncVSSClient). 메서드와 인자는 AsyncVSSClient 와 같음.
+    PooledVSSClient 와 같은 pool 을 주면 health / 파일 소유 정보를 공유함.
+    """
+
+    def __init__(self, base_urls: Iterable[str], pool: Optional[BackendPool] = None, **options):
+        try:
+            from .VSS_async_client import AsyncVSSClient
+        except ImportError:
+            from VSS_async_client import AsyncVSSClient
+        super().__init__(base_urls, AsyncVSSClient, pool, **options)
+
+    async def close(self) -> None:
+        for client in self._clients.values():
+            await client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def health_check(self, timeout: Optional[float] = None) -> bool:
+        return await self._run(self.pool.health_plan(timeout))
+
+    async def upload_video(self, file_path: str, **kwargs) -> Dict[str, Any]:
+        return await self._run(self.pool.upload_plan(file_path, **kwargs))
+
+    async def delete_video(self, file_id: str) -> Dict[str, Any]:
+        return await self._run(self.pool.delete_plan(file_id))
+
+    async def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        return await self._run(self.pool.get_file_plan(file_id))
+
+    async def generate_vlm_captions(self, video_id: str, model: str, **kwargs) -> Dict[str, Any]:
+        return await self._run(self.pool.generate_plan(video_id, model, **kwargs))
+
+    async def _run(self, plan: Plan) -> Any:
+        """PooledVSSClient._run 과 같고, health check 목록은 동시에 실행."""
+        result, error = None, None
+        while True:
+            try:
+                request = plan.throw(error) if error is not None else plan.send(result)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                result, error = await self._call(request), None
+            except Exception as e:
+                result, error = None, e
+
+    async def _call(self, request: Union[BackendCall, List[BackendCall]]) -> Any:
+        if isinstance(request, list):
+            return list(await asyncio.gather(*(self._call(call) for call in request)))
+        if not request.tracked:
+            return await self._method(request)(*request.args, **request.kwargs)
+        with self.pool.track(request.backend):
+            return await self._method(request)(*request.args, **request.kwargs)
+
+
+def create_vss_client(base_url: str, async_client: bool = False, pool: Optional[BackendPool] = None, **options):
+    """
+    base_url 에 주소가 하나면 VSSClient / AsyncVSSClient, 여러 개 (쉼표 구분) 면 PooledVSSClient / AsyncPooledVSSClient.
+    pool 을 주면 그 pool 의 backend 를 사용 (동기 / 비동기 클라이언트가 공유할 때).
+    """
+    urls = [backend.url for backend in pool.backends] if pool else parse_backend_urls(base_url)
+    if not urls:
+        raise ValueError("VSS base_url is empty")
+    if len(urls) == 1 and pool is None:
+        if async_client:
+            try:
+                from .VSS_async_client import AsyncVSSClient
+            except ImportError:
+                from VSS_async_client import AsyncVSSClient
+            return AsyncVSSClient(urls[0], **options)
+        return VSSClient(urls[0], **options)
+    if async_client:
+        return AsyncPooledVSSClient(urls, pool=pool, **options)
+    return PooledVSSClient(urls, pool=pool, **options)
@@ -1,13 +1,34 @@
 import os
 import json
+import logging
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 import json
 import os
 from datetime import datetime
 from unittest import result
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+try:
+    from .VSS_resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, TokenBucket, VSSRequestError
+    from .VSS_upload import DEFAULT_CHUNK_SIZE, StreamingMultipartEncoder, UploadCancelled, UploadProgress
+    from .VSS_response_cache import ResponseCache
+    from .VSS_metrics import MetricsRegistry, RequestMetrics, as_seconds
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from VSS_resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, TokenBucket, VSSRequestError
+    from VSS_upload import DEFAULT_CHUNK_SIZE, StreamingMultipartEncoder, UploadCancelled, UploadProgress
+    from VSS_response_cache import ResponseCache
+    from VSS_metrics import MetricsRegistry, RequestMetrics, as_seconds
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -17,10 +38,244 @@ class PromptPreset:
     system_prompt: Optional[str] = None
 
 
-class VSSClient:
+@dataclass
+class RequestTiming:
+    """요청 1회의 시간 측정 결과 (초 단위)"""
+    context: str
+    method: str
+    url: str
+    status_code: Optional[int]
+    elapsed: float                   # 클라이언트 측 전체 소요 시간 (연결 + 전송 + 응답 body 수신)
+    response_elapsed: Optional[float]  # 요청 전송 ~ 응답 헤더 수신 (requests 의 resp.elapsed)
+    error: Optional[str] = None
+    attempt: int = 1                 # 1 = 최초 요청, 2 이상 = 재시도
+
+
+# 현재 스레드에서 요청 1회 동안 새 연결에 쓴 시간 (DNS + TCP + TLS, 초)
+_connect_time = threading.local()
+
+
+class _TimedConnectionMixin:
+    """connect() 소요 시간을 _connect_time 에 누적 (재사용 연결은 connect 를 호출하지 않으므로 0)."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_time.value = getattr(_connect_time, "value", 0.0) + time.perf_counter() - started
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """연결 시간을 측정하는 connection 을 쓰는 HTTPAdapter."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class PromptPresetMixin:
+    """
+    프롬프트 프리셋 관리와 generate_vlm_captions 요청 구성 (동기 / 비동기 클라이언트 공용).
+    사용하는 클래스는 base_url, prompt_presets, default_chunk_duration, default_chunk_overlap_duration 을 가져야 함.
+    """
+
+    # generate_vlm_captions 응답 캐시 (None 이면 사용 안 함)
+    response_cache: Optional[ResponseCache] = None
+
+    # 호출별 측정값 저장소
+    metrics: MetricsRegistry
+
+    def _new_metrics(self, method: str, url: str, context: str, model: Optional[str]) -> RequestMetrics:
+        return RequestMetrics(context=context, method=method, url=url, started_at=time.time(), model=model)
+
+    @staticmethod
+    def _body_size(data) -> int:
+        """request body 크기 (bytes). 알 수 없으면 0."""
+        if data is None:
+            return 0
+        if isinstance(data, str):
+            return len(data.encode("utf-8"))
+        try:
+            return len(data)
+        except TypeError:
+            return 0
+
+    def _finish_caption_metrics(self, metrics: RequestMetrics, result: Dict[str, Any]) -> None:
+        """generate_vlm_captions 응답의 execution_time 을 server_time 으로 기록하고 registry 에 저장."""
+        metrics.server_time = as_seconds(result.get("execution_time"))
+        self.metrics.record(metrics)
+
+    # ------------------------------------------------------------------
+    # 프롬프트 프리셋 관리 기능
+    # ------------------------------------------------------------------
+    def add_preset(self, name: str, prompt: str, system_prompt: Optional[str] = None) -> None:
+        """
+        새로운 프롬프트 프리셋 등록.
+        """
+        self.prompt_presets[name] = PromptPreset(prompt=prompt, system_prompt=system_prompt)
+
+    def remove_preset(self, name: str) -> None:
+        """
+        프롬프트 프리셋 삭제.
+        """
+        if name in self.prompt_presets:
+            del self.prompt_presets[name]
+
+    def get_preset(self, name: str) -> PromptPreset:
+        """
+        프리셋 조회.
+        """
+        preset = self.prompt_presets.get(name)
+        if preset is None:
+            raise ValueError(f"Unknown prompt preset: {name}")
+        return preset
+
+    def list_presets(self) -> Dict[str, PromptPreset]:
+        """
+        등록된 모든 프리셋 반환.
+        """
+        return dict(self.prompt_presets)
+    
+    @staticmethod
+    def save_json(data: dict, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+    def _build_caption_request(
+        self,
+        video_id: str,
+        model: str,
+        preset_name: Optional[str] = None,
+        prompt: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        chunk_duration: Optional[int] = None,
+        chunk_overlap_duration: Optional[int] = None,
+        response_format: str = "json_object",
+        extra_params: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+    ):
+        """generate_vlm_captions 요청의 (url, payload, headers) 구성. 인자는 generate_vlm_captions 참고."""
+        url = f"{self.base_url}/generate_vlm_captions"
+
+        # 3. 프리셋에서 prompt / system_prompt 가져오기
+        preset_prompt = None
+        preset_system_prompt = None
+        if preset_name:
+            preset = self.prompt_presets.get(preset_name)
+            if preset is None:
+                raise ValueError(f"Unknown prompt preset: {preset_name}")
+            preset_prompt = preset.prompt
+            preset_system_prompt = preset.system_prompt
+
+        final_prompt = prompt if prompt is not None else preset_prompt
+        final_system_prompt = system_prompt if system_prompt is not None else preset_system_prompt
+
+        if final_prompt is None:
+            raise ValueError(
+                "No prompt provided. Set either prompt=... or preset_name referencing a stored prompt."
+            )
+
+        cd = chunk_duration if chunk_duration is not None else self.default_chunk_duration
+        cod = chunk_overlap_duration if chunk_overlap_duration is not None else self.default_chunk_overlap_duration
+
+        payload: Dict[str, Any] = {
+            # 서버 스펙에 따라 "id"가 리스트인지 단일 값인지 다를 수 있음.
+            # 여기서는 단일 ID 사용을 가정.
+            "id": video_id,
+            "model": model,
+            "prompt": final_prompt,
+            "system_prompt": final_system_prompt,
+            "chunk_duration": cd,
+            "chunk_overlap_duration": cod,
+            "response_format": {"type": response_format}
+        }
+
+        # system_prompt가 필요할 경우 포함
+        if final_system_prompt is not None:
+            payload["system_prompt"] = final_system_prompt
+
+        # 추가 파라미터 (temperature, top_p, max_tokens 등)
+        if extra_params:
+            payload.update(extra_params)
+
+        headers = {"Content-Type": "application/json"}
+        if request_id:
+            headers["X-Request-ID"] = request_id
+            headers["Idempotency-Key"] = request_id
+
+        return url, payload, headers
+
+    # ------------------------------------------------------------------
+    # 응답 캐시
+    # ------------------------------------------------------------------
+    def get_cached_captions(
+        self,
+        video_hash: str,
+        model: str,
+        preset_name: Optional[str] = None,
+        prompt: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        chunk_duration: Optional[int] = None,
+        chunk_overlap_duration: Optional[int] = None,
+        response_format: str = "json_object",
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        같은 영상 내용 / 요청의 캐시된 generate_vlm_captions 응답 (없으면 None).
+        서버에 요청하지 않으므로 업로드 전에 확인할 수 있음.
+        """
+        if self.response_cache is None or not video_hash:
+            return None
+        _, payload, _ = self._build_caption_request(
+            "", model, preset_name, prompt, system_prompt,
+            chunk_duration, chunk_overlap_duration, response_format, extra_params,
+        )
+        return self._cached_response(video_hash, payload)
+
+    def _cached_response(self, video_hash: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cached = self.response_cache.get(ResponseCache.make_key(video_hash, payload))
+        if cached is not None:
+            cached["cache_hit"] = True
+        return cached
+
+    def _store_response(self, video_hash: Optional[str], payload: Dict[str, Any], result: Dict[str, Any]) -> None:
+        if self.response_cache is not None and video_hash:
+            self.response_cache.put(ResponseCache.make_key(video_hash, payload), result, payload)
+
+
+class VSSClient(PromptPresetMixin):
     """
     NVIDIA VSS (Video Search and Summarization) 서버와 통신하는 클라이언트.
     공개된 VSS API 문서를 기준으로 작성됨. (https://docs.nvidia.com/vss/latest/content/API_doc.html)
+
+    모든 요청은 하나의 requests.Session (connection pool, keep-alive) 을 통해 전송되며
+    connect / read timeout 이 항상 적용됨. 요청별 소요 시간은 last_timing / get_request_timings() 로 조회.
+
+    연결 오류와 429/5xx 는 RetryPolicy 에 따라 재시도하고 (Retry-After 준수), 연속 실패 시
+    CircuitBreaker 가 요청을 차단함. 업로드와 캡션 생성처럼 서버 작업을 만드는 요청은
+    서버가 받지 않은 것이 확실한 경우(연결 실패, 429, 503)에만 재시도하며,
+    generate_vlm_captions 에 request_id 를 주면 같은 ID 로 모든 실패를 재시도함.
     """
 
     def __init__(
@@ -29,6 +284,17 @@ class VSSClient:
         default_chunk_duration: int = 2,
         default_chunk_overlap_duration: int = 0,
         prompt_presets: Optional[Dict[str, PromptPreset]] = None,
+        pool_size: int = 10,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 900.0,
+        keep_alive: bool = True,
+        timing_history: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limit: Optional[float] = None,
+        model_rate_limits: Optional[Dict[str, float]] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+        metrics: Optional[MetricsRegistry] = None,
     ):
         """
         Args:
@@ -36,12 +302,69 @@ class VSSClient:
             default_chunk_duration: 별도 지정 없을 때 사용할 기본 chunk duration (초 단위)
             default_chunk_overlap_duration: 별도 지정 없을 때 사용할 기본 chunk overlap duration (초 단위)
             prompt_presets: 이름으로 불러 쓸 프롬프트 프리셋 딕셔너리
+            pool_size: 호스트당 유지할 최대 연결 수 (동시 요청 수 이상으로 설정)
+            connect_timeout: TCP 연결 timeout (초). 서버가 죽어 있으면 이 시간 안에 실패
+            read_timeout: 응답 대기 timeout (초). generate_vlm_captions 는 수 분이 걸릴 수 있으므로 넉넉하게
+            keep_alive: False 이면 매 요청 후 연결을 닫음 (Connection: close)
+            timing_history: 보관할 최근 요청 시간 측정 개수
+            retry_policy: 재시도 규칙 (None 이면 기본 RetryPolicy, 재시도를 끄려면 RetryPolicy(max_retries=0))
+            rate_limit: 모든 요청에 적용할 초당 요청 수 제한 (None 이면 제한 없음)
+            model_rate_limits: 모델별 generate_vlm_captions 초당 요청 수 제한 (예: {"gpt-4o": 0.5})
+            circuit_breaker: 공유할 CircuitBreaker (None 이면 클라이언트 전용 기본값)
+            response_cache: generate_vlm_captions 응답 캐시 (video_hash 를 준 요청에만 적용)
+            metrics: 호출별 측정값(연결 / 업로드 / TTFB / 서버 처리 시간 / 재시도)을 기록할 registry
+                (None 이면 클라이언트 전용, 여러 클라이언트가 공유 가능)
         """
         self.base_url = base_url.rstrip("/")
         self.default_chunk_duration = default_chunk_duration
         self.default_chunk_overlap_duration = default_chunk_overlap_duration
         self.prompt_presets: Dict[str, PromptPreset] = prompt_presets or {}
 
+        # 연결 재사용을 위한 pooled session
+        self.timeout = (connect_timeout, read_timeout)
+        self._session = requests.Session()
+        adapter = _TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+        # 요청별 시간 측정
+        self.last_timing: Optional[RequestTiming] = None
+        self._timings = deque(maxlen=timing_history)
+        self.metrics = metrics or MetricsRegistry()
+
+        # 재시도 / 속도 제한 / circuit breaker
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+        self._model_rate_limiters = {
+            model: TokenBucket(rate) for model, rate in (model_rate_limits or {}).items() if rate
+        }
+        self.response_cache = response_cache
+
+    def close(self) -> None:
+        """Session 의 모든 연결을 닫음."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def get_request_timings(self) -> List[RequestTiming]:
+        """최근 요청들의 시간 측정 결과 (오래된 순)."""
+        return list(self._timings)
+
+    def health_check(self, timeout: float = 3.0) -> bool:
+        """GET /health/ready 가 200 이면 True. 재시도 / circuit breaker 를 거치지 않음."""
+        try:
+            resp = self._session.get(f"{self.base_url}/health/ready", timeout=(timeout, timeout))
+            resp.close()
+            return resp.status_code == 200
+        except requests.RequestException:
+            return False
+
     # ------------------------------------------------------------------
     # 1. 비디오 업로드 / 삭제
     # ------------------------------------------------------------------
@@ -50,9 +373,13 @@ class VSSClient:
         file_path: str,
         purpose: str = "vision",
         media_type: str = "video",
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        cancel_event=None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> Dict[str, Any]:
         """
         VSS 서버에 비디오(또는 이미지)를 업로드.
+        multipart body 를 chunk_size 단위로 stream 하므로 파일 크기와 관계없이 메모리 사용량이 일정함.
 
         Args:
             file_path: 업로드할 파일 경로
@@ -60,6 +387,9 @@ class VSSClient:
                 기본: "vision". 그 이외에는 뭐가 있는지 VSS API 문서에 명시되어 있지 않음..
                 참고: https://docs.nvidia.com/vss/latest/content/API_doc.html#files-files-post
             media_type: "video" 또는 "image"
+            progress_callback: UploadProgress (전송 bytes, 처리량, ETA) 를 받는 함수. 전송 스레드에서 호출됨
+            cancel_event: threading.Event. set 하면 업로드를 중단하고 UploadCancelled 발생
+            chunk_size: 파일을 읽어 보내는 단위 (bytes)
 
         Returns:
             서버에서 반환한 JSON (보통 {id, filename, bytes, purpose, media_type} 등)
@@ -69,16 +399,19 @@ class VSSClient:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        files = {
-            "file": open(file_path, "rb"),
-            "purpose": (None, purpose),
-            "media_type": (None, media_type),
-        }
+        encoder = StreamingMultipartEncoder(
+            "file", file_path,
+            fields={"purpose": purpose, "media_type": media_type},
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event,
+        )
 
         try:
-            resp = requests.post(url, files=files)
+            # 업로드는 서버에 파일을 만들기 때문에 idempotent 하지 않음
+            resp = self._request("POST", url, "upload_video", idempotent=False, data=encoder, headers=encoder.headers)
         finally:
-            files["file"].close()
+            encoder.close()
 
         self._raise_for_error(resp, "upload_video")
         return resp.json()
@@ -94,10 +427,27 @@ class VSSClient:
             서버의 JSON 응답
         """
         url = f"{self.base_url}/files/{file_id}"
-        resp = requests.delete(url)
+        resp = self._request("DELETE", url, "delete_video")
         self._raise_for_error(resp, "delete_video")
         return resp.json()
 
+    def get_file(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """
+        업로드된 파일 정보 조회. 서버에 없으면 (404) None.
+
+        Args:
+            file_id: VSS 서버에서 관리하는 파일 ID
+
+        Returns:
+            서버의 JSON 응답 (파일 정보) 또는 None
+        """
+        url = f"{self.base_url}/files/{file_id}"
+        resp = self._request("GET", url, "get_file")
+        if resp.status_code == 404:
+            return None
+        self._raise_for_error(resp, "get_file")
+        return resp.json()
+
     # ------------------------------------------------------------------
     # 2. generate_vlm_captions 기능
     # ------------------------------------------------------------------
@@ -111,7 +461,10 @@ class VSSClient:
         chunk_duration: Optional[int] = None,
         chunk_overlap_duration: Optional[int] = None,
         response_format: str = "json_object",
-        extra_params: Optional[Dict[str, Any]] = None
+        extra_params: Optional[Dict[str, Any]] = None,
+        request_id: Optional[str] = None,
+        video_hash: Optional[str] = None,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         VLM 기반 캡션 생성 요청. 이 요청을 기반으로 timestamp와 object ID 추출이 이루어짐.
@@ -126,111 +479,202 @@ class VSSClient:
             chunk_overlap_duration: 청크 겹침 길이(초). None이면 default_chunk_overlap_duration 사용
             response_format: 서버에서 지원하는 응답 포맷 (예: "json_object" / "text")
             extra_params: temperature, top_p 등 추가 파라미터를 딕셔너리로 전달
+            request_id: 요청 ID (X-Request-ID / Idempotency-Key 헤더로 전송). 서버가 같은 ID 를
+                중복 처리하지 않는 경우에만 지정. 지정하면 read timeout / 5xx 도 같은 ID 로 재시도하고,
+                지정하지 않으면 서버 작업이 중복되지 않도록 연결 실패 / 429 / 503 만 재시도
+            video_hash: 영상 내용의 SHA-256. 주면 response_cache 에서 같은 요청의 응답을 찾고 (hit 이면 "cache_hit": True),
+                없으면 서버 응답을 저장
+            use_cache: False 이면 캐시를 조회하지 않고 서버에 요청 (응답은 새로 저장)
 
         Returns:
             서버의 JSON 응답
         """
-        url = f"{self.base_url}/generate_vlm_captions"
-
-        # 3. 프리셋에서 prompt / system_prompt 가져오기
-        preset_prompt = None
-        preset_system_prompt = None
-        if preset_name:
-            preset = self.prompt_presets.get(preset_name)
-            if preset is None:
-                raise ValueError(f"Unknown prompt preset: {preset_name}")
-            preset_prompt = preset.prompt
-            preset_system_prompt = preset.system_prompt
-
-        final_prompt = prompt if prompt is not None else preset_prompt
-        final_system_prompt = system_prompt if system_prompt is not None else preset_system_prompt
-
-        if final_prompt is None:
-            raise ValueError(
-                "No prompt provided. Set either prompt=... or preset_name referencing a stored prompt."
-            )
-
-        cd = chunk_duration if chunk_duration is not None else self.default_chunk_duration
-        cod = chunk_overlap_duration if chunk_overlap_duration is not None else self.default_chunk_overlap_duration
-
-        payload: Dict[str, Any] = {
-            # 서버 스펙에 따라 "id"가 리스트인지 단일 값인지 다를 수 있음.
-            # 여기서는 단일 ID 사용을 가정.
-            "id": video_id,
-            "model": model,
-            "prompt": final_prompt,
-            "system_prompt": final_system_prompt,
-            "chunk_duration": cd,
-            "chunk_overlap_duration": cod,
-            "response_format": {"type": response_format}
-        }
-
-        # system_prompt가 필요할 경우 포함
-        if final_system_prompt is not None:
-            payload["system_prompt"] = final_system_prompt
-
-        # 추가 파라미터 (temperature, top_p, max_tokens 등)
-        if extra_params:
-            payload.update(extra_params)
-
-        headers = {"Content-Type": "application/json"}
+        url, payload, headers = self._build_caption_request(
+            video_id, model, preset_name, prompt, system_prompt,
+            chunk_duration, chunk_overlap_duration, response_format, extra_params, request_id,
+        )
+        if use_cache and self.response_cache is not None and video_hash:
+            cached = self._cached_response(video_hash, payload)
+            if cached is not None:
+                return cached
 
         # resp = requests.post(url, data=json.dumps(payload), headers=headers)
         # self._raise_for_error(resp, "generate_vlm_captions")
         # return resp.json()
 
 
-        resp = requests.post(url, data=json.dumps(payload), headers=headers)
-        self._raise_for_error(resp, "generate_vlm_captions")
-        result = resp.json()
+        resp = self._request(
+            "POST", url, "generate_vlm_captions",
+            idempotent=bool(request_id),
+            rate_limiter=self._model_rate_limiters.get(model),
+            model=model, record_metrics=False,
+            data=json.dumps(payload), headers=headers,
+        )
+        result = {}
+        try:
+            self._raise_for_error(resp, "generate_vlm_captions")
+            result = resp.json()
+        finally:
+            self._finish_caption_metrics(resp.metrics, result)
         # 서버 응답에 execution_time이 있으면 사용, 없으면 클라이언트 측 측정값 사용
         if "execution_time" not in result:
             result["execution_time"] = resp.elapsed.total_seconds()
+        self._store_response(video_hash, payload, result)
         return result
     
     # ------------------------------------------------------------------
-    # 3. 프롬프트 프리셋 관리 기능
+    # 내부 유틸
     # ------------------------------------------------------------------
-    def add_preset(self, name: str, prompt: str, system_prompt: Optional[str] = None) -> None:
-        """
-        새로운 프롬프트 프리셋 등록.
+    def _request(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        idempotent: bool = True,
+        rate_limiter: Optional[TokenBucket] = None,
+        model: Optional[str] = None,
+        record_metrics: bool = True,
+        **kwargs,
+    ) -> requests.Response:
         """
-        self.prompt_presets[name] = PromptPreset(prompt=prompt, system_prompt=system_prompt)
-
-    def remove_preset(self, name: str) -> None:
+        Pooled session 으로 요청을 보내고 소요 시간을 기록.
+        RetryPolicy 에 따라 재시도하며, 비멱등 요청(idempotent=False)은 서버가 요청을 받지 않은 것이
+        확실한 경우(연결 실패, 429, 503)에만 재시도. 마지막 응답은 status 와 관계없이 반환됨.
+        호출 전체의 RequestMetrics 는 resp.metrics 에 붙으며, record_metrics=False 이면 호출자가
+        (server_time 등을 채운 뒤) registry 에 기록함. 예외로 끝나면 항상 여기서 기록.
         """
-        프롬프트 프리셋 삭제.
-        """
-        if name in self.prompt_presets:
-            del self.prompt_presets[name]
+        kwargs.setdefault("timeout", self.timeout)
+        metrics = self._new_metrics(method, url, context, model)
+        started = time.perf_counter()
+        try:
+            resp = self._request_with_retries(method, url, context, idempotent, rate_limiter, metrics, **kwargs)
+        except BaseException as e:
+            metrics.error = f"{type(e).__name__}: {e}"
+            metrics.total = time.perf_counter() - started
+            self.metrics.record(metrics)
+            raise
+        metrics.total = time.perf_counter() - started
+        resp.metrics = metrics
+        if record_metrics:
+            self.metrics.record(metrics)
+        return resp
+
+    def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        idempotent: bool,
+        rate_limiter: Optional[TokenBucket],
+        metrics: RequestMetrics,
+        **kwargs,
+    ) -> requests.Response:
+        policy = self.retry_policy
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.circuit_breaker.before_request(context)
+            if self._rate_limiter:
+                self._rate_limiter.acquire()
+            if rate_limiter:
+                rate_limiter.acquire()
+            self._rewind_files(kwargs.get("files"))
+            if hasattr(kwargs.get("data"), "rewind"):
+                kwargs["data"].rewind()
+
+            metrics.retries = attempt - 1
+            try:
+                resp = self._send(method, url, context, attempt, metrics, **kwargs)
+            except UploadCancelled:
+                # 사용자 취소는 백엔드 상태와 무관
+                self.circuit_breaker.release_trial()
+                raise
+            except requests.RequestException as e:
+                self.circuit_breaker.record_failure()
+                retryable = idempotent or self._is_connect_failure(e)
+                if not retryable or attempt > policy.max_retries:
+                    raise
+                delay = policy.compute_delay(attempt)
+                logger.warning(f"[VSSClient:{context}] {type(e).__name__}, retry {attempt}/{policy.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            # 5xx 만 백엔드 장애로 간주 (4xx / 429 는 서버가 살아 있음)
+            if resp.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+            retryable = idempotent or resp.status_code in policy.REJECTED_STATUSES
+            if resp.status_code in policy.retry_statuses and retryable and attempt <= policy.max_retries:
+                delay = policy.compute_delay(attempt, resp.headers.get("Retry-After"))
+                logger.warning(f"[VSSClient:{context}] HTTP {resp.status_code}, retry {attempt}/{policy.max_retries} in {delay:.1f}s")
+                resp.close()
+                time.sleep(delay)
+                continue
+            return resp
+
+    def _send(
+        self, method: str, url: str, context: str, attempt: int, metrics: RequestMetrics, **kwargs
+    ) -> requests.Response:
+        """요청 1회 전송 + 시간 기록 (metrics 에는 이 시도의 연결 / 업로드 / TTFB / 크기를 덮어씀)."""
+        data = kwargs.get("data")
+        metrics.upload_bytes = self._body_size(data)
+        metrics.upload = metrics.ttfb = None
+        metrics.download_bytes = 0
+        _connect_time.value = 0.0
+        started = time.perf_counter()
+        resp = None
+        error = None
+        try:
+            resp = self._session.request(method, url, **kwargs)
+            # body 까지 받은 뒤의 시간을 재기 위해 content 접근
+            metrics.download_bytes = len(resp.content or b"")
+            return resp
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            metrics.connect = _connect_time.value
+            metrics.upload = getattr(data, "send_duration", None)
+            if resp is not None:
+                metrics.status_code = resp.status_code
+                metrics.ttfb = resp.elapsed.total_seconds()
+            timing = RequestTiming(
+                context=context,
+                method=method,
+                url=url,
+                status_code=resp.status_code if resp is not None else None,
+                elapsed=time.perf_counter() - started,
+                response_elapsed=resp.elapsed.total_seconds() if resp is not None else None,
+                error=error,
+                attempt=attempt,
+            )
+            self.last_timing = timing
+            self._timings.append(timing)
 
-    def get_preset(self, name: str) -> PromptPreset:
-        """
-        프리셋 조회.
-        """
-        preset = self.prompt_presets.get(name)
-        if preset is None:
-            raise ValueError(f"Unknown prompt preset: {name}")
-        return preset
+    @staticmethod
+    def _is_connect_failure(e: requests.RequestException) -> bool:
+        """연결 단계에서 실패 (요청이 서버에 도달하지 않음)."""
+        if isinstance(e, requests.ConnectTimeout):
+            return True
+        if isinstance(e, requests.ConnectionError) and e.args:
+            return isinstance(getattr(e.args[0], "reason", None), NewConnectionError)
+        return False
 
-    def list_presets(self) -> Dict[str, PromptPreset]:
-        """
-        등록된 모든 프리셋 반환.
-        """
-        return dict(self.prompt_presets)
-    
     @staticmethod
-    def save_json(data: dict, path: str):
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+    def _rewind_files(files) -> None:
+        """재시도 시 업로드 파일 스트림을 처음으로 되돌림."""
+        if not files:
+            return
+        for value in files.values():
+            if hasattr(value, "seek"):
+                value.seek(0)
 
-    # ------------------------------------------------------------------
-    # 내부 유틸
-    # ------------------------------------------------------------------
     @staticmethod
     def _raise_for_error(resp: requests.Response, context: str) -> None:
-        """HTTP 에러 공통 처리."""
+        """HTTP 에러 공통 처리. VSSRequestError 는 RuntimeError 이므로 기존 처리와 호환."""
         try:
             resp.raise_for_status()
         except requests.HTTPError as e:
@@ -239,7 +683,7 @@ class VSSClient:
                 msg = err_json.get("message") or err_json
             except Exception:
                 msg = resp.text
-            raise RuntimeError(f"[VSSClient:{context}] HTTP {resp.status_code} - {msg}") from e
+            raise VSSRequestError(f"[VSSClient:{context}] HTTP {resp.status_code} - {msg}", resp.status_code) from e
 
 
 # ----------------------------------------------------------------------
@@ -0,0 +1,218 @@
+"""
+VLM 작업(업로드 + 캡션 생성) 상태를 SQLite 에 기록하는 영구 작업 저장소
+
+Omniverse 를 중간에 닫으면 진행 중이던 작업, video id, 입력 설정이 모두 사라지므로 작업마다
+상태 / 입력 / 서버 id / 결과 경로를 기록해 두고, 다음 실행 때 끝나지 않은 작업을 이어서 처리함.
+
+상태: queued -> uploading -> generating -> done
+                                       \\-> failed / cancelled
+- 취소는 request_cancel() 로 표시하며, 실행 중인 작업은 실행 측이 표시를 보고 cancelled 로 기록
+- 강제 종료로 중단된 작업은 uploading / generating 상태로 남아 unfinished() 로 조회됨
+
+VLMClientCore 가 사용하며, 표준 라이브러리만 사용함.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class JobState:
+    QUEUED = "queued"
+    UPLOADING = "uploading"
+    GENERATING = "generating"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    UNFINISHED = (QUEUED, UPLOADING, GENERATING)
+    FINISHED = (DONE, FAILED, CANCELLED)
+
+
+@dataclass
+class Job:
+    """작업 1개의 기록"""
+    id: int
+    state: str
+    video_filename: str
+    model: str
+    preset: str
+    params: Dict[str, Any]          # chunk_overlap_duration, use_cache, segment_duration 등
+    video_id: Optional[str]         # 서버 file id
+    output_path: Optional[str]
+    error: Optional[str]
+    cancel_requested: bool
+    attempts: int                   # 실행(재개 포함) 횟수
+    created_at: float
+    updated_at: float
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    state TEXT NOT NULL,
+    video_filename TEXT NOT NULL,
+    model TEXT NOT NULL,
+    preset TEXT NOT NULL,
+    params TEXT NOT NULL DEFAULT '{}',
+    video_id TEXT,
+    output_path TEXT,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state);
+"""
+
+_UPDATABLE = {"state", "video_id", "output_path", "error", "cancel_requested", "attempts"}
+
+
+class JobStore:
+    """
+    Thread-safe SQLite job store.
+
+    Args:
+        path: SQLite 파일 경로
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # 생성 / 조회
+    # ------------------------------------------------------------------
+    def create(
+        self,
+        video_filename: str,
+        model: str,
+        preset: str,
+        params: Optional[Dict[str, Any]] = None,
+        video_id: Optional[str] = None,
+        state: str = JobState.QUEUED,
+    ) -> int:
+        """작업을 기록하고 id 반환."""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (state, video_filename, model, preset, params, video_id, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (state, video_filename, model, preset, json.dumps(params or {}), video_id, now, now),
+            )
+            return cursor.lastrowid
+
+    def get(self, job_id: int) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _to_job(row) if row else None
+
+    def unfinished(self) -> List[Job]:
+        """queued / uploading / generating 작업 (오래된 순)."""
+        return self._select("WHERE state IN (?, ?, ?) ORDER BY id", JobState.UNFINISHED)
+
+    def recent(self, limit: int = 20) -> List[Job]:
+        return self._select("ORDER BY id DESC LIMIT ?", (limit,))
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수."""
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return {state: count for state, count in rows}
+
+    # ------------------------------------------------------------------
+    # 상태 변경
+    # ------------------------------------------------------------------
+    def update(self, job_id: int, **fields) -> None:
+        """state / video_id / output_path / error / cancel_requested / attempts 갱신."""
+        unknown = set(fields) - _UPDATABLE
+        if unknown:
+            raise ValueError(f"Unknown job fields: {sorted(unknown)}")
+        if not fields:
+            return
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET {columns}, updated_at = ? WHERE id = ?",
+                (*fields.values(), time.time(), job_id),
+            )
+
+    def start_attempt(self, job_id: int, state: str) -> None:
+        """실행(재개) 시작: 상태 변경과 attempts 증가."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts + 1, error = NULL, updated_at = ? WHERE id = ?",
+                (state, time.time(), job_id),
+            )
+
+    def request_cancel(self, job_id: int) -> bool:
+        """
+        취소 요청. 대기 중(queued)이면 바로 cancelled, 실행 중이면 표시만 하고 실행 측이 처리.
+        이미 끝난 작업이면 False.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET state = ?, cancel_requested = 1, updated_at = ? WHERE id = ? AND state = ?",
+                (JobState.CANCELLED, now, job_id, JobState.QUEUED),
+            )
+            if cursor.rowcount:
+                return True
+            cursor = self._conn.execute(
+                "UPDATE jobs SET cancel_requested = 1, updated_at = ? WHERE id = ? AND state IN (?, ?)",
+                (now, job_id, JobState.UPLOADING, JobState.GENERATING),
+            )
+            return bool(cursor.rowcount)
+
+    def is_cancel_requested(self, job_id: int) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row[0])
+
+    def prune(self, max_age: float) -> int:
+        """끝난 지 max_age 초가 지난 작업 기록 삭제. 삭제한 수 반환."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM jobs WHERE state IN (?, ?, ?) AND updated_at < ?",
+                (*JobState.FINISHED, time.time() - max_age),
+            )
+            return cursor.rowcount
+
+    def _select(self, clause: str, params) -> List[Job]:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT * FROM jobs {clause}", tuple(params)).fetchall()
+        return [_to_job(row) for row in rows]
+
+
+def _to_job(row: sqlite3.Row) -> Job:
+    return Job(
+        id=row["id"],
+        state=row["state"],
+        video_filename=row["video_filename"],
+        model=row["model"],
+        preset=row["preset"],
+        params=json.loads(row["params"] or "{}"),
+        video_id=row["video_id"],
+        output_path=row["output_path"],
+        error=row["error"],
+        cancel_requested=bool(row["cancel_requested"]),
+        attempts=row["attempts"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
@@ -0,0 +1,190 @@
+"""
+VSS 클라이언트 호출별 측정값 (연결 / 업로드 / 첫 바이트 / 전체 / 서버 처리 시간, 재시도 수) 과 집계 registry
+
+generate_vlm_captions 의 execution_time 만으로는 업로드, VSS 대기 / 디코딩, VLM 추론 중 어디가 느린지
+알 수 없으므로, VSSClient / AsyncVSSClient 가 호출 1회마다 RequestMetrics 를 남김.
+- connect: DNS + TCP(+TLS) 연결 시간. 재사용한 연결이면 0 (AsyncVSSClient 는 dns 를 따로 측정)
+- upload: request body (업로드 파일) 전송 시간, upload_bytes / download_bytes: 송수신 body 크기
+- ttfb: 마지막 시도의 요청 시작 ~ 응답 헤더 수신 (연결 + 전송 + 서버 대기 / 처리)
+- server_time: 응답의 execution_time (서버가 보고한 처리 시간)
+- overhead: ttfb - upload - server_time (네트워크 + 서버 대기열 등 서버 처리 외 시간)
+- total: 호출 전체 (재시도 backoff 포함), retries: 재시도 횟수
+
+MetricsRegistry 는 최근 측정값을 보관하고 context (upload_video, generate_vlm_captions 등) 별
+p50 / p95 / p99 요약을 제공하며, jsonl_path 를 주면 측정값을 한 줄씩 JSONL 로 기록함.
+
+사용법:
+    metrics = MetricsRegistry(jsonl_path="vlm_outputs/vss_metrics.jsonl")
+    client = VSSClient(base_url, metrics=metrics)
+    ...
+    print(metrics.format_summary())
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 요약에 포함하는 시간 항목 (초)
+SUMMARY_FIELDS = ("total", "connect", "upload", "ttfb", "server_time", "overhead")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0 ~ 100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def as_seconds(value: Any) -> Optional[float]:
+    """응답의 execution_time 같은 값을 초(float)로 변환. 숫자가 아니면 None."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RequestMetrics:
+    """클라이언트 호출 1회의 측정값 (시간은 초, 재시도 포함)"""
+    context: str
+    method: str
+    url: str
+    started_at: float                   # time.time()
+    model: Optional[str] = None
+    status_code: Optional[int] = None
+    total: float = 0.0
+    dns: Optional[float] = None         # AsyncVSSClient 만 측정 (VSSClient 는 connect 에 포함)
+    connect: Optional[float] = None
+    upload: Optional[float] = None
+    ttfb: Optional[float] = None
+    server_time: Optional[float] = None
+    upload_bytes: int = 0
+    download_bytes: int = 0
+    retries: int = 0
+    error: Optional[str] = None
+
+    @property
+    def overhead(self) -> Optional[float]:
+        """ttfb 중 업로드와 서버 처리 시간을 뺀 나머지 (네트워크 / 대기열)."""
+        if self.ttfb is None or self.server_time is None:
+            return None
+        return max(0.0, self.ttfb - (self.upload or 0.0) - self.server_time)
+
+    @property
+    def upload_throughput(self) -> Optional[float]:
+        """업로드 bytes/s."""
+        if not self.upload or not self.upload_bytes:
+            return None
+        return self.upload_bytes / self.upload
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["overhead"] = self.overhead
+        data["upload_throughput"] = self.upload_throughput
+        return data
+
+
+class MetricsRegistry:
+    """
+    Thread-safe 측정값 저장소. 여러 클라이언트가 같은 registry 를 공유할 수 있음.
+
+    Args:
+        history: 보관할 최근 측정값 개수
+        jsonl_path: 주면 측정값마다 한 줄씩 append
+    """
+
+    def __init__(self, history: int = 1000, jsonl_path: Optional[str] = None):
+        self._records = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self.jsonl_path = Path(jsonl_path) if jsonl_path else None
+        self._jsonl = None
+
+    def record(self, metrics: RequestMetrics) -> None:
+        with self._lock:
+            self._records.append(metrics)
+            if self.jsonl_path is not None:
+                if self._jsonl is None:
+                    self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._jsonl = open(self.jsonl_path, "a", encoding="utf-8")
+                self._jsonl.write(json.dumps(metrics.to_dict(), ensure_ascii=False) + "\n")
+                self._jsonl.flush()
+
+    def records(self, context: Optional[str] = None) -> List[RequestMetrics]:
+        """보관 중인 측정값 (오래된 순, context 로 거를 수 있음)."""
+        with self._lock:
+            records = list(self._records)
+        return [m for m in records if context is None or m.context == context]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._jsonl is not None:
+                self._jsonl.close()
+                self._jsonl = None
+
+    def export_jsonl(self, path: str) -> int:
+        """보관 중인 측정값을 path 에 JSONL 로 저장. 저장한 수 반환."""
+        records = self.records()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for metrics in records:
+                f.write(json.dumps(metrics.to_dict(), ensure_ascii=False) + "\n")
+        return len(records)
+
+    def summary(self, context: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        context 별 요약:
+            {context: {"count", "errors", "retries", "upload_bytes", "upload_mb_per_s",
+                       "<field>": {"p50", "p95", "p99", "mean"}}}  (field: SUMMARY_FIELDS 중 측정된 항목)
+        """
+        grouped: Dict[str, List[RequestMetrics]] = {}
+        for metrics in self.records(context):
+            grouped.setdefault(metrics.context, []).append(metrics)
+
+        result = {}
+        for name, records in grouped.items():
+            entry: Dict[str, Any] = {
+                "count": len(records),
+                "errors": sum(1 for m in records if m.error or (m.status_code or 0) >= 400),
+                "retries": sum(m.retries for m in records),
+                "upload_bytes": sum(m.upload_bytes for m in records),
+            }
+            upload_time = sum(m.upload or 0.0 for m in records if m.upload_bytes)
+            entry["upload_mb_per_s"] = entry["upload_bytes"] / upload_time / 1e6 if upload_time > 0 else None
+            for field in SUMMARY_FIELDS:
+                values = [v for v in (getattr(m, field) for m in records) if v is not None]
+                if values:
+                    entry[field] = {
+                        "p50": percentile(values, 50),
+                        "p95": percentile(values, 95),
+                        "p99": percentile(values, 99),
+                        "mean": sum(values) / len(values),
+                    }
+            result[name] = entry
+        return result
+
+    def format_summary(self, context: Optional[str] = None) -> str:
+        """summary() 를 사람이 읽을 수 있는 표로 (p50 / p95 / p99, 초)."""
+        lines = []
+        for name, entry in self.summary(context).items():
+            throughput = entry["upload_mb_per_s"]
+            lines.append(
+                f"{name}: {entry['count']} calls, {entry['errors']} errors, {entry['retries']} retries"
+                + (f", upload {entry['upload_bytes'] / 1e6:.1f} MB @ {throughput:.1f} MB/s" if throughput else "")
+            )
+            for field in SUMMARY_FIELDS:
+                if field in entry:
+                    stats = entry[field]
+                    lines.append(f"  {field:<12} p50 {stats['p50']:8.3f}  p95 {stats['p95']:8.3f}  p99 {stats['p99']:8.3f}")
+        return "\n".join(lines)
+
@@ -0,0 +1,107 @@
+"""
+VLM Client 프롬프트 프리셋
+
+VLMClientCore (Omniverse 익스텐션) 와 vss_batch_runner.py (CLI) 가 같은 프롬프트를 쓰도록
+프리셋을 한 곳에서 정의함.
+- twin_view  : 입력 영상을 디지털트윈 BEV 영상으로 묘사
+- simple_view: 단순 도형(번호가 적힌 원)의 움직임으로 묘사
+"""
+
+from typing import Dict
+
+try:
+    from .VSS_client import PromptPreset
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from VSS_client import PromptPreset
+
+
+PROMPT_PRESETS: Dict[str, PromptPreset] = {
+    "twin_view": PromptPreset(
+        prompt=("""
+Analyze the provided BEV digital twin video.
+Identify every frame or moment where two or more objects visually overlap or intersect.
+For each overlapping event, extract:
+- the timestamp shown on the video, and
+- the numbers of all overlapping objects.
+
+Return only a JSON list following this structure:
+[
+  {"HH:MM:SS": [3, 5]},
+  {"HH:MM:SS": [1, 2, 4]}
+]
+"""),
+        system_prompt=("""
+You are a vision-language reasoning model specialized in video understanding. 
+You are given a video generated from a digital twin simulation viewed from a bird's-eye view (BEV).
+In the video:
+- Multiple numbered objects move freely in a shared space.
+- Each object has a visible numeric label.
+- A timestamp (date and time) is displayed at the bottom-right corner of the video.
+- Occasionally, objects visually overlap or intersect.
+
+Your task is to detect all frames or time periods where two or more numbered objects overlap (i.e., their bounding areas visually intersect). 
+
+When an overlap occurs, extract and return:
+1. The exact timestamp displayed on screen.
+2. The list of object numbers involved in the overlap.
+
+Format the final answer as a structured JSON array with this schema:
+[
+  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
+  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
+...
+]
+
+Be concise, accurate, and consistent. Only report actual overlaps (not near contacts).
+If multiple overlaps occur at the same timestamp, list them all in the same entry.
+Do not include any explanatory text or reasoning in the output.
+"""),
+    ),
+    
+    "simple_view": PromptPreset(
+        prompt=("""
+Analyze the video showing moving numbered circles on a white background.
+
+Identify every moment where two or more circles overlap visually.
+For each overlap, extract:
+- the datetime shown on the video
+- the numeric labels of the overlapping circles
+
+Return your answer **only** in the following JSON format:
+
+[
+  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
+  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
+...
+]
+"""),
+        system_prompt=("""
+You are a vision-language model specialized in visual reasoning over video data.
+
+You are given a video where:
+- The background is plain white.
+- Multiple black circular objects move freely across the screen.
+- Each circle has a white numeric label written at its center.
+- A timestamp is displayed in the bottom-right corner of the video.
+- No other visual elements are present.
+
+Your task is to detect every moment when two or more circles visually overlap.
+Overlap is defined as their areas intersect, cover each other, or appear as a single object.
+
+When an overlap occurs, extract and return:
+1. The exact timestamp shown in the bottom-right corner of the video at that moment.
+2. The numeric labels of the overlapping circles.
+
+Return your results strictly in JSON format as follows:
+
+[
+  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
+  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
+...
+]
+
+Only include timestamps where the circles are overlapping — ignore moments when they are merely close or touching edges.
+Do not include any reasoning or description; output **only** the JSON results.
+"""),
+    )
+}
@@ -0,0 +1,196 @@
+"""
+VSS 요청 안정성 유틸 (retry / rate limit / circuit breaker)
+
+- RetryPolicy     : 연결 오류와 429/5xx 에 대한 재시도 규칙 (지수 backoff + full jitter, Retry-After 준수)
+- TokenBucket     : 클라이언트 측 요청 속도 제한 (gpt-4o 등 상용 백엔드의 rate limit 대응)
+- CircuitBreaker  : 연속 실패 시 일정 시간 요청을 차단하여 죽은 백엔드를 계속 두드리지 않음
+
+VSSClient 가 내부에서 사용하며, 외부 의존성 없이 표준 라이브러리만 사용함.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+
+class VSSRequestError(RuntimeError):
+    """HTTP 에러 응답. 기존 RuntimeError 처리와 호환되며 status_code 를 함께 전달."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CircuitOpenError(RuntimeError):
+    """Circuit breaker 가 열려 있어 요청을 보내지 않음."""
+
+
+# ----------------------------------------------------------------------
+# Retry
+# ----------------------------------------------------------------------
+@dataclass
+class RetryPolicy:
+    """
+    재시도 규칙.
+
+    Args:
+        max_retries: 최초 요청 이후 최대 재시도 횟수 (0 이면 재시도 안 함)
+        backoff_base: 첫 재시도 대기 시간 상한 (초). 시도마다 2배
+        backoff_max: 대기 시간 상한 (초)
+        jitter: True 이면 full jitter (0 ~ 상한 사이 균등 분포)
+        retry_statuses: 재시도할 HTTP status
+        respect_retry_after: 429/503 의 Retry-After 헤더 값을 우선 사용
+        max_retry_after: Retry-After 로 기다릴 최대 시간 (초)
+    """
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = field(default_factory=lambda: frozenset({429, 500, 502, 503, 504}))
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+
+    # 서버가 작업을 시작하기 전에 거절한 것이 확실한 status (비멱등 요청도 재시도 가능)
+    REJECTED_STATUSES = frozenset({429, 503})
+
+    def compute_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        attempt 번째 재시도(1부터) 전 대기 시간.
+        Retry-After 가 있으면 그 값을, 없으면 min(backoff_max, base * 2^(attempt-1)) 에 jitter 적용.
+        """
+        if self.respect_retry_after and retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(max(seconds, 0.0), self.max_retry_after)
+
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0.0, ceiling) if self.jitter else ceiling
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP-date) -> 대기 초."""
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+
+# ----------------------------------------------------------------------
+# Rate limit
+# ----------------------------------------------------------------------
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    rate 개/초로 토큰이 채워지고 최대 capacity 개까지 모임 (순간 burst 허용량).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 가져오면 0, 부족하면 기다려야 할 시간(초)을 반환 (토큰은 가져가지 않음)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """토큰을 가져올 때까지 대기. timeout 초 안에 못 가져오면 False."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+# ----------------------------------------------------------------------
+# Circuit breaker
+# ----------------------------------------------------------------------
+class CircuitBreaker:
+    """
+    연속 failure_threshold 번 실패하면 open -> recovery_timeout 초 동안 요청 차단.
+    이후 half-open 상태에서 시험 요청 1개를 허용하고, 성공하면 closed 로 복귀, 실패하면 다시 open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_request(self, context: str = "") -> None:
+        """요청 전에 호출. 차단 중이면 CircuitOpenError."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            remaining = self.recovery_timeout - (time.monotonic() - self._opened_at)
+            if self._state == self.OPEN and remaining > 0:
+                raise CircuitOpenError(
+                    f"[VSSClient:{context}] circuit open after {self._failures} consecutive failures, "
+                    f"retry in {remaining:.1f}s"
+                )
+            # half-open: 시험 요청 1개만 통과
+            if self._trial_in_flight:
+                raise CircuitOpenError(f"[VSSClient:{context}] circuit half-open, trial request in flight")
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """성공 / 실패를 판단할 수 없이 끝난 요청 (취소 등). half-open 시험 요청 슬롯만 반환."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,67 @@
+"""
+generate_vlm_captions 응답 캐시 (디스크, gzip 압축)
+
+평가를 다시 돌릴 때 같은 입력으로 generate_vlm_captions 를 호출하면 매번 수십 초의 GPU 시간이 듦.
+영상 내용(SHA-256)과 요청 payload (모델, 최종 prompt / system_prompt, chunk_duration,
+chunk_overlap_duration, response_format, extra_params) 로 key 를 만들어 응답을 저장해 두고,
+같은 key 의 요청은 서버에 보내지 않고 저장된 응답을 반환함.
+서버의 video id 는 업로드마다 달라지므로 key 에 포함하지 않음.
+
+저장 형식: <directory>/<key 앞 2글자>/<key>.json.gz  ({"request", "stored_at", "response"})
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """
+    Args:
+        directory: 캐시 디렉토리
+        compress_level: gzip 압축 레벨 (1 ~ 9)
+    """
+
+    def __init__(self, directory: Path, compress_level: int = 6):
+        self.directory = Path(directory)
+        self.compress_level = compress_level
+
+    @staticmethod
+    def make_key(video_hash: str, payload: Dict[str, Any]) -> str:
+        """영상 SHA-256 + 요청 payload ("id" 제외) 의 canonical JSON -> SHA-256."""
+        request = {name: value for name, value in payload.items() if name != "id"}
+        canonical = json.dumps({"video": video_hash, "request": request},
+                               sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """저장된 응답. 없거나 읽을 수 없으면 None."""
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)["response"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError):
+            return None  # 기록 중 죽어서 깨진 항목은 miss 로 처리 (다음 put 에서 덮어씀)
+
+    def put(self, key: str, response: Dict[str, Any], payload: Optional[Dict[str, Any]] = None) -> None:
+        """응답 저장 (임시 파일에 쓰고 교체)."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "request": {name: value for name, value in (payload or {}).items() if name != "id"},
+            "stored_at": time.time(),
+            "response": response,
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=self.compress_level) as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json.gz"
@@ -0,0 +1,391 @@
+"""
+클라이언트 측 영상 분할 + 구간별 병렬 generate_vlm_captions
+
+generate_vlm_captions 는 영상 하나를 한 요청으로 보내고 chunk 분할은 서버가 하므로, 긴 영상은
+서버 한 곳에서 순서대로 처리됨. 여기서는 영상을 chunk 경계에 맞춘 구간(segment)으로 잘라
+구간마다 업로드 / 캡션 요청을 동시에 보내고, 응답의 chunk_responses 를 원래 영상 기준 시간으로
+옮겨 하나의 응답(기존과 같은 형태)으로 합침. 서버에 GPU slot 이 여러 개이거나 backend 가 여러 개일 때
+긴 영상의 대기 시간이 줄어듦.
+
+- 구간 길이는 서버의 chunk 간격 (chunk_duration - chunk_overlap_duration) 의 배수로 올림하여
+  모든 구간이 전체 영상을 보냈을 때의 chunk 경계에서 시작
+- chunk_overlap_duration > 0 이면 구간 끝을 overlap 만큼 늘려 보내고, 합칠 때 다음 구간과 겹치는 chunk 는 제거
+- chunk 의 start_time / end_time 만 구간 시작 시각만큼 이동. content 의 timestamp 는 영상에 표시된
+  dataset 시각이므로 그대로 둠
+- 자르기는 ffmpeg 재인코딩 (-ss 입력 seek + libx264) 으로 keyframe 위치와 관계없이 정확한 경계에서 자름
+"""
+
+import asyncio
+import math
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    from .VSS_upload_cache import file_sha256
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from VSS_upload_cache import file_sha256
+
+TIME_FIELDS = ("start_time", "end_time")
+
+
+@dataclass(frozen=True)
+class Segment:
+    """원본 영상의 한 구간 (초)"""
+    index: int
+    start: float
+    end: float          # 실제로 잘라 보내는 끝 (overlap 포함)
+    nominal_end: float  # 다음 구간의 시작. 이 이후에 시작하는 chunk 는 다음 구간이 담당
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+# ----------------------------------------------------------------------
+# ffmpeg
+# ----------------------------------------------------------------------
+def find_ffmpeg() -> str:
+    """ffmpeg 실행 파일 (imageio-ffmpeg 우선, 없으면 PATH)."""
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except ImportError:
+        pass
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise RuntimeError("ffmpeg not found. Install ffmpeg or imageio-ffmpeg to split videos.")
+    return ffmpeg
+
+
+def probe_duration(video_path: str, ffmpeg: Optional[str] = None) -> float:
+    """영상 길이 (초). imageio-ffmpeg 에는 ffprobe 가 없으므로 ffmpeg -i 출력의 Duration 을 읽음."""
+    proc = subprocess.run(
+        [ffmpeg or find_ffmpeg(), "-hide_banner", "-i", str(video_path)],
+        capture_output=True, text=True, errors="replace",
+    )
+    match = re.search(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)", proc.stderr)
+    if not match:
+        raise RuntimeError(f"Cannot read duration of {video_path}: {proc.stderr.strip()[-200:]}")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def cut_segment(video_path: str, segment: Segment, output_path: str, ffmpeg: Optional[str] = None) -> str:
+    """segment 구간을 output_path 로 재인코딩하여 저장 (오디오 제외)."""
+    cmd = [
+        ffmpeg or find_ffmpeg(), "-hide_banner", "-loglevel", "error", "-y",
+        "-ss", f"{segment.start:.3f}", "-i", str(video_path), "-t", f"{segment.duration:.3f}",
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", "18", "-pix_fmt", "yuv420p", "-an",
+        str(output_path),
+    ]
+    proc = subprocess.run(cmd, capture_output=True, text=True, errors="replace")
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed for segment {segment.index}: {proc.stderr.strip()[-500:]}")
+    return output_path
+
+
+# ----------------------------------------------------------------------
+# 구간 계획 / 결과 병합
+# ----------------------------------------------------------------------
+def plan_segments(
+    duration: float,
+    segment_duration: float,
+    chunk_duration: float,
+    chunk_overlap_duration: float = 0,
+) -> List[Segment]:
+    """
+    [0, duration) 을 chunk 간격 (chunk_duration - chunk_overlap_duration) 배수 길이의 구간으로 나눔.
+    서버는 chunk 를 이 간격으로 시작하므로, 구간 경계가 전체 영상의 chunk 경계와 일치함.
+    마지막 구간이 chunk 하나보다 짧으면 앞 구간에 붙임.
+    """
+    if chunk_duration <= 0:
+        raise ValueError("chunk_duration must be positive")
+    stride = chunk_duration - (chunk_overlap_duration or 0)
+    if stride <= 0:
+        raise ValueError("chunk_overlap_duration must be smaller than chunk_duration")
+    step = max(1, math.ceil(segment_duration / stride)) * stride
+
+    starts = []
+    start = 0.0
+    while start < duration:
+        starts.append(start)
+        start += step
+    if len(starts) > 1 and duration - starts[-1] < chunk_duration:
+        starts.pop()
+
+    segments = []
+    for index, start in enumerate(starts):
+        nominal_end = starts[index + 1] if index + 1 < len(starts) else duration
+        end = min(duration, nominal_end + chunk_overlap_duration)
+        segments.append(Segment(index, start, end, nominal_end))
+    return segments
+
+
+def shift_time(value: Any, offset: float) -> Any:
+    """
+    chunk 시간 값을 offset 초만큼 이동. 숫자, 숫자 문자열, "HH:MM:SS(.fff)" / "MM:SS" 를 지원하며
+    원래 형식(소수 자릿수 포함)을 유지. 알 수 없는 형식은 그대로 반환.
+    """
+    if isinstance(value, bool) or offset == 0:
+        return value
+    if isinstance(value, (int, float)):
+        shifted = value + offset
+        return int(shifted) if isinstance(value, int) and float(shifted).is_integer() else shifted
+    if not isinstance(value, str):
+        return value
+
+    text = value.strip()
+    try:
+        return _format_number(float(text) + offset, text)
+    except ValueError:
+        pass
+
+    parts = text.split(":")
+    if len(parts) not in (2, 3):
+        return value
+    try:
+        numbers = [float(part) for part in parts]
+    except ValueError:
+        return value
+    seconds = 0.0
+    for number in numbers:
+        seconds = seconds * 60 + number
+    seconds += offset
+
+    decimals = len(parts[-1].split(".")[1]) if "." in parts[-1] else 0
+    seconds = round(seconds, decimals)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    width = 3 + decimals if decimals else 2
+    secs_text = f"{secs:0{width}.{decimals}f}"
+    if len(parts) == 2 and hours == 0:
+        return f"{int(minutes):02d}:{secs_text}"
+    return f"{int(hours):02d}:{int(minutes):02d}:{secs_text}"
+
+
+def _format_number(number: float, template: str) -> str:
+    decimals = len(template.split(".")[1]) if "." in template else 0
+    return f"{number:.{decimals}f}"
+
+
+def _chunk_start(chunk: Dict[str, Any]) -> Optional[float]:
+    """chunk 의 start_time (초). 읽을 수 없으면 None."""
+    value = chunk.get("start_time")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            seconds = 0.0
+            for part in value.strip().split(":"):
+                seconds = seconds * 60 + float(part)
+            return seconds
+        except ValueError:
+            return None
+    return None
+
+
+def merge_segment_responses(responses: Sequence[Dict[str, Any]], segments: Sequence[Segment]) -> Dict[str, Any]:
+    """
+    구간별 응답을 하나로 합침. chunk_responses 는 구간 순서대로 이어 붙이고 start_time / end_time 을
+    원본 영상 기준으로 옮김. 다른 최상위 필드는 첫 응답 값을 쓰고, usage 의 숫자 값은 합산.
+    구간 정보는 "segments" 에 기록.
+    """
+    if len(responses) != len(segments):
+        raise ValueError("responses and segments must have the same length")
+    if not responses:
+        return {"chunk_responses": []}
+
+    merged = {name: value for name, value in responses[0].items()
+              if name not in ("chunk_responses", "cache_hit", "usage")}
+    chunks: List[Dict[str, Any]] = []
+    usage: Dict[str, Any] = {}
+    segment_info = []
+
+    for response, segment in zip(responses, segments):
+        last = segment.index == len(segments) - 1
+        for chunk in response.get("chunk_responses", []):
+            start = _chunk_start(chunk)
+            # overlap 으로 다음 구간과 겹쳐 보낸 부분은 다음 구간의 결과를 사용
+            if not last and start is not None and segment.start + start >= segment.nominal_end:
+                continue
+            chunk = dict(chunk)
+            for name in TIME_FIELDS:
+                if name in chunk:
+                    chunk[name] = shift_time(chunk[name], segment.start)
+            chunks.append(chunk)
+
+        for name, value in (response.get("usage") or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                usage[name] = usage.get(name, 0) + value
+            else:
+                usage.setdefault(name, value)
+
+        segment_info.append({
+            "index": segment.index,
+            "start": segment.start,
+            "end": segment.end,
+            "id": response.get("id") or response.get("video_id"),
+            "execution_time": response.get("execution_time"),
+        })
+
+    merged["chunk_responses"] = chunks
+    if usage:
+        merged["usage"] = usage
+    merged["segments"] = segment_info
+    return merged
+
+
+# ----------------------------------------------------------------------
+# 실행
+# ----------------------------------------------------------------------
+def _segment_payload(client, model: str, segment_duration: float, caption_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """응답 캐시 key 용 payload (분할 길이를 포함하여 전체 영상 요청과 구분)."""
+    _, payload, _ = client._build_caption_request(
+        "", model,
+        caption_kwargs.get("preset_name"), caption_kwargs.get("prompt"), caption_kwargs.get("system_prompt"),
+        caption_kwargs.get("chunk_duration"), caption_kwargs.get("chunk_overlap_duration"),
+        caption_kwargs.get("response_format", "json_object"), caption_kwargs.get("extra_params"),
+    )
+    payload["client_segment_duration"] = segment_duration
+    return payload
+
+
+def _plan(client, video_path: str, segment_duration: float, caption_kwargs: Dict[str, Any], ffmpeg: str) -> List[Segment]:
+    chunk_duration = caption_kwargs.get("chunk_duration")
+    overlap = caption_kwargs.get("chunk_overlap_duration")
+    return plan_segments(
+        probe_duration(video_path, ffmpeg),
+        segment_duration,
+        chunk_duration if chunk_duration is not None else client.default_chunk_duration,
+        overlap if overlap is not None else client.default_chunk_overlap_duration,
+    )
+
+
+def generate_segmented_captions(
+    client,
+    video_path: str,
+    model: str,
+    segment_duration: float,
+    max_workers: int = 4,
+    video_hash: Optional[str] = None,
+    use_cache: bool = True,
+    work_dir: Optional[str] = None,
+    **caption_kwargs,
+) -> Dict[str, Any]:
+    """
+    video_path 를 segment_duration 초 (chunk 간격의 배수로 올림) 구간으로 잘라 VSSClient 로 동시에 요청하고 결과를 합침.
+    구간 파일은 요청 후 서버와 로컬에서 삭제.
+
+    Args:
+        client: VSSClient
+        max_workers: 동시에 처리할 구간 수 (자르기 + 업로드 + 캡션)
+        video_hash: 원본 영상 SHA-256. 주면 분할 결과 전체를 response_cache 에 저장 / 재사용
+        use_cache: False 이면 캐시를 조회하지 않음
+        work_dir: 구간 파일을 만들 디렉토리 (None 이면 임시 디렉토리)
+        caption_kwargs: generate_vlm_captions 인자 (preset_name, chunk_duration, chunk_overlap_duration 등)
+
+    Returns:
+        generate_vlm_captions 와 같은 형태의 응답 (+ "segments")
+    """
+    payload = _segment_payload(client, model, segment_duration, caption_kwargs)
+    if use_cache and client.response_cache is not None and video_hash:
+        cached = client._cached_response(video_hash, payload)
+        if cached is not None:
+            return cached
+
+    ffmpeg = find_ffmpeg()
+    segments = _plan(client, video_path, segment_duration, caption_kwargs, ffmpeg)
+    started = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="vss_segments_", dir=work_dir) as tmp_dir:
+        def run(segment: Segment) -> Dict[str, Any]:
+            path = os.path.join(tmp_dir, f"{Path(video_path).stem}_seg{segment.index:03d}.mp4")
+            cut_segment(video_path, segment, path, ffmpeg)
+            file_id = client.upload_video(path)["id"]
+            try:
+                return client.generate_vlm_captions(
+                    video_id=file_id, model=model, video_hash=file_sha256(path), use_cache=use_cache,
+                    **caption_kwargs,
+                )
+            finally:
+                try:
+                    client.delete_video(file_id)
+                except Exception:
+                    pass  # 서버에 남은 구간 파일은 실패해도 결과에 영향 없음
+                os.remove(path)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(segments)))) as pool:
+            responses = list(pool.map(run, segments))
+
+    merged = merge_segment_responses(responses, segments)
+    merged["execution_time"] = time.perf_counter() - started
+    client._store_response(video_hash, payload, merged)
+    return merged
+
+
+async def generate_segmented_captions_async(
+    client,
+    video_path: str,
+    model: str,
+    segment_duration: float,
+    video_hash: Optional[str] = None,
+    use_cache: bool = True,
+    work_dir: Optional[str] = None,
+    **caption_kwargs,
+) -> Dict[str, Any]:
+    """
+    generate_segmented_captions 의 AsyncVSSClient 버전. 동시 요청 수는 client 의 max_concurrency 로 제한되며,
+    ffmpeg 는 executor 에서 실행. 하나라도 실패하면 나머지 구간 작업을 취소하고 예외를 전달.
+    """
+    payload = _segment_payload(client, model, segment_duration, caption_kwargs)
+    if use_cache and client.response_cache is not None and video_hash:
+        cached = client._cached_response(video_hash, payload)
+        if cached is not None:
+            return cached
+
+    loop = asyncio.get_event_loop()
+    ffmpeg = await loop.run_in_executor(None, find_ffmpeg)
+    segments = await loop.run_in_executor(
+        None, _plan, client, video_path, segment_duration, caption_kwargs, ffmpeg
+    )
+    started = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(prefix="vss_segments_", dir=work_dir) as tmp_dir:
+        async def run(segment: Segment) -> Dict[str, Any]:
+            path = os.path.join(tmp_dir, f"{Path(video_path).stem}_seg{segment.index:03d}.mp4")
+            await loop.run_in_executor(None, cut_segment, video_path, segment, path, ffmpeg)
+            segment_hash = await loop.run_in_executor(None, file_sha256, path)
+            file_id = (await client.upload_video(path))["id"]
+            try:
+                return await client.generate_vlm_captions(
+                    video_id=file_id, model=model, video_hash=segment_hash, use_cache=use_cache,
+                    **caption_kwargs,
+                )
+            finally:
+                try:
+                    await client.delete_video(file_id)
+                except Exception:
+                    pass
+                os.remove(path)
+
+        tasks = [asyncio.ensure_future(run(segment)) for segment in segments]
+        try:
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    merged = merge_segment_responses(responses, segments)
+    merged["execution_time"] = time.perf_counter() - started
+    client._store_response(video_hash, payload, merged)
+    return merged
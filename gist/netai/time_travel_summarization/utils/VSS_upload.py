@@ -0,0 +1,226 @@
+"""
+VSS 업로드용 streaming multipart encoder
+
+requests 의 files=... 는 multipart body 전체를 메모리에 만든 뒤 전송하므로 수 GB 영상에서 메모리가 급증하고
+진행 상황을 알 수 없음. StreamingMultipartEncoder 는 파일을 chunk_size 단위로 읽으며 body 를 흘려보내므로
+메모리 사용량이 파일 크기와 관계없이 일정하고, 전송량 / 처리량을 progress_callback 으로 알려줌.
+
+- 동기 (requests): data=encoder, headers=encoder.headers  -> read() 로 읽힘
+- 비동기 (aiohttp): data=encoder.async_iter(), headers=encoder.headers
+- 취소: cancel_event 를 set 하면 다음 chunk 를 읽을 때 UploadCancelled (asyncio 에서는 task.cancel() 로도 가능)
+"""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, Optional
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class UploadCancelled(RuntimeError):
+    """cancel_event 로 업로드가 취소됨."""
+
+
+@dataclass
+class UploadProgress:
+    """업로드 진행 상황"""
+    bytes_sent: int
+    total_bytes: int
+    elapsed: float  # 초
+
+    @property
+    def fraction(self) -> float:
+        return self.bytes_sent / self.total_bytes if self.total_bytes else 1.0
+
+    @property
+    def throughput(self) -> float:
+        """bytes / 초"""
+        return self.bytes_sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """남은 예상 시간 (초). 아직 측정값이 없으면 None."""
+        throughput = self.throughput
+        if throughput <= 0:
+            return None
+        return (self.total_bytes - self.bytes_sent) / throughput
+
+
+class StreamingMultipartEncoder:
+    """
+    multipart/form-data body 를 고정 크기 buffer 로 생성하는 file-like 객체.
+    Content-Length 를 미리 계산하므로 chunked transfer encoding 없이 전송됨.
+
+    Args:
+        file_field: 파일 field 이름 (VSS: "file")
+        file_path: 업로드할 파일 경로
+        fields: 파일 뒤에 붙일 일반 form field (예: {"purpose": "vision", "media_type": "video"})
+        chunk_size: 파일을 읽는 단위 (bytes). 메모리 사용량의 상한
+        progress_callback: UploadProgress 를 받는 함수. progress_interval 초마다, 그리고 마지막에 호출
+        cancel_event: set 되면 다음 read 에서 UploadCancelled
+        progress_interval: progress_callback 최소 호출 간격 (초)
+    """
+
+    def __init__(
+        self,
+        file_field: str,
+        file_path: str,
+        fields: Optional[Dict[str, str]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[UploadProgress], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        progress_interval: float = 0.1,
+    ):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self.progress_interval = progress_interval
+
+        self.boundary = uuid.uuid4().hex
+        filename = os.path.basename(file_path).replace('"', "%22")
+        self._file_header = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        trailer = "\r\n"
+        for name, value in (fields or {}).items():
+            trailer += (
+                f"--{self.boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            )
+        trailer += f"--{self.boundary}--\r\n"
+        self._trailer = trailer.encode("utf-8")
+
+        self._file_size = os.path.getsize(file_path)
+        self.total_bytes = len(self._file_header) + self._file_size + len(self._trailer)
+
+        self._file = None
+        self._buffer = b""
+        self._offset = 0
+        self._stage = 0  # 0: header, 1: file, 2: trailer, 3: done
+        self._bytes_sent = 0
+        self._started = None
+        self._finished = None
+        self._last_report = 0.0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Content-Type": self.content_type, "Content-Length": str(self.total_bytes)}
+
+    def __len__(self) -> int:
+        return self.total_bytes
+
+    def rewind(self) -> None:
+        """처음부터 다시 보낼 수 있게 초기화 (재시도용)."""
+        self.close()
+        self._buffer = b""
+        self._offset = 0
+        self._stage = 0
+        self._bytes_sent = 0
+        self._started = None
+        self._finished = None
+        self._last_report = 0.0
+
+    @property
+    def send_duration(self) -> Optional[float]:
+        """첫 조각을 읽은 시점 ~ 마지막 byte 를 넘긴 시점 (초). 전송이 끝나지 않았으면 None."""
+        if self._started is None or self._finished is None:
+            return None
+        return self._finished - self._started
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # 동기 읽기 (requests / http.client)
+    # ------------------------------------------------------------------
+    def read(self, size: int = -1) -> bytes:
+        """
+        최대 size bytes 를 반환 (size < 0 이면 chunk_size). 파일은 chunk_size 단위로만 읽으므로
+        내부 buffer 는 chunk_size 를 넘지 않음. 끝나면 b"".
+        """
+        if size is None or size < 0:
+            size = self.chunk_size
+        if self._offset >= len(self._buffer):
+            self._buffer = self._next_block()
+            self._offset = 0
+        # offset 으로 잘라서 buffer 전체를 매번 복사하지 않음
+        data = self._buffer[self._offset:self._offset + size]
+        self._offset += len(data)
+        self._advance(len(data))
+        return data
+
+    def __iter__(self):
+        while True:
+            data = self.read(self.chunk_size)
+            if not data:
+                return
+            yield data
+
+    # ------------------------------------------------------------------
+    # 비동기 읽기 (aiohttp)
+    # ------------------------------------------------------------------
+    async def async_iter(self) -> AsyncIterator[bytes]:
+        """파일 읽기를 executor 에서 수행하여 event loop 를 막지 않는 async generator."""
+        loop = asyncio.get_event_loop()
+        try:
+            while True:
+                data = await loop.run_in_executor(None, self._next_block)
+                if not data:
+                    return
+                self._advance(len(data))
+                yield data
+        finally:
+            self.close()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _next_block(self) -> bytes:
+        """다음 body 조각 (header / 파일 chunk / trailer). 끝나면 b""."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            self.close()
+            raise UploadCancelled(f"Upload cancelled: {self.file_path}")
+        if self._started is None:
+            self._started = time.perf_counter()
+
+        if self._stage == 0:
+            self._stage = 1
+            return self._file_header
+        if self._stage == 1:
+            if self._file is None:
+                self._file = open(self.file_path, "rb")
+            block = self._file.read(self.chunk_size)
+            if block:
+                return block
+            self.close()
+            self._stage = 2
+        if self._stage == 2:
+            self._stage = 3
+            return self._trailer
+        return b""
+
+    def _advance(self, count: int) -> None:
+        self._bytes_sent += count
+        now = time.perf_counter()
+        finished = self._bytes_sent >= self.total_bytes
+        if finished and self._finished is None:
+            self._finished = now
+        if self.progress_callback is None or count == 0:
+            return
+        if finished or now - self._last_report >= self.progress_interval:
+            self._last_report = now
+            self.progress_callback(UploadProgress(self._bytes_sent, self.total_bytes, now - (self._started or now)))
@@ -0,0 +1,278 @@
+"""
+VSS 업로드 중복 제거 캐시 (content SHA-256 -> VSS file id)
+
+같은 영상을 모델 / 프리셋만 바꿔 다시 분석할 때 매번 업로드하지 않도록, 업로드한 파일의 SHA-256 과
+서버 file id 를 JSON manifest 에 기록해 두고 업로드 전에 조회함.
+- 재사용 전 서버에 파일이 아직 있는지 확인 (GET /files/{id}), 없으면 다시 업로드
+- 같은 경로 / 크기 / 수정 시각의 파일은 해시를 다시 계산하지 않음
+- 서버에 남겨 둘 파일 수 / 총 크기 / 미사용 기간을 넘으면 가장 오래 쓰지 않은 파일부터 서버에서 삭제 (LRU)
+
+VLMClientCore 와 vss_batch_runner.py 가 사용하며, 표준 라이브러리만 사용함.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def file_sha256(file_path: str) -> str:
+    """파일 내용의 SHA-256 (HASH_CHUNK_SIZE 단위로 읽음)."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class UploadCache:
+    """
+    Thread-safe SHA-256 -> file id manifest with LRU eviction.
+
+    Args:
+        path: manifest JSON 경로
+        max_files: 서버에 남겨 둘 최대 파일 수 (None 이면 제한 없음)
+        max_bytes: 서버에 남겨 둘 최대 총 크기 (bytes)
+        max_age: 마지막 사용 후 이 시간(초)이 지난 파일은 삭제 대상
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_files: Optional[int] = 20,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.path = Path(path)
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # entries: {sha256: {"file_id", "filename", "bytes", "uploaded_at", "last_used"}}
+        # sources: {절대 경로: {"size", "mtime_ns", "sha256"}}  (해시 재계산 방지)
+        self._entries: Dict[str, dict] = {}
+        self._sources: Dict[str, dict] = {}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 해시
+    # ------------------------------------------------------------------
+    def hash_file(self, file_path: str) -> str:
+        """파일 SHA-256. 경로 / 크기 / 수정 시각이 같으면 기록된 값을 재사용."""
+        source = str(Path(file_path).resolve())
+        stat = os.stat(source)
+        with self._lock:
+            known = self._sources.get(source)
+            if known and known["size"] == stat.st_size and known["mtime_ns"] == stat.st_mtime_ns:
+                return known["sha256"]
+
+        sha256 = file_sha256(source)
+
+        with self._lock:
+            self._sources[source] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+            self._save()
+        return sha256
+
+    # ------------------------------------------------------------------
+    # 조회 / 기록
+    # ------------------------------------------------------------------
+    def lookup(self, sha256: str) -> Optional[str]:
+        """기록된 file id (서버 존재 여부는 호출 측에서 확인)."""
+        with self._lock:
+            entry = self._entries.get(sha256)
+            return entry["file_id"] if entry else None
+
+    def sha256_for(self, file_id: str) -> Optional[str]:
+        """file id 로 업로드한 파일의 SHA-256 (기록이 없으면 None)."""
+        with self._lock:
+            for sha256, entry in self._entries.items():
+                if entry["file_id"] == file_id:
+                    return sha256
+        return None
+
+    def touch(self, sha256: str) -> None:
+        """재사용 시각 갱신."""
+        with self._lock:
+            if sha256 in self._entries:
+                self._entries[sha256]["last_used"] = time.time()
+                self._save()
+
+    def record(self, sha256: str, file_id: str, file_path: str) -> None:
+        """업로드 결과 기록."""
+        now = time.time()
+        with self._lock:
+            self._entries[sha256] = {
+                "file_id": file_id,
+                "filename": os.path.basename(file_path),
+                "bytes": os.path.getsize(file_path),
+                "uploaded_at": now,
+                "last_used": now,
+            }
+            self._save()
+
+    def remove(self, sha256: str) -> None:
+        with self._lock:
+            if self._entries.pop(sha256, None) is not None:
+                self._save()
+
+    def remove_file_id(self, file_id: str) -> None:
+        """서버에서 삭제된 file id 의 기록 제거."""
+        with self._lock:
+            stale = [sha256 for sha256, entry in self._entries.items() if entry["file_id"] == file_id]
+            for sha256 in stale:
+                del self._entries[sha256]
+            if stale:
+                self._save()
+
+    # ------------------------------------------------------------------
+    # LRU eviction
+    # ------------------------------------------------------------------
+    def select_evictions(self, protect: Iterable[str] = ()) -> List[Tuple[str, dict]]:
+        """
+        제한을 넘는 항목을 오래 쓰지 않은 순으로 반환 (protect 의 SHA-256 은 사용 중이므로 제외).
+        기록은 지우지 않으므로, 서버에서 삭제한 뒤 remove() 호출.
+        """
+        protect = set(protect)
+        now = time.time()
+        with self._lock:
+            ordered = sorted(self._entries.items(), key=lambda item: item[1]["last_used"])
+            count = len(ordered)
+            total = sum(entry["bytes"] for _, entry in ordered)
+
+            evictions = []
+            for sha256, entry in ordered:
+                if sha256 in protect:
+                    continue
+                over_count = self.max_files is not None and count > self.max_files
+                over_bytes = self.max_bytes is not None and total > self.max_bytes
+                expired = self.max_age is not None and now - entry["last_used"] > self.max_age
+                if not (over_count or over_bytes or expired):
+                    continue
+                evictions.append((sha256, dict(entry)))
+                count -= 1
+                total -= entry["bytes"]
+            return evictions
+
+    def evict(self, delete_fn: Callable[[str], object], protect: Iterable[str] = ()) -> List[str]:
+        """
+        select_evictions 항목을 delete_fn(file_id) 로 서버에서 삭제하고 기록 제거.
+        이미 서버에 없는 파일(404)도 기록에서 제거. 삭제된 file id 목록 반환.
+        """
+        deleted = []
+        for sha256, entry in self.select_evictions(protect):
+            try:
+                delete_fn(entry["file_id"])
+            except Exception as e:
+                if getattr(e, "status_code", None) != 404:
+                    continue  # 다음 eviction 때 다시 시도
+            self.remove(sha256)
+            deleted.append(entry["file_id"])
+        return deleted
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._entries = data.get("entries", {})
+            self._sources = data.get("sources", {})
+        except (OSError, ValueError):
+            # 깨진 manifest 는 무시 (다음 업로드부터 다시 기록)
+            self._entries, self._sources = {}, {}
+
+    def _save(self) -> None:
+        """임시 파일에 쓰고 교체하여 중간에 죽어도 manifest 가 깨지지 않게 함. self._lock 안에서 호출."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"entries": self._entries, "sources": self._sources}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+def upload_with_cache(
+    client,
+    cache: UploadCache,
+    file_path: str,
+    protect: Iterable[str] = (),
+    **upload_kwargs,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    VSSClient 로 업로드하되 같은 내용이 이미 서버에 있으면 재사용. 업로드 후 LRU 제한을 넘은 파일은 삭제.
+
+    Args:
+        protect: 삭제하면 안 되는 (다른 작업이 사용 중인) 파일의 SHA-256
+        upload_kwargs: VSSClient.upload_video 인자 (progress_callback 등)
+
+    Returns:
+        (파일 정보 {"id", ...}, 재사용 여부)
+    """
+    sha256 = cache.hash_file(file_path)
+    file_id = cache.lookup(sha256)
+    if file_id:
+        try:
+            info = client.get_file(file_id)
+        except Exception:
+            info = None  # 확인할 수 없으면 다시 업로드
+        if info is not None:
+            cache.touch(sha256)
+            if hasattr(client, "register_source"):
+                # backend pool: 소유 backend 가 죽으면 이 파일을 다른 backend 에 다시 올릴 수 있게
+                client.register_source(file_id, file_path)
+            return _with_id(info, file_id), True
+        cache.remove(sha256)
+
+    response = client.upload_video(file_path, **upload_kwargs)
+    cache.record(sha256, response["id"], file_path)
+    cache.evict(client.delete_video, protect={sha256, *protect})
+    return response, False
+
+
+async def upload_with_cache_async(
+    client,
+    cache: UploadCache,
+    file_path: str,
+    protect: Iterable[str] = (),
+    **upload_kwargs,
+) -> Tuple[Dict[str, Any], bool]:
+    """upload_with_cache 의 AsyncVSSClient 버전. 해시 계산은 executor 에서 수행."""
+    sha256 = await asyncio.get_event_loop().run_in_executor(None, cache.hash_file, file_path)
+    file_id = cache.lookup(sha256)
+    if file_id:
+        try:
+            info = await client.get_file(file_id)
+        except Exception:
+            info = None
+        if info is not None:
+            cache.touch(sha256)
+            if hasattr(client, "register_source"):
+                # backend pool: 소유 backend 가 죽으면 이 파일을 다른 backend 에 다시 올릴 수 있게
+                client.register_source(file_id, file_path)
+            return _with_id(info, file_id), True
+        cache.remove(sha256)
+
+    response = await client.upload_video(file_path, **upload_kwargs)
+    cache.record(sha256, response["id"], file_path)
+    for evicted_sha256, entry in cache.select_evictions(protect={sha256, *protect}):
+        try:
+            await client.delete_video(entry["file_id"])
+        except Exception as e:
+            if getattr(e, "status_code", None) != 404:
+                continue
+        cache.remove(evicted_sha256)
+    return response, False
+
+
+def _with_id(info: Dict[str, Any], file_id: str) -> Dict[str, Any]:
+    info = dict(info)
+    info.setdefault("id", file_id)
+    return info
@@ -0,0 +1,390 @@
+"""
+Headless BEV 프레임 렌더러
+
+Omniverse Stage + Movie Capture 없이, 궤적 데이터(CSV)로부터 `simple_view` 프리셋 형태의
+영상(흰 배경 위 번호가 붙은 검은 원 + 우측 하단 timestamp)을 NumPy/Pillow로 직접 래스터라이즈합니다.
+GPU가 필요 없고, 여러 프로세스에서 병렬로 렌더링합니다.
+
+*   투영: core.py 의 summarization camera 와 동일한 XZ 투영(회전 RotateYXZ, focal length) 사용.
+    카메라 위치는 기본적으로 데이터 전체가 보이도록 맞춤 (--no-fit: summarization camera 시작 위치)
+*   라벨: ViewOverlay._get_id_from_name 과 동일한 번호 (정렬된 objid 순서대로 1, 2, 3, ...)
+*   시간: View Overlay 와 동일한 우측 하단 "HH:MM:SS" 표시
+
+사용법:
+    # 1분 데이터를 30fps, 1배속 MP4로 렌더링
+    python bev_renderer.py ../data/living_trajectory_1min_0.2s.csv -o ../video/video_100.mp4
+
+    # 3배속, 8개 프로세스
+    python bev_renderer.py ../data/living_trajectory_1min_0.2s.csv -o ../video/video_101.mp4 --speed 3 -j 8
+
+    # 활동 기반 가변 가속 (근접 구간 1배속, 나머지 3배속)
+    python bev_renderer.py ../data/living_trajectory_1min_0.2s.csv -o ../video/video_102.mp4 --adaptive 200 --quiet-speed 3
+
+    # MP4 대신 PNG 프레임 시퀀스로 저장
+    python bev_renderer.py ../data/living_trajectory_1min_0.2s.csv --frames-dir ../video/frames_100
+
+의존성: numpy, Pillow, (MP4 출력 시) ffmpeg 실행 파일 또는 imageio-ffmpeg
+"""
+
+import argparse
+import math
+import multiprocessing
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+# trajectory_analysis 는 extension 루트에 위치 (omni 의존성 없음)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import trajectory_analysis  # noqa: E402
+
+
+# ----------------------------------------------------------------------
+# Summarization camera (core.py TimeTravelCore 의 값과 동일하게 유지)
+# ----------------------------------------------------------------------
+SUMMARIZATION_CAMERA_POSITION = (332.2, 1602.28, -2113)
+SUMMARIZATION_CAMERA_ROTATION = (-0.012842645866697922, 89.99956531948999, 88.06146995128398)  # RotateYXZ
+SUMMARIZATION_CAMERA_FOCAL_LENGTH = 18.147562
+USD_DEFAULT_HORIZONTAL_APERTURE = 20.955
+
+# simple_view 스타일
+BACKGROUND_COLOR = (255, 255, 255)
+CIRCLE_COLOR = (0, 0, 0)
+LABEL_COLOR = (255, 255, 255)
+# View Overlay 시간 박스 스타일 (배경 0xFF1A1A1A, 테두리 0xFF00FF00, 흰 글씨)
+TIME_BOX_COLOR = (26, 26, 26)
+TIME_BORDER_COLOR = (0, 255, 0)
+TIME_TEXT_COLOR = (255, 255, 255)
+
+
+@dataclass
+class BEVCamera:
+    """Pinhole 카메라. USD xformOp 순서(translate -> rotateYXZ)와 Camera 기본값을 그대로 따름."""
+    position: Tuple[float, float, float] = SUMMARIZATION_CAMERA_POSITION
+    rotation_yxz: Tuple[float, float, float] = SUMMARIZATION_CAMERA_ROTATION
+    focal_length: float = SUMMARIZATION_CAMERA_FOCAL_LENGTH
+    horizontal_aperture: float = USD_DEFAULT_HORIZONTAL_APERTURE
+    width: int = 532
+    height: int = 280
+
+    def __post_init__(self):
+        rx, ry, rz = (math.radians(a) for a in self.rotation_yxz)
+        # USD(Gf)는 row-vector 규약: rotateYXZ = Y 먼저, 그 다음 X, 마지막 Z
+        rot_x = np.array([[1, 0, 0], [0, math.cos(rx), math.sin(rx)], [0, -math.sin(rx), math.cos(rx)]])
+        rot_y = np.array([[math.cos(ry), 0, -math.sin(ry)], [0, 1, 0], [math.sin(ry), 0, math.cos(ry)]])
+        rot_z = np.array([[math.cos(rz), math.sin(rz), 0], [-math.sin(rz), math.cos(rz), 0], [0, 0, 1]])
+        rotation = rot_y @ rot_x @ rot_z
+        self._right = rotation[0]
+        self._up = rotation[1]
+        self._forward = -rotation[2]  # 카메라는 local -Z 방향을 바라봄
+        self._origin = np.asarray(self.position, dtype=np.float64)
+        # 가로 aperture 기준 fit, 세로 aperture 는 해상도 비율로 결정
+        self._scale = self.focal_length / (self.horizontal_aperture / 2.0) * (self.width / 2.0)
+
+    def project(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        월드 좌표 (N, 3) -> 픽셀 좌표 (u, v), 깊이.
+        깊이가 0 이하(카메라 뒤)인 점은 u, v 가 NaN.
+        """
+        delta = points - self._origin
+        depth = delta @ self._forward
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_depth = np.where(depth > 0, 1.0 / depth, np.nan)
+            u = self.width / 2.0 + (delta @ self._right) * inv_depth * self._scale
+            v = self.height / 2.0 - (delta @ self._up) * inv_depth * self._scale
+        return u, v, depth
+
+    def pixels_per_unit(self, depth: np.ndarray) -> np.ndarray:
+        """깊이 depth 에서 월드 1 unit 이 차지하는 픽셀 수."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(depth > 0, self._scale / depth, np.nan)
+
+    def fitted_to(self, points: np.ndarray, padding: float = 0.1) -> "BEVCamera":
+        """
+        같은 회전/focal length 를 유지한 채, points 전체가 화면에 들어오도록
+        카메라를 XZ 중심 위로 옮기고 높이를 조정한 카메라를 반환.
+        """
+        points = points[np.all(np.isfinite(points), axis=1)]
+        if len(points) == 0:
+            return self
+        center = (points.min(axis=0) + points.max(axis=0)) / 2.0
+        offsets = points - center
+        # 화면 가로/세로 방향으로 필요한 반폭 -> 필요한 깊이
+        half_right = np.abs(offsets @ self._right).max()
+        half_up = np.abs(offsets @ self._up).max()
+        depth = max(half_right * self._scale / (self.width / 2.0),
+                    half_up * self._scale / (self.height / 2.0)) * (1.0 + padding)
+        position = center - self._forward * depth
+        return BEVCamera(
+            position=tuple(float(c) for c in position),
+            rotation_yxz=self.rotation_yxz,
+            focal_length=self.focal_length,
+            horizontal_aperture=self.horizontal_aperture,
+            width=self.width,
+            height=self.height,
+        )
+
+
+def fit_camera_to_data(data: Dict[str, Dict[str, Tuple[float, float, float]]], camera: BEVCamera) -> BEVCamera:
+    """데이터의 모든 위치가 보이도록 camera 를 맞춤 (회전/해상도 유지)."""
+    all_points = np.array([xyz for frame in data.values() for xyz in frame.values()], dtype=np.float64)
+    return camera.fitted_to(all_points) if len(all_points) else camera
+
+
+# ----------------------------------------------------------------------
+# 프레임 시간 / 위치 해석
+# ----------------------------------------------------------------------
+def constant_speed_frame_times(start_ms: float, end_ms: float, fps: float, speed: float) -> List[float]:
+    """고정 배속 재생 시 각 출력 프레임이 보여줄 데이터 시간(ms)."""
+    step_ms = 1000.0 / fps * speed
+    count = int((end_ms - start_ms) // step_ms) + 1
+    return [start_ms + i * step_ms for i in range(count)]
+
+
+def iter_frame_positions(
+    data: Dict[str, Dict[str, Tuple[float, float, float]]],
+    objids: Sequence[str],
+    frame_times_ms: Sequence[float],
+):
+    """
+    frame_times_ms(오름차순) 각각에 대한 (N, 3) 위치 배열을 순서대로 생성.
+    core.py 와 같은 LKV(Last Known Value) 규칙. 아직 등장하지 않은 객체는 NaN.
+    데이터와 프레임 시간을 한 번씩만 훑으므로 O(T + F).
+    """
+    column = {objid: i for i, objid in enumerate(objids)}
+    positions = np.full((len(objids), 3), np.nan, dtype=np.float64)
+    samples = iter(data.items())
+    pending = next(samples, None)
+
+    for frame_ms in frame_times_ms:
+        while pending is not None:
+            timestamp_str, frame = pending
+            if trajectory_analysis.to_ms(trajectory_analysis.parse_timestamp(timestamp_str)) > frame_ms:
+                break
+            for objid, xyz in frame.items():
+                positions[column[objid]] = xyz
+            pending = next(samples, None)
+        yield positions.copy()
+
+
+# ----------------------------------------------------------------------
+# 렌더링 (worker 프로세스)
+# ----------------------------------------------------------------------
+_worker_state = {}
+
+
+def _load_font(size: int, bold: bool = False):
+    names = ["DejaVuSans-Bold.ttf", "arialbd.ttf"] if bold else ["DejaVuSans.ttf", "arial.ttf"]
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size=size)  # Pillow >= 10.1
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def _init_worker(camera: BEVCamera, labels: List[str], radius: float, label_size: int, time_size: int):
+    _worker_state["camera"] = camera
+    _worker_state["labels"] = labels
+    _worker_state["radius"] = radius
+    _worker_state["label_font"] = _load_font(label_size, bold=True)
+    _worker_state["time_font"] = _load_font(time_size, bold=True)
+
+
+def render_frame(time_ms: float, positions: np.ndarray) -> Image.Image:
+    """한 프레임 렌더링: 흰 배경, 번호가 적힌 검은 원, 우측 하단 시간 (time_ms)."""
+    camera = _worker_state["camera"]
+    labels = _worker_state["labels"]
+
+    image = Image.new("RGB", (camera.width, camera.height), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(image)
+
+    u, v, depth = camera.project(positions)
+    radius_px = _worker_state["radius"] * camera.pixels_per_unit(depth)
+    for i in np.flatnonzero(np.isfinite(u) & np.isfinite(v)):
+        r = radius_px[i]
+        if u[i] + r < 0 or u[i] - r > camera.width or v[i] + r < 0 or v[i] - r > camera.height:
+            continue
+        draw.ellipse((u[i] - r, v[i] - r, u[i] + r, v[i] + r), fill=CIRCLE_COLOR)
+        draw.text((u[i], v[i]), labels[i], fill=LABEL_COLOR, font=_worker_state["label_font"], anchor="mm")
+
+    # View Overlay 와 같은 "HH:MM:SS" 형식
+    time_text = trajectory_analysis.from_ms(time_ms).strftime("%H:%M:%S")
+    font = _worker_state["time_font"]
+    left, top, right, bottom = draw.textbbox((0, 0), time_text, font=font)
+    padding = 5
+    box_w, box_h = right - left + 2 * padding, bottom - top + 2 * padding
+    box = (camera.width - box_w - 2, camera.height - box_h - 2, camera.width - 2, camera.height - 2)
+    draw.rounded_rectangle(box, radius=5, fill=TIME_BOX_COLOR, outline=TIME_BORDER_COLOR, width=2)
+    draw.text((box[0] + padding - left, box[1] + padding - top), time_text, fill=TIME_TEXT_COLOR, font=font)
+    return image
+
+
+def _render_task(task):
+    index, overlay_ms, positions, frames_dir = task
+    image = render_frame(overlay_ms, positions)
+    if frames_dir:
+        image.save(Path(frames_dir) / f"frame_{index:06d}.png")
+        return None
+    return image.tobytes()
+
+
+def _find_ffmpeg() -> str:
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except ImportError:
+        pass
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise RuntimeError("ffmpeg not found. Install ffmpeg or imageio-ffmpeg, or use --frames-dir.")
+    return ffmpeg
+
+
+def render_video(
+    data: Dict[str, Dict[str, Tuple[float, float, float]]],
+    frame_times_ms: Sequence[float],
+    output_path: Optional[str] = None,
+    frames_dir: Optional[str] = None,
+    fps: float = 30.0,
+    camera: Optional[BEVCamera] = None,
+    radius: float = 50.0,
+    workers: Optional[int] = None,
+    batch_size: int = 256,
+    overlay_times_ms: Optional[Sequence[float]] = None,
+) -> int:
+    """
+    frame_times_ms 의 각 시간을 한 프레임으로 렌더링하여 MP4(output_path) 또는
+    PNG 시퀀스(frames_dir)로 저장. 렌더링은 workers 개 프로세스에서 병렬 수행되고,
+    batch_size 프레임 단위로 위치를 해석하므로 메모리 사용량은 영상 길이와 무관.
+    overlay_times_ms 를 주면 우측 하단에 프레임의 데이터 시간 대신 그 시간을 표시 (예: 영상 경과 시간).
+
+    Returns:
+        렌더링한 프레임 수
+    """
+    if not output_path and not frames_dir:
+        raise ValueError("Specify output_path (MP4) or frames_dir (PNG sequence).")
+    if overlay_times_ms is None:
+        overlay_times_ms = frame_times_ms
+    elif len(overlay_times_ms) != len(frame_times_ms):
+        raise ValueError("overlay_times_ms must have one time per frame.")
+
+    camera = camera or BEVCamera()
+    objids = sorted({objid for frame in data.values() for objid in frame})
+    label_map = trajectory_analysis.objid_label_map(objids)
+    labels = [label_map[objid] for objid in objids]
+    label_size = max(8, int(camera.height * 0.05))
+    time_size = max(10, int(camera.height * 0.07))
+
+    encoder = None
+    if frames_dir:
+        Path(frames_dir).mkdir(parents=True, exist_ok=True)
+    else:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        encoder = subprocess.Popen(
+            [_find_ffmpeg(), "-y", "-loglevel", "error",
+             "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{camera.width}x{camera.height}", "-r", str(fps),
+             "-i", "-", "-c:v", "libx264", "-pix_fmt", "yuv420p", str(output_path)],
+            stdin=subprocess.PIPE,
+        )
+
+    frame_count = 0
+    positions_iter = iter_frame_positions(data, objids, frame_times_ms)
+    with multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(camera, labels, radius, label_size, time_size),
+    ) as pool:
+        while frame_count < len(frame_times_ms):
+            batch_end = min(frame_count + batch_size, len(frame_times_ms))
+            tasks = [(i, overlay_times_ms[i], next(positions_iter), frames_dir) for i in range(frame_count, batch_end)]
+            # imap 은 입력 순서를 유지 -> 인코더에 순서대로 기록
+            for frame_bytes in pool.imap(_render_task, tasks, chunksize=8):
+                if encoder:
+                    encoder.stdin.write(frame_bytes)
+            frame_count = batch_end
+
+    if encoder:
+        encoder.stdin.close()
+        if encoder.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed with exit code {encoder.returncode}")
+    return frame_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render simple_view BEV video directly from trajectory CSV (no GPU).")
+    parser.add_argument("csv", type=str, help="Trajectory CSV (timestamp,objid,x,y,z)")
+    parser.add_argument("-o", "--output", type=str, default=None, help="Output MP4 path")
+    parser.add_argument("--frames-dir", type=str, default=None, help="Write PNG frame sequence instead of MP4")
+    parser.add_argument("--fps", type=float, default=30.0, help="Output frame rate (default: 30)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed, e.g. 3 = 3x accelerated (default: 1)")
+    parser.add_argument("--adaptive", type=float, default=None, metavar="THRESHOLD",
+                        help="Activity-adaptive speed: 1x while any pair is within THRESHOLD (XZ), --quiet-speed otherwise")
+    parser.add_argument("--quiet-speed", type=float, default=3.0, help="Speed factor for quiet periods (default: 3)")
+    parser.add_argument("--margin", type=float, default=1.0, help="Seconds of 1x padding around near contacts (default: 1)")
+    parser.add_argument("--width", type=int, default=532, help="Frame width (default: 532)")
+    parser.add_argument("--height", type=int, default=280, help="Frame height (default: 280)")
+    parser.add_argument("--camera-x", type=float, default=None, help="Camera X (default: fitted to data)")
+    parser.add_argument("--camera-z", type=float, default=None, help="Camera Z (default: fitted to data)")
+    parser.add_argument("--camera-height", type=float, default=None, help="Camera Y (default: fitted to data)")
+    parser.add_argument("--no-fit", action="store_true",
+                        help="Use the summarization camera start position instead of fitting the view to the data")
+    parser.add_argument("--radius", type=float, default=50.0, help="Circle radius in world units (default: 50)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    args = parser.parse_args()
+
+    if not args.output and not args.frames_dir:
+        parser.error("one of --output or --frames-dir is required")
+
+    data = trajectory_analysis.load_trajectory_csv(args.csv)
+    timestamps = list(data.keys())
+    if not timestamps:
+        print(f"⚠️ 데이터가 비어 있습니다: {args.csv}")
+        return
+
+    start_ms = trajectory_analysis.to_ms(trajectory_analysis.parse_timestamp(timestamps[0]))
+    end_ms = trajectory_analysis.to_ms(trajectory_analysis.parse_timestamp(timestamps[-1]))
+
+    if args.adaptive is not None:
+        schedule = trajectory_analysis.build_speed_schedule(
+            data, threshold=args.adaptive, quiet_speed=args.quiet_speed, margin_ms=int(args.margin * 1000)
+        )
+        frame_times = trajectory_analysis.schedule_frame_times(schedule, args.fps, base_speed=args.speed)
+    else:
+        frame_times = constant_speed_frame_times(start_ms, end_ms, args.fps, args.speed)
+
+    camera = BEVCamera(width=args.width, height=args.height)
+    if not args.no_fit:
+        camera = fit_camera_to_data(data, camera)
+    camera_x, camera_y, camera_z = camera.position
+    camera = BEVCamera(
+        position=(camera_x if args.camera_x is None else args.camera_x,
+                  camera_y if args.camera_height is None else args.camera_height,
+                  camera_z if args.camera_z is None else args.camera_z),
+        width=args.width,
+        height=args.height,
+    )
+
+    started = time.perf_counter()
+    frame_count = render_video(
+        data, frame_times,
+        output_path=args.output, frames_dir=args.frames_dir,
+        fps=args.fps, camera=camera, radius=args.radius, workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"✓ {frame_count} frames ({frame_count / args.fps:.1f}s video) rendered in {elapsed:.1f}s "
+          f"({frame_count / max(elapsed, 1e-9):.1f} fps) -> {args.output or args.frames_dir}")
+
+
+if __name__ == "__main__":
+    main()
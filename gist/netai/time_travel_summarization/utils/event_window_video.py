@@ -0,0 +1,139 @@
+"""
+이벤트 후보 구간만 렌더링하여 하나의 VLM 입력 영상으로 이어 붙이는 스크립트
+
+전체 구간을 캡쳐해서 VSS로 보내는 대신, 궤적 데이터에서 충돌 후보 구간
+(어떤 두 객체가 k x 충돌 반경 이내에 있는 구간 + 앞뒤 margin)만 골라 렌더링하고 하나의 영상으로 연결합니다.
+동시에 영상 시간 -> 데이터 시간 매핑(time map)을 sidecar JSON 으로 저장하여,
+`event_post_processing_core.consolidate_events` 가 실제 timestamp 를 복원할 수 있게 합니다.
+
+출력:
+    - <output>.mp4              : 후보 구간만 이어 붙인 simple_view 영상
+    - <output>.timemap.json     : {"overlay_clock", "segments": [{"video_start", "video_end", "data_start", "data_end"}, ...]}
+      (VLMClientCore 가 video/ 폴더의 sidecar 를 찾아 VLM 결과 JSON 에 자동으로 포함)
+      overlay_clock: 우측 하단에 표시한 시각의 기준. dataset (기본, 데이터 시각) 또는 video (영상 경과 시간)
+      -> VLM 이 읽은 시각을 restore_timestamp 가 그 기준으로만 복원
+
+사용법:
+    python event_window_video.py ../data/living_trajectory_1min_0.2s.csv -o ../video/video_40.mp4
+    python event_window_video.py ../data/living_trajectory_1min_0.2s.csv -o ../video/video_41.mp4 --radius 50 -k 2 --margin 1.5
+    # 우측 하단에 영상 경과 시간 표시
+    python event_window_video.py ../data/living_trajectory_1min_0.2s.csv -o ../video/video_43.mp4 --overlay-clock video
+    # 구간만 확인 (렌더링 없이)
+    python event_window_video.py ../data/living_trajectory_1min_0.2s.csv -o ../video/video_42.mp4 --dry-run
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from bev_renderer import BEVCamera, constant_speed_frame_times, fit_camera_to_data, render_video
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import trajectory_analysis  # noqa: E402
+
+
+OVERLAY_CLOCKS = ("dataset", "video")
+
+
+def build_time_map(windows, fps: float, speed: float, overlay_clock: str = "dataset"):
+    """
+    후보 구간 목록 -> (프레임 시간 리스트, time map).
+    각 구간은 fps/speed 로 샘플링되어 순서대로 이어 붙여짐.
+    time map 에는 영상에 표시하는 시각의 기준 (overlay_clock) 을 함께 기록.
+    """
+    if overlay_clock not in OVERLAY_CLOCKS:
+        raise ValueError(f"overlay_clock must be one of {OVERLAY_CLOCKS}: {overlay_clock}")
+    frame_times = []
+    segments = []
+    video_cursor = 0.0
+    for start_ms, end_ms in windows:
+        times = constant_speed_frame_times(start_ms, end_ms, fps, speed)
+        frame_times.extend(times)
+        video_duration = len(times) / fps
+        segments.append({
+            "video_start": round(video_cursor, 3),
+            "video_end": round(video_cursor + video_duration, 3),
+            "data_start": trajectory_analysis.format_timestamp_ms(start_ms),
+            "data_end": trajectory_analysis.format_timestamp_ms(end_ms),
+        })
+        video_cursor += video_duration
+    time_map = {"overlay_clock": overlay_clock, "fps": fps, "speed": speed, "segments": segments}
+    return frame_times, time_map
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render only event-candidate windows into one video with a video->dataset time map."
+    )
+    parser.add_argument("csv", type=str, help="Trajectory CSV (timestamp,objid,x,y,z)")
+    parser.add_argument("-o", "--output", type=str, required=True, help="Output MP4 path (time map: <stem>.timemap.json)")
+    parser.add_argument("--radius", type=float, default=50.0, help="Collision radius in world units (default: 50)")
+    parser.add_argument("-k", type=float, default=2.0, help="Candidate when a pair is within k x collision radius (default: 2)")
+    parser.add_argument("--margin", type=float, default=1.0, help="Seconds of padding around each window (default: 1)")
+    parser.add_argument("--fps", type=float, default=30.0, help="Output frame rate (default: 30)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed inside windows (default: 1)")
+    parser.add_argument("--width", type=int, default=532, help="Frame width (default: 532)")
+    parser.add_argument("--height", type=int, default=280, help="Frame height (default: 280)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    parser.add_argument("--overlay-clock", type=str, default="dataset", choices=OVERLAY_CLOCKS, help="Time shown in the overlay: dataset time or elapsed video time (default: dataset)")
+    parser.add_argument("--dry-run", action="store_true", help="Only print windows and write the time map")
+    args = parser.parse_args()
+
+    data = trajectory_analysis.load_trajectory_csv(args.csv)
+    timestamps = list(data.keys())
+    if not timestamps:
+        print(f"⚠️ 데이터가 비어 있습니다: {args.csv}")
+        return
+
+    data_start_ms = trajectory_analysis.to_ms(trajectory_analysis.parse_timestamp(timestamps[0]))
+    data_end_ms = trajectory_analysis.to_ms(trajectory_analysis.parse_timestamp(timestamps[-1]))
+
+    windows = trajectory_analysis.proximity_intervals(
+        data, threshold=args.k * args.radius, margin_ms=int(args.margin * 1000)
+    )
+    if not windows:
+        print("⚠️ 후보 구간이 없습니다. -k 또는 --radius 를 늘려보세요.")
+        return
+
+    frame_times, time_map = build_time_map(windows, args.fps, args.speed, args.overlay_clock)
+    segments = time_map["segments"]
+
+    full_seconds = (data_end_ms - data_start_ms) / 1000.0 / args.speed
+    video_seconds = len(frame_times) / args.fps
+    print(f"📊 후보 구간 {len(windows)}개, 영상 길이 {video_seconds:.1f}s "
+          f"(전체 렌더링 시 {full_seconds:.1f}s, {100.0 * video_seconds / max(full_seconds, 1e-9):.1f}%)")
+    for segment in segments:
+        print(f"  {segment['video_start']:8.2f}s - {segment['video_end']:8.2f}s  <-  "
+              f"{segment['data_start']} ~ {segment['data_end']}")
+
+    output_path = Path(args.output)
+    time_map_path = output_path.with_name(f"{output_path.stem}.timemap.json")
+    time_map_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(time_map_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "video": output_path.name,
+            "source": Path(args.csv).name,
+            "threshold": args.k * args.radius,
+            "margin_seconds": args.margin,
+            **time_map,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"📁 time map 저장: {time_map_path}")
+
+    if args.dry_run:
+        return
+
+    camera = fit_camera_to_data(data, BEVCamera(width=args.width, height=args.height))
+    started = time.perf_counter()
+    frame_count = render_video(
+        data, frame_times, output_path=str(output_path),
+        fps=args.fps, camera=camera, radius=args.radius, workers=args.workers,
+        overlay_times_ms=[index * 1000.0 / args.fps for index in range(len(frame_times))]
+        if args.overlay_clock == "video" else None,
+    )
+    print(f"✓ {frame_count} frames rendered in {time.perf_counter() - started:.1f}s -> {output_path}")
+
+
+if __name__ == "__main__":
+    main()
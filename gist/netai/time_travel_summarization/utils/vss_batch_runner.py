@@ -0,0 +1,405 @@
+"""
+여러 영상 x 모델 x 프리셋 조합을 VSS 서버로 일괄 처리하는 배치 스크립트
+
+UI 에서 영상 하나씩 Upload -> Generate -> Delete 하던 과정을 video/*.mp4 전체에 대해 자동으로 수행합니다.
+- 영상은 한 번만 업로드하고, 그 영상의 모든 (모델, 프리셋) 캡션 요청이 끝나면 (--delete 시) 삭제
+- 같은 내용의 영상이 이전 실행에서 업로드되어 서버에 남아 있으면 업로드 생략 (vlm_outputs/vss_upload_cache.json)
+- 같은 영상 내용 / 모델 / 프롬프트 / chunk 설정의 응답이 캐시에 있으면 서버에 요청하지 않음 (vlm_outputs/response_cache/)
+- 캡션 요청은 --concurrency 개까지 동시에 진행
+- --base-url 에 여러 VSS 서버를 쉼표로 주면 영상을 진행 중 요청이 적은 서버에 나눠 올리고, 그 영상의 요청은
+  같은 서버로 보냄 (VSS_backend_pool). 서버 수만큼 --concurrency 를 늘리면 처리량이 늘어남
+- --segment-seconds 시 영상을 chunk 경계에 맞춘 구간으로 잘라 구간별로 동시에 요청하고 결과를 합침 (VSS_segmenter)
+- 결과는 VLM Client 와 같이 vlm_outputs/ 에 저장 (stitched 영상의 time map 도 포함)
+- 완료된 작업은 manifest (JSONL) 에 기록되어, 중간에 죽더라도 다시 실행하면 남은 작업(실패 포함)만 처리
+- 요청별 연결 / 업로드 / TTFB / 서버 처리 시간 / 재시도 요약을 종료 시 출력 (--metrics-jsonl 로 측정값 저장)
+- --post-process 시 event_post_processing_core 로 intermediate_results/*_intermediate.jsonl 까지 생성
+  (event list 는 Time Travel 의 in-memory 데이터가 필요하므로 Event Post Processing 창에서 생성)
+
+출력:
+    - vlm_outputs/<model>_<video>_<preset>_<시각>.json
+    - vlm_outputs/batch_manifest.jsonl   : 작업별 {"key", "status", "output", "elapsed", ...}
+
+사용법:
+    python vss_batch_runner.py --models gpt-4o Qwen3-VL-8B-Instruct --presets simple_view twin_view
+    python vss_batch_runner.py "video_1*.mp4" --models nvila --concurrency 8 --delete --post-process
+    # 긴 영상을 60초 구간으로 나눠 구간 4개씩 동시에 요청
+    python vss_batch_runner.py --models nvila --segment-seconds 60 --segment-workers 4
+    # GPU 별 VSS stack 2개에 나눠 처리
+    python vss_batch_runner.py --models Qwen3-VL-8B-Instruct -c 8 --base-url http://10.38.38.40:8100,http://10.38.38.40:8101
+    # 실행할 작업만 확인
+    python vss_batch_runner.py --models nvila --dry-run
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from VSS_backend_pool import create_vss_client
+from VSS_client import VSSClient
+from VSS_metrics import MetricsRegistry
+from VSS_prompt_presets import PROMPT_PRESETS
+from VSS_resilience import RetryPolicy
+from VSS_response_cache import ResponseCache
+from VSS_segmenter import generate_segmented_captions
+from VSS_upload_cache import UploadCache, file_sha256, upload_with_cache
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import event_post_processing_core  # noqa: E402
+
+EXTENSION_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """
+    캡션 요청 1건 (영상 x 모델 x 프리셋).
+    chunk_duration / chunk_overlap_duration 을 주면 runner 기본값 대신 사용 (파라미터 sweep)
+    """
+    video: str
+    model: str
+    preset: str
+    chunk_duration: Optional[int] = None
+    chunk_overlap_duration: Optional[int] = None
+
+    @property
+    def chunk_tag(self) -> str:
+        """chunk 설정을 지정한 작업의 key / 파일명 접미사 (기본값 작업은 "")."""
+        if self.chunk_duration is None and self.chunk_overlap_duration is None:
+            return ""
+        return f"cd{self.chunk_duration if self.chunk_duration is not None else '-'}" \
+               f"_ov{self.chunk_overlap_duration if self.chunk_overlap_duration is not None else '-'}"
+
+    @property
+    def key(self) -> str:
+        key = f"{self.video}|{self.model}|{self.preset}"
+        return f"{key}|{self.chunk_tag}" if self.chunk_tag else key
+
+
+class BatchManifest:
+    """
+    작업 결과를 한 줄씩 append 하는 JSONL manifest.
+    같은 key 가 여러 번 기록되면 마지막 기록이 유효 (재시도 후 성공 등).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.records: Dict[str, dict] = {}
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 기록 중 죽어서 잘린 마지막 줄
+                    self.records[record["key"]] = record
+
+    def is_done(self, job: BatchJob) -> bool:
+        return self.records.get(job.key, {}).get("status") == "done"
+
+    def record(self, job: BatchJob, status: str, **fields) -> None:
+        record = {"key": job.key, "video": job.video, "model": job.model, "preset": job.preset,
+                  "chunk_duration": job.chunk_duration, "chunk_overlap_duration": job.chunk_overlap_duration,
+                  "status": status, "time": datetime.now().isoformat(timespec="seconds"), **fields}
+        with self._lock:
+            self.records[job.key] = record
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class BatchRunner:
+    """
+    VSSClient 하나를 여러 스레드가 공유하며 작업을 처리.
+    영상별 업로드는 첫 작업이 수행하고, 같은 영상의 다른 작업은 그 결과(file id)를 기다려 재사용.
+    """
+
+    def __init__(
+        self,
+        client: VSSClient,
+        videos_dir: Path,
+        outputs_dir: Path,
+        manifest: BatchManifest,
+        concurrency: int = 4,
+        chunk_overlap_duration: int = 0,
+        delete_after: bool = False,
+        post_process: bool = False,
+        upload_cache: Optional[UploadCache] = None,
+        use_response_cache: bool = True,
+        segment_duration: float = 0,
+        segment_workers: int = 4,
+    ):
+        self.client = client
+        self.upload_cache = upload_cache
+        self.use_response_cache = use_response_cache
+        self.videos_dir = videos_dir
+        self.outputs_dir = outputs_dir
+        self.manifest = manifest
+        self.concurrency = concurrency
+        self.chunk_overlap_duration = chunk_overlap_duration
+        self.delete_after = delete_after
+        self.post_process = post_process
+        self.segment_duration = segment_duration
+        self.segment_workers = segment_workers
+
+        self._lock = threading.Lock()
+        self._upload_locks: Dict[str, threading.Lock] = {}
+        self._file_ids: Dict[str, str] = {}
+        self._remaining: Dict[str, int] = {}  # 영상별 남은 작업 수 (0 이 되면 삭제)
+        self._video_hashes: Dict[str, str] = {}  # 작업이 남은 영상의 SHA-256 (LRU 삭제에서 보호)
+        self._content_hashes: Dict[str, str] = {}  # 응답 캐시 key 용 영상 SHA-256
+        self.cache_hits = 0
+
+    def run(self, jobs: List[BatchJob]) -> dict:
+        """남은 작업을 처리하고 요약 통계를 반환."""
+        pending = [job for job in jobs if not self.manifest.is_done(job)]
+        skipped = len(jobs) - len(pending)
+        for job in pending:
+            self._remaining[job.video] = self._remaining.get(job.video, 0) + 1
+            self._upload_locks.setdefault(job.video, threading.Lock())
+
+        print(f"📋 작업 {len(jobs)}개 중 {skipped}개 완료됨 (manifest), {len(pending)}개 실행 "
+              f"(영상 {len(self._remaining)}개, 동시 요청 {self.concurrency})")
+
+        started = time.perf_counter()
+        done = failed = 0
+        failed_videos = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {executor.submit(self._run_job, job): job for job in pending}
+            for future in as_completed(futures):
+                job = futures[future]
+                ok = future.result()
+                done += ok
+                failed += not ok
+                if not ok:
+                    failed_videos.add(job.video)
+                elapsed_min = (time.perf_counter() - started) / 60.0
+                print(f"  [{done + failed}/{len(pending)}] {'✓' if ok else '✗'} {job.key}  "
+                      f"({(done + failed) / max(elapsed_min, 1e-9):.2f} jobs/min)")
+
+        elapsed = time.perf_counter() - started
+        completed_videos = len(self._remaining) - len(failed_videos)
+        return {
+            "jobs": len(pending),
+            "skipped": skipped,
+            "done": done,
+            "cache_hits": self.cache_hits,
+            "failed": failed,
+            "videos": completed_videos,
+            "elapsed_seconds": elapsed,
+            "videos_per_minute": completed_videos / (elapsed / 60.0) if elapsed > 0 else 0.0,
+            "jobs_per_minute": done / (elapsed / 60.0) if elapsed > 0 else 0.0,
+        }
+
+    def _run_job(self, job: BatchJob) -> bool:
+        started = time.perf_counter()
+        try:
+            request = dict(preset_name=job.preset, chunk_overlap_duration=self.chunk_overlap_duration)
+            if job.chunk_duration is not None:
+                request["chunk_duration"] = job.chunk_duration
+            if job.chunk_overlap_duration is not None:
+                request["chunk_overlap_duration"] = job.chunk_overlap_duration
+            video_hash = self._content_hash(job.video) if self.client.response_cache is not None else None
+            # 캐시에 응답이 있으면 업로드도 하지 않음 (분할 요청은 generate_segmented_captions 가 캐시 확인)
+            response = None
+            if video_hash and self.use_response_cache and self.segment_duration <= 0:
+                response = self.client.get_cached_captions(video_hash, job.model, **request)
+            if response is None and self.segment_duration > 0:
+                # 구간 파일을 따로 업로드하므로 원본 영상은 업로드하지 않음
+                response = generate_segmented_captions(
+                    self.client, str(self.videos_dir / job.video), job.model, self.segment_duration,
+                    max_workers=self.segment_workers, video_hash=video_hash,
+                    use_cache=self.use_response_cache, **request
+                )
+            if response is not None and response.get("cache_hit"):
+                with self._lock:
+                    self.cache_hits += 1
+            elif response is None:
+                file_id = self._ensure_uploaded(job.video)
+                response = self.client.generate_vlm_captions(
+                    video_id=file_id, model=job.model, video_hash=video_hash, use_cache=self.use_response_cache,
+                    **request
+                )
+            output_path = self._save_response(job, response)
+            intermediate = self._post_process(output_path) if self.post_process else None
+            self.manifest.record(
+                job, "done",
+                output=output_path.name,
+                intermediate=intermediate,
+                elapsed=round(time.perf_counter() - started, 3),
+                execution_time=response.get("execution_time"),
+            )
+            return True
+        except Exception as e:
+            print(f"  ⚠️ {job.key}: {type(e).__name__}: {e}")
+            self.manifest.record(job, "failed", error=f"{type(e).__name__}: {e}",
+                                 elapsed=round(time.perf_counter() - started, 3))
+            return False
+        finally:
+            self._release(job.video)
+
+    def _content_hash(self, video: str) -> str:
+        """영상 SHA-256 (업로드 캐시가 있으면 그 기록을 재사용)."""
+        video_path = str(self.videos_dir / video)
+        if self.upload_cache is not None:
+            return self.upload_cache.hash_file(video_path)
+        with self._upload_locks[video]:
+            if video not in self._content_hashes:
+                self._content_hashes[video] = file_sha256(video_path)
+            return self._content_hashes[video]
+
+    def _ensure_uploaded(self, video: str) -> str:
+        """영상이 업로드되지 않았으면 업로드하고 file id 반환 (영상별 1회)."""
+        with self._upload_locks[video]:
+            if video not in self._file_ids:
+                video_path = str(self.videos_dir / video)
+                if self.upload_cache is None:
+                    response, reused = self.client.upload_video(video_path), False
+                else:
+                    video_hash = self.upload_cache.hash_file(video_path)
+                    with self._lock:
+                        self._video_hashes[video] = video_hash
+                        protect = set(self._video_hashes.values())
+                    response, reused = upload_with_cache(self.client, self.upload_cache, video_path, protect=protect)
+                self._file_ids[video] = response["id"]
+                print(f"  {'♻️' if reused else '⬆️'} {video} -> {response['id']}{' (reused)' if reused else ''}")
+            return self._file_ids[video]
+
+    def _release(self, video: str) -> None:
+        """영상의 작업 1개 종료. 마지막 작업이면 (--delete 시) 서버에서 삭제."""
+        with self._lock:
+            self._remaining[video] -= 1
+            if self._remaining[video] > 0:
+                return
+            file_id = self._file_ids.pop(video, None)
+            self._video_hashes.pop(video, None)
+        if self.delete_after and file_id:
+            try:
+                self.client.delete_video(file_id)
+                if self.upload_cache is not None:
+                    self.upload_cache.remove_file_id(file_id)
+                print(f"  🗑️ {video} ({file_id}) 삭제")
+            except Exception as e:
+                print(f"  ⚠️ {video} 삭제 실패: {e}")
+
+    def _save_response(self, job: BatchJob, response: dict) -> Path:
+        """VLMClientCore 와 같이 time map 을 붙여 vlm_outputs/ 에 저장."""
+        video_stem = Path(job.video).stem
+        time_map_path = self.videos_dir / f"{video_stem}.timemap.json"
+        if time_map_path.exists():
+            with open(time_map_path, 'r', encoding='utf-8') as f:
+                response["time_map"] = json.load(f)
+
+        # 같은 초에 끝나는 작업끼리 겹치지 않도록 프리셋 (와 chunk 설정) 을 파일명에 포함
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        preset = f"{job.preset}_{job.chunk_tag}" if job.chunk_tag else job.preset
+        output_path = self.outputs_dir / f"{job.model}_{video_stem}_{preset}_{timestamp}.json"
+        VSSClient.save_json(response, str(output_path))
+        return output_path
+
+    def _post_process(self, output_path: Path) -> str:
+        """VLM 결과 -> intermediate_results/<stem>_intermediate.jsonl (Event Post Processing 1단계)."""
+        data = event_post_processing_core.load_json(str(output_path))
+        events = event_post_processing_core.consolidate_events(data)
+        intermediate_dir = output_path.parent.parent / "intermediate_results"
+        intermediate_dir.mkdir(exist_ok=True)
+        intermediate_path = intermediate_dir / f"{output_path.stem}_intermediate.jsonl"
+        event_post_processing_core.save_jsonl(events, str(intermediate_path))
+        return intermediate_path.name
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batch upload / caption / save for many videos x models x presets with a resumable manifest."
+    )
+    parser.add_argument("patterns", nargs="*", default=["*.mp4"], help="Video glob patterns in --videos-dir (default: *.mp4)")
+    parser.add_argument("--models", nargs="+", required=True, help="VLM model names")
+    parser.add_argument("--presets", nargs="+", default=["simple_view"], choices=sorted(PROMPT_PRESETS), help="Prompt presets (default: simple_view)")
+    parser.add_argument("--videos-dir", type=str, default=str(EXTENSION_DIR / "video"), help="Video directory (default: ../video)")
+    parser.add_argument("--outputs-dir", type=str, default=str(EXTENSION_DIR / "vlm_outputs"), help="Output directory (default: ../vlm_outputs)")
+    parser.add_argument("--manifest", type=str, default=None, help="Manifest path (default: <outputs-dir>/batch_manifest.jsonl)")
+    parser.add_argument("--base-url", type=str, default=os.environ.get("VIA_BACKEND", "http://10.38.38.40:8100"), help="VSS server URL(s), comma-separated for several backends (default: $VIA_BACKEND)")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="Concurrent caption requests (default: 4)")
+    parser.add_argument("--overlap", type=int, default=0, help="Chunk overlap duration in seconds (default: 0)")
+    parser.add_argument("--delete", action="store_true", help="Delete each video from the server after its last job")
+    parser.add_argument("--no-upload-cache", action="store_true", help="Always upload, ignoring the content-hash upload cache")
+    parser.add_argument("--no-response-cache", action="store_true", help="Always ask the server (fresh responses still refresh the cache)")
+    parser.add_argument("--cache-max-files", type=int, default=20, help="Server files kept by the upload cache LRU (default: 20)")
+    parser.add_argument("--segment-seconds", type=float, default=0, help="Split videos client-side into segments of this length and caption them concurrently (default: 0 = off)")
+    parser.add_argument("--segment-workers", type=int, default=4, help="Concurrent segments per video with --segment-seconds (default: 4)")
+    parser.add_argument("--post-process", action="store_true", help="Also write intermediate_results/*_intermediate.jsonl")
+    parser.add_argument("--metrics-jsonl", type=str, default=None, help="Append per-request metrics (connect / upload / TTFB / server time) to this JSONL file")
+    parser.add_argument("--dry-run", action="store_true", help="Only list pending jobs")
+    args = parser.parse_args()
+
+    videos_dir = Path(args.videos_dir)
+    videos = sorted({path.name for pattern in args.patterns for path in videos_dir.glob(pattern)})
+    if not videos:
+        print(f"⚠️ 영상이 없습니다: {videos_dir} / {args.patterns}")
+        return
+
+    outputs_dir = Path(args.outputs_dir)
+    manifest = BatchManifest(Path(args.manifest) if args.manifest else outputs_dir / "batch_manifest.jsonl")
+    jobs = [BatchJob(video, model, preset) for video in videos for model in args.models for preset in args.presets]
+
+    if args.dry_run:
+        for job in jobs:
+            print(f"  {'done   ' if manifest.is_done(job) else 'pending'}  {job.key}")
+        return
+
+    client = create_vss_client(
+        args.base_url,
+        default_chunk_duration=2,
+        default_chunk_overlap_duration=0,
+        prompt_presets=dict(PROMPT_PRESETS),
+        pool_size=max(10, args.concurrency * max(1, args.segment_workers if args.segment_seconds > 0 else 1)),
+        retry_policy=RetryPolicy(max_retries=int(os.environ.get("VSS_MAX_RETRIES", 3))),
+        response_cache=ResponseCache(outputs_dir / "response_cache"),
+        metrics=MetricsRegistry(history=100000, jsonl_path=args.metrics_jsonl),
+    )
+    runner = BatchRunner(
+        client, videos_dir, outputs_dir, manifest,
+        concurrency=args.concurrency,
+        chunk_overlap_duration=args.overlap,
+        delete_after=args.delete,
+        post_process=args.post_process,
+        upload_cache=None if args.no_upload_cache else UploadCache(
+            outputs_dir / "vss_upload_cache.json", max_files=max(args.cache_max_files, args.concurrency)
+        ),
+        use_response_cache=not args.no_response_cache,
+        segment_duration=args.segment_seconds,
+        segment_workers=args.segment_workers,
+    )
+    with client:
+        summary = runner.run(jobs)
+
+    print(f"\n📊 {summary['done']}/{summary['jobs']} 작업 완료, 실패 {summary['failed']}, "
+          f"manifest 로 건너뜀 {summary['skipped']}, 응답 캐시 hit {summary['cache_hits']}")
+    print(f"⏱️ {summary['elapsed_seconds']:.1f}s, 영상 {summary['videos']}개 "
+          f"-> {summary['videos_per_minute']:.2f} videos/min ({summary['jobs_per_minute']:.2f} jobs/min)")
+    for backend in getattr(client, "get_backend_status", list)():
+        print(f"🖥️ {backend['url']}: {backend['requests']} requests, {backend['files']} files, "
+              f"{'healthy' if backend['healthy'] else 'unhealthy'}"
+              + (f" (last error: {backend['last_error']})" if backend["last_error"] else ""))
+    metrics_summary = client.metrics.format_summary()
+    if metrics_summary:
+        print(f"\n⏱️ 요청별 측정 (초)\n{metrics_summary}")
+    client.metrics.close()
+    print(f"📁 manifest: {manifest.path}")
+
+
+if __name__ == "__main__":
+    main()
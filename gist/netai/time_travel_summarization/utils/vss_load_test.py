@@ -0,0 +1,255 @@
+"""
+VSS 클라이언트 부하 테스트 (mock VSS 서버 사용, GPU 불필요)
+
+vss_mock_server.MockVSSServer 를 같은 프로세스에서 띄우고 (--base-url 을 주면 그 서버 사용)
+동시 요청 수별로 작업을 실행하여 클라이언트 처리량 / 지연 / 재시도 / 동시성 제한을 측정합니다.
+- 작업: upload -> generate_vlm_captions -> delete (--mode full) 또는 한 번 올린 영상에 generate 만 (--mode generate)
+- 동기 VSSClient (스레드) 또는 --async 시 AsyncVSSClient (max_concurrency = 동시 요청 수)
+- 결과: 동시 요청 수별 jobs/s, 지연 p50 / p95 / p99, 재시도 수, 실패 수, 서버 측 최대 동시 처리 / 대기 수,
+  generate 요청의 서버 처리 시간 / 대기(overhead) p50 과 요청 종류별 측정 요약 (VSS_metrics, --json 에 포함)
+
+사용법:
+    python vss_load_test.py -n 40 -c 1 2 4 8 --gpu-slots 4 --latency 1 --time-scale 0.1
+    python vss_load_test.py -n 100 -c 16 --failure-rate 0.2 --failure-statuses 429,503 --max-retries 5
+    python vss_load_test.py -n 20 -c 4 --async --mode full --video ../video/video_19.mp4
+    # 이미 실행 중인 서버 (mock 또는 실제 VSS) 에 대해
+    python vss_load_test.py --base-url http://127.0.0.1:8100 -n 20 -c 4
+    # mock backend 3개에 나눠 보내기 (VSS_backend_pool, 작업마다 업로드해야 backend 에 고르게 퍼짐)
+    python vss_load_test.py --mock-backends 3 --mode full -n 30 -c 6 --gpu-slots 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+from VSS_backend_pool import BackendPool, create_vss_client, parse_backend_urls
+from VSS_client import PromptPreset
+from VSS_metrics import percentile
+from VSS_resilience import CircuitBreaker, RetryPolicy
+from vss_mock_server import MockVSSServer, add_mock_arguments, config_from_args
+
+LOAD_TEST_PRESET = {"load_test": PromptPreset(prompt="List timestamps where numbered objects overlap.")}
+
+
+def make_client(args, concurrency: int, jobs: int, async_client: bool = False):
+    options = dict(
+        default_chunk_duration=args.chunk_duration,
+        default_chunk_overlap_duration=0,
+        prompt_presets=dict(LOAD_TEST_PRESET),
+        pool_size=max(10, concurrency),
+        timing_history=jobs * (args.max_retries + 1) * 3 + 10,
+        retry_policy=RetryPolicy(max_retries=args.max_retries, backoff_base=args.backoff),
+        # 부하 테스트에서는 실패율 측정을 위해 circuit breaker 가 요청을 막지 않게 함
+        circuit_breaker=CircuitBreaker(failure_threshold=10 ** 9),
+    )
+    urls = parse_backend_urls(args.base_url)
+    pool = BackendPool(urls, failure_threshold=10 ** 9) if len(urls) > 1 else None
+    if async_client:
+        return create_vss_client(args.base_url, async_client=True, pool=pool, max_concurrency=concurrency, **options)
+    return create_vss_client(args.base_url, pool=pool, **options)
+
+
+def summarize(concurrency: int, latencies: List[float], errors: Dict[str, int], timings, elapsed: float,
+              stats: Optional[dict], metrics: dict) -> dict:
+    retries = sum(1 for timing in timings if timing.attempt > 1)
+    ok = len(latencies)
+    generate = metrics.get("generate_vlm_captions", {})
+    return {
+        "concurrency": concurrency,
+        "ok": ok,
+        "failed": sum(errors.values()),
+        "errors": errors,
+        "elapsed": elapsed,
+        "jobs_per_second": ok / elapsed if elapsed > 0 else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "retries": retries,
+        "server_peak_in_flight": (stats or {}).get("peak_in_flight"),
+        "server_peak_waiting": (stats or {}).get("peak_waiting"),
+        "server_status_counts": (stats or {}).get("status_counts"),
+        "server_time_p50": generate.get("server_time", {}).get("p50"),
+        "overhead_p50": generate.get("overhead", {}).get("p50"),
+        "metrics": metrics,
+    }
+
+
+def _record_error(errors: Dict[str, int], error: BaseException) -> None:
+    status = getattr(error, "status_code", None)
+    key = f"HTTP {status}" if status else type(error).__name__
+    errors[key] = errors.get(key, 0) + 1
+
+
+def run_threads(args, concurrency: int, video_path: str) -> tuple:
+    client = make_client(args, concurrency, args.jobs)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    shared_id = client.upload_video(video_path)["id"] if args.mode == "generate" else None
+
+    def job(_):
+        started = time.perf_counter()
+        file_id = shared_id
+        try:
+            if file_id is None:
+                file_id = client.upload_video(video_path)["id"]
+            client.generate_vlm_captions(file_id, args.model, preset_name="load_test")
+            latencies.append(time.perf_counter() - started)
+        except Exception as e:
+            _record_error(errors, e)
+        finally:
+            if shared_id is None and file_id is not None:
+                try:
+                    client.delete_video(file_id)
+                except Exception:
+                    pass
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(job, range(args.jobs)))
+    elapsed = time.perf_counter() - started
+
+    if shared_id is not None:
+        client.delete_video(shared_id)
+    timings = client.get_request_timings()
+    client.close()
+    return latencies, errors, timings, elapsed, client.metrics.summary()
+
+
+async def run_async(args, concurrency: int, video_path: str) -> tuple:
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    async with make_client(args, concurrency, args.jobs, async_client=True) as client:
+        shared_id = (await client.upload_video(video_path))["id"] if args.mode == "generate" else None
+
+        async def job():
+            started = time.perf_counter()
+            file_id = shared_id
+            try:
+                if file_id is None:
+                    file_id = (await client.upload_video(video_path))["id"]
+                await client.generate_vlm_captions(file_id, args.model, preset_name="load_test")
+                latencies.append(time.perf_counter() - started)
+            except Exception as e:
+                _record_error(errors, e)
+            finally:
+                if shared_id is None and file_id is not None:
+                    try:
+                        await client.delete_video(file_id)
+                    except Exception:
+                        pass
+
+        started = time.perf_counter()
+        await asyncio.gather(*(job() for _ in range(args.jobs)))
+        elapsed = time.perf_counter() - started
+
+        if shared_id is not None:
+            await client.delete_video(shared_id)
+        timings = client.get_request_timings()
+    return latencies, errors, timings, elapsed, client.metrics.summary()
+
+
+def server_stats(base_url: str, reset: bool = False) -> Optional[dict]:
+    """mock 서버 통계 (실제 VSS 이면 None). 주소가 여러 개면 최대 동시 처리 / 대기 수와 status 수를 합산."""
+    merged = None
+    for url in parse_backend_urls(base_url):
+        try:
+            if reset:
+                requests.post(f"{url}/mock/reset", timeout=5)
+                continue
+            resp = requests.get(f"{url}/mock/stats", timeout=5)
+            stats = resp.json() if resp.ok else None
+        except (requests.RequestException, ValueError):
+            stats = None
+        if stats is None:
+            continue
+        if merged is None:
+            merged = dict(stats, status_counts=dict(stats.get("status_counts") or {}))
+            continue
+        for key in ("peak_in_flight", "peak_waiting"):
+            merged[key] = (merged.get(key) or 0) + (stats.get(key) or 0)
+        for status, count in (stats.get("status_counts") or {}).items():
+            merged["status_counts"][status] = merged["status_counts"].get(status, 0) + count
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the VSS client against a local mock VSS server")
+    parser.add_argument("--base-url", type=str, default=None, help="Existing server URL(s), comma-separated for a backend pool (default: start in-process mocks)")
+    parser.add_argument("--mock-backends", type=int, default=1, help="Number of in-process mock backends (default: 1)")
+    parser.add_argument("-n", "--jobs", type=int, default=20, help="Jobs per concurrency level (default: 20)")
+    parser.add_argument("-c", "--concurrency", type=int, nargs="+", default=[1, 2, 4, 8], help="Concurrency levels (default: 1 2 4 8)")
+    parser.add_argument("--mode", choices=["generate", "full"], default="generate", help="generate: one shared upload, full: upload + generate + delete per job")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use AsyncVSSClient (aiohttp)")
+    parser.add_argument("--video", type=str, default=None, help="Video to upload (default: synthetic file of --video-mb)")
+    parser.add_argument("--video-mb", type=float, default=5.0, help="Synthetic video size in MB (default: 5)")
+    parser.add_argument("--model", type=str, default="mock-vlm", help="Model name (default: mock-vlm)")
+    parser.add_argument("--chunk-duration", type=int, default=2, help="chunk_duration (default: 2)")
+    parser.add_argument("--max-retries", type=int, default=3, help="Client RetryPolicy max_retries (default: 3)")
+    parser.add_argument("--backoff", type=float, default=0.2, help="Client backoff base in seconds (default: 0.2)")
+    parser.add_argument("--port", type=int, default=0, help="In-process mock port (default: random)")
+    parser.add_argument("--json", type=str, default=None, help="Write the results to this JSON file")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.video and args.video_seconds is None:
+        args.video_seconds = 60.0  # 합성 파일은 영상이 아니므로 길이를 지정
+    mocks = []
+    if args.base_url is None:
+        for index in range(max(1, args.mock_backends)):
+            mocks.append(MockVSSServer(config_from_args(args), port=args.port + index if args.port else 0).start())
+        args.base_url = ",".join(mock.url for mock in mocks)
+        print(f"🧪 in-process mock VSS: {args.base_url} (gpu_slots={args.gpu_slots}, failure_rate={args.failure_rate})")
+
+    tmp_dir = None
+    video_path = args.video
+    if video_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="vss_load_")
+        video_path = os.path.join(tmp_dir, "synthetic.mp4")
+        with open(video_path, "wb") as f:
+            f.write(os.urandom(int(args.video_mb * 1024 * 1024)))
+
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            server_stats(args.base_url, reset=True)
+            if args.use_async:
+                latencies, errors, timings, elapsed, metrics = asyncio.run(run_async(args, concurrency, video_path))
+            else:
+                latencies, errors, timings, elapsed, metrics = run_threads(args, concurrency, video_path)
+            result = summarize(concurrency, latencies, errors, timings, elapsed, server_stats(args.base_url), metrics)
+            results.append(result)
+            print(f"  c={concurrency:<3} ✓ {result['ok']:<4} ✗ {result['failed']:<4} "
+                  f"{result['jobs_per_second']:7.2f} jobs/s  p50 {result['p50']:6.2f}s  p95 {result['p95']:6.2f}s  "
+                  f"p99 {result['p99']:6.2f}s  retries {result['retries']:<4} "
+                  f"server peak {result['server_peak_in_flight']} (waiting {result['server_peak_waiting']})  "
+                  f"server_time p50 {result['server_time_p50'] or 0:.2f}s  overhead p50 {result['overhead_p50'] or 0:.2f}s"
+                  + (f"  errors {result['errors']}" if result["errors"] else ""))
+    finally:
+        for mock in mocks:
+            mock.stop()
+        if tmp_dir:
+            os.remove(video_path)
+            os.rmdir(tmp_dir)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": {k: v for k, v in vars(args).items()}, "results": results}, f, indent=2)
+        print(f"📁 {args.json}")
+
+    best = max(results, key=lambda result: result["jobs_per_second"], default=None)
+    if best:
+        print(f"\n📊 최대 처리량: c={best['concurrency']} -> {best['jobs_per_second']:.2f} jobs/s "
+              f"(p95 {best['p95']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
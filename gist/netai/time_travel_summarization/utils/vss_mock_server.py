@@ -0,0 +1,660 @@
+"""
+GPU 없이 VSS 클라이언트를 개발 / 부하 테스트하기 위한 로컬 mock VSS 서버
+
+실제 VSS (10.38.38.40:8100) 대신 같은 API 를 흉내내며 표준 라이브러리만 사용합니다.
+- POST /files (multipart: file, purpose, media_type), GET /files/{id}, DELETE /files/{id}
+- POST /generate_vlm_captions : chunk_duration / chunk_overlap_duration 에 맞춘 chunk_responses 반환
+- GET /health/ready, GET /models
+- GET /mock/stats (요청 수, 실패 주입 수, 최대 동시 처리 수 등), POST /mock/reset
+
+지연 / 실패 / 내용 설정:
+- --latency + --chunk-latency x chunk 수 (± --jitter) 만큼 응답 지연, --gpu-slots 개까지만 동시에 처리
+  (나머지는 대기, 대기열이 --queue-limit 를 넘으면 503)
+- --failure-rate 확률로 --failure-statuses 중 하나를 반환 (429 / 503 에는 Retry-After), --reset-rate 확률로 응답 없이 연결 종료
+- --content empty | random | trajectory
+  trajectory: --trajectory CSV 에서 --threshold 보다 가까운 객체 쌍을 찾아, 화면에 표시되는 dataset 시각과
+  번호로 {"HH:MM:SS": [번호, ...]} 를 생성 (영상 시간 t -> 데이터 시작 + t x --speed).
+  --miss-rate / --false-rate 로 VLM 의 누락 / 오탐을 흉내냄
+- 영상 길이는 ffmpeg 가 있으면 업로드된 파일에서 읽고, 없으면 --video-seconds (trajectory 는 데이터 길이 / --speed)
+
+사용법:
+    python vss_mock_server.py --port 8100
+    python vss_mock_server.py --content trajectory --trajectory ../data/living_trajectory_1min_0.2s.csv --speed 1 --threshold 100
+    python vss_mock_server.py --latency 5 --gpu-slots 2 --failure-rate 0.1
+    # 클라이언트에서
+    VIA_BACKEND=http://127.0.0.1:8100 ...
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# trajectory_analysis 는 extension 루트에 위치 (omni 의존성 없음)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import trajectory_analysis  # noqa: E402
+
+try:
+    from .VSS_segmenter import probe_duration
+except ImportError:  # 스크립트로 직접 실행하는 경우
+    from VSS_segmenter import probe_duration
+
+READ_SIZE = 64 * 1024
+
+
+@dataclass
+class MockConfig:
+    """mock 서버 동작 설정 (시간 단위: 초)"""
+    latency: float = 2.0                 # generate 기본 지연
+    chunk_latency: float = 0.1           # chunk 하나당 추가 지연
+    jitter: float = 0.2                  # 지연 x (1 ± jitter) 균등 분포
+    upload_latency: float = 0.0          # 업로드 처리 지연
+    time_scale: float = 1.0              # 모든 지연에 곱함 (테스트를 빠르게 돌릴 때 < 1)
+    gpu_slots: int = 1                   # 동시에 처리하는 generate 수
+    queue_limit: Optional[int] = None    # 대기 중인 generate 가 이 수를 넘으면 503
+    failure_rate: float = 0.0
+    failure_statuses: Tuple[int, ...] = (503,)
+    retry_after: float = 1.0
+    reset_rate: float = 0.0              # 응답 없이 연결을 끊는 확률 (generate)
+    content: str = "random"              # empty | random | trajectory
+    event_rate: float = 0.2              # random: chunk 당 이벤트 확률
+    num_objects: int = 8                 # random: 객체 번호 범위
+    video_seconds: Optional[float] = None
+    models: Tuple[str, ...] = ()         # 비어 있으면 모든 모델 허용
+    trajectory: Optional[str] = None
+    speed: float = 1.0                   # 영상 1초 = 데이터 speed 초
+    threshold: float = 100.0             # trajectory: 근접 판정 거리 (XZ 평면)
+    miss_rate: float = 0.0               # trajectory: 정답 이벤트를 빠뜨릴 확률
+    false_rate: float = 0.0              # trajectory: chunk 당 오탐을 추가할 확률
+    seed: Optional[int] = None
+
+
+@dataclass
+class MockStats:
+    uploads: int = 0
+    upload_bytes: int = 0
+    deletes: int = 0
+    generates: int = 0
+    generate_ok: int = 0
+    injected_failures: int = 0
+    resets: int = 0
+    rejected: int = 0                    # queue_limit 초과로 거절
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    waiting: int = 0
+    peak_waiting: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+
+
+class TrajectoryEvents:
+    """trajectory CSV 에서 근접 이벤트를 초 단위로 미리 계산: {dataset 초(ms 단위 floor): 번호 집합}."""
+
+    def __init__(self, csv_path: str, threshold: float):
+        data = trajectory_analysis.load_trajectory_csv(csv_path)
+        objids = sorted({objid for frame in data.values() for objid in frame})
+        labels = trajectory_analysis.objid_label_map(objids)
+        self.labels = sorted(int(label) for label in labels.values())
+        self.events: Dict[int, Set[int]] = {}
+        self.start_ms = self.end_ms = 0
+        for index, (time_ms, positions) in enumerate(trajectory_analysis.iter_full_frames(data)):
+            if index == 0:
+                self.start_ms = time_ms
+            self.end_ms = time_ms
+            for objid_a, objid_b in trajectory_analysis.find_close_pairs(positions, threshold):
+                second_ms = time_ms - time_ms % 1000
+                self.events.setdefault(second_ms, set()).update((int(labels[objid_a]), int(labels[objid_b])))
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ms - self.start_ms) / 1000.0
+
+    def between(self, start_ms: float, end_ms: float) -> List[Tuple[int, Set[int]]]:
+        return [(second_ms, ids) for second_ms, ids in sorted(self.events.items())
+                if start_ms <= second_ms < end_ms]
+
+
+class MockVSSServer:
+    """
+    in-process 로도 사용할 수 있는 mock VSS 서버.
+
+        with MockVSSServer(MockConfig(time_scale=0.01)) as server:
+            client = VSSClient(server.url, ...)
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockConfig()
+        self.stats = MockStats()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._slots = threading.Semaphore(max(1, self.config.gpu_slots))
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._storage = tempfile.mkdtemp(prefix="vss_mock_")
+        self._trajectory = None
+        if self.config.content == "trajectory":
+            if not self.config.trajectory:
+                raise ValueError("content='trajectory' needs a trajectory CSV")
+            self._trajectory = TrajectoryEvents(self.config.trajectory, self.config.threshold)
+
+        handler = type("Handler", (_MockHandler,), {"server_state": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+        self._connections: Set[socket.socket] = set()  # keep-alive 연결 (stop 에서 닫음)
+        self._stopping = False
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockVSSServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """accept loop 를 멈추고, 다음 요청을 기다리는 keep-alive 연결까지 닫음."""
+        self._stopping = True  # 처리 중인 요청은 Connection: close 로 응답
+        self.httpd.shutdown()
+        with self._lock:
+            connections = list(self._connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # 이미 닫힘
+        self.httpd.server_close()
+        shutil.rmtree(self._storage, ignore_errors=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = MockStats()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats.__dict__)
+            stats["status_counts"] = dict(self.stats.status_counts)
+            stats["files"] = len(self._files)
+        return stats
+
+    # ------------------------------------------------------------------
+    # 시뮬레이션
+    # ------------------------------------------------------------------
+    def sleep(self, seconds: float) -> None:
+        seconds *= self.config.time_scale
+        if self.config.jitter:
+            seconds *= 1 + self._random.uniform(-self.config.jitter, self.config.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def video_duration(self, info: Dict[str, Any]) -> float:
+        if info.get("duration"):
+            return info["duration"]
+        if self.config.video_seconds:
+            return self.config.video_seconds
+        if self._trajectory is not None:
+            return self._trajectory.duration / self.config.speed
+        return 60.0
+
+    def chunk_windows(self, duration: float, chunk_duration: float, overlap: float) -> List[Tuple[float, float]]:
+        chunk_duration = chunk_duration if chunk_duration and chunk_duration > 0 else duration
+        step = max(chunk_duration - (overlap or 0), 1e-3)
+        windows = []
+        start = 0.0
+        while start < duration - 1e-6:
+            windows.append((start, min(duration, start + chunk_duration)))
+            start += step
+        return windows or [(0.0, duration)]
+
+    def chunk_content(self, start: float, end: float) -> str:
+        config = self.config
+        entries: List[Dict[str, List[int]]] = []
+        if config.content == "random":
+            if self._random.random() < config.event_rate:
+                ids = sorted(self._random.sample(range(1, config.num_objects + 1), 2))
+                entries.append({_hms(start + self._random.uniform(0, end - start)): ids})
+        elif config.content == "trajectory":
+            trajectory = self._trajectory
+            data_start = trajectory.start_ms + start * config.speed * 1000
+            data_end = trajectory.start_ms + end * config.speed * 1000
+            for second_ms, ids in trajectory.between(data_start, data_end):
+                if self._random.random() >= config.miss_rate:
+                    entries.append({_clock(second_ms): sorted(ids)})
+            if len(trajectory.labels) >= 2 and self._random.random() < config.false_rate:
+                second_ms = data_start + self._random.uniform(0, data_end - data_start)
+                entries.append({_clock(second_ms): sorted(self._random.sample(trajectory.labels, 2))})
+        return json.dumps(entries)
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    server_state: MockVSSServer = None
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server_state._lock:
+            self.server_state._connections.add(self.connection)
+
+    def finish(self):
+        with self.server_state._lock:
+            self.server_state._connections.discard(self.connection)
+        super().finish()
+
+    # ------------------------------------------------------------------
+    # routing
+    # ------------------------------------------------------------------
+    def do_GET(self):
+        if self.path in ("/health/ready", "/health/live"):
+            return self._send_json(200, {"status": "ok"})
+        if self.path == "/models":
+            models = self.server_state.config.models or ("mock-vlm",)
+            return self._send_json(200, {"object": "list", "data": [{"id": model, "object": "model"} for model in models]})
+        if self.path == "/mock/stats":
+            return self._send_json(200, self.server_state.snapshot())
+        match = re.fullmatch(r"/files/([\w-]+)", self.path)
+        if match:
+            info = self.server_state._files.get(match.group(1))
+            if info is None:
+                return self._send_error(404, f"File {match.group(1)} not found")
+            return self._send_json(200, _public(info))
+        self._send_error(404, f"Unknown path {self.path}")
+
+    def do_DELETE(self):
+        match = re.fullmatch(r"/files/([\w-]+)", self.path)
+        if not match:
+            return self._send_error(404, f"Unknown path {self.path}")
+        state = self.server_state
+        with state._lock:
+            info = state._files.pop(match.group(1), None)
+            if info is not None:
+                state.stats.deletes += 1
+        if info is None:
+            return self._send_error(404, f"File {match.group(1)} not found")
+        try:
+            os.remove(info["path"])
+        except OSError:
+            pass
+        self._send_json(200, {"id": info["id"], "object": "file", "deleted": True})
+
+    def do_POST(self):
+        if self.path == "/files":
+            return self._upload()
+        if self.path == "/generate_vlm_captions":
+            return self._generate()
+        if self.path == "/mock/reset":
+            self._drain()
+            self.server_state.reset_stats()
+            return self._send_json(200, {"reset": True})
+        self._drain()
+        self._send_error(404, f"Unknown path {self.path}")
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 인터페이스
+        pass
+
+    # ------------------------------------------------------------------
+    # /files
+    # ------------------------------------------------------------------
+    def _upload(self):
+        state = self.server_state
+        match = re.search(r"boundary=\"?([^\";]+)\"?", self.headers.get("Content-Type", ""))
+        length = int(self.headers.get("Content-Length") or 0)
+        if not match or not length:
+            self._drain()
+            return self._send_error(400, "Expected multipart/form-data with Content-Length")
+
+        file_id = str(uuid.uuid4())
+        path = os.path.join(state._storage, file_id)
+        try:
+            fields, filename, size = _read_multipart(self.rfile, length, match.group(1).encode(), path)
+        except ValueError as e:
+            self.close_connection = True  # 남은 body 를 읽지 않았으므로 연결 재사용 불가
+            return self._send_error(400, str(e))
+        if filename is None:
+            return self._send_error(422, "Missing file field")
+
+        state.sleep(state.config.upload_latency)
+        duration = None
+        try:
+            duration = probe_duration(path)
+        except Exception:
+            pass  # ffmpeg 가 없거나 영상이 아니면 설정값 사용
+
+        info = {
+            "id": file_id,
+            "object": "file",
+            "bytes": size,
+            "filename": filename,
+            "purpose": fields.get("purpose", "vision"),
+            "media_type": fields.get("media_type", "video"),
+            "created_at": int(time.time()),
+            "duration": duration,
+            "path": path,
+        }
+        with state._lock:
+            state._files[file_id] = info
+            state.stats.uploads += 1
+            state.stats.upload_bytes += size
+        self._send_json(200, _public(info))
+
+    # ------------------------------------------------------------------
+    # /generate_vlm_captions
+    # ------------------------------------------------------------------
+    def _generate(self):
+        state = self.server_state
+        config = state.config
+        try:
+            payload = json.loads(self._read_body() or b"{}")
+        except ValueError:
+            return self._send_error(400, "Invalid JSON body")
+
+        with state._lock:
+            state.stats.generates += 1
+        video_id = payload.get("id")
+        video_id = video_id[0] if isinstance(video_id, list) and video_id else video_id
+        info = state._files.get(video_id)
+        if info is None:
+            return self._send_error(404, f"File {video_id} not found")
+        if config.models and payload.get("model") not in config.models:
+            return self._send_error(400, f"Model {payload.get('model')} is not served")
+
+        # 실패 주입 (GPU 작업 전에 거절되는 경우)
+        if state._random.random() < config.failure_rate:
+            status = state._random.choice(config.failure_statuses)
+            with state._lock:
+                state.stats.injected_failures += 1
+            headers = {"Retry-After": f"{config.retry_after:g}"} if status in (429, 503) else None
+            return self._send_error(status, "Injected failure", headers)
+
+        # GPU slot 대기
+        with state._lock:
+            if config.queue_limit is not None and state.stats.waiting >= config.queue_limit:
+                state.stats.rejected += 1
+                rejected = True
+            else:
+                rejected = False
+                state.stats.waiting += 1
+                state.stats.peak_waiting = max(state.stats.peak_waiting, state.stats.waiting)
+        if rejected:
+            return self._send_error(503, "Server busy", {"Retry-After": f"{config.retry_after:g}"})
+
+        state._slots.acquire()
+        try:
+            with state._lock:
+                state.stats.waiting -= 1
+                state.stats.in_flight += 1
+                state.stats.peak_in_flight = max(state.stats.peak_in_flight, state.stats.in_flight)
+
+            started = time.perf_counter()
+            duration = state.video_duration(info)
+            windows = state.chunk_windows(
+                duration, float(payload.get("chunk_duration") or 0), float(payload.get("chunk_overlap_duration") or 0)
+            )
+            state.sleep(config.latency + config.chunk_latency * len(windows))
+
+            if state._random.random() < config.reset_rate:
+                with state._lock:
+                    state.stats.resets += 1
+                self.close_connection = True
+                self.connection.close()
+                return
+
+            chunks = [
+                {
+                    "chunk_idx": index,
+                    "start_time": _hms(start),
+                    "end_time": _hms(end),
+                    "content": state.chunk_content(start, end),
+                }
+                for index, (start, end) in enumerate(windows)
+            ]
+            prompt_tokens = len(str(payload.get("prompt", "")).split()) * len(chunks)
+            completion_tokens = sum(len(chunk["content"]) // 4 for chunk in chunks)
+            response = {
+                "id": str(uuid.uuid4()),
+                "video_id": video_id,
+                "model": payload.get("model"),
+                "object": "summarization.completion",
+                "created": int(time.time()),
+                "chunk_responses": chunks,
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+                "execution_time": time.perf_counter() - started,
+            }
+        finally:
+            with state._lock:
+                state.stats.in_flight -= 1
+            state._slots.release()
+
+        with state._lock:
+            state.stats.generate_ok += 1
+        self._send_json(200, response)
+
+    # ------------------------------------------------------------------
+    # 응답 / body
+    # ------------------------------------------------------------------
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _drain(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        while length > 0:
+            data = self.rfile.read(min(READ_SIZE, length))
+            if not data:
+                break
+            length -= len(data)
+
+    def _send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if self.server_state._stopping:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        try:
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # 클라이언트가 먼저 끊음 (취소 / timeout)
+            return
+        state = self.server_state
+        with state._lock:
+            key = str(status)
+            state.stats.status_counts[key] = state.stats.status_counts.get(key, 0) + 1
+
+    def _send_error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send_json(status, {"code": str(status), "message": message}, headers)
+
+
+# ----------------------------------------------------------------------
+# multipart
+# ----------------------------------------------------------------------
+def _read_multipart(stream, length: int, boundary: bytes, file_path: str) -> Tuple[Dict[str, str], Optional[str], int]:
+    """
+    multipart body 를 READ_SIZE 단위로 읽으며 파일 part 는 file_path 에 바로 기록 (메모리 사용량 일정).
+    Returns: (일반 field, 파일 이름, 파일 크기)
+    """
+    remaining = length
+    buffer = b""
+
+    def fill() -> bool:
+        nonlocal buffer, remaining
+        if remaining <= 0:
+            return False
+        data = stream.read(min(READ_SIZE, remaining))
+        if not data:
+            raise ValueError("Unexpected end of multipart body")
+        remaining -= len(data)
+        buffer += data
+        return True
+
+    def read_until(marker: bytes) -> bytes:
+        nonlocal buffer
+        while marker not in buffer:
+            if not fill():
+                raise ValueError("Malformed multipart body")
+        head, buffer = buffer.split(marker, 1)
+        return head
+
+    delimiter = b"--" + boundary
+    separator = b"\r\n" + delimiter
+    read_until(delimiter)
+
+    fields: Dict[str, str] = {}
+    filename = None
+    size = 0
+    while True:
+        while len(buffer) < 2 and fill():
+            pass
+        if buffer.startswith(b"--"):
+            break
+        headers = read_until(b"\r\n\r\n").decode("utf-8", "replace")
+        name_match = re.search(r'name="([^"]*)"', headers)
+        file_match = re.search(r'filename="([^"]*)"', headers)
+
+        if file_match:
+            filename = file_match.group(1)
+            with open(file_path, "wb") as f:
+                while True:
+                    index = buffer.find(separator)
+                    if index >= 0:
+                        f.write(buffer[:index])
+                        size += index
+                        buffer = buffer[index + len(separator):]
+                        break
+                    # separator 가 걸쳐 있을 수 있으므로 끝부분은 남겨 둠
+                    keep = len(separator) - 1
+                    if len(buffer) > keep:
+                        f.write(buffer[:-keep])
+                        size += len(buffer) - keep
+                        buffer = buffer[-keep:]
+                    if not fill():
+                        raise ValueError("Malformed multipart body")
+        else:
+            value = read_until(separator)
+            if name_match:
+                fields[name_match.group(1)] = value.decode("utf-8", "replace")
+
+    # 남은 body (epilogue) 는 버림
+    while remaining > 0:
+        data = stream.read(min(READ_SIZE, remaining))
+        if not data:
+            break
+        remaining -= len(data)
+    return fields, filename, size
+
+
+def _hms(seconds: float) -> str:
+    seconds = int(math.floor(seconds))
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def _clock(time_ms: float) -> str:
+    return trajectory_analysis.from_ms(time_ms).strftime("%H:%M:%S")
+
+
+def _public(info: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: value for name, value in info.items() if name not in ("path", "duration")}
+
+
+def _parse_statuses(value: str) -> Tuple[int, ...]:
+    return tuple(int(item) for item in value.split(",") if item.strip())
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser) -> None:
+    """MockConfig 인자 (vss_load_test.py 와 공유)."""
+    parser.add_argument("--latency", type=float, default=2.0, help="Base generate latency in seconds (default: 2)")
+    parser.add_argument("--chunk-latency", type=float, default=0.1, help="Extra latency per chunk in seconds (default: 0.1)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Latency jitter fraction (default: 0.2)")
+    parser.add_argument("--upload-latency", type=float, default=0.0, help="Upload processing latency in seconds (default: 0)")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiply all simulated latencies (default: 1)")
+    parser.add_argument("--gpu-slots", type=int, default=1, help="Concurrent generate requests (default: 1)")
+    parser.add_argument("--queue-limit", type=int, default=None, help="Reject with 503 when this many requests wait (default: unlimited)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Probability of an injected error response (default: 0)")
+    parser.add_argument("--failure-statuses", type=_parse_statuses, default=(503,), help="Comma-separated injected statuses (default: 503)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds for 429/503 (default: 1)")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="Probability of dropping the connection without a response (default: 0)")
+    parser.add_argument("--content", choices=["empty", "random", "trajectory"], default="random", help="chunk_responses content (default: random)")
+    parser.add_argument("--event-rate", type=float, default=0.2, help="random: event probability per chunk (default: 0.2)")
+    parser.add_argument("--video-seconds", type=float, default=None, help="Video length when it cannot be probed")
+    parser.add_argument("--models", nargs="*", default=[], help="Served model names (default: any)")
+    parser.add_argument("--trajectory", type=str, default=None, help="trajectory: CSV (timestamp,objid,x,y,z)")
+    parser.add_argument("--speed", type=float, default=1.0, help="trajectory: data seconds per video second (default: 1)")
+    parser.add_argument("--threshold", type=float, default=100.0, help="trajectory: proximity threshold (default: 100)")
+    parser.add_argument("--miss-rate", type=float, default=0.0, help="trajectory: probability of missing an event (default: 0)")
+    parser.add_argument("--false-rate", type=float, default=0.0, help="trajectory: probability of a false event per chunk (default: 0)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+
+
+def config_from_args(args: argparse.Namespace) -> MockConfig:
+    return MockConfig(
+        latency=args.latency,
+        chunk_latency=args.chunk_latency,
+        jitter=args.jitter,
+        upload_latency=args.upload_latency,
+        time_scale=args.time_scale,
+        gpu_slots=args.gpu_slots,
+        queue_limit=args.queue_limit,
+        failure_rate=args.failure_rate,
+        failure_statuses=tuple(args.failure_statuses),
+        retry_after=args.retry_after,
+        reset_rate=args.reset_rate,
+        content=args.content,
+        event_rate=args.event_rate,
+        video_seconds=args.video_seconds,
+        models=tuple(args.models),
+        trajectory=args.trajectory,
+        speed=args.speed,
+        threshold=args.threshold,
+        miss_rate=args.miss_rate,
+        false_rate=args.false_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock VSS server (no GPU)")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8100, help="Port (default: 8100)")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    server = MockVSSServer(config_from_args(args), host=args.host, port=args.port)
+    print(f"🧪 mock VSS: {server.url}  (content={args.content}, gpu_slots={args.gpu_slots}, "
+          f"latency={args.latency}s + {args.chunk_latency}s/chunk, failure_rate={args.failure_rate})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 종료")
+    finally:
+        server.httpd.server_close()
+        shutil.rmtree(server._storage, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
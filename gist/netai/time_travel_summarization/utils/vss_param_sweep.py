@@ -0,0 +1,292 @@
+"""
+chunk 길이 / chunk overlap / 캡처 속도 / 모델 / 프리셋 조합을 VSS 서버에서 일괄 실행하고 정답과 비교하는 파라미터 sweep
+
+UI 에서 설정을 하나씩 바꿔 Generate 하고 compare_results.py 로 따로 평가하던 과정을 한 번에 수행합니다.
+- 조합 (grid) 별 캡션 요청을 vss_batch_runner 의 BatchRunner 로 --concurrency 개까지 동시에 실행
+  (영상은 한 번만 업로드, 업로드 캐시 / 응답 캐시 재사용, --base-url 에 여러 서버 지정 가능)
+- 캡처 속도는 서버 요청 파라미터가 아니므로, 속도별로 캡처한 영상을 --videos "속도=파일" 로 지정
+  (overlay 는 dataset 시각을 표시하므로 모든 속도에 같은 정답 사용, stitched 영상은 time map 으로 시각 복원)
+- 각 결과를 compare_results 와 같은 방식 (완전 일치만 정답) 으로 평가하여 latency / F1 표 출력
+- latency: 응답의 execution_time (서버 처리 시간, 캐시 hit 이면 처음 요청했을 때의 값)
+- F1 이 --min-f1 이상인 조합 중 latency 가 가장 작은 조합을 추천
+- 완료된 조합은 manifest 에 기록되어, 같은 --name 으로 다시 실행하면 남은 조합만 요청 (평가는 전체 다시 수행)
+
+출력:
+    - vlm_outputs/sweeps/<name>/<model>_<video>_<preset>_cd<chunk>_ov<overlap>_<시각>.json
+    - vlm_outputs/sweeps/<name>/sweep_manifest.jsonl
+    - vlm_outputs/sweeps/<name>/sweep_results.json : 조합별 {"latency", "precision", "recall", "f1", ...} 와 "best"
+
+사용법:
+    # video_19 (Ground Truth 2) 를 chunk 2 / 5 / 10초, overlap 0 / 1초로 비교
+    python vss_param_sweep.py --videos video_19.mp4 -g 2 --models Qwen3-VL-8B-Instruct \
+        --chunk-durations 2 5 10 --overlaps 0 1 --min-f1 0.6
+    # 1배속 / 2배속 캡처 영상과 모델 2개, 프리셋 2개
+    python vss_param_sweep.py --videos 1=video_19.mp4 2=video_19_x2.mp4 -g 2 --models nvila gpt-4o \
+        --presets simple_view twin_view -c 8 --name speed_test
+    # 정답 파일 지정 ("HH:MM:SS 1,4" 형식), 실행할 조합만 확인
+    python vss_param_sweep.py --videos video_180.mp4 --ground-truth-file gt_180.txt --models nvila --dry-run
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from VSS_backend_pool import create_vss_client
+from VSS_metrics import MetricsRegistry
+from VSS_prompt_presets import PROMPT_PRESETS
+from VSS_resilience import RetryPolicy
+from VSS_response_cache import ResponseCache
+from VSS_upload_cache import UploadCache
+from compare_results import calculate_metrics, get_ground_truth_texts, parse_ground_truth, parse_prediction_json
+from vss_batch_runner import BatchJob, BatchManifest, BatchRunner
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import event_post_processing_core  # noqa: E402
+
+EXTENSION_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class SweepResult:
+    """조합 1개의 실행 / 평가 결과 (latency 는 초)"""
+    speed: float
+    video: str
+    model: str
+    preset: str
+    chunk_duration: int
+    chunk_overlap_duration: int
+    status: str
+    latency: Optional[float] = None      # execution_time (서버 처리 시간)
+    elapsed: Optional[float] = None      # 이번 실행의 요청 소요 시간 (manifest 로 건너뛰면 이전 실행 값)
+    precision: Optional[float] = None
+    recall: Optional[float] = None
+    f1: Optional[float] = None
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+    def meets(self, min_f1: float) -> bool:
+        return self.status == "done" and self.f1 is not None and self.f1 >= min_f1
+
+
+def parse_video_specs(specs: List[str]) -> Dict[str, float]:
+    """["video_19.mp4", "2=video_19_x2.mp4"] -> {영상 파일: 캡처 속도} (속도를 생략하면 1)."""
+    videos: Dict[str, float] = {}
+    for spec in specs:
+        speed, separator, video = spec.partition("=")
+        if not separator:
+            speed, video = "1", spec
+        if video in videos:
+            raise ValueError(f"Video given twice: {video}")
+        videos[video] = float(speed)
+    return videos
+
+
+def build_jobs(
+    videos: Dict[str, float],
+    models: List[str],
+    presets: List[str],
+    chunk_durations: List[int],
+    overlaps: List[int],
+) -> List[BatchJob]:
+    """grid 의 모든 조합 (overlap 이 chunk 길이 이상인 조합은 제외)."""
+    jobs = []
+    for video, model, preset, chunk_duration, overlap in itertools.product(
+        videos, models, presets, chunk_durations, overlaps
+    ):
+        if overlap >= chunk_duration:
+            print(f"  ⏭️ 건너뜀: overlap {overlap}s >= chunk {chunk_duration}s")
+            continue
+        jobs.append(BatchJob(video, model, preset, chunk_duration=chunk_duration, chunk_overlap_duration=overlap))
+    return jobs
+
+
+def evaluate_output(output_path: Path, ground_truth: Dict[str, Set[int]]):
+    """
+    저장된 VLM 결과를 정답과 비교 (compare_results 와 같은 기준).
+    time map 이 있으면 (stitched 영상) 예측 시각을 dataset 시각으로 복원한 뒤 비교.
+
+    Returns:
+        (precision, recall, f1)
+    """
+    predictions = parse_prediction_json(str(output_path))
+    with open(output_path, 'r', encoding='utf-8') as f:
+        time_map = json.load(f).get("time_map")
+    if time_map:
+        restored: Dict[str, List[Set[int]]] = {}
+        for timestamp, object_sets in predictions.items():
+            entries = restored.setdefault(event_post_processing_core.restore_timestamp(timestamp, time_map), [])
+            entries.extend(objects for objects in object_sets if objects not in entries)
+        predictions = restored
+    precision, recall, f1, _ = calculate_metrics(ground_truth, predictions)
+    return precision, recall, f1
+
+
+def collect_results(
+    jobs: List[BatchJob],
+    videos: Dict[str, float],
+    manifest: BatchManifest,
+    outputs_dir: Path,
+    ground_truth: Dict[str, Set[int]],
+) -> List[SweepResult]:
+    """manifest 의 조합별 기록과 평가 결과."""
+    results = []
+    for job in jobs:
+        record = manifest.records.get(job.key, {})
+        result = SweepResult(
+            speed=videos[job.video], video=job.video, model=job.model, preset=job.preset,
+            chunk_duration=job.chunk_duration, chunk_overlap_duration=job.chunk_overlap_duration,
+            status=record.get("status", "pending"), elapsed=record.get("elapsed"),
+            output=record.get("output"), error=record.get("error"),
+        )
+        if result.status == "done":
+            try:
+                result.latency = float(record["execution_time"])
+            except (KeyError, TypeError, ValueError):
+                result.latency = result.elapsed
+            try:
+                result.precision, result.recall, result.f1 = evaluate_output(outputs_dir / result.output, ground_truth)
+            except (OSError, ValueError) as e:
+                result.status, result.error = "failed", f"evaluation: {type(e).__name__}: {e}"
+        results.append(result)
+    return results
+
+
+def select_best(results: List[SweepResult], min_f1: float) -> Optional[SweepResult]:
+    """F1 이 min_f1 이상인 조합 중 latency 가 가장 작은 조합 (같으면 F1 이 높은 쪽)."""
+    candidates = [result for result in results if result.meets(min_f1) and result.latency is not None]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda result: (result.latency, -result.f1))
+
+
+def format_table(results: List[SweepResult], min_f1: float, best: Optional[SweepResult]) -> str:
+    """latency 오름차순 latency / F1 표 (✓: F1 >= min_f1, ★: 추천 조합)."""
+    def sort_key(result):
+        return (result.latency is None, result.latency or 0.0, -(result.f1 or 0.0))
+
+    lines = [
+        f"   {'speed':>5} {'chunk':>5} {'ovl':>4}  {'model':<24} {'preset':<14} "
+        f"{'latency':>8} {'elapsed':>8} {'P':>5} {'R':>5} {'F1':>5}",
+    ]
+    for result in sorted(results, key=sort_key):
+        mark = "★" if result is best else ("✓" if result.meets(min_f1) else " ")
+        if result.status == "done":
+            metrics = f"{result.latency:8.2f} {result.elapsed or 0.0:8.2f} " \
+                      f"{result.precision:5.2f} {result.recall:5.2f} {result.f1:5.2f}"
+        else:
+            metrics = f"{result.status}: {result.error or ''}"
+        lines.append(
+            f" {mark} {result.speed:>5g} {result.chunk_duration:>5} {result.chunk_overlap_duration:>4}  "
+            f"{result.model:<24} {result.preset:<14} {metrics}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Sweep chunk duration / overlap / capture speed / model / preset against VSS and pick the "
+                    "fastest configuration whose F1 meets the floor."
+    )
+    parser.add_argument("--videos", nargs="+", required=True, help="Videos in --videos-dir as FILE or SPEED=FILE (one capture per speed factor)")
+    parser.add_argument("--models", nargs="+", required=True, help="VLM model names")
+    parser.add_argument("--presets", nargs="+", default=["simple_view"], choices=sorted(PROMPT_PRESETS), help="Prompt presets (default: simple_view)")
+    parser.add_argument("--chunk-durations", nargs="+", type=int, default=[2], help="Chunk durations in seconds (default: 2)")
+    parser.add_argument("--overlaps", nargs="+", type=int, default=[0], help="Chunk overlap durations in seconds (default: 0)")
+    parser.add_argument("-g", "--ground-truth", type=str, default="2", choices=sorted(get_ground_truth_texts()), help="Ground truth number from compare_results.py (default: 2)")
+    parser.add_argument("--ground-truth-file", type=str, default=None, help="Ground truth text file (\"HH:MM:SS 1,4\" per line), overrides -g")
+    parser.add_argument("--min-f1", type=float, default=0.5, help="Accuracy floor for the recommended configuration (default: 0.5)")
+    parser.add_argument("--name", type=str, default=None, help="Sweep name; rerunning a name only requests unfinished combinations (default: timestamp)")
+    parser.add_argument("--videos-dir", type=str, default=str(EXTENSION_DIR / "video"), help="Video directory (default: ../video)")
+    parser.add_argument("--outputs-dir", type=str, default=str(EXTENSION_DIR / "vlm_outputs"), help="Output root; results go to <outputs-dir>/sweeps/<name> (default: ../vlm_outputs)")
+    parser.add_argument("--base-url", type=str, default=os.environ.get("VIA_BACKEND", "http://10.38.38.40:8100"), help="VSS server URL(s), comma-separated for several backends (default: $VIA_BACKEND)")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="Concurrent caption requests (default: 4)")
+    parser.add_argument("--delete", action="store_true", help="Delete each video from the server after its last combination")
+    parser.add_argument("--no-upload-cache", action="store_true", help="Always upload, ignoring the content-hash upload cache")
+    parser.add_argument("--no-response-cache", action="store_true", help="Always ask the server (fresh responses still refresh the cache)")
+    parser.add_argument("--cache-max-files", type=int, default=20, help="Server files kept by the upload cache LRU (default: 20)")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the combinations")
+    args = parser.parse_args()
+
+    videos = parse_video_specs(args.videos)
+    videos_dir = Path(args.videos_dir)
+    missing = [video for video in videos if not (videos_dir / video).exists()]
+    if missing:
+        print(f"⚠️ 영상이 없습니다: {videos_dir} / {missing}")
+        return
+
+    if args.ground_truth_file:
+        gt_text = Path(args.ground_truth_file).read_text(encoding='utf-8')
+        print(f"🎯 Ground Truth 파일 사용: {args.ground_truth_file}")
+    else:
+        gt_text = get_ground_truth_texts()[args.ground_truth]
+        print(f"🎯 Ground Truth {args.ground_truth} 사용")
+    ground_truth = parse_ground_truth(gt_text)
+
+    outputs_dir = Path(args.outputs_dir)
+    sweep_dir = outputs_dir / "sweeps" / (args.name or datetime.now().strftime("%Y%m%d_%H%M%S"))
+    manifest = BatchManifest(sweep_dir / "sweep_manifest.jsonl")
+    jobs = build_jobs(videos, args.models, args.presets, args.chunk_durations, args.overlaps)
+    if not jobs:
+        print("⚠️ 실행할 조합이 없습니다.")
+        return
+
+    if args.dry_run:
+        for job in jobs:
+            print(f"  {'done   ' if manifest.is_done(job) else 'pending'}  {job.key}  (speed {videos[job.video]:g})")
+        return
+
+    client = create_vss_client(
+        args.base_url,
+        default_chunk_duration=2,
+        default_chunk_overlap_duration=0,
+        prompt_presets=dict(PROMPT_PRESETS),
+        pool_size=max(10, args.concurrency),
+        retry_policy=RetryPolicy(max_retries=int(os.environ.get("VSS_MAX_RETRIES", 3))),
+        response_cache=ResponseCache(outputs_dir / "response_cache"),
+        metrics=MetricsRegistry(history=100000),
+    )
+    runner = BatchRunner(
+        client, videos_dir, sweep_dir, manifest,
+        concurrency=args.concurrency,
+        delete_after=args.delete,
+        upload_cache=None if args.no_upload_cache else UploadCache(
+            outputs_dir / "vss_upload_cache.json", max_files=max(args.cache_max_files, args.concurrency)
+        ),
+        use_response_cache=not args.no_response_cache,
+    )
+    with client:
+        summary = runner.run(jobs)
+    client.metrics.close()
+
+    print(f"\n📊 {summary['done']}/{summary['jobs']} 조합 완료, 실패 {summary['failed']}, "
+          f"manifest 로 건너뜀 {summary['skipped']}, 응답 캐시 hit {summary['cache_hits']} "
+          f"({summary['elapsed_seconds']:.1f}s)")
+
+    results = collect_results(jobs, videos, manifest, sweep_dir, ground_truth)
+    best = select_best(results, args.min_f1)
+    print(f"\n⏱️ latency (초) / F1  (✓: F1 >= {args.min_f1:g}, ★: 추천)\n{format_table(results, args.min_f1, best)}")
+    if best is not None:
+        print(f"\n🏆 추천: speed {best.speed:g}, chunk {best.chunk_duration}s, overlap {best.chunk_overlap_duration}s, "
+              f"{best.model} / {best.preset} -> latency {best.latency:.2f}s, F1 {best.f1:.2f}")
+    else:
+        print(f"\n⚠️ F1 {args.min_f1:g} 이상인 조합이 없습니다.")
+
+    results_path = sweep_dir / "sweep_results.json"
+    with open(results_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "ground_truth": args.ground_truth_file or args.ground_truth,
+            "min_f1": args.min_f1,
+            "results": [asdict(result) for result in results],
+            "best": asdict(best) if best is not None else None,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"📁 결과 저장 완료: {results_path}")
+
+
+if __name__ == "__main__":
+    main()
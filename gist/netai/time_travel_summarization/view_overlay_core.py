@@ -5,8 +5,21 @@ import omni.ui.scene as sc
 import omni.usd
 import omni.kit.app
 import carb
-from pxr import UsdGeom, Gf
+import asyncio
+import hashlib
+import os
+import struct
+import tempfile
+import time
+import zlib
+import numpy as np
+from pxr import Usd, UsdGeom, Gf, Sdf, Tf
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # 없으면 atlas 는 seven-segment 글리프로 그림
+    Image = ImageDraw = ImageFont = None
 from omni.kit.viewport.utility import get_active_viewport_window
+from . import label_layout
 
 
 # -----------------------------------------------------------------
@@ -16,11 +29,13 @@ class ObjectIDManipulator(sc.Manipulator):
     """
     Displays an object ID label at the prim's 3D position.
     Directly reads prim position without using a model.
+    The XformCache is owned by ViewOverlay and shared by all labels for one frame.
     """
-    def __init__(self, prim_path: str, label_text: str, **kwargs):
+    def __init__(self, prim_path: str, label_text: str, xform_cache: UsdGeom.XformCache = None, **kwargs):
         super().__init__(**kwargs)
         self._prim_path = prim_path
         self._label_text = label_text
+        self._xform_cache = xform_cache
         self._stage = omni.usd.get_context().get_stage()
         self._prim = self._stage.GetPrimAtPath(self._prim_path)
         self._xformable = UsdGeom.Xformable(self._prim) 
@@ -32,24 +47,56 @@ class ObjectIDManipulator(sc.Manipulator):
         self._label = None
         self._transform = None
         self._last_position = None
+        self._layout_shift = (0.0, 0.0, 0.0)  # declutter offset (world), set by ViewOverlay
+
+    def refresh_prim(self):
+        """Re-resolve the prim handle (the prim at this path was removed and re-created)."""
+        self._stage = omni.usd.get_context().get_stage()
+        self._prim = self._stage.GetPrimAtPath(self._prim_path) if self._stage else None
+        self._xformable = UsdGeom.Xformable(self._prim) if self._prim else None
+
+    @property
+    def world_position(self):
+        """Last world position of the prim (None until built)."""
+        return self._last_position
+
+    def set_layout(self, shift, visible: bool):
+        """Apply screen-space layout: world shift of the label and culling visibility."""
+        shift = (shift[0], shift[1], shift[2])
+        if visible != self.visible:
+            self.visible = visible
+        if shift != self._layout_shift:
+            self._layout_shift = shift
+            self._apply_transform()
+
+    def _apply_transform(self):
+        """Place the label 100 units above the prim, plus the layout shift."""
+        if not self._transform or self._last_position is None:
+            return
+        self._transform.transform = sc.Matrix44.get_translation_matrix(
+            self._last_position[0] + self._layout_shift[0],
+            self._last_position[1] + 100 + self._layout_shift[1],
+            self._last_position[2] + self._layout_shift[2]
+        )
 
     def on_build(self):
         """Build the label UI at prim's current position."""
         if not self._prim or not self._prim.IsValid():
             return
 
-        # Get world position
-        xform_cache = UsdGeom.XformCache() # 변환 계산 캐싱
-        world_transform = xform_cache.GetLocalToWorldTransform(self._prim) # prim의 월드 변환 행렬 추출
-        # print(f"world_transform: {world_transform}")
-        translation = world_transform.ExtractTranslation() # 위치 벡터 x,y,z 추출
-        # print(f"Extracted translation: {translation}")
+        # Get world position (update_position 에서 이미 계산된 위치가 있으면 재사용)
+        if self._last_position is not None:
+            translation = self._last_position
+        else:
+            xform_cache = self._xform_cache or UsdGeom.XformCache() # 변환 계산 캐싱 (프레임 단위 공유 캐시)
+            world_transform = xform_cache.GetLocalToWorldTransform(self._prim) # prim의 월드 변환 행렬 추출
+            translation = world_transform.ExtractTranslation() # 위치 벡터 x,y,z 추출
         
         # Store transform for updates
         self._transform = sc.Transform(transform=sc.Matrix44.get_translation_matrix( #Matrix44: 행렬 저장, get_translation_matrix: 위치 행렬 생성
-            translation[0],         # X 좌표
-            translation[1] + 100,   # Y 좌표 (100 단위 위로 오프셋)
-            translation[2]          # Z 좌표
+            translation[0] + self._layout_shift[0],         # X 좌표
+            translation[1] + 100 + self._layout_shift[1],   # Y 좌표 (100 단위 위로 오프셋)
+            translation[2] + self._layout_shift[2]          # Z 좌표
         ))
         """
         sc.Matrix44.get_translation_matrix(x, y, z): 이동 행렬 생성
@@ -85,47 +132,386 @@ class ObjectIDManipulator(sc.Manipulator):
         # Store position for comparison
         self._last_position = (translation[0], translation[1], translation[2])
     
-    def update_position(self):
-        """Update label position only if prim has moved."""
-        if not self._prim or not self._prim.IsValid() or not self._transform:
-            return
+    def update_position(self, xform_cache: UsdGeom.XformCache = None, position=None):
+        """
+        Update label position only if prim has moved.
         
-        # Get current world position
-        xform_cache = UsdGeom.XformCache()
-        world_transform = xform_cache.GetLocalToWorldTransform(self._prim)
-        translation = world_transform.ExtractTranslation()
+        Args:
+            xform_cache: Shared per-frame cache (used when position is not given)
+            position: World position (x, y, z) already known by the caller (e.g. core frame data)
+        """
+        if not self._transform:
+            return
         
-        current_position = (translation[0], translation[1], translation[2])
+        if position is not None:
+            current_position = (position[0], position[1], position[2])
+        else:
+            if not self._prim or not self._prim.IsValid():
+                return
+            # Get current world position
+            xform_cache = xform_cache or self._xform_cache or UsdGeom.XformCache()
+            world_transform = xform_cache.GetLocalToWorldTransform(self._prim)
+            translation = world_transform.ExtractTranslation()
+            current_position = (translation[0], translation[1], translation[2])
         
         # Only update if position has changed
         if self._last_position != current_position:
             # Update transform matrix
-            self._transform.transform = sc.Matrix44.get_translation_matrix(
-                translation[0], translation[1] + 100, translation[2]
-            )
             self._last_position = current_position
+            self._apply_transform()
 
     def on_model_updated(self, item):
         """Called when model changes (not used in this simplified version)."""
         pass
 
 # -----------------------------------------------------------------
-#  2. Manager Class (Model removed - not needed)
+#  2. Batched Label Layer - one mesh for all labels
+# -----------------------------------------------------------------
+KIT_DEFAULT_FONT = "${fonts}/OpenSans-SemiBold.ttf"  # omni.ui default (/app/font/file)
+
+# Fallback when Pillow or the Kit font is unavailable:
+# seven-segment glyphs in a unit cell (width 0.6, height 1.0), segments as (x0, y0, x1, y1)
+_GLYPH_WIDTH = 0.6
+_GLYPH_STROKE = 0.14
+_SEGMENTS = {
+    "a": (0.0, 1.0 - _GLYPH_STROKE, _GLYPH_WIDTH, 1.0),
+    "b": (_GLYPH_WIDTH - _GLYPH_STROKE, 0.5, _GLYPH_WIDTH, 1.0),
+    "c": (_GLYPH_WIDTH - _GLYPH_STROKE, 0.0, _GLYPH_WIDTH, 0.5),
+    "d": (0.0, 0.0, _GLYPH_WIDTH, _GLYPH_STROKE),
+    "e": (0.0, 0.0, _GLYPH_STROKE, 0.5),
+    "f": (0.0, 0.5, _GLYPH_STROKE, 1.0),
+    "g": (0.0, 0.5 - _GLYPH_STROKE / 2, _GLYPH_WIDTH, 0.5 + _GLYPH_STROKE / 2),
+}
+_DIGIT_SEGMENTS = {
+    "0": "abcdef", "1": "bc", "2": "abged", "3": "abgcd", "4": "fgbc",
+    "5": "afgcd", "6": "afgedc", "7": "abc", "8": "abcdefg", "9": "abcdfg",
+}
+
+
+def _digit_rects(text: str):
+    """Seven-segment rectangles (x0, y0, x1, y1) for text in disc units (disc radius = 1)."""
+    digits = [char for char in text if char in _DIGIT_SEGMENTS]
+    if not digits:
+        return []
+    
+    gap = _GLYPH_WIDTH * 0.35
+    total_width = len(digits) * _GLYPH_WIDTH + (len(digits) - 1) * gap
+    # 3자리 라벨은 원 안에 들어가도록 축소
+    height = min(0.9, 1.4 / total_width)
+    
+    rects = []
+    cursor = -total_width / 2
+    for char in digits:
+        for segment in _DIGIT_SEGMENTS[char]:
+            x0, y0, x1, y1 = _SEGMENTS[segment]
+            rects.append(((cursor + x0) * height, (y0 - 0.5) * height,
+                          (cursor + x1) * height, (y1 - 0.5) * height))
+        cursor += _GLYPH_WIDTH + gap
+    return rects
+
+
+def _write_png(path: str, rgba: np.ndarray):
+    """Write an (H, W, 4) uint8 image as PNG (no imaging library needed)."""
+    height, width = rgba.shape[:2]
+    
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+    
+    raw = b"".join(b"\x00" + rgba[row].tobytes() for row in range(height))
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw, 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def kit_font_path() -> str:
+    """Resolved path of the font omni.ui draws sc.Label with, or None if it cannot be found."""
+    try:
+        import carb.settings
+        import carb.tokens
+        font = carb.settings.get_settings().get("/app/font/file") or KIT_DEFAULT_FONT
+        path = carb.tokens.get_tokens_interface().resolve(font)
+        return path if isinstance(path, str) and os.path.isfile(path) else None
+    except Exception:
+        return None
+
+
+def _font_glyph_mask(text: str, font_path: str, cell_size: int, radius_px: float) -> np.ndarray:
+    """
+    (cell, cell) float coverage [0, 1] of text drawn with font_path, centered in the cell.
+    Text height follows ObjectIDManipulator (sc.Label size 30 on a radius 30 disc -> half
+    the diameter); labels wider than the disc are shrunk to fit like the fallback glyphs.
+    """
+    size = max(1, int(round(radius_px)))
+    font = ImageFont.truetype(font_path, size)
+    max_width = 1.8 * radius_px
+    left, _, right, _ = font.getbbox(text)
+    if right - left > max_width:
+        size = max(1, int(size * max_width / (right - left)))
+        font = ImageFont.truetype(font_path, size)
+    
+    mask = Image.new("L", (cell_size, cell_size), 0)
+    center = cell_size / 2.0
+    ImageDraw.Draw(mask).text((center, center), text, font=font, fill=255, anchor="mm")
+    return np.asarray(mask, dtype=np.float64) / 255.0
+
+
+def build_label_atlas(label_texts, cell_size: int = 64, font_path: str = None) -> np.ndarray:
+    """
+    Rasterize one white disc + black number per label into a square grid atlas.
+    Numbers are drawn with font_path (the Kit UI font, see kit_font_path) so batched
+    labels read like sc.Label; without Pillow or a font they fall back to seven-segment
+    digits (non-digit characters are then dropped).
+    Returns (H, W, 4) uint8 RGBA; label i sits in cell (i // columns, i % columns).
+    """
+    use_font = bool(font_path) and ImageFont is not None
+    columns = max(1, int(np.ceil(np.sqrt(len(label_texts)))))
+    atlas = np.zeros((columns * cell_size, columns * cell_size, 4), dtype=np.uint8)
+    
+    # Disc with 1px anti-aliased edge, shared by every cell
+    center = (cell_size - 1) / 2.0
+    radius_px = cell_size / 2.0 - 1.0
+    ys, xs = np.mgrid[0:cell_size, 0:cell_size]
+    distance = np.sqrt((xs - center) ** 2 + (ys - center) ** 2)
+    disc = np.zeros((cell_size, cell_size, 4), dtype=np.uint8)
+    disc[..., :3] = 255
+    disc[..., 3] = (np.clip(radius_px + 0.5 - distance, 0.0, 1.0) * 255).astype(np.uint8)
+    
+    for index, text in enumerate(label_texts):
+        cell = disc.copy()
+        if use_font:
+            coverage = _font_glyph_mask(text, font_path, cell_size, radius_px)
+            cell[..., :3] = np.round(255.0 * (1.0 - coverage))[..., None].astype(np.uint8)
+        else:
+            for x0, y0, x1, y1 in _digit_rects(text):
+                # disc units -> pixels (image rows grow downward)
+                col0 = int(round(center + x0 * radius_px))
+                col1 = int(round(center + x1 * radius_px))
+                row0 = int(round(center - y1 * radius_px))
+                row1 = int(round(center - y0 * radius_px))
+                cell[row0:row1 + 1, col0:col1 + 1, :3] = 0
+        row, col = divmod(index, columns)
+        atlas[row * cell_size:(row + 1) * cell_size, col * cell_size:(col + 1) * cell_size] = cell
+    return atlas
+
+
+class BatchedObjectIDLayer(sc.Manipulator):
+    """
+    Draws every object ID label (white disc + black number) as one sc.TexturedMesh.
+    
+    Same look as ObjectIDManipulator, but the scene graph holds one item regardless of
+    the label count. Each label is a camera-facing quad sampling its own cell of a glyph
+    atlas rasterized once per label set, so an update only recomputes 4 vertices per
+    label from an (N, 3) NumPy array and the camera billboard axes.
+    
+    Setters only record state; commit() pushes the vertices to the mesh once, so a frame
+    that moves labels, re-orients them and re-lays them out costs a single mesh update.
+    """
+    ATLAS_CELL = 64  # atlas cell size in pixels
+    
+    def __init__(self, radius: float = 30.0, height_offset: float = 100.0, **kwargs):
+        super().__init__(**kwargs)
+        self._radius = radius
+        self._height_offset = height_offset
+        self._mesh = None
+        self._dirty = False  # state changed since the last mesh push
+        
+        # Static topology (rebuilt by set_labels)
+        self._label_count = 0
+        self._atlas_path = None
+        self._uvs = []
+        self._colors = []
+        self._vertex_counts = []
+        self._vertex_indices = []
+        
+        # Dynamic state
+        self._positions = np.zeros((0, 3))
+        self._known = np.zeros(0, dtype=bool)  # (N,) rows with a resolved world position
+        self._shifts = None   # (N, 3) declutter offsets (world), None -> no offset
+        self._visible = None  # (N,) culling mask, None -> all visible
+        self._right = np.array([1.0, 0.0, 0.0])
+        self._up = np.array([0.0, 1.0, 0.0])
+        # Quad corners in billboard plane (counter-clockwise from bottom-left)
+        self._corners = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]]) * self._radius
+    
+    def set_labels(self, label_texts):
+        """Set label strings (one per object); rebuilds the atlas and mesh topology."""
+        label_texts = list(label_texts)
+        unique_texts = sorted(set(label_texts), key=lambda text: (len(text), text))
+        cell_index = {text: index for index, text in enumerate(unique_texts)}
+        columns = max(1, int(np.ceil(np.sqrt(len(unique_texts)))))
+        
+        self._atlas_path = self._get_atlas_path(unique_texts)
+        
+        # UV per quad corner (v = 0 at the bottom of the image)
+        uvs = []
+        for text in label_texts:
+            row, col = divmod(cell_index[text], columns)
+            u0, u1 = col / columns, (col + 1) / columns
+            v0, v1 = 1.0 - (row + 1) / columns, 1.0 - row / columns
+            uvs.extend([[u0, v0], [u1, v0], [u1, v1], [u0, v1]])
+        
+        self._label_count = len(label_texts)
+        self._uvs = uvs
+        self._colors = [[1.0, 1.0, 1.0, 1.0]] * (4 * self._label_count)
+        self._vertex_counts = [4] * self._label_count
+        self._vertex_indices = list(range(4 * self._label_count))
+        self._positions = np.zeros((self._label_count, 3))
+        self._known = np.zeros(self._label_count, dtype=bool)
+        self._shifts = None
+        self._visible = None
+        self._dirty = False
+        self._mesh = None
+        self.invalidate()
+    
+    def _get_atlas_path(self, unique_texts) -> str:
+        """Rasterize (or reuse) the atlas PNG for this label set in the temp directory."""
+        font_path = kit_font_path() if ImageFont is not None else None
+        key = hashlib.sha1(
+            f"{self.ATLAS_CELL}|{font_path}|{'|'.join(unique_texts)}".encode("utf-8")
+        ).hexdigest()[:16]
+        path = os.path.join(tempfile.gettempdir(), f"timetravel_label_atlas_{key}.png")
+        if not os.path.exists(path):
+            if font_path is None:
+                carb.log_warn("[ViewOverlay] Pillow or Kit font unavailable, using seven-segment label glyphs")
+            _write_png(path, build_label_atlas(unique_texts, self.ATLAS_CELL, font_path))
+            carb.log_info(f"[ViewOverlay] Label atlas created: {path} ({len(unique_texts)} labels)")
+        return path
+    
+    def set_positions(self, positions: np.ndarray, known: np.ndarray = None):
+        """
+        Set world positions of all labels' objects, (N, 3) in set_labels order.
+        Rows not in known (N,) bool have no resolved position yet and are not drawn.
+        """
+        self._positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        self._known = (np.ones(len(self._positions), dtype=bool) if known is None
+                       else np.asarray(known, dtype=bool))
+        self._dirty = True
+    
+    def set_layout(self, shifts: np.ndarray, visible: np.ndarray):
+        """Set per-label world shifts (N, 3) and visibility (N,); hidden labels collapse to a point."""
+        self._shifts = np.asarray(shifts, dtype=np.float64).reshape(-1, 3)
+        self._visible = np.asarray(visible, dtype=bool)
+        self._dirty = True
+    
+    def set_camera_basis(self, right, up):
+        """Set billboard axes (world space) from the active camera."""
+        self._right = np.asarray(right, dtype=np.float64)
+        self._up = np.asarray(up, dtype=np.float64)
+        self._dirty = True
+    
+    def commit(self):
+        """Push pending position / layout / camera changes to the mesh (once per frame)."""
+        if self._dirty:
+            self._dirty = False
+            self._update_mesh()
+    
+    def _compute_vertices(self) -> np.ndarray:
+        """World space quad corners (4 per label) for the current positions and camera basis."""
+        centers = self._positions + (0.0, self._height_offset, 0.0)
+        if self._shifts is not None and len(self._shifts) == len(centers):
+            centers = centers + self._shifts
+        offsets = self._corners[:, 0:1] * self._right + self._corners[:, 1:2] * self._up  # (4, 3)
+        vertices = centers[:, None, :] + offsets[None, :, :]
+        drawn = self._known.copy() if len(self._known) == len(centers) else np.ones(len(centers), dtype=bool)
+        if self._visible is not None and len(self._visible) == len(centers):
+            drawn &= self._visible
+        # Culled / unresolved labels become degenerate quads (nothing rasterized, topology unchanged)
+        vertices[~drawn] = centers[~drawn, None, :]
+        return vertices.reshape(-1, 3)
+    
+    def _update_mesh(self):
+        """Push new vertex positions to the existing mesh (no scene graph rebuild)."""
+        if self._mesh is None or len(self._positions) != self._label_count:
+            return
+        self._mesh.positions = self._compute_vertices().tolist()
+    
+    def on_build(self):
+        """Build the single mesh holding all labels."""
+        self._mesh = None
+        self._dirty = False
+        if not self._label_count or len(self._positions) != self._label_count:
+            return
+        self._mesh = sc.TexturedMesh(
+            self._atlas_path,
+            self._uvs,
+            self._compute_vertices().tolist(),
+            self._colors,
+            self._vertex_counts,
+            self._vertex_indices,
+            legacy_flipped_v=False,
+        )
+    
+    def on_model_updated(self, item):
+        """Not model driven."""
+        pass
+
+
+# -----------------------------------------------------------------
+#  3. Manager Class (Model removed - not needed)
 # -----------------------------------------------------------------
 class ViewOverlay:
     """
     Manages viewport overlay, creating and updating
     3D labels and 2D time display.
+    
+    Updates are event-driven: the overlay listens to the core's frame changed signal
+    and only moves labels whose objects moved, so a paused scene costs no overlay work.
+    Label positions come from the core's current frame ({objid: local translate}),
+    transformed by the parent world matrix computed once per update. Labels whose prim
+    is not mapped by the core fall back to one XformCache shared by all labels.
+    
+    With many objects (>= BATCH_THRESHOLD, or when batched mode is forced) all labels
+    are drawn by a single BatchedObjectIDLayer fed from a NumPy positions array.
+    
+    After every label or camera change, labels are projected with the active viewport
+    camera: off-screen labels are culled and overlapping ones are offset to free slots
+    (see label_layout) so every ID stays readable at collision moments.
+    
+    Membership of /World/TimeTravel_Objects is tracked with USD change notices: when
+    children are added, removed or re-created, only the affected label entries change
+    (applied once on the next app update), instead of tearing down the whole scene.
     """
-    def __init__(self, viewport_window, ext_id, core):
+    PARENT_PRIM_PATH = "/World/TimeTravel_Objects"
+    PROFILE_LOG_INTERVAL = 300  # label updates between timing logs
+    BATCH_THRESHOLD = 200  # label count from which the batched layer is used automatically
+    LABEL_HEIGHT_OFFSET = 100.0  # label anchor above the prim origin (matches ObjectIDManipulator)
+    LABEL_RADIUS = 30.0  # label disc radius in world units
+    
+    def __init__(self, viewport_window, ext_id, core, batched: bool = None):
         self._viewport_window = viewport_window
         self._ext_id = ext_id
         self._core = core  # TimeTravelCore for time data
         self._usd_context = omni.usd.get_context()
         self._scene_view = None
         self._manipulators = []
+        self._manipulators_by_objid = {}  # {objid: manipulator} for prims mapped by the core
+        self._unmapped_manipulators = []  # read from USD through the shared cache
+        self._manipulators_by_path = {}  # {prim_path: manipulator}
+        self._label_containers = {}  # {prim_path: sc.Transform} holding one manipulator, reused per path
+        self._label_entries = []  # [(prim_path, label_id, objid)] currently shown
+        self._xform_cache = UsdGeom.XformCache()  # shared per-update transform cache
         self._stage_event_sub = None
-        self._update_sub = None
+        
+        # Batched label layer (None -> automatic by label count)
+        self._batched = batched
+        self._batch_layer = None
+        self._batch_container = None  # sc.Transform holding the batched layer
+        self._batch_paths = []  # prim path per row
+        self._batch_rows = {}  # {objid: row} for prims mapped by the core
+        self._batch_unmapped_rows = []  # rows read from USD through the shared cache
+        self._batch_world = np.zeros((0, 3))  # (N, 3) world positions, row order = labels
+        self._batch_known = np.zeros(0, dtype=bool)  # (N,) rows whose world position was resolved
+        self._view_change_sub = None
+        
+        # USD change notice listener for /World/TimeTravel_Objects membership
+        self._objects_changed_listener = None
+        self._membership_dirty = False
+        self._sync_task = None
+        
+        # Screen-space layout (culling is always on; declutter mode: OFFSET or None)
+        self._layout_mode = label_layout.OFFSET
         self._visible = True
         self._labels_visible = True  # 3D labels visibility
         self._time_visible = True    # Time display visibility
@@ -133,16 +519,26 @@ class ViewOverlay:
         # Time display UI elements
         self._time_frame = None
         self._time_label = None
+        self._time_text = None  # Last string written to the time label
+        
+        # Label update timing (ms)
+        self._profile_updates = 0
+        self._profile_total_ms = 0.0
+        self._profile_max_ms = 0.0
 
         # Subscribe to stage events
         self._stage_event_sub = self._usd_context.get_stage_event_stream().create_subscription_to_pop(
             self._on_stage_event, name="ViewOverlayStageEvent"
         ) # usd_context 를 보면서 stage 이벤트 변화가 생길 때 마다 _on_stage_event 함수를 호출함.
         
+        # Subscribe to core frame changes (재생/seek 로 stage 가 갱신될 때만 호출됨)
+        self._core.add_frame_changed_fn(self._on_frame_changed)
+        
         carb.log_info("[ViewOverlay] Initialized")
         
         # Create time display
         self._create_time_overlay()
+        self._update_time_label()
         
         # If stage is already open, build UI immediately
         stage = self._usd_context.get_stage()
@@ -219,6 +615,11 @@ class ViewOverlay:
         # Control time display
         if self._time_frame:
             self._time_frame.visible = visible
+        
+        # Hidden 동안 건너뛴 갱신을 한 번에 반영
+        if visible:
+            self._update_label_positions()
+            self._update_time_label()
             
         carb.log_info(f"[ViewOverlay] All visibility set to: {visible}")
     
@@ -227,6 +628,8 @@ class ViewOverlay:
         self._labels_visible = visible
         if self._scene_view:
             self._scene_view.visible = visible
+        if visible:
+            self._update_label_positions()
         carb.log_info(f"[ViewOverlay] Labels visibility set to: {visible}")
     
     def set_time_visible(self, visible: bool):
@@ -234,18 +637,44 @@ class ViewOverlay:
         self._time_visible = visible
         if self._time_frame:
             self._time_frame.visible = visible
+        if visible:
+            self._update_time_label()
         carb.log_info(f"[ViewOverlay] Time visibility set to: {visible}")
     
     def is_visible(self) -> bool:
         """Get current visibility state."""
         return self._visible
+    
+    def set_batched(self, batched: bool = None):
+        """Force batched (True) or per-label (False) drawing, None for automatic; rebuilds labels."""
+        self._batched = batched
+        carb.log_info(f"[ViewOverlay] Batched labels set to: {batched}")
+        if self._scene_view:
+            self._sync_labels()
+    
+    def is_batched(self) -> bool:
+        """Whether labels are currently drawn by the batched layer."""
+        return self._batch_layer is not None
+    
+    def set_layout_mode(self, mode: str = None):
+        """Set declutter mode: label_layout.OFFSET or None (culling only)."""
+        self._layout_mode = mode
+        carb.log_info(f"[ViewOverlay] Declutter mode set to: {mode}")
+        self._apply_layout()
+    
+    def get_layout_mode(self) -> str:
+        """Current declutter mode."""
+        return self._layout_mode
+    
+    def _has_labels(self) -> bool:
+        return bool(self._manipulators) or self._batch_layer is not None
 
     def shutdown(self):
         """Clean up all resources."""
         carb.log_info("[ViewOverlay] Shutting down...")
         
         self._stage_event_sub = None
-        self._update_sub = None
+        self._core.remove_frame_changed_fn(self._on_frame_changed)
 
         # Clean up scene components (manipulators, scene view)
         self._cleanup_scene()
@@ -256,6 +685,7 @@ class ViewOverlay:
             self._time_frame = None
         
         self._time_label = None
+        self._time_text = None
         
         carb.log_info("[ViewOverlay] Cleanup complete")
 
@@ -285,15 +715,21 @@ class ViewOverlay:
 
     def _cleanup_scene(self):
         """Clean up UI when stage is closed."""
-        # Stop update subscription
-        self._update_sub = None
+        # Stop membership tracking
+        if self._objects_changed_listener:
+            self._objects_changed_listener.Revoke()
+            self._objects_changed_listener = None
+        if self._sync_task:
+            self._sync_task.cancel()
+            self._sync_task = None
+        self._membership_dirty = False
         
-        # Explicitly invalidate manipulators
-        if self._manipulators:
-            for manipulator in self._manipulators:
-                if hasattr(manipulator, "invalidate"):
-                    manipulator.invalidate()
-        self._manipulators = []
+        self._clear_labels()
+        self._xform_cache.Clear()
+        self._view_change_sub = None
+        
+        self._label_containers = {}
+        self._batch_container = None
         
         # Remove and clear scene view
         if self._scene_view:
@@ -304,10 +740,39 @@ class ViewOverlay:
         
         carb.log_info("[ViewOverlay] Scene view cleaned up")
 
+    def _clear_labels(self):
+        """Remove every label (both modes), keeping the scene view."""
+        # Explicitly invalidate manipulators
+        if self._manipulators:
+            for manipulator in self._manipulators:
+                if hasattr(manipulator, "invalidate"):
+                    manipulator.invalidate()
+        # Containers stay in the scene (empty) and are reused per path
+        for container in self._label_containers.values():
+            container.clear()
+        self._manipulators = []
+        self._manipulators_by_objid = {}
+        self._unmapped_manipulators = []
+        self._manipulators_by_path = {}
+        self._label_entries = []
+        
+        # Batched layer
+        if self._batch_layer:
+            self._batch_layer.invalidate()
+        if self._batch_container:
+            self._batch_container.clear()
+        self._batch_layer = None
+        self._batch_paths = []
+        self._batch_rows = {}
+        self._batch_unmapped_rows = []
+        self._batch_world = np.zeros((0, 3))
+        self._batch_known = np.zeros(0, dtype=bool)
+
     def _build_scene_for_stage(self):
         """
         Build all Models and Manipulators when stage is ready.
-        Creates labels for all prims under /World/TimeTravel_Objects.
+        Creates labels for all prims under /World/TimeTravel_Objects and starts
+        tracking its membership (the parent may not exist yet).
         """
         if self._scene_view:
             carb.log_info("[ViewOverlay] Scene view already exists. Cleaning up...")
@@ -318,13 +783,6 @@ class ViewOverlay:
             carb.log_error("[ViewOverlay] Cannot get stage")
             return
 
-        parent_prim_path = "/World/TimeTravel_Objects"
-        parent_prim = stage.GetPrimAtPath(parent_prim_path)
-        
-        if not parent_prim.IsValid():
-            carb.log_warn(f"[ViewOverlay] '{parent_prim_path}' prim not found")
-            return
-
         # Create scene view
         with self._viewport_window.get_frame(self._ext_id): 
             """
@@ -333,46 +791,384 @@ class ViewOverlay:
             with 문 안에서 생성된 UI 요소들은 이 프레임에 속하게 됨.
             """
             self._scene_view = sc.SceneView()   # 3D 공간을 포함하는 컨테이너 역할. 3D 공간에 3D 객체나 라벨 등을 배치할 수 있음.
-            
-            with self._scene_view.scene: # 루트 scene 컨테이너에 접근하는 속성
-                # Create manipulator for each child prim
-                for prim in parent_prim.GetChildren():
-                    prim_name = prim.GetName()
-                    label_id = self._get_id_from_name(prim_name)
-
-                    if not label_id:
-                        carb.log_info(f"[ViewOverlay] Cannot extract ID from '{prim_name}', skipping")
-                        continue
-
-                    prim_path = str(prim.GetPath())
-                    
-                    carb.log_info(f"[ViewOverlay] Tracking '{prim_path}' (ID: {label_id})")
-                    
-                    # Create manipulator (reads prim position directly)
-                    manipulator = ObjectIDManipulator(prim_path=prim_path, label_text=label_id) # prim 마다 manipulator 생성
-                    self._manipulators.append(manipulator)
 
             # Add scene view to viewport
             self._viewport_window.viewport_api.add_scene_view(self._scene_view) # viewport에 scene view 추가. 즉 화면에 표시
+        
+        self._scene_view.visible = self._labels_visible
+        
+        # prim 추가/삭제를 USD change notice 로 추적 (이후에는 바뀐 라벨만 갱신)
+        self._objects_changed_listener = Tf.Notice.Register(
+            Usd.Notice.ObjectsChanged, self._on_objects_changed, stage
+        )
+        
+        # Billboard axes and screen-space layout follow the camera
+        viewport_api = self._viewport_window.viewport_api
+        self._view_change_sub = viewport_api.subscribe_to_view_change(self._on_view_changed)
+        
+        self._sync_labels()
 
-        # Subscribe to frame updates
-        if not self._update_sub:
-            self._update_sub = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_pop(
-                self._on_update, name="ViewOverlayFrameUpdate"
-            )
+    def _collect_label_entries(self):
+        """[(prim_path, label_id, objid)] for labelled children of /World/TimeTravel_Objects."""
+        stage = self._usd_context.get_stage()
+        parent_prim = stage.GetPrimAtPath(self.PARENT_PRIM_PATH) if stage else None
+        if not parent_prim or not parent_prim.IsValid():
+            return []
+        
+        # prim path -> objid (core 의 현재 프레임 데이터로 위치를 바로 읽기 위함)
+        path_to_objid = {path: objid for objid, path in self._core.get_prim_map().items()}
+        
+        entries = []
+        for prim in parent_prim.GetChildren():
+            prim_name = prim.GetName()
+            label_id = self._get_id_from_name(prim_name)
 
-    def _on_update(self, e):
-        """Called every frame to update all manipulators and time display."""
-        # Update 3D label positions (only if visible and changed - no flicker)
-        if self._labels_visible and self._manipulators:
-            for manipulator in self._manipulators:
-                manipulator.update_position()
+            if not label_id:
+                carb.log_info(f"[ViewOverlay] Cannot extract ID from '{prim_name}', skipping")
+                continue
+
+            prim_path = str(prim.GetPath())
+            entries.append((prim_path, label_id, path_to_objid.get(prim_path)))
+        return entries
+
+    def _sync_labels(self):
+        """
+        Bring labels in line with the current children of /World/TimeTravel_Objects.
+        Per-label mode only creates/removes manipulators for added/removed paths;
+        re-created prims at an existing path keep their manipulator.
+        """
+        if not self._scene_view:
+            return
+        
+        self._xform_cache.Clear()
+        entries = self._collect_label_entries()
+        batched = self._batched if self._batched is not None else len(entries) >= self.BATCH_THRESHOLD
+        
+        # 모드가 바뀌면 기존 라벨을 모두 제거
+        if batched != (self._batch_layer is not None) and (self._manipulators or self._batch_layer):
+            self._clear_labels()
+        
+        if batched:
+            self._sync_batched_labels(entries)
+        else:
+            self._sync_manipulator_labels(entries)
+        
+        self._label_entries = entries
+        if self._batch_layer:
+            self._on_view_changed(self._viewport_window.viewport_api)
+        self._update_label_positions()
+
+    def _sync_manipulator_labels(self, entries):
+        """Per-label mode: add/remove only changed paths."""
+        wanted = {prim_path: label_id for prim_path, label_id, _ in entries}
+        
+        # Removed (or renamed to a different label)
+        removed = 0
+        for prim_path in list(self._manipulators_by_path):
+            manipulator = self._manipulators_by_path[prim_path]
+            if wanted.get(prim_path) != manipulator._label_text:
+                manipulator.invalidate()
+                self._label_containers[prim_path].clear()
+                del self._manipulators_by_path[prim_path]
+                removed += 1
+        
+        # Added / kept
+        added = 0
+        self._manipulators = []
+        self._manipulators_by_objid = {}
+        self._unmapped_manipulators = []
+        for prim_path, label_id, objid in entries:
+            manipulator = self._manipulators_by_path.get(prim_path)
+            if manipulator is None:
+                container = self._label_containers.get(prim_path)
+                if container is None:
+                    with self._scene_view.scene: # 루트 scene 컨테이너에 접근하는 속성
+                        container = sc.Transform()  # 라벨 하나를 담는 컨테이너 (삭제 시 clear)
+                    self._label_containers[prim_path] = container
+                with container:
+                    # Create manipulator (reads prim position directly)
+                    manipulator = ObjectIDManipulator(
+                        prim_path=prim_path, label_text=label_id, xform_cache=self._xform_cache
+                    ) # prim 마다 manipulator 생성 (XformCache 는 공유)
+                self._manipulators_by_path[prim_path] = manipulator
+                added += 1
+            else:
+                # 같은 경로에 다시 생성된 prim 일 수 있으므로 handle 만 갱신
+                manipulator.refresh_prim()
+            
+            self._manipulators.append(manipulator)
+            if objid is not None:
+                self._manipulators_by_objid[objid] = manipulator
+            else:
+                self._unmapped_manipulators.append(manipulator)
+        
+        carb.log_info(
+            f"[ViewOverlay] Tracking {len(self._manipulators)} prims (+{added} / -{removed} labels)"
+        )
+
+    def _sync_batched_labels(self, entries):
+        """Batched mode: one layer; label set changes only rebuild its atlas/topology."""
+        if self._batch_layer is None:
+            if self._batch_container is None:
+                with self._scene_view.scene:
+                    self._batch_container = sc.Transform()
+            with self._batch_container:
+                # 모든 라벨을 하나의 mesh 로 그림
+                self._batch_layer = BatchedObjectIDLayer(
+                    radius=self.LABEL_RADIUS, height_offset=self.LABEL_HEIGHT_OFFSET
+                )
+        
+        labels_changed = ([(path, label) for path, label, _ in entries]
+                          != [(path, label) for path, label, _ in self._label_entries])
+        if labels_changed or not self._batch_paths:
+            self._batch_layer.set_labels([label_id for _, label_id, _ in entries])
+            self._batch_paths = [prim_path for prim_path, _, _ in entries]
+            self._batch_world = np.zeros((len(entries), 3))
+            self._batch_known = np.zeros(len(entries), dtype=bool)
+        
+        self._batch_rows = {}
+        self._batch_unmapped_rows = []
+        for row, (_, _, objid) in enumerate(entries):
+            if objid is not None:
+                self._batch_rows[objid] = row
+            else:
+                self._batch_unmapped_rows.append(row)
+        carb.log_info(f"[ViewOverlay] Tracking {len(entries)} prims with batched labels")
+
+    def _on_objects_changed(self, notice, sender):
+        """
+        USD change notice: flag membership changes under /World/TimeTravel_Objects.
+        Only resyncs (add/remove/re-create) matter; translate updates are info-only and skipped.
+        The sync itself is deferred to the next app update so a burst of changes
+        (e.g. re-spawning all agents) is applied once.
+        """
+        parent_path = Sdf.Path(self.PARENT_PRIM_PATH)
+        for path in notice.GetResyncedPaths():
+            prim_path = path.GetPrimPath()
+            if prim_path == parent_path or prim_path.GetParentPath() == parent_path or parent_path.HasPrefix(prim_path):
+                self._membership_dirty = True
+                break
+        
+        if self._membership_dirty and self._sync_task is None:
+            self._sync_task = asyncio.ensure_future(self._apply_membership_changes())
+
+    async def _apply_membership_changes(self):
+        """Apply flagged membership changes once, on the next app update."""
+        await omni.kit.app.get_app().next_update_async()
+        self._sync_task = None
+        if not self._membership_dirty:
+            return
+        self._membership_dirty = False
+        try:
+            self._sync_labels()
+        except Exception as e:
+            carb.log_error(f"[ViewOverlay] Failed to sync labels: {e}")
+
+    def _on_frame_changed(self, moved_objids):
+        """Called by the core after each stage write (never while paused)."""
+        # Update 3D label positions (only if visible and moved - no flicker)
+        if self._labels_visible and self._has_labels():
+            started = time.perf_counter()
+            self._update_label_positions(moved_objids)
+            self._record_update_time((time.perf_counter() - started) * 1000.0)
         
         # Update time display
-        if self._time_visible and self._time_label:
-            try:
-                current_time = self._core.get_current_time()
-                time_str = current_time.strftime("%H:%M:%S")
+        self._update_time_label()
+
+    def _update_time_label(self):
+        """Rewrite the time text only when the displayed string changes."""
+        if not self._time_visible or not self._time_label:
+            return
+        try:
+            time_str = self._core.get_current_time().strftime("%H:%M:%S")
+            if time_str != self._time_text:
                 self._time_label.text = time_str
+                self._time_text = time_str
+        except Exception as e:
+            carb.log_error(f"[ViewOverlay] Error updating time: {e}")
+
+    def _update_label_positions(self, objids=None):
+        """
+        Move labels with one shared XformCache.
+        
+        Args:
+            objids: Objects that moved since the last update (None -> all labels)
+        """
+        stage = self._usd_context.get_stage()
+        if not stage or not self._has_labels():
+            return
+        
+        # 갱신당 한 번만 캐시를 비우고, 모든 라벨이 같은 캐시를 사용
+        self._xform_cache.Clear()
+        
+        parent_prim = stage.GetPrimAtPath(self.PARENT_PRIM_PATH)
+        parent_world = None
+        if parent_prim and parent_prim.IsValid():
+            parent_world = self._xform_cache.GetLocalToWorldTransform(parent_prim)
+        
+        positions = self._core.get_current_positions() if parent_world is not None else {}
+        
+        if self._batch_layer:
+            self._update_batch_positions(objids, positions, parent_world)
+            self._apply_layout()
+            return
+        
+        if objids is None:
+            objids = self._manipulators_by_objid.keys()
+        
+        for objid in objids:
+            manipulator = self._manipulators_by_objid.get(objid)
+            if manipulator is None:
+                continue
+            local = positions.get(objid)
+            if local is not None:
+                # translate 가 첫 번째 xformOp 이므로 prim 원점 = parent_world * translate
+                world = parent_world.Transform(Gf.Vec3d(local[0], local[1], local[2]))
+                manipulator.update_position(position=world)
+            else:
+                manipulator.update_position(xform_cache=self._xform_cache)
+        
+        # Core 가 모르는 prim 은 stage 가 바뀔 때마다 USD 에서 직접 읽음
+        for manipulator in self._unmapped_manipulators:
+            manipulator.update_position(xform_cache=self._xform_cache)
+        
+        self._apply_layout()
+
+    def _update_batch_positions(self, objids, positions, parent_world):
+        """Write moved rows of the (N, 3) world position array and push it to the batched layer."""
+        if objids is None:
+            objids = self._batch_rows.keys()
+        
+        rows, local = [], []
+        for objid in objids:
+            row = self._batch_rows.get(objid)
+            position = positions.get(objid)
+            if row is not None and position is not None:
+                rows.append(row)
+                local.append(position)
+        
+        changed = bool(rows)
+        if rows:
+            # Row-vector convention (Gf): world = [x y z 1] * M
+            matrix = np.array(parent_world, dtype=np.float64)
+            self._batch_world[rows] = np.asarray(local, dtype=np.float64) @ matrix[:3, :3] + matrix[3, :3]
+            self._batch_known[rows] = True
+        
+        # Core 가 모르는 prim 은 USD 에서 직접 읽음
+        if self._batch_unmapped_rows:
+            stage = self._usd_context.get_stage()
+            for row in self._batch_unmapped_rows:
+                prim = stage.GetPrimAtPath(self._batch_paths[row])
+                if prim and prim.IsValid():
+                    translation = self._xform_cache.GetLocalToWorldTransform(prim).ExtractTranslation()
+                    self._batch_world[row] = (translation[0], translation[1], translation[2])
+                    self._batch_known[row] = True
+                else:
+                    # 위치를 모르는 행은 원점에 그리지 않고 숨김
+                    self._batch_known[row] = False
+            changed = True
+        
+        if changed:
+            self._batch_layer.set_positions(self._batch_world, self._batch_known)
+
+    def _on_view_changed(self, viewport_api):
+        """Re-orient batched billboards and redo the screen-space layout when the camera moves."""
+        if self._batch_layer:
+            try:
+                # view 는 world -> camera 변환, 역행렬의 행이 카메라 축 (row-vector 규약)
+                camera_to_world = viewport_api.view.GetInverse()
+                right = camera_to_world.GetRow3(0)
+                up = camera_to_world.GetRow3(1)
+                self._batch_layer.set_camera_basis((right[0], right[1], right[2]), (up[0], up[1], up[2]))
             except Exception as e:
-                carb.log_error(f"[ViewOverlay] Error updating time: {e}")
+                carb.log_error(f"[ViewOverlay] Error updating label billboard: {e}")
+        
+        if self._labels_visible:
+            self._apply_layout()
+
+    def _apply_layout(self):
+        """
+        Project label anchors with the active camera, cull off-screen labels and
+        declutter overlapping ones (uniform grid hash, O(n)), then apply the result
+        as world shifts so labels keep billboarding in 3D.
+        The batched layer's pending changes are pushed once at the end, on every path.
+        """
+        try:
+            self._layout_labels()
+        finally:
+            if self._batch_layer:
+                self._batch_layer.commit()
+
+    def _layout_labels(self):
+        """Compute and set culling / declutter results (see _apply_layout)."""
+        if not self._has_labels() or not self._viewport_window:
+            return
+        
+        # Label world anchors (N, 3)
+        if self._batch_layer:
+            anchors = self._batch_world + (0.0, self.LABEL_HEIGHT_OFFSET, 0.0)
+            known = self._batch_known
+        else:
+            positions = [manipulator.world_position for manipulator in self._manipulators]
+            known = np.array([position is not None for position in positions], dtype=bool)
+            anchors = np.array([position if position is not None else (0.0, 0.0, 0.0) for position in positions],
+                               dtype=np.float64).reshape(-1, 3) + (0.0, self.LABEL_HEIGHT_OFFSET, 0.0)
+        if not len(anchors):
+            return
+        
+        try:
+            viewport_api = self._viewport_window.viewport_api
+            view = np.array(viewport_api.view, dtype=np.float64)
+            view_projection = view @ np.array(viewport_api.projection, dtype=np.float64)
+            width, height = viewport_api.resolution
+            
+            screen, ndc_z, in_front = label_layout.project(anchors, view_projection, width, height)
+            
+            # Label radius in pixels (depends on depth)
+            right = np.linalg.inv(view)[0, :3]
+            edge, _, _ = label_layout.project(anchors + right * self.LABEL_RADIUS, view_projection, width, height)
+            radius_px = np.linalg.norm(edge - screen, axis=1)
+            
+            visible = label_layout.cull(screen, in_front & known, width, height, padding=radius_px)
+            shifts = np.zeros_like(anchors)
+            
+            if self._layout_mode and visible.any():
+                min_distance = 2.0 * float(np.median(radius_px[visible]))
+                offsets, hidden = label_layout.declutter(screen, visible, min_distance, self._layout_mode)
+                visible &= ~hidden
+                moved = visible & np.any(offsets != 0.0, axis=1)
+                if moved.any():
+                    target = label_layout.unproject(
+                        screen[moved] + offsets[moved], ndc_z[moved],
+                        np.linalg.inv(view_projection), width, height
+                    )
+                    shifts[moved] = target - anchors[moved]
+        except Exception as e:
+            carb.log_error(f"[ViewOverlay] Error in label layout: {e}")
+            return
+        
+        if self._batch_layer:
+            # Unresolved rows stay hidden by the layer itself (see set_positions)
+            self._batch_layer.set_layout(shifts, visible)
+        else:
+            # Unknown (not yet built) manipulators stay visible so they can build
+            visible |= ~known
+            for manipulator, shift, is_visible in zip(self._manipulators, shifts, visible):
+                manipulator.set_layout(shift, bool(is_visible))
+
+    def _record_update_time(self, elapsed_ms: float):
+        """Accumulate label update time and log average/max periodically."""
+        self._profile_updates += 1
+        self._profile_total_ms += elapsed_ms
+        self._profile_max_ms = max(self._profile_max_ms, elapsed_ms)
+        
+        if self._profile_updates >= self.PROFILE_LOG_INTERVAL:
+            carb.log_info(
+                f"[ViewOverlay] Label update: {len(self._manipulators) or len(self._batch_world)} labels"
+                f"{' (batched)' if self._batch_layer else ''}, "
+                f"avg {self._profile_total_ms / self._profile_updates:.3f} ms, "
+                f"max {self._profile_max_ms:.3f} ms over {self._profile_updates} updates"
+            )
+            self._profile_updates = 0
+            self._profile_total_ms = 0.0
+            self._profile_max_ms = 0.0
@@ -3,6 +3,8 @@
 import omni.ui as ui
 import carb
 
+from . import label_layout
+
 
 class OverlayControlWindow:
     """Simple control window to toggle object ID labels and time display."""
@@ -19,7 +21,7 @@ class OverlayControlWindow:
         self._window = ui.Window(
             "View Overlay", 
             width=180, 
-            height=85,  # Reduced height for tighter fit
+            height=131,  # Fits the Batched IDs and Declutter rows
             visible=True
         )
         
@@ -42,6 +44,20 @@ class OverlayControlWindow:
                     self._time_checkbox.model.add_value_changed_fn(self._on_time_visibility_changed)
                     ui.Label("Timestamp", style={"font_size": 18})
                 
+                # Batched label layer toggle (single draw for many objects)
+                with ui.HStack(height=20):
+                    self._batched_checkbox = ui.CheckBox(width=16)
+                    self._batched_checkbox.model.set_value(self._overlay.is_batched())
+                    self._batched_checkbox.model.add_value_changed_fn(self._on_batched_changed)
+                    ui.Label("Batched IDs", style={"font_size": 18})
+                
+                # Overlapping label declutter toggle (off-screen culling is always on)
+                with ui.HStack(height=20):
+                    self._declutter_checkbox = ui.CheckBox(width=16)
+                    self._declutter_checkbox.model.set_value(self._overlay.get_layout_mode() is not None)
+                    self._declutter_checkbox.model.add_value_changed_fn(self._on_declutter_changed)
+                    ui.Label("Declutter", style={"font_size": 18})
+                
                 # Push everything to top
                 ui.Spacer()
         
@@ -59,6 +75,18 @@ class OverlayControlWindow:
         self._overlay.set_time_visible(visible)
         carb.log_info(f"[OverlayControl] Time display {'enabled' if visible else 'disabled'}")
     
+    def _on_batched_changed(self, model):
+        """Handle batched labels checkbox change."""
+        batched = model.get_value_as_bool()
+        self._overlay.set_batched(batched)
+        carb.log_info(f"[OverlayControl] Batched IDs {'enabled' if batched else 'disabled'}")
+    
+    def _on_declutter_changed(self, model):
+        """Handle declutter checkbox change."""
+        enabled = model.get_value_as_bool()
+        self._overlay.set_layout_mode(label_layout.OFFSET if enabled else None)
+        carb.log_info(f"[OverlayControl] Declutter {'enabled' if enabled else 'disabled'}")
+    
     def destroy(self):
         """Clean up the window."""
         if self._window:
@@ -3,14 +3,41 @@ VLM 서버에 동영상을 업로드하고, VLM 분석을 요청하고, 결과
 default_chunk_duration=2 초, default_chunk_overlap_duration=0 초로 설정됨.
 
 VLM 서버 통신: _initialize_client 메서드에서 직접 IP 주소와 포트를 지정하여 통신.
+연결은 VSSClient 의 pooled session 으로 재사용되며, timeout 은 VSS_CONNECT_TIMEOUT / VSS_READ_TIMEOUT
+환경변수(초)로 조정 가능.
+재시도 횟수는 VSS_MAX_RETRIES, 모델별 초당 요청 수 제한은 VSS_MODEL_RATE_LIMITS (예: "gpt-4o=0.5,nvila=2") 로 설정.
+VIA_BACKEND 에 여러 VSS 서버를 쉼표로 주면 backend pool 로 동작 (utils/VSS_backend_pool.py): 업로드는 진행 중 요청이
+가장 적은 healthy 서버로 보내고, 그 video id 는 같은 서버에서만 사용하며, 서버 장애 시 다른 서버로 다시 올려 처리.
+
+*_async 메서드는 AsyncVSSClient (aiohttp) 로 Kit event loop 에서 요청을 보내며, 동시 요청 수는
+VSS_MAX_CONCURRENCY 로 제한. aiohttp 를 불러올 수 없으면 동기 클라이언트를 executor 에서 실행.
+
+같은 내용(SHA-256)의 영상은 서버에 남아 있으면 다시 업로드하지 않음 (vlm_outputs/vss_upload_cache.json).
+서버에 남겨 둘 파일은 VSS_CACHE_MAX_FILES (기본 20) / VSS_CACHE_MAX_GB / VSS_CACHE_MAX_AGE_HOURS 를 넘으면
+가장 오래 쓰지 않은 것부터 삭제.
+generate 응답은 영상 내용 / 모델 / 프롬프트 / chunk 설정별로 vlm_outputs/response_cache/ 에 압축 저장되어
+같은 요청은 서버에 보내지 않음 (use_cache=False 로 우회).
+segment_duration (기본값 VSS_SEGMENT_SECONDS, 0 이면 끔) 을 주면 긴 영상을 chunk 경계에 맞춘 구간으로 잘라
+동시에 요청하고 결과를 하나로 합침 (utils/VSS_segmenter.py, 동시 구간 수는 VSS_SEGMENT_WORKERS).
+Generate 작업은 상태 / 입력 / video id / 결과 경로가 vlm_jobs.sqlite3 에 기록되어, Kit 를 닫아 중단된 작업은
+다음 실행 때 resume_jobs_async 로 이어서 처리 (서버에 video id 가 없으면 다시 업로드).
 """
 
+import asyncio
 import os
+import threading
+import json
 from pathlib import Path
 from typing import Optional, Dict, Any
 import carb
 from datetime import datetime
 
+from .utils.VSS_upload import UploadCancelled
+from .utils.VSS_upload_cache import UploadCache, upload_with_cache, upload_with_cache_async
+from .utils.VSS_segmenter import generate_segmented_captions, generate_segmented_captions_async
+from .utils.VSS_job_store import JobState, JobStore
+from .task_executor import get_executor
+
 
 class VLMClientCore:
     """Core logic for VLM Client."""
@@ -18,6 +45,7 @@ class VLMClientCore:
     def __init__(self):
         """Initialize VLM Client Core."""
         self._client = None
+        self._async_client = None
         self._current_video_id = None
         self._last_upload_response = None
         self._last_generation_response = None
@@ -30,119 +58,76 @@ class VLMClientCore:
         self._videos_base_path.mkdir(exist_ok=True)
         self._outputs_base_path.mkdir(exist_ok=True)
         
+        # Content-hash -> VSS file id, so unchanged videos are not uploaded again
+        max_gb = os.environ.get("VSS_CACHE_MAX_GB")
+        max_age_hours = os.environ.get("VSS_CACHE_MAX_AGE_HOURS")
+        self._upload_cache = UploadCache(
+            self._outputs_base_path / "vss_upload_cache.json",
+            max_files=int(os.environ.get("VSS_CACHE_MAX_FILES", 20)),
+            max_bytes=int(float(max_gb) * 1024 ** 3) if max_gb else None,
+            max_age=float(max_age_hours) * 3600 if max_age_hours else None,
+        )
+        self._last_upload_reused = False
+        self._last_generation_cached = False
+        
+        # Persistent job records so work survives a Kit restart (resume_jobs_async)
+        self._jobs = JobStore(Path(__file__).parent / "vlm_jobs.sqlite3")
+        self._running_jobs: Dict[int, asyncio.Task] = {}
+        
+        # Client-side segmentation for long videos (0 = let the server chunk the whole video)
+        self._segment_duration = float(os.environ.get("VSS_SEGMENT_SECONDS", 0))
+        self._segment_workers = int(os.environ.get("VSS_SEGMENT_WORKERS", 4))
+        
         # Initialize client
         self._initialize_client()
     
     def _initialize_client(self):
         """Initialize VSS Client with presets."""
         try:
-            from .utils.VSS_client import VSSClient, PromptPreset
+            from .utils.VSS_backend_pool import create_vss_client, parse_backend_urls
+            from .utils.VSS_prompt_presets import PROMPT_PRESETS
+            from .utils.VSS_resilience import RetryPolicy
+            from .utils.VSS_response_cache import ResponseCache
+            from .utils.VSS_metrics import MetricsRegistry
             
             # Get base URL from environment or use default
             # VLM 서버 ip 설정.
             # port는 video-search-and-summarization/deploy/docker/remote_llm_deployment/.env 에서 설정, BACKEND_PORT=8100         
+            # 여러 VSS stack (GPU 별) 을 쓰려면 쉼표로 구분: VIA_BACKEND=http://a:8100,http://b:8100
             base_url = os.environ.get("VIA_BACKEND", "http://10.38.38.40:8100")
             
-            # Define prompt presets
-            presets = {
-                "twin_view": PromptPreset(
-                    prompt=("""
-Analyze the provided BEV digital twin video.
-Identify every frame or moment where two or more objects visually overlap or intersect.
-For each overlapping event, extract:
-- the timestamp shown on the video, and
-- the numbers of all overlapping objects.
-
-Return only a JSON list following this structure:
-[
-  {"HH:MM:SS": [3, 5]},
-  {"HH:MM:SS": [1, 2, 4]}
-]
-"""),
-                    system_prompt=("""
-You are a vision-language reasoning model specialized in video understanding. 
-You are given a video generated from a digital twin simulation viewed from a bird's-eye view (BEV).
-In the video:
-- Multiple numbered objects move freely in a shared space.
-- Each object has a visible numeric label.
-- A timestamp (date and time) is displayed at the bottom-right corner of the video.
-- Occasionally, objects visually overlap or intersect.
-
-Your task is to detect all frames or time periods where two or more numbered objects overlap (i.e., their bounding areas visually intersect). 
-
-When an overlap occurs, extract and return:
-1. The exact timestamp displayed on screen.
-2. The list of object numbers involved in the overlap.
-
-Format the final answer as a structured JSON array with this schema:
-[
-  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
-  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
-...
-]
-
-Be concise, accurate, and consistent. Only report actual overlaps (not near contacts).
-If multiple overlaps occur at the same timestamp, list them all in the same entry.
-Do not include any explanatory text or reasoning in the output.
-"""),
-                ),
-                
-                "simple_view": PromptPreset(
-                    prompt=("""
-Analyze the video showing moving numbered circles on a white background.
-
-Identify every moment where two or more circles overlap visually.
-For each overlap, extract:
-- the datetime shown on the video
-- the numeric labels of the overlapping circles
-
-Return your answer **only** in the following JSON format:
-
-[
-  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
-  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
-...
-]
-"""),
-                    system_prompt=("""
-You are a vision-language model specialized in visual reasoning over video data.
-
-You are given a video where:
-- The background is plain white.
-- Multiple black circular objects move freely across the screen.
-- Each circle has a white numeric label written at its center.
-- A timestamp is displayed in the bottom-right corner of the video.
-- No other visual elements are present.
-
-Your task is to detect every moment when two or more circles visually overlap.
-Overlap is defined as their areas intersect, cover each other, or appear as a single object.
-
-When an overlap occurs, extract and return:
-1. The exact timestamp shown in the bottom-right corner of the video at that moment.
-2. The numeric labels of the overlapping circles.
-
-Return your results strictly in JSON format as follows:
-
-[
-  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
-  {"HH:MM:SS": [object_number_1, object_number_2, ...]},
-...
-]
-
-Only include timestamps where the circles are overlapping — ignore moments when they are merely close or touching edges.
-Do not include any reasoning or description; output **only** the JSON results.
-"""),
-                )
-            }
-            
-            self._client = VSSClient(
-                base_url=base_url,
+            client_options = dict(
                 default_chunk_duration=2,
                 default_chunk_overlap_duration=0,
-                prompt_presets=presets,
+                prompt_presets=dict(PROMPT_PRESETS),
+                connect_timeout=float(os.environ.get("VSS_CONNECT_TIMEOUT", 10)),
+                read_timeout=float(os.environ.get("VSS_READ_TIMEOUT", 900)),
+                retry_policy=RetryPolicy(max_retries=int(os.environ.get("VSS_MAX_RETRIES", 3))),
+                model_rate_limits=self._parse_rate_limits(os.environ.get("VSS_MODEL_RATE_LIMITS", "")),
+                response_cache=ResponseCache(self._outputs_base_path / "response_cache"),
+                # 요청별 측정값 (두 클라이언트 공유), VSS_METRICS_JSONL 을 주면 JSONL 로도 기록
+                metrics=MetricsRegistry(jsonl_path=os.environ.get("VSS_METRICS_JSONL") or None),
             )
+            self._client = create_vss_client(base_url, **client_options)
+            
+            backends = parse_backend_urls(base_url)
+            if len(backends) > 1:
+                carb.log_info(f"[VLMClient] Initialized with {len(backends)} backends: {', '.join(backends)}")
+            else:
+                carb.log_info(f"[VLMClient] Initialized with base_url: {base_url}")
             
-            carb.log_info(f"[VLMClient] Initialized with base_url: {base_url}")
+            # Async client shares the circuit breaker (or the backend pool) so both paths see the same
+            # backend health and file ownership
+            try:
+                async_options = dict(client_options, max_concurrency=int(os.environ.get("VSS_MAX_CONCURRENCY", 4)))
+                if hasattr(self._client, "pool"):
+                    async_options["pool"] = self._client.pool
+                else:
+                    async_options["circuit_breaker"] = self._client.circuit_breaker
+                self._async_client = create_vss_client(base_url, async_client=True, **async_options)
+            except ImportError as e:
+                carb.log_warn(f"[VLMClient] Async client unavailable, using executor fallback: {e}")
+                self._async_client = None
             
         except Exception as e:
             carb.log_error(f"[VLMClient] Failed to initialize client: {e}")
@@ -150,12 +135,28 @@ Do not include any reasoning or description; output **only** the JSON results.
             carb.log_error(traceback.format_exc())
             self._client = None
     
-    def upload_video(self, video_filename: str) -> bool:
+    @staticmethod
+    def _parse_rate_limits(value: str) -> Dict[str, float]:
+        """Parse "model=rate,model=rate" (requests per second) into a dict."""
+        limits = {}
+        for item in value.split(","):
+            if "=" not in item:
+                continue
+            model, rate = item.split("=", 1)
+            try:
+                limits[model.strip()] = float(rate)
+            except ValueError:
+                carb.log_warn(f"[VLMClient] Invalid rate limit entry: {item}")
+        return limits
+    
+    def upload_video(self, video_filename: str, progress_callback=None, cancel_event=None) -> bool:
         """
-        Upload video to VSS server.
+        Upload video to VSS server (streamed in fixed-size chunks).
         
         Args:
             video_filename: Video filename (relative to videos/ directory)
+            progress_callback: Optional callable receiving UploadProgress (called on the upload thread)
+            cancel_event: Optional threading.Event; set it to cancel the upload
             
         Returns:
             True if successful, False otherwise
@@ -174,22 +175,80 @@ Do not include any reasoning or description; output **only** the JSON results.
             
             carb.log_info(f"[VLMClient] Uploading video: {video_path}")
             
-            # Upload video
-            response = self._client.upload_video(str(video_path))
+            # Upload video (skipped when the same content is still on the server)
+            response, reused = upload_with_cache(
+                self._client, self._upload_cache, str(video_path),
+                progress_callback=progress_callback, cancel_event=cancel_event,
+            )
             
-            # Store response and video ID
-            self._last_upload_response = response
-            self._current_video_id = response.get("id")
+            self._on_uploaded(response, reused)
+            self._log_request_timing()
+            return True
             
-            carb.log_info(f"[VLMClient] Uploaded video ID: {self._current_video_id}")
+        except UploadCancelled:
+            carb.log_info(f"[VLMClient] Upload cancelled: {video_filename}")
+            return False
+        except Exception as e:
+            carb.log_error(f"[VLMClient] Upload failed: {e}")
+            import traceback
+            carb.log_error(traceback.format_exc())
+            return False
+    
+    async def upload_video_async(self, video_filename: str, progress_callback=None) -> bool:
+        """
+        Upload video without blocking the Kit event loop.
+        Await from the main loop so callers can update the UI with the result directly.
+        progress_callback receives UploadProgress on the main loop; cancel the awaiting task to abort.
+        """
+        if not self._async_client:
+            # Executor fallback: progress would arrive on a worker thread, so it is not reported
+            cancel_event = threading.Event()
+            try:
+                return await get_executor().run_blocking(
+                    lambda: self.upload_video(video_filename, cancel_event=cancel_event)
+                )
+            except asyncio.CancelledError:
+                cancel_event.set()
+                raise
+        
+        try:
+            video_path = self._videos_base_path / video_filename
+            
+            if not video_path.exists():
+                carb.log_error(f"[VLMClient] Video file not found: {video_path}")
+                return False
+            
+            carb.log_info(f"[VLMClient] Uploading video: {video_path}")
+            
+            response, reused = await upload_with_cache_async(
+                self._async_client, self._upload_cache, str(video_path),
+                progress_callback=progress_callback,
+            )
+            
+            self._on_uploaded(response, reused)
+            self._log_request_timing(self._async_client)
             return True
             
+        except UploadCancelled:
+            carb.log_info(f"[VLMClient] Upload cancelled: {video_filename}")
+            return False
         except Exception as e:
             carb.log_error(f"[VLMClient] Upload failed: {e}")
             import traceback
             carb.log_error(traceback.format_exc())
             return False
     
+    def _on_uploaded(self, response: Dict[str, Any], reused: bool = False):
+        """Store upload response and video ID."""
+        self._last_upload_response = response
+        self._last_upload_reused = reused
+        self._current_video_id = response.get("id")
+        
+        if reused:
+            carb.log_info(f"[VLMClient] Same content already on server, reusing video ID: {self._current_video_id}")
+        else:
+            carb.log_info(f"[VLMClient] Uploaded video ID: {self._current_video_id}")
+    
     def delete_video(self) -> bool:
         """
         Delete currently uploaded video.
@@ -211,8 +270,39 @@ Do not include any reasoning or description; output **only** the JSON results.
             response = self._client.delete_video(self._current_video_id)
             
             carb.log_info(f"[VLMClient] Video deleted: {response}")
+            self._log_request_timing()
             
             # Clear current video ID
+            self._upload_cache.remove_file_id(self._current_video_id)
+            self._current_video_id = None
+            self._last_upload_response = None
+            
+            return True
+            
+        except Exception as e:
+            carb.log_error(f"[VLMClient] Delete failed: {e}")
+            import traceback
+            carb.log_error(traceback.format_exc())
+            return False
+    
+    async def delete_video_async(self) -> bool:
+        """Delete currently uploaded video without blocking the Kit event loop."""
+        if not self._async_client:
+            return await get_executor().run_blocking(self.delete_video)
+        
+        if not self._current_video_id:
+            carb.log_error("[VLMClient] No video ID to delete")
+            return False
+        
+        try:
+            carb.log_info(f"[VLMClient] Deleting video ID: {self._current_video_id}")
+            
+            response = await self._async_client.delete_video(self._current_video_id)
+            
+            carb.log_info(f"[VLMClient] Video deleted: {response}")
+            self._log_request_timing(self._async_client)
+            
+            self._upload_cache.remove_file_id(self._current_video_id)
             self._current_video_id = None
             self._last_upload_response = None
             
@@ -229,7 +319,11 @@ Do not include any reasoning or description; output **only** the JSON results.
         model: str = "Qwen3-VL-8B-Instruct",
         preset_name: str = "simple_view",
         video_filename: Optional[str] = None,
-        chunk_overlap_duration: int = 0
+        chunk_overlap_duration: int = 0,
+        use_cache: bool = True,
+        segment_duration: Optional[float] = None,
+        video_id: Optional[str] = None,
+        job_id: Optional[int] = None
     ) -> tuple[bool, Optional[str]]:
         """
         Generate VLM captions for current video.
@@ -239,6 +333,14 @@ Do not include any reasoning or description; output **only** the JSON results.
             preset_name: Prompt preset name (default: "simple_view")
             video_filename: Optional video filename for output naming
             chunk_overlap_duration: Chunk overlap duration in seconds (default: 0)
+            use_cache: Reuse a cached response for the same video content and request (default: True).
+                       False always asks the server and refreshes the cache.
+            segment_duration: Split the local video into segments of this many seconds (rounded up to
+                              whole chunk strides) and caption them concurrently. None uses VSS_SEGMENT_SECONDS,
+                              0 sends the whole video. Needs video_filename; segments are uploaded on their
+                              own, so no uploaded video is required.
+            video_id: Uploaded video ID (default: current video)
+            job_id: Existing job record to update (default: record a new job)
             
         Returns:
             Tuple of (success: bool, output_filename: Optional[str])
@@ -247,61 +349,430 @@ Do not include any reasoning or description; output **only** the JSON results.
             carb.log_error("[VLMClient] Client not initialized")
             return False, None
         
-        if not self._current_video_id:
+        segment_path = self._segment_source(video_filename, segment_duration)
+        video_id = video_id or self._current_video_id
+        if not video_id and not segment_path:
             carb.log_error("[VLMClient] No video uploaded")
             return False, None
         
+        job_id = self._begin_generation_job(
+            job_id, video_id, model, preset_name, video_filename, chunk_overlap_duration, use_cache, segment_duration
+        )
         try:
-            carb.log_info(f"[VLMClient] Generating captions for video ID: {self._current_video_id}")
+            carb.log_info(f"[VLMClient] Generating captions for {segment_path or f'video ID: {video_id}'} (job {job_id})")
             carb.log_info(f"[VLMClient] Model: {model}, Preset: {preset_name}")
             carb.log_info(f"[VLMClient] Chunk overlap duration: {chunk_overlap_duration}s")
             
-            # Generate captions
-            response = self._client.generate_vlm_captions(
-                video_id=self._current_video_id,
-                model=model,
-                preset_name=preset_name,
-                chunk_overlap_duration=chunk_overlap_duration
-            )
-            
-            # Store response
-            self._last_generation_response = response
-            
-            # Save to outputs directory
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            if video_filename:
-                # Use video filename without extension
-                video_stem = Path(video_filename).stem
-                output_filename = f"{model}_{video_stem}_{timestamp}.json"
+            if segment_path:
+                seconds = self._resolve_segment_duration(segment_duration)
+                carb.log_info(f"[VLMClient] Splitting into {seconds:g}s segments")
+                response = generate_segmented_captions(
+                    self._client,
+                    str(segment_path),
+                    model,
+                    seconds,
+                    max_workers=self._segment_workers,
+                    video_hash=self._upload_cache.hash_file(str(segment_path)),
+                    use_cache=use_cache,
+                    preset_name=preset_name,
+                    chunk_overlap_duration=chunk_overlap_duration
+                )
             else:
-                output_filename = f"{model}_output_{timestamp}.json"
+                # Generate captions
+                response = self._client.generate_vlm_captions(
+                    video_id=video_id,
+                    model=model,
+                    preset_name=preset_name,
+                    chunk_overlap_duration=chunk_overlap_duration,
+                    video_hash=self._upload_cache.sha256_for(video_id),
+                    use_cache=use_cache
+                )
+                if not response.get("cache_hit"):
+                    self._log_request_timing()
             
-            output_path = self._outputs_base_path / output_filename
+            output_filename = self._finish_generation(response, model, video_filename)
+            self._finish_job(job_id, output_filename)
+            return True, output_filename
             
-            # Save JSON
-            self._client.save_json(response, str(output_path))
+        except Exception as e:
+            carb.log_error(f"[VLMClient] Generation failed: {e}")
+            carb.log_error(f"[VLMClient] Video ID: {video_id}")
+            carb.log_error(f"[VLMClient] Model: {model}, Preset: {preset_name}")
+            import traceback
+            carb.log_error(traceback.format_exc())
+            self._jobs.update(job_id, state=JobState.FAILED, error=f"{type(e).__name__}: {e}")
+            return False, None
+    
+    async def generate_captions_async(
+        self,
+        model: str = "Qwen3-VL-8B-Instruct",
+        preset_name: str = "simple_view",
+        video_filename: Optional[str] = None,
+        chunk_overlap_duration: int = 0,
+        use_cache: bool = True,
+        segment_duration: Optional[float] = None,
+        video_id: Optional[str] = None,
+        job_id: Optional[int] = None
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Generate VLM captions without blocking the Kit event loop. Same arguments as generate_captions.
+        Cancel the awaiting task after cancel_job() to stop it; a task cancelled without a cancel
+        request (e.g. Kit shutting down) leaves the job resumable.
+        """
+        segment_path = self._segment_source(video_filename, segment_duration)
+        video_id = video_id or self._current_video_id
+        if not video_id and not segment_path:
+            carb.log_error("[VLMClient] No video uploaded")
+            return False, None
+        
+        job_id = self._begin_generation_job(
+            job_id, video_id, model, preset_name, video_filename, chunk_overlap_duration, use_cache, segment_duration
+        )
+        self._running_jobs[job_id] = asyncio.current_task()
+        try:
+            if not self._async_client:
+                return await get_executor().run_blocking(
+                    lambda: self.generate_captions(
+                        model, preset_name, video_filename, chunk_overlap_duration, use_cache,
+                        segment_duration, video_id, job_id
+                    )
+                )
             
-            carb.log_info(f"[VLMClient] Results saved to: {output_path}")
+            carb.log_info(f"[VLMClient] Generating captions for {segment_path or f'video ID: {video_id}'} (job {job_id})")
+            carb.log_info(f"[VLMClient] Model: {model}, Preset: {preset_name}")
+            carb.log_info(f"[VLMClient] Chunk overlap duration: {chunk_overlap_duration}s")
             
-            # Log execution time
-            exec_time = response.get("execution_time", 0)
-            carb.log_info(f"[VLMClient] Execution time: {exec_time:.2f} seconds")
+            if segment_path:
+                seconds = self._resolve_segment_duration(segment_duration)
+                carb.log_info(f"[VLMClient] Splitting into {seconds:g}s segments")
+                video_hash = await get_executor().run_blocking(
+                    self._upload_cache.hash_file, str(segment_path)
+                )
+                response = await generate_segmented_captions_async(
+                    self._async_client,
+                    str(segment_path),
+                    model,
+                    seconds,
+                    video_hash=video_hash,
+                    use_cache=use_cache,
+                    preset_name=preset_name,
+                    chunk_overlap_duration=chunk_overlap_duration
+                )
+            else:
+                response = await self._async_client.generate_vlm_captions(
+                    video_id=video_id,
+                    model=model,
+                    preset_name=preset_name,
+                    chunk_overlap_duration=chunk_overlap_duration,
+                    video_hash=self._upload_cache.sha256_for(video_id),
+                    use_cache=use_cache
+                )
+                if not response.get("cache_hit"):
+                    self._log_request_timing(self._async_client)
             
+            output_filename = self._finish_generation(response, model, video_filename)
+            self._finish_job(job_id, output_filename)
             return True, output_filename
             
+        except asyncio.CancelledError:
+            self._on_job_interrupted(job_id)
+            raise
         except Exception as e:
             carb.log_error(f"[VLMClient] Generation failed: {e}")
-            carb.log_error(f"[VLMClient] Video ID: {self._current_video_id}")
+            carb.log_error(f"[VLMClient] Video ID: {video_id}")
             carb.log_error(f"[VLMClient] Model: {model}, Preset: {preset_name}")
             import traceback
             carb.log_error(traceback.format_exc())
+            self._jobs.update(job_id, state=JobState.FAILED, error=f"{type(e).__name__}: {e}")
             return False, None
+        finally:
+            self._running_jobs.pop(job_id, None)
+    
+    # ------------------------------------------------------------------
+    # Persistent jobs
+    # ------------------------------------------------------------------
+    def _begin_generation_job(
+        self, job_id, video_id, model, preset_name, video_filename, chunk_overlap_duration, use_cache, segment_duration
+    ) -> int:
+        """Record a new generating job, or move an existing one (resume) to generating."""
+        if job_id is None:
+            return self._jobs.create(
+                video_filename or "",
+                model,
+                preset_name,
+                params={
+                    "chunk_overlap_duration": chunk_overlap_duration,
+                    "use_cache": use_cache,
+                    "segment_duration": segment_duration,
+                },
+                video_id=video_id,
+                state=JobState.GENERATING,
+            )
+        self._jobs.update(job_id, state=JobState.GENERATING, video_id=video_id)
+        return job_id
+    
+    def _finish_job(self, job_id: int, output_filename: str):
+        self._jobs.update(
+            job_id, state=JobState.DONE, output_path=str(self._outputs_base_path / output_filename), error=None
+        )
+    
+    def _on_job_interrupted(self, job_id: int):
+        """Task cancelled: a user cancel ends the job, anything else (shutdown) leaves it to resume."""
+        if self._jobs.is_cancel_requested(job_id):
+            self._jobs.update(job_id, state=JobState.CANCELLED)
+            carb.log_info(f"[VLMClient] Job {job_id} cancelled")
+        else:
+            carb.log_info(f"[VLMClient] Job {job_id} interrupted, will resume on next start")
+    
+    def submit_job(
+        self,
+        video_filename: str,
+        model: str,
+        preset_name: str,
+        chunk_overlap_duration: int = 0,
+        use_cache: bool = True,
+        segment_duration: Optional[float] = None
+    ) -> int:
+        """Queue an upload + generate job; run it with run_job_async. Returns the job ID."""
+        return self._jobs.create(
+            video_filename,
+            model,
+            preset_name,
+            params={
+                "chunk_overlap_duration": chunk_overlap_duration,
+                "use_cache": use_cache,
+                "segment_duration": segment_duration,
+            },
+        )
+    
+    async def run_job_async(self, job_id: int) -> tuple[bool, Optional[str]]:
+        """
+        Run (or resume) a job: upload the video unless its video ID is still on the server, then generate.
+        A generation interrupted by a restart is sent again; the response cache answers it when
+        another run already stored the same request.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            carb.log_error(f"[VLMClient] Unknown job: {job_id}")
+            return False, None
+        if job.state in JobState.FINISHED:
+            return job.state == JobState.DONE, Path(job.output_path).name if job.output_path else None
+        if job.cancel_requested:
+            self._jobs.update(job_id, state=JobState.CANCELLED)
+            return False, None
+        
+        self._jobs.start_attempt(job_id, job.state if job.state != JobState.QUEUED else JobState.UPLOADING)
+        self._running_jobs[job_id] = asyncio.current_task()
+        try:
+            video_id = job.video_id
+            if video_id and not await self._video_exists_async(video_id):
+                carb.log_info(f"[VLMClient] Job {job_id}: video ID {video_id} no longer on server, uploading again")
+                video_id = None
+            
+            # 클라이언트 분할 job 은 구간을 각각 업로드하므로 전체 영상 업로드가 필요 없음
+            segmented = self._segment_source(job.video_filename or None, job.params.get("segment_duration"))
+            if not video_id and not segmented:
+                self._jobs.update(job_id, state=JobState.UPLOADING)
+                if not await self.upload_video_async(job.video_filename):
+                    if self._jobs.is_cancel_requested(job_id):
+                        self._jobs.update(job_id, state=JobState.CANCELLED)
+                    else:
+                        self._jobs.update(job_id, state=JobState.FAILED, error="Upload failed")
+                    return False, None
+                video_id = self._current_video_id
+                self._jobs.update(job_id, video_id=video_id)
+        except asyncio.CancelledError:
+            self._on_job_interrupted(job_id)
+            raise
+        finally:
+            self._running_jobs.pop(job_id, None)
+        
+        return await self.generate_captions_async(
+            model=job.model,
+            preset_name=job.preset,
+            video_filename=job.video_filename or None,
+            chunk_overlap_duration=job.params.get("chunk_overlap_duration", 0),
+            use_cache=job.params.get("use_cache", True),
+            segment_duration=job.params.get("segment_duration"),
+            video_id=video_id,
+            job_id=job_id
+        )
+    
+    async def resume_jobs_async(self) -> int:
+        """
+        Resume jobs left unfinished by a previous session, one at a time (they share the current
+        video state). Returns the number of jobs resumed.
+        """
+        jobs = self._jobs.unfinished()
+        if jobs:
+            carb.log_info(f"[VLMClient] Resuming {len(jobs)} unfinished job(s)")
+        for job in jobs:
+            await self.run_job_async(job.id)
+        return len(jobs)
+    
+    async def _video_exists_async(self, video_id: str) -> bool:
+        try:
+            if self._async_client:
+                return await self._async_client.get_file(video_id) is not None
+            return await get_executor().run_blocking(self._client.get_file, video_id) is not None
+        except Exception as e:
+            carb.log_warn(f"[VLMClient] Could not check video ID {video_id}: {e}")
+            return False
+    
+    def cancel_job(self, job_id: int) -> bool:
+        """Cancel a queued or running job (a blocking request on the sync fallback finishes first)."""
+        requested = self._jobs.request_cancel(job_id)
+        task = self._running_jobs.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+        return requested
+    
+    def cancel_running_jobs(self) -> int:
+        """Cancel every job running in this session. Returns how many were cancelled."""
+        job_ids = list(self._running_jobs)
+        for job_id in job_ids:
+            self.cancel_job(job_id)
+        return len(job_ids)
+    
+    def has_running_jobs(self) -> bool:
+        return bool(self._running_jobs)
+    
+    def get_job_counts(self) -> Dict[str, int]:
+        """Number of recorded jobs per state."""
+        return self._jobs.counts()
+    
+
+    def _resolve_segment_duration(self, segment_duration: Optional[float]) -> float:
+        return self._segment_duration if segment_duration is None else float(segment_duration)
+    
+    def _segment_source(self, video_filename: Optional[str], segment_duration: Optional[float]) -> Optional[Path]:
+        """Local video to split client-side, or None to caption the uploaded video as a whole."""
+        if self._resolve_segment_duration(segment_duration) <= 0:
+            return None
+        if not video_filename:
+            carb.log_warn("[VLMClient] Segmentation needs the video filename; sending the whole video")
+            return None
+        video_path = self._videos_base_path / video_filename
+        if not video_path.exists():
+            carb.log_warn(f"[VLMClient] Video file not found for segmentation: {video_path}")
+            return None
+        return video_path
+    
+    def _finish_generation(self, response: Dict[str, Any], model: str, video_filename: Optional[str]) -> str:
+        """Attach the time map, store and save a generation response. Returns the output filename."""
+        self._last_generation_cached = bool(response.get("cache_hit"))
+        if self._last_generation_cached:
+            carb.log_info(
+                f"[VLMClient] Cache hit: reused {model} response, "
+                f"saved {response.get('execution_time', 0):.2f}s of server time"
+            )
+        
+        # Stitched event-window video: carry its time map so post-processing can restore dataset time
+        if video_filename:
+            time_map_path = self._videos_base_path / f"{Path(video_filename).stem}.timemap.json"
+            if time_map_path.exists():
+                with open(time_map_path, 'r', encoding='utf-8') as f:
+                    response["time_map"] = json.load(f)
+                carb.log_info(f"[VLMClient] Attached time map: {time_map_path.name}")
+        
+        # Store response
+        self._last_generation_response = response
+        
+        # Save to outputs directory
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        if video_filename:
+            # Use video filename without extension
+            video_stem = Path(video_filename).stem
+            output_filename = f"{model}_{video_stem}_{timestamp}.json"
+        else:
+            output_filename = f"{model}_output_{timestamp}.json"
+        
+        output_path = self._outputs_base_path / output_filename
+        
+        # Save JSON
+        self._client.save_json(response, str(output_path))
+        
+        carb.log_info(f"[VLMClient] Results saved to: {output_path}")
+        
+        # Log execution time
+        if not self._last_generation_cached:
+            exec_time = response.get("execution_time", 0)
+            carb.log_info(f"[VLMClient] Execution time: {exec_time:.2f} seconds")
+        
+        return output_filename
+    
+    def _log_request_timing(self, client=None):
+        """Log client-side timing of the last VSS request (of the sync client unless given)."""
+        client = client or self._client
+        timing = client.last_timing if client else None
+        if timing:
+            carb.log_info(
+                f"[VLMClient] {timing.context}: {timing.elapsed:.2f}s total, "
+                f"{timing.response_elapsed or 0:.2f}s until response headers (HTTP {timing.status_code}), "
+                f"attempt {timing.attempt}"
+            )
+    
+    def get_last_request_timing(self):
+        """Get RequestTiming of the last VSS request (None if no request yet)."""
+        return self._client.last_timing if self._client else None
+    
+    def get_backend_status(self) -> list:
+        """Per-backend health / load when VIA_BACKEND lists several VSS servers (empty for a single server)."""
+        if self._client and hasattr(self._client, "get_backend_status"):
+            return self._client.get_backend_status()
+        return []
+    
+    def get_metrics_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-call latency breakdown (connect / upload / TTFB / server time, p50 / p95 / p99) by request type."""
+        if not self._client:
+            return {}
+        return self._client.metrics.summary()
+    
+    def shutdown(self):
+        """Stop running jobs (left resumable), close pooled connections and the job store."""
+        # Cancel without a cancel request so the jobs resume on the next start; the job store is
+        # closed once their cancellation handlers (which read it) have run
+        running = [task for task in self._running_jobs.values() if not task.done()]
+        for task in running:
+            task.cancel()
+        if running:
+            asyncio.ensure_future(self._close_jobs_after(running))
+        else:
+            self._jobs.close()
+        
+        if self._client:
+            summary = self._client.metrics.format_summary()
+            if summary:
+                carb.log_info(f"[VLMClient] Request metrics:\n{summary}")
+            self._client.metrics.close()
+            self._client.close()
+            self._client = None
+        if self._async_client:
+            # aiohttp session must be closed on the loop that owns it
+            asyncio.ensure_future(self._async_client.close())
+            self._async_client = None
+    
+    async def _close_jobs_after(self, tasks):
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._jobs.close()
     
     def get_current_video_id(self) -> Optional[str]:
         """Get current video ID."""
         return self._current_video_id
     
+    def get_segment_duration(self) -> float:
+        """Get the default client-side segment length in seconds (0 = off)."""
+        return self._segment_duration
+    
+    def was_last_generation_cached(self) -> bool:
+        """Check if the last generation was served from the response cache."""
+        return self._last_generation_cached
+    
+    def was_last_upload_reused(self) -> bool:
+        """Check if the last upload reused a file already on the server."""
+        return self._last_upload_reused
+    
     def has_video_uploaded(self) -> bool:
         """Check if video is uploaded."""
         return self._current_video_id is not None
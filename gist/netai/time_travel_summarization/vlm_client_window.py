@@ -1,8 +1,10 @@
 # vlm_client_window.py - UI for VLM Client
 
 import omni.ui as ui
+import asyncio
 import carb
-import threading
+
+from .task_executor import get_executor
 
 
 class VLMClientWindow:
@@ -13,8 +15,14 @@ class VLMClientWindow:
         self._vlm_core = vlm_core
         self._ext_id = ext_id
         
+        # Running request tasks (TaskHandles of the shared executor; coroutines run on Kit's main loop,
+        # so UI updates stay on the UI thread)
+        self._tasks = {}
+        self._upload_task = None
+        self._generating = False  # generation started from this window in progress
+        
         # Create window
-        self._window = ui.Window("VLM Client", width=450, height=285)
+        self._window = ui.Window("VLM Client", width=450, height=370)
         
         with self._window.frame:
             with ui.VStack(spacing=5, style={"margin": 3}):
@@ -33,11 +41,20 @@ class VLMClientWindow:
                     ui.Label("Video ID:", width=60, style={"font_size": 15})
                     self._video_id_label = ui.Label("Not uploaded", style={"color": 0xFF888888, "font_size": 15})
                 
+                # Upload progress (bytes sent, throughput, ETA)
+                with ui.HStack(height=20, spacing=5):
+                    self._upload_progress_bar = ui.ProgressBar(width=150)
+                    self._upload_progress_label = ui.Label("", style={"color": 0xFF888888})
+                
                 # Action buttons
                 with ui.HStack(height=28, spacing=8):
                     self._upload_button = ui.Button("Upload", width=0)
                     self._upload_button.set_clicked_fn(self._on_upload_clicked)
                     
+                    self._cancel_upload_button = ui.Button("Cancel", width=0)
+                    self._cancel_upload_button.set_clicked_fn(self._on_cancel_upload_clicked)
+                    self._cancel_upload_button.enabled = False
+                    
                     self._delete_button = ui.Button("Delete", width=0)
                     self._delete_button.set_clicked_fn(self._on_delete_clicked)
                     self._delete_button.enabled = False
@@ -45,6 +62,10 @@ class VLMClientWindow:
                     self._generate_button = ui.Button("Generate", width=0)
                     self._generate_button.set_clicked_fn(self._on_generate_clicked)
                     self._generate_button.enabled = False
+                    
+                    self._stop_button = ui.Button("Stop", width=0)
+                    self._stop_button.set_clicked_fn(self._on_stop_clicked)
+                    self._stop_button.enabled = False
                 
                 # Separator
                 with ui.HStack(height=1):
@@ -67,6 +88,23 @@ class VLMClientWindow:
                     self._overlap_field.model.set_value(0)
                     ui.Label("sec", width=30)
                 
+                # Client-side segmentation (0: the server chunks the whole video)
+                with ui.HStack(height=22, spacing=5):
+                    ui.Label("Segment:", width=50)
+                    self._segment_field = ui.IntField()
+                    self._segment_field.model.set_value(int(self._vlm_core.get_segment_duration()))
+                    ui.Label("sec (0 = whole video)", width=130)
+                # Segmented runs upload each segment themselves: Generate needs only the filename
+                self._segment_field.model.add_value_changed_fn(lambda _: self._update_generate_button())
+                self._video_filename_field.model.add_value_changed_fn(lambda _: self._update_generate_button())
+                
+                # Response cache (off: always ask the server and refresh the cache)
+                with ui.HStack(height=22, spacing=5):
+                    ui.Label("Cache:", width=50)
+                    self._cache_checkbox = ui.CheckBox(width=16)
+                    self._cache_checkbox.model.set_value(True)
+                    ui.Label("Reuse cached results for identical requests")
+                
                 # Separator
                 with ui.HStack(height=1):
                     ui.Line(style={"color": 0xFF666666})
@@ -75,6 +113,11 @@ class VLMClientWindow:
                 with ui.HStack(height=20, spacing=5):
                     ui.Label("Status:", width=50, style={"font_size": 16})
                     self._status_label = ui.Label("Ready", style={"color": 0xFF00AA00, "font_size": 16})
+        
+        self._update_generate_button()
+        
+        # Pick up generation jobs interrupted by the last shutdown
+        self._run_task(self._resume_jobs())
 
     def _on_upload_clicked(self):
         """Handle Upload button click."""
@@ -88,28 +131,74 @@ class VLMClientWindow:
         
         # Disable upload button during processing
         self._upload_button.enabled = False
+        self._cancel_upload_button.enabled = True
+        self._upload_progress_bar.model.set_value(0.0)
+        self._upload_progress_label.text = ""
         
-        # Run upload in separate thread to avoid blocking UI
-        def upload_async():
-            success = self._vlm_core.upload_video(video_filename)
-            
-            # Update UI with results
+        self._upload_task = self._run_task(self._upload(video_filename))
+    
+    def _on_cancel_upload_clicked(self):
+        """Handle Cancel button click."""
+        if self._upload_task:
+            self._upload_task.cancel()
+    
+    async def _upload(self, video_filename: str):
+        """Upload on the Kit event loop and update UI with results."""
+        try:
+            success = await self._vlm_core.upload_video_async(
+                video_filename, progress_callback=self._on_upload_progress
+            )
+        except asyncio.CancelledError:
+            if self._window is None:
+                # Window destroyed
+                raise
             self._upload_button.enabled = True
-            if success:
-                video_id = self._vlm_core.get_current_video_id()
-                self._video_id_label.text = video_id
-                self._video_id_label.style = {"color": 0xFF00AA00}
-                
-                # Enable delete and generate buttons
-                self._delete_button.enabled = True
-                self._generate_button.enabled = True
-                
-                self._update_status(f"Upload successful! ID: {video_id[:8]}...", is_error=False)
-            else:
-                self._update_status("Upload failed. Check console for details.", is_error=True)
+            self._cancel_upload_button.enabled = False
+            self._upload_progress_label.text = "Cancelled"
+            self._update_status("Upload cancelled", is_error=True)
+            return
+        finally:
+            self._upload_task = None
         
-        thread = threading.Thread(target=upload_async, daemon=True)
-        thread.start()
+        # Update UI with results
+        self._upload_button.enabled = True
+        self._cancel_upload_button.enabled = False
+        if success:
+            video_id = self._vlm_core.get_current_video_id()
+            self._video_id_label.text = video_id
+            self._video_id_label.style = {"color": 0xFF00AA00}
+            
+            # Enable delete and generate buttons
+            self._delete_button.enabled = True
+            self._update_generate_button()
+            
+            if self._vlm_core.was_last_upload_reused():
+                self._upload_progress_bar.model.set_value(1.0)
+                self._upload_progress_label.text = "Already on server"
+                self._update_status(f"Reused uploaded video. ID: {video_id[:8]}...", is_error=False)
+            else:
+                self._update_status(f"Upload successful! ID: {video_id[:8]}...", is_error=False)
+        else:
+            self._update_status("Upload failed. Check console for details.", is_error=True)
+    
+    def _refresh_video_id(self):
+        """Show the core's current video ID (it changes when a resumed job uploads)."""
+        video_id = self._vlm_core.get_current_video_id()
+        if video_id:
+            self._video_id_label.text = video_id
+            self._video_id_label.style = {"color": 0xFF00AA00}
+            self._delete_button.enabled = True
+            self._update_generate_button()
+    
+    def _on_upload_progress(self, progress):
+        """Show UploadProgress (called on the Kit event loop)."""
+        self._upload_progress_bar.model.set_value(progress.fraction)
+        eta = progress.eta
+        eta_text = f", ETA {eta:.0f}s" if eta is not None and progress.fraction < 1.0 else ""
+        self._upload_progress_label.text = (
+            f"{progress.bytes_sent / 1e6:.1f} / {progress.total_bytes / 1e6:.1f} MB, "
+            f"{progress.throughput / 1e6:.1f} MB/s{eta_text}"
+        )
     
     def _on_delete_clicked(self):
         """Handle Delete button click."""
@@ -122,31 +211,43 @@ class VLMClientWindow:
         # Disable delete button during processing
         self._delete_button.enabled = False
         
-        # Run delete in separate thread to avoid blocking UI
-        def delete_async():
-            success = self._vlm_core.delete_video()
-            
-            # Update UI with results
-            if success:
-                self._video_id_label.text = "Not uploaded"
-                self._video_id_label.style = {"color": 0xFF888888}
-                
-                # Disable generate button (delete button already disabled)
-                self._generate_button.enabled = False
-                
-                self._update_status("Video deleted successfully", is_error=False)
-            else:
-                # Re-enable delete button on failure
-                self._delete_button.enabled = True
-                self._update_status("Delete failed. Check console for details.", is_error=True)
+        self._run_task(self._delete())
+    
+    async def _delete(self):
+        """Delete on the Kit event loop and update UI with results."""
+        success = await self._vlm_core.delete_video_async()
         
-        thread = threading.Thread(target=delete_async, daemon=True)
-        thread.start()
+        # Update UI with results
+        if success:
+            self._video_id_label.text = "Not uploaded"
+            self._video_id_label.style = {"color": 0xFF888888}
+            
+            # Generate stays available only for segmented runs (delete button already disabled)
+            self._update_generate_button()
+            
+            self._update_status("Video deleted successfully", is_error=False)
+        else:
+            # Re-enable delete button on failure
+            self._delete_button.enabled = True
+            self._update_status("Delete failed. Check console for details.", is_error=True)
+    
+    def _segment_duration(self) -> int:
+        return max(0, self._segment_field.model.get_value_as_int())
+    
+    def _can_generate(self) -> bool:
+        """Uploaded video, or a local video to split into segments (uploaded per segment by the core)."""
+        if self._vlm_core.has_video_uploaded():
+            return True
+        return self._segment_duration() > 0 and bool(self._video_filename_field.model.get_value_as_string())
+    
+    def _update_generate_button(self):
+        """Enable Generate when it can run and no generation started from this window is in progress."""
+        self._generate_button.enabled = not self._generating and self._can_generate()
     
     def _on_generate_clicked(self):
         """Handle Generate button click."""
-        if not self._vlm_core.has_video_uploaded():
-            self._update_status("No video uploaded", is_error=True)
+        if not self._can_generate():
+            self._update_status("No video uploaded (or set Segment > 0 to split the local video)", is_error=True)
             return
         
         # Get selected model and preset
@@ -162,6 +263,7 @@ class VLMClientWindow:
         self._update_status(f"Generating with {model}...", is_processing=True)
         
         # Disable generate button during processing
+        self._generating = True
         self._generate_button.enabled = False
         
         # Get video filename for output naming
@@ -169,25 +271,82 @@ class VLMClientWindow:
         
         # Get chunk overlap duration
         chunk_overlap = self._overlap_field.model.get_value_as_int()
+        use_cache = self._cache_checkbox.model.get_value_as_bool()
+        segment_duration = self._segment_duration()
         
-        # Run generation in separate thread to avoid blocking UI
-        def generate_async():
-            success, output_filename = self._vlm_core.generate_captions(
+        self._run_task(self._generate(model, preset, video_filename, chunk_overlap, use_cache, segment_duration))
+    
+    async def _generate(
+        self, model: str, preset: str, video_filename: str, chunk_overlap: int, use_cache: bool, segment_duration: int
+    ):
+        """Generate on the Kit event loop and update UI with results."""
+        self._stop_button.enabled = True
+        try:
+            success, output_filename = await self._vlm_core.generate_captions_async(
                 model=model,
                 preset_name=preset,
                 video_filename=video_filename,
-                chunk_overlap_duration=chunk_overlap
+                chunk_overlap_duration=chunk_overlap,
+                use_cache=use_cache,
+                segment_duration=segment_duration
             )
-            
-            # Update UI with results (simple assignment is thread-safe for display)
-            self._generate_button.enabled = True
-            if success and output_filename:
-                self._update_status(f"Saved: {output_filename}", is_error=False)
-            else:
-                self._update_status("Generation failed. Check console for details.", is_error=True)
+        except asyncio.CancelledError:
+            self._generating = False
+            if self._window:
+                # Stopped by the user (window teardown leaves the job to resume)
+                self._update_generate_button()
+                self._stop_button.enabled = False
+                self._update_status("Generation stopped", is_error=True)
+            raise
         
-        thread = threading.Thread(target=generate_async, daemon=True)
-        thread.start()
+        # Update UI with results
+        self._generating = False
+        self._stop_button.enabled = self._vlm_core.has_running_jobs()
+        self._update_generate_button()
+        if success and output_filename and self._vlm_core.was_last_generation_cached():
+            self._update_status(f"Saved (cached): {output_filename}", is_error=False)
+        elif success and output_filename:
+            self._update_status(f"Saved: {output_filename}", is_error=False)
+        else:
+            self._update_status("Generation failed. Check console for details.", is_error=True)
+    
+    def _on_stop_clicked(self):
+        """Handle Stop button click: cancel running generation jobs."""
+        if self._vlm_core.cancel_running_jobs():
+            self._update_status("Stopping generation...", is_processing=True)
+        self._stop_button.enabled = False
+    
+    async def _resume_jobs(self):
+        """Resume generation jobs left unfinished when Omniverse was last closed."""
+        pending = self._vlm_core.get_job_counts()
+        if not any(pending.get(state, 0) for state in ("queued", "uploading", "generating")):
+            return
+        self._update_status("Resuming unfinished jobs...", is_processing=True)
+        self._stop_button.enabled = True
+        resumed = await self._vlm_core.resume_jobs_async()
+        self._stop_button.enabled = self._vlm_core.has_running_jobs()
+        self._refresh_video_id()
+        counts = self._vlm_core.get_job_counts()
+        self._update_status(
+            f"Resumed {resumed} job(s): {counts.get('done', 0)} done, {counts.get('failed', 0)} failed in history",
+            is_error=False
+        )
+    
+    def _run_task(self, coroutine):
+        """Schedule a request coroutine on the shared executor and keep its handle until it finishes."""
+        handle = get_executor().run_coroutine(coroutine, name=f"VLMClient.{coroutine.__name__}",
+                                              on_done=self._on_task_done)
+        self._tasks[handle.id] = handle
+        return handle
+    
+    def _on_task_done(self, handle):
+        """Forget a finished task and log unexpected errors (called on the main loop)."""
+        self._tasks.pop(handle.id, None)
+        error = handle.exception()
+        if error is not None:
+            carb.log_error(f"[VLMClient] {handle.name} failed: {error}")
+            if self._window:
+                self._update_status(f"Error: {error}", is_error=True)
     
     def _update_status(self, message: str, is_error: bool = False, is_processing: bool = False):
         """Update status label with color."""
@@ -202,6 +361,10 @@ class VLMClientWindow:
     
     def destroy(self):
         """Clean up the window."""
+        for handle in list(self._tasks.values()):
+            handle.cancel()
+        self._tasks.clear()
+        
         if self._window:
             self._window.destroy()
             self._window = None
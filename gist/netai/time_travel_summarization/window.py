@@ -106,6 +106,12 @@ class TimeTravelWindow:
                     self._speed_field.model.set_value(self._core.get_playback_speed())
                     self._speed_field.model.add_end_edit_fn(self._on_speed_changed)
                     ui.Label("x", width=20)
+                    
+                    # Activity-adaptive speed (fast in quiet periods, 1x near contacts)
+                    self._adaptive_checkbox = ui.CheckBox(width=20)
+                    self._adaptive_checkbox.model.set_value(False)
+                    self._adaptive_checkbox.model.add_value_changed_fn(self._on_adaptive_checkbox_changed)
+                    self._adaptive_label = ui.Label("Adaptive", style={"color": 0xFF888888})
                 
                 # Separator
                 ui.Spacer(height=5)
@@ -139,11 +145,11 @@ class TimeTravelWindow:
                 self._goto_second.model.get_value_as_int()
             )
             
-            # Always go to the specified time
-            self._core.set_current_time(goto_time)
+            # Always go to the specified time (latched, applied on next app update)
+            self._core.request_seek(goto_time)
             
             # Update slider
-            self._time_slider.model.set_value(self._core.get_progress())
+            self._sync_slider()
             
         except Exception as e:
             carb.log_error(f"[TimeTravel] Error setting time: {e}")
@@ -154,7 +160,7 @@ class TimeTravelWindow:
             self._core.go_to_next_event()
             
             # Update slider
-            self._time_slider.model.set_value(self._core.get_progress())
+            self._sync_slider()
             
             # Update goto fields to reflect new time
             self._update_goto_fields()
@@ -165,7 +171,7 @@ class TimeTravelWindow:
         self._update_play_button()
     
     def _on_slider_changed(self, model):
-        """Handle slider value change."""
+        """Handle slider value change. Seeks are latched in core and applied once per app update."""
         # Prevent infinite loop when updating slider programmatically
         if self._updating_slider:
             return
@@ -174,11 +180,34 @@ class TimeTravelWindow:
         self._core.set_progress(progress)
         self._update_goto_fields()
     
+    def _sync_slider(self):
+        """Move slider to current progress without issuing another seek."""
+        self._updating_slider = True
+        self._time_slider.model.set_value(self._core.get_progress())
+        self._updating_slider = False
+    
     def _on_speed_changed(self, model):
         """Handle speed value change."""
         speed = model.get_value_as_float()
         self._core.set_playback_speed(speed)
     
+    def _on_adaptive_checkbox_changed(self, model):
+        """Handle adaptive speed checkbox change."""
+        requested_value = model.get_value_as_bool()
+        
+        if not self._core.set_use_adaptive_speed(requested_value):
+            model.set_value(False)
+            carb.log_warn("[TimeTravel] Adaptive speed unavailable - no trajectory data")
+            return
+        
+        if requested_value:
+            duration = self._core.get_adaptive_video_duration()
+            self._adaptive_label.text = f"Adaptive ({duration:.1f}s @1x)"
+            self._adaptive_label.style = {"color": 0xFFFFFFFF}
+        else:
+            self._adaptive_label.text = "Adaptive"
+            self._adaptive_label.style = {"color": 0xFF888888}
+    
     def _on_event_checkbox_changed(self, model):
         """Handle event summary checkbox change."""
         requested_value = model.get_value_as_bool()
@@ -188,7 +217,7 @@ class TimeTravelWindow:
             if not self._core.has_events():
                 # Try to load events from Events directory
                 if self._core.load_events_from_positions_jsonl():
-                    # Successfully loaded events
+                    # Successfully loaded events (schedule compiled in core)
                     self._core.set_use_event_summary(True)
                     carb.log_info("[TimeTravel] Event based Summary Mode enabled")
                     # Update label to show event count
@@ -204,6 +233,7 @@ class TimeTravelWindow:
                 # Events already exist
                 self._core.set_use_event_summary(True)
                 carb.log_info("[TimeTravel] Event based Summary Mode enabled")
+                self._update_event_label()
                 self._next_event_button.enabled = True
         else:
             # User wants to disable event mode
@@ -215,7 +245,8 @@ class TimeTravelWindow:
         """Update event label with current event count."""
         if self._core.has_events():
             event_count = len(self._core.get_summary_events())
-            self._event_label.text = f"Event based Summary Mode ({event_count} events)"
+            duration = self._core.get_event_summary_duration()
+            self._event_label.text = f"Event based Summary Mode ({event_count} events, {duration:.1f}s)"
             self._event_label.style = {"color": 0xFFFFFFFF}
         else:
             self._event_label.text = "Event based Summary (Check to load events)"
@@ -245,10 +276,7 @@ class TimeTravelWindow:
         
         # Update slider if playing (but don't interfere with user dragging)
         if self._core.is_playing():
-            progress = self._core.get_progress()
-            self._updating_slider = True  # Prevent triggering _on_slider_changed
-            self._time_slider.model.set_value(progress)
-            self._updating_slider = False
+            self._sync_slider()  # Prevent triggering _on_slider_changed
             # self._update_goto_fields()
         
         # Update progress percentage